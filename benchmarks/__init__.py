@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Colour - Benchmarks
+===================
+
+Defines the *Colour* benchmarks suite covering the computational hot paths.
+
+The benchmarks follow the *airspeed velocity* (asv) conventions, i.e.
+classes with ``setup``, ``params`` and ``param_names`` attributes, ``time_*``
+methods and ``timeraw_*`` methods returning code to time in a fresh
+interpreter, thus they can be run either with *asv* or with the bundled
+runner:
+
+-   ``python -m benchmarks run --output results.json``
+-   ``python -m benchmarks compare baseline.json results.json``
+"""
+
+from __future__ import absolute_import
+
+from .common import SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SIZES', 'random_array']
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks Command Line Interface
+=================================
+
+Runs the benchmarks suite or compares benchmarks results::
+
+    python -m benchmarks run --output results.json
+    python -m benchmarks compare baseline.json results.json --threshold 0.1
+"""
+
+from __future__ import division, unicode_literals
+
+import argparse
+import sys
+
+from benchmarks.runner import (REGRESSION_THRESHOLD, compare_results,
+                               format_comparison, read_results,
+                               run_benchmarks, write_results)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['main']
+
+
+def main(arguments=None):
+    """
+    Runs the benchmarks command line interface.
+
+    Parameters
+    ----------
+    arguments : list, optional
+        Command line arguments.
+
+    Returns
+    -------
+    integer
+        Exit code, *1* if a regression is flagged.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description='Colour benchmarks.')
+    subparsers = parser.add_subparsers(dest='command')
+
+    run = subparsers.add_parser('run', help='Runs the benchmarks.')
+    run.add_argument(
+        '--output', '-o', default='benchmarks.json', help='JSON results file.')
+    run.add_argument(
+        '--bench', '-b', help='Regular expression filtering the benchmarks.')
+    run.add_argument(
+        '--sizes',
+        '-s',
+        help='Comma separated sizes, e.g. "scalar,1K,HD,4K".')
+    run.add_argument(
+        '--repeat', '-r', type=int, default=5, help='Timing samples count.')
+    run.add_argument(
+        '--min-time',
+        type=float,
+        default=0.1,
+        help='Minimum time in seconds of a timing sample.')
+
+    compare = subparsers.add_parser(
+        'compare', help='Compares benchmarks results.')
+    compare.add_argument('baseline', help='Baseline JSON results file.')
+    compare.add_argument('contender', help='Contender JSON results file.')
+    compare.add_argument(
+        '--threshold',
+        '-t',
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help='Relative slowdown flagged as a regression.')
+    compare.add_argument(
+        '--only-changed',
+        action='store_true',
+        help='Only reports the changed benchmarks.')
+
+    arguments = parser.parse_args(arguments)
+
+    if arguments.command == 'run':
+        results = run_benchmarks(
+            arguments.bench,
+            arguments.sizes.split(',') if arguments.sizes else None,
+            arguments.repeat, arguments.min_time)
+        write_results(results, arguments.output)
+
+        return 0
+    elif arguments.command == 'compare':
+        comparisons = compare_results(
+            read_results(arguments.baseline),
+            read_results(arguments.contender), arguments.threshold)
+
+        if arguments.only_changed:
+            comparisons = [
+                comparison for comparison in comparisons
+                if comparison.status != 'Unchanged'
+            ]
+
+        print(format_comparison(comparisons))
+
+        regressions = [
+            comparison for comparison in comparisons
+            if comparison.status == 'Regression'
+        ]
+        if regressions:
+            print('\n{0} benchmark(s) regressed by more than {1:.0%}!'.format(
+                len(regressions), arguments.threshold))
+
+            return 1
+
+        return 0
+
+    parser.print_help()
+
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Algebra Benchmarks
+==================
+
+Defines the benchmarks for :mod:`colour.algebra` package.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.algebra import KernelInterpolator
+
+from benchmarks.common import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TimeKernelInterpolator']
+
+
+class TimeKernelInterpolator(object):
+    """
+    Benchmarks :class:`colour.KernelInterpolator` class resampling spectral
+    signals from 5nm to 1nm.
+    """
+
+    params = [['scalar', '1K']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.x = np.arange(360, 835, 5)
+        self.x_i = np.arange(360, 831, 1)
+        self.y = np.transpose(random_array(size, len(self.x)))
+
+        self.interpolator = KernelInterpolator(self.x, self.y)
+
+    def time_KernelInterpolator(self, size):
+        """
+        Benchmarks :class:`colour.KernelInterpolator` class.
+        """
+
+        self.interpolator(self.x_i)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Appearance Models Benchmarks
+===================================
+
+Defines the benchmarks for :mod:`colour.appearance` package.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.appearance import XYZ_to_CAM16, XYZ_to_CIECAM02
+
+from benchmarks.common import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TimeColourAppearanceModels']
+
+
+class TimeColourAppearanceModels(object):
+    """
+    Benchmarks :func:`colour.XYZ_to_CIECAM02` and :func:`colour.XYZ_to_CAM16`
+    definitions.
+    """
+
+    params = [['scalar', '1K', 'HD', '4K']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.XYZ = random_array(size, high=100)
+        self.XYZ_w = np.array([95.05, 100.00, 108.88])
+
+    def time_XYZ_to_CIECAM02(self, size):
+        """
+        Benchmarks :func:`colour.XYZ_to_CIECAM02` definition.
+        """
+
+        XYZ_to_CIECAM02(self.XYZ, self.XYZ_w, 318.31, 20.0)
+
+    def time_XYZ_to_CAM16(self, size):
+        """
+        Benchmarks :func:`colour.XYZ_to_CAM16` definition.
+        """
+
+        XYZ_to_CAM16(self.XYZ, self.XYZ_w, 318.31, 20.0)
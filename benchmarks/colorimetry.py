@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+Colorimetry Benchmarks
+======================
+
+Defines the benchmarks for :mod:`colour.colorimetry` package.
+"""
+
+from __future__ import division, unicode_literals
+
+from colour.algebra import LinearInterpolator, SpragueInterpolator
+from colour.characterisation import COLOURCHECKERS_SPDS
+from colour.colorimetry import (
+    ILLUMINANTS_SPDS, SpectralShape, D_illuminant_relative_XYZ, blackbody_XYZ,
+    mesopic_luminous_flux, multi_spectral_to_XYZ,
+    resample_multi_spectral_array, spectral_to_XYZ)
+from colour.temperature import CCT_to_xy_CIE_D
+
+from benchmarks.common import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TimeSpectralToXYZ', 'TimeMultiSpectralToXYZ',
+    'TimeSpectralPowerDistribution', 'TimeResampleMultiSpectralArray',
+    'TimeBlackbodyXYZ', 'TimeD_illuminantRelativeXYZ',
+    'TimeMesopicLuminousFlux'
+]
+
+
+class TimeSpectralToXYZ(object):
+    """
+    Benchmarks :func:`colour.spectral_to_XYZ` definition.
+    """
+
+    params = [['Integration', 'ASTM E308-15']]
+    param_names = ['method']
+
+    def setup(self, method):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.spd = COLOURCHECKERS_SPDS['ColorChecker N Ohta']['dark skin']
+        self.illuminant = ILLUMINANTS_SPDS['D65']
+
+    def time_spectral_to_XYZ(self, method):
+        """
+        Benchmarks :func:`colour.spectral_to_XYZ` definition.
+        """
+
+        spectral_to_XYZ(self.spd, illuminant=self.illuminant, method=method)
+
+
+class TimeMultiSpectralToXYZ(object):
+    """
+    Benchmarks :func:`colour.multi_spectral_to_XYZ` definition.
+
+    Notes
+    -----
+    -   The multi-spectral arrays have 31 bins, e.g. a typical multi-spectral
+        camera, *HD* and *4K* multi-spectral images are not benchmarked as
+        they require gigabytes of memory.
+    """
+
+    params = [['scalar', '1K']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.shape = SpectralShape(400, 700, 10)
+        self.msa = random_array(size, len(self.shape)).reshape(
+            -1, 1, len(self.shape))
+
+    def time_multi_spectral_to_XYZ(self, size):
+        """
+        Benchmarks :func:`colour.multi_spectral_to_XYZ` definition.
+        """
+
+        multi_spectral_to_XYZ(self.msa, self.shape)
+
+
+class TimeSpectralPowerDistribution(object):
+    """
+    Benchmarks :class:`colour.SpectralPowerDistribution` class interpolation
+    and alignment.
+    """
+
+    params = [['Sprague', 'Linear']]
+    param_names = ['interpolator']
+
+    def setup(self, interpolator):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.spd = COLOURCHECKERS_SPDS['ColorChecker N Ohta'][
+            'dark skin'].copy()
+        self.spd.interpolator = (SpragueInterpolator if interpolator ==
+                                 'Sprague' else LinearInterpolator)
+
+    def time_interpolate(self, interpolator):
+        """
+        Benchmarks :meth:`colour.SpectralPowerDistribution.interpolate`
+        method.
+        """
+
+        self.spd.copy().interpolate(SpectralShape(interval=1))
+
+    def time_align(self, interpolator):
+        """
+        Benchmarks :meth:`colour.SpectralPowerDistribution.align` method.
+        """
+
+        self.spd.copy().align(SpectralShape(360, 830, 1))
+
+
+class TimeResampleMultiSpectralArray(object):
+    """
+    Benchmarks :func:`colour.colorimetry.resample_multi_spectral_array`
+    definition resampling a spectral library from 10nm to 1nm.
+    """
+
+    params = [['scalar', '1K']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.source_shape = SpectralShape(360, 830, 10)
+        self.target_shape = SpectralShape(360, 830, 1)
+        self.msa = random_array(size, len(self.source_shape))
+
+        resample_multi_spectral_array(self.msa, self.source_shape,
+                                      self.target_shape)
+
+    def time_resample_multi_spectral_array(self, size):
+        """
+        Benchmarks :func:`colour.colorimetry.resample_multi_spectral_array`
+        definition.
+        """
+
+        resample_multi_spectral_array(self.msa, self.source_shape,
+                                      self.target_shape)
+
+
+class TimeBlackbodyXYZ(object):
+    """
+    Benchmarks :func:`colour.colorimetry.blackbody_XYZ` definition.
+    """
+
+    params = [['scalar', '1K']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.T = random_array(size, None, 1000, 25000)
+
+        blackbody_XYZ(self.T)
+
+    def time_blackbody_XYZ(self, size):
+        """
+        Benchmarks :func:`colour.colorimetry.blackbody_XYZ` definition.
+        """
+
+        blackbody_XYZ(self.T)
+
+
+class TimeD_illuminantRelativeXYZ(object):
+    """
+    Benchmarks :func:`colour.colorimetry.D_illuminant_relative_XYZ`
+    definition.
+    """
+
+    params = [['scalar', '1K', 'HD']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.xy = CCT_to_xy_CIE_D(random_array(size, None, 4000, 25000))
+
+        D_illuminant_relative_XYZ(self.xy)
+
+    def time_D_illuminant_relative_XYZ(self, size):
+        """
+        Benchmarks :func:`colour.colorimetry.D_illuminant_relative_XYZ`
+        definition.
+        """
+
+        D_illuminant_relative_XYZ(self.xy)
+
+
+class TimeMesopicLuminousFlux(object):
+    """
+    Benchmarks :func:`colour.colorimetry.mesopic_luminous_flux` definition
+    for a photopic luminance map.
+    """
+
+    params = [['scalar', '1K', 'HD']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.spd = ILLUMINANTS_SPDS['F2']
+        self.Lp = random_array(size, None, 0.001, 20)
+
+        mesopic_luminous_flux(self.spd, self.Lp)
+
+    def time_mesopic_luminous_flux(self, size):
+        """
+        Benchmarks :func:`colour.colorimetry.mesopic_luminous_flux`
+        definition.
+        """
+
+        mesopic_luminous_flux(self.spd, self.Lp)
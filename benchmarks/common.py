@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Common Benchmarks Utilities
+===========================
+
+Defines the common benchmarks utilities objects.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import OrderedDict
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SIZES', 'random_array']
+
+SIZES = OrderedDict((
+    ('scalar', ()),
+    ('1K', (1024, )),
+    ('HD', (1080, 1920)),
+    ('4K', (2160, 3840)),
+))
+"""
+Benchmarks samples shapes, from a single sample to a *4K* image.
+
+SIZES : OrderedDict
+    **{'scalar', '1K', 'HD', '4K'}**
+"""
+
+
+def random_array(size, channels=3, low=0, high=1, seed=4):
+    """
+    Returns a reproducible random array of given size.
+
+    Parameters
+    ----------
+    size : unicode
+        **{'scalar', '1K', 'HD', '4K'}**,
+        Samples shape name.
+    channels : integer, optional
+        Channels count, *None* for a single channel array.
+    low : numeric, optional
+        Lower bound of the random values.
+    high : numeric, optional
+        Upper bound of the random values.
+    seed : integer, optional
+        Random state seed.
+
+    Returns
+    -------
+    ndarray
+        Random array.
+    """
+
+    shape = SIZES[size] + (() if channels is None else (channels, ))
+
+    return np.random.RandomState(seed).uniform(low, high, shape)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Difference Benchmarks
+============================
+
+Defines the benchmarks for :mod:`colour.difference` package.
+"""
+
+from __future__ import division, unicode_literals
+
+from colour.difference import delta_E
+
+from benchmarks.common import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TimeDeltaE']
+
+
+class TimeDeltaE(object):
+    """
+    Benchmarks :func:`colour.delta_E` definition.
+    """
+
+    params = [['CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC', 'DIN99'],
+              ['scalar', '1K', 'HD', '4K']]
+    param_names = ['method', 'size']
+
+    def setup(self, method, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.Lab_1 = random_array(size, low=-100, high=100, seed=4)
+        self.Lab_2 = random_array(size, low=-100, high=100, seed=8)
+
+    def time_delta_E(self, method, size):
+        """
+        Benchmarks :func:`colour.delta_E` definition.
+        """
+
+        delta_E(self.Lab_1, self.Lab_2, method)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Import Benchmarks
+=================
+
+Defines the benchmarks for the *Colour* package import.
+"""
+
+from __future__ import division, unicode_literals
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TimeImport', 'TimeModuleAPI']
+
+
+class TimeImport(object):
+    """
+    Benchmarks the *Colour* package import in a fresh interpreter.
+    """
+
+    def timeraw_import_colour(self):
+        """
+        Benchmarks *Colour* package import.
+        """
+
+        return 'import colour'
+
+    def timeraw_import_colour_attribute(self):
+        """
+        Benchmarks *Colour* package import and first access to a top-level
+        attribute.
+        """
+
+        return 'import colour; colour.delta_E'
+
+
+class TimeModuleAPI(object):
+    """
+    Benchmarks *Colour* package top-level attributes access.
+    """
+
+    def setup(self):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        import colour
+
+        self.colour = colour
+        self.colour.RGB_to_XYZ
+
+    def time_attribute_access(self):
+        """
+        Benchmarks *Colour* package top-level attribute access.
+        """
+
+        self.colour.RGB_to_XYZ
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Models Benchmarks
+========================
+
+Defines the benchmarks for :mod:`colour.models` package.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.models import (RGB_COLOURSPACES, RGB_COLOURSPACES_REGISTRY,
+                           RGB_to_RGB, YCbCr_to_RGB, YCbCr_to_planar,
+                           planar_to_YCbCr, eotf, log_decoding_curve,
+                           log_encoding_curve, oetf)
+
+from benchmarks.common import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TimeRGBToRGB', 'TimeRGBColourspacesRegistry', 'TimeTransferFunctions',
+    'TimeYCbCrToRGB'
+]
+
+
+class TimeRGBToRGB(object):
+    """
+    Benchmarks :func:`colour.RGB_to_RGB` definition.
+    """
+
+    params = [['scalar', '1K', 'HD', '4K']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.RGB = random_array(size)
+        self.sRGB = RGB_COLOURSPACES['sRGB']
+        self.ACEScg = RGB_COLOURSPACES['ACEScg']
+
+    def time_RGB_to_RGB(self, size):
+        """
+        Benchmarks :func:`colour.RGB_to_RGB` definition.
+        """
+
+        RGB_to_RGB(self.RGB, self.sRGB, self.ACEScg)
+
+    def time_RGB_to_RGB_cctf(self, size):
+        """
+        Benchmarks :func:`colour.RGB_to_RGB` definition with the colour
+        component transfer functions applied.
+        """
+
+        RGB_to_RGB(
+            self.RGB,
+            self.sRGB,
+            self.ACEScg,
+            apply_decoding_cctf=True,
+            apply_encoding_cctf=True)
+
+
+class TimeRGBColourspacesRegistry(object):
+    """
+    Benchmarks :meth:`colour.models.RGB_ColourspacesRegistry.convert` method.
+    """
+
+    params = [['scalar', '1K', 'HD', '4K']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.RGB = random_array(size)
+
+        RGB_COLOURSPACES_REGISTRY.matrix('sRGB', 'ACEScg')
+
+    def time_convert(self, size):
+        """
+        Benchmarks :meth:`colour.models.RGB_ColourspacesRegistry.convert`
+        method.
+        """
+
+        RGB_COLOURSPACES_REGISTRY.convert(self.RGB, 'sRGB', 'ACEScg')
+
+
+class TimeTransferFunctions(object):
+    """
+    Benchmarks the transfer functions dispatchers.
+    """
+
+    params = [['scalar', '1K', 'HD', '4K']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.value = random_array(size)
+
+    def time_oetf(self, size):
+        """
+        Benchmarks :func:`colour.oetf` definition.
+        """
+
+        oetf(self.value, 'ITU-R BT.709')
+
+    def time_eotf(self, size):
+        """
+        Benchmarks :func:`colour.eotf` definition.
+        """
+
+        eotf(self.value, 'ST 2084')
+
+    def time_log_encoding_curve(self, size):
+        """
+        Benchmarks :func:`colour.log_encoding_curve` definition.
+        """
+
+        log_encoding_curve(self.value, 'ACEScct')
+
+    def time_log_decoding_curve(self, size):
+        """
+        Benchmarks :func:`colour.log_decoding_curve` definition.
+        """
+
+        log_decoding_curve(self.value, 'ACEScct')
+
+
+class TimeYCbCrToRGB(object):
+    """
+    Benchmarks :func:`colour.YCbCr_to_RGB` definition with 10-bit integer code
+    values.
+    """
+
+    params = [['HD', '4K']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.YCbCr = np.round(random_array(size, 3, 64, 940)).astype(
+            np.uint16)
+        self.RGB = np.empty(self.YCbCr.shape, np.uint16)
+        self.planes = YCbCr_to_planar(self.YCbCr, '4:2:0')
+
+    def time_YCbCr_to_RGB(self, size):
+        """
+        Benchmarks :func:`colour.YCbCr_to_RGB` definition.
+        """
+
+        YCbCr_to_RGB(
+            self.YCbCr,
+            in_bits=10,
+            in_legal=True,
+            in_int=True,
+            out_int=True,
+            out=self.RGB)
+
+    def time_YCbCr_to_RGB_float(self, size):
+        """
+        Benchmarks :func:`colour.YCbCr_to_RGB` definition with float code
+        values.
+        """
+
+        YCbCr_to_RGB(
+            self.YCbCr.astype(np.float_),
+            in_bits=10,
+            in_legal=True,
+            in_int=True,
+            out_int=True)
+
+    def time_planar_to_YCbCr_to_RGB(self, size):
+        """
+        Benchmarks :func:`colour.planar_to_YCbCr` and
+        :func:`colour.YCbCr_to_RGB` definitions with *4:2:0* chroma
+        subsampling.
+        """
+
+        YCbCr_to_RGB(
+            planar_to_YCbCr(*self.planes),
+            in_bits=10,
+            in_legal=True,
+            in_int=True,
+            out_int=True,
+            out=self.RGB)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Notation Systems Benchmarks
+==================================
+
+Defines the benchmarks for :mod:`colour.notation` package.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.notation.munsell import (munsell_value_ASTMD153508,
+                                     xyY_to_munsell_specification)
+from colour.notation.triplet import HEX_to_RGB, RGB_to_HEX
+
+from benchmarks.common import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TimeMunsell', 'TimeMunsellValue', 'TimeTriplet']
+
+
+class TimeMunsell(object):
+    """
+    Benchmarks the *Munsell Renotation System* definitions.
+
+    Notes
+    -----
+    -   :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition only supports a single sample.
+    """
+
+    def setup(self):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.xyY = np.array([0.38736945, 0.35751656, 0.59362000])
+
+    def time_xyY_to_munsell_specification(self):
+        """
+        Benchmarks :func:`colour.notation.munsell.\
+xyY_to_munsell_specification` definition.
+        """
+
+        xyY_to_munsell_specification(self.xyY)
+
+
+class TimeMunsellValue(object):
+    """
+    Benchmarks :func:`colour.notation.munsell_value_ASTMD153508` definition.
+    """
+
+    params = [['scalar', '1K', 'HD']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.Y = random_array(size, None, 0, 100)
+
+        munsell_value_ASTMD153508(self.Y)
+
+    def time_munsell_value_ASTMD153508(self, size):
+        """
+        Benchmarks :func:`colour.notation.munsell_value_ASTMD153508`
+        definition.
+        """
+
+        munsell_value_ASTMD153508(self.Y)
+
+
+class TimeTriplet(object):
+    """
+    Benchmarks the hexadecimal triplet notation definitions.
+    """
+
+    params = [['scalar', '1K', 'HD']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.RGB = random_array(size)
+        self.HEX = RGB_to_HEX(self.RGB)
+
+    def time_RGB_to_HEX(self, size):
+        """
+        Benchmarks :func:`colour.notation.RGB_to_HEX` definition.
+        """
+
+        RGB_to_HEX(self.RGB)
+
+    def time_HEX_to_RGB(self, size):
+        """
+        Benchmarks :func:`colour.notation.HEX_to_RGB` definition.
+        """
+
+        HEX_to_RGB(self.HEX)
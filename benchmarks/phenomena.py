@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Optical Phenomena Benchmarks
+============================
+
+Defines the benchmarks for :mod:`colour.phenomena` package.
+"""
+
+from __future__ import division, unicode_literals
+
+from colour.colorimetry import SpectralShape
+from colour.phenomena import rayleigh_optical_depth_msa
+
+from benchmarks.common import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TimeRayleighOpticalDepthMsa']
+
+
+class TimeRayleighOpticalDepthMsa(object):
+    """
+    Benchmarks :func:`colour.phenomena.rayleigh_optical_depth_msa`
+    definition.
+    """
+
+    params = [['scalar', '1K', 'HD']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.shape = SpectralShape(400, 700, 20)
+        self.altitude = random_array(size, None, 0, 8000)
+        self.pressure = random_array(size, None, 35000, 101325)
+
+    def time_rayleigh_optical_depth_msa(self, size):
+        """
+        Benchmarks :func:`colour.phenomena.rayleigh_optical_depth_msa`
+        definition.
+        """
+
+        rayleigh_optical_depth_msa(
+            self.shape, pressure=self.pressure, altitude=self.altitude)
@@ -0,0 +1,491 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks Runner
+=================
+
+Defines the objects to run the benchmarks suite, store the results as *JSON*
+files and compare them to flag the performance regressions:
+
+-   :func:`benchmarks.runner.discover_benchmarks`
+-   :func:`benchmarks.runner.time_function`
+-   :func:`benchmarks.runner.time_code`
+-   :func:`benchmarks.runner.run_benchmarks`
+-   :func:`benchmarks.runner.write_results`
+-   :func:`benchmarks.runner.read_results`
+-   :func:`benchmarks.runner.compare_results`
+-   :func:`benchmarks.runner.format_comparison`
+"""
+
+from __future__ import division, unicode_literals
+
+import datetime
+import importlib
+import inspect
+import itertools
+import json
+import numpy as np
+import platform
+import re
+import subprocess
+import sys
+import timeit
+from collections import OrderedDict, namedtuple
+
+import colour
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'BENCHMARKS_MODULES', 'REGRESSION_THRESHOLD', 'Benchmark',
+    'BenchmarkComparison', 'discover_benchmarks', 'time_function',
+    'time_code', 'run_benchmarks', 'write_results', 'read_results',
+    'compare_results', 'format_comparison'
+]
+
+BENCHMARKS_MODULES = ('algebra', 'appearance', 'colorimetry', 'difference',
+                      'imports', 'models', 'notation', 'phenomena',
+                      'temperature', 'utilities', 'volume')
+"""
+Benchmarks modules of the :mod:`benchmarks` package.
+
+BENCHMARKS_MODULES : tuple
+"""
+
+REGRESSION_THRESHOLD = 0.1
+"""
+Default relative slowdown of the median time above which a benchmark is
+flagged as a regression, i.e. 10%.
+
+REGRESSION_THRESHOLD : numeric
+"""
+
+
+class Benchmark(
+        namedtuple('Benchmark', ('name', 'benchmark_class', 'method',
+                                 'parameters'))):
+    """
+    Defines a benchmark, i.e. a benchmark class method and its parameters.
+
+    Parameters
+    ----------
+    name : unicode
+        Benchmark name, e.g. *models.TimeRGBToRGB.time_RGB_to_RGB(4K)*.
+    benchmark_class : type
+        Benchmark class.
+    method : unicode
+        Benchmark class method name.
+    parameters : tuple
+        Benchmark parameters.
+    """
+
+
+class BenchmarkComparison(
+        namedtuple('BenchmarkComparison',
+                   ('name', 'baseline', 'contender', 'ratio', 'status'))):
+    """
+    Defines a benchmark comparison.
+
+    Parameters
+    ----------
+    name : unicode
+        Benchmark name.
+    baseline : numeric
+        Baseline median time in seconds.
+    contender : numeric
+        Contender median time in seconds.
+    ratio : numeric
+        Contender to baseline median times ratio.
+    status : unicode
+        **{'Regression', 'Improvement', 'Unchanged', 'New', 'Missing',
+        'Failed'}**,
+        Comparison status.
+    """
+
+
+def discover_benchmarks(pattern=None, sizes=None):
+    """
+    Discovers the benchmarks of the :mod:`benchmarks` package.
+
+    Parameters
+    ----------
+    pattern : unicode, optional
+        Regular expression the benchmarks names must match.
+    sizes : array_like, optional
+        Sizes, e.g. *('scalar', '1K')*, benchmarks with a *size* parameter are
+        restricted to.
+
+    Returns
+    -------
+    list
+        Benchmarks.
+    """
+
+    benchmarks = []
+    for module_name in BENCHMARKS_MODULES:
+        module = importlib.import_module('benchmarks.{0}'.format(module_name))
+        for class_name in getattr(module, '__all__'):
+            benchmark_class = getattr(module, class_name)
+
+            params = getattr(benchmark_class, 'params', [])
+            param_names = getattr(benchmark_class, 'param_names', [])
+            if params and not isinstance(params[0], (list, tuple)):
+                params = [params]
+
+            methods = sorted(
+                name
+                for name, _value in inspect.getmembers(benchmark_class)
+                if name.startswith(('time_', 'timeraw_')))
+
+            for method in methods:
+                for parameters in itertools.product(*params):
+                    if (sizes is not None and 'size' in param_names and
+                            parameters[param_names.index('size')] not in
+                            sizes):
+                        continue
+
+                    name = '{0}.{1}.{2}'.format(module_name, class_name,
+                                                method)
+                    if parameters:
+                        name = '{0}({1})'.format(
+                            name, ', '.join(str(p) for p in parameters))
+
+                    if pattern is not None and not re.search(pattern, name):
+                        continue
+
+                    benchmarks.append(
+                        Benchmark(name, benchmark_class, method, parameters))
+
+    return benchmarks
+
+
+def _statistics(samples, number):
+    """
+    Returns the statistics of given timing samples.
+
+    Parameters
+    ----------
+    samples : array_like
+        Timing samples in seconds per call.
+    number : integer
+        Calls count per sample.
+
+    Returns
+    -------
+    OrderedDict
+        Timing statistics.
+    """
+
+    samples = np.asarray(samples)
+
+    return OrderedDict((
+        ('min', float(np.min(samples))),
+        ('median', float(np.median(samples))),
+        ('mean', float(np.mean(samples))),
+        ('std', float(np.std(samples))),
+        ('number', int(number)),
+        ('repeat', len(samples)),
+    ))
+
+
+def time_function(function, repeat=5, min_time=0.1):
+    """
+    Times given function.
+
+    The calls count per timing sample is calibrated so that a sample lasts at
+    least given minimum time.
+
+    Parameters
+    ----------
+    function : callable
+        Function to time.
+    repeat : integer, optional
+        Timing samples count.
+    min_time : numeric, optional
+        Minimum time in seconds of a timing sample.
+
+    Returns
+    -------
+    OrderedDict
+        Timing statistics in seconds per call.
+    """
+
+    timer = timeit.Timer(function)
+
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+
+        number = max(number * 2,
+                     int(np.ceil(number * min_time / max(elapsed, 1e-9))))
+
+    samples = [elapsed / number]
+    samples.extend(timer.timeit(number) / number for _ in range(repeat - 1))
+
+    return _statistics(samples, number)
+
+
+def time_code(code, repeat=5):
+    """
+    Times given code in fresh interpreters, e.g. to time package imports.
+
+    Parameters
+    ----------
+    code : unicode
+        Code to time.
+    repeat : integer, optional
+        Timing samples count.
+
+    Returns
+    -------
+    OrderedDict
+        Timing statistics in seconds.
+    """
+
+    script = ('import timeit\n'
+              '_start = timeit.default_timer()\n'
+              '{0}\n'
+              'print(timeit.default_timer() - _start)\n').format(code)
+
+    samples = [
+        float(
+            subprocess.check_output([sys.executable, '-c', script])
+            .decode('utf-8').strip().splitlines()[-1]) for _ in range(repeat)
+    ]
+
+    return _statistics(samples, 1)
+
+
+def _metadata():
+    """
+    Returns the benchmarks environment metadata.
+
+    Returns
+    -------
+    OrderedDict
+        Benchmarks environment metadata.
+    """
+
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'],
+            stderr=subprocess.STDOUT).decode('utf-8').strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return OrderedDict((
+        ('date', datetime.datetime.now().isoformat()),
+        ('commit', commit),
+        ('colour', colour.__version__),
+        ('python', platform.python_version()),
+        ('numpy', np.__version__),
+        ('platform', platform.platform()),
+        ('machine', platform.machine()),
+        ('processor', platform.processor()),
+    ))
+
+
+def run_benchmarks(pattern=None,
+                   sizes=None,
+                   repeat=5,
+                   min_time=0.1,
+                   verbose=True):
+    """
+    Runs the benchmarks of the :mod:`benchmarks` package.
+
+    Parameters
+    ----------
+    pattern : unicode, optional
+        Regular expression the benchmarks names must match.
+    sizes : array_like, optional
+        Sizes, e.g. *('scalar', '1K')*, benchmarks with a *size* parameter are
+        restricted to.
+    repeat : integer, optional
+        Timing samples count.
+    min_time : numeric, optional
+        Minimum time in seconds of a timing sample.
+    verbose : bool, optional
+        Whether to print the benchmarks timings.
+
+    Returns
+    -------
+    OrderedDict
+        Benchmarks results with *metadata* and *results* keys, benchmarks
+        raising an exception have an *error* key, benchmarks whose *setup*
+        method raises a :class:`NotImplementedError` exception are skipped.
+    """
+
+    results = OrderedDict()
+    for benchmark in discover_benchmarks(pattern, sizes):
+        instance = benchmark.benchmark_class()
+        try:
+            if hasattr(instance, 'setup'):
+                instance.setup(*benchmark.parameters)
+        except NotImplementedError:
+            continue
+        except Exception as error:  # noqa
+            results[benchmark.name] = OrderedDict((('error', repr(error)), ))
+            continue
+
+        method = getattr(instance, benchmark.method)
+        try:
+            if benchmark.method.startswith('timeraw_'):
+                statistics = time_code(method(*benchmark.parameters), repeat)
+            else:
+                statistics = time_function(
+                    lambda: method(*benchmark.parameters), repeat, min_time)
+        except Exception as error:  # noqa
+            statistics = OrderedDict((('error', repr(error)), ))
+        finally:
+            if hasattr(instance, 'teardown'):
+                instance.teardown(*benchmark.parameters)
+
+        results[benchmark.name] = statistics
+
+        if verbose:
+            if 'error' in statistics:
+                print('{0}: {1}'.format(benchmark.name, statistics['error']))
+            else:
+                print('{0}: {1:.6g}s'.format(benchmark.name,
+                                             statistics['median']))
+
+    return OrderedDict((('metadata', _metadata()), ('results', results)))
+
+
+def write_results(results, path):
+    """
+    Writes given benchmarks results to given *JSON* file.
+
+    Parameters
+    ----------
+    results : dict_like
+        Benchmarks results.
+    path : unicode
+        *JSON* file path.
+
+    Returns
+    -------
+    bool
+        Definition success.
+    """
+
+    with open(path, 'w') as file_:
+        json.dump(results, file_, indent=4)
+
+    return True
+
+
+def read_results(path):
+    """
+    Reads the benchmarks results from given *JSON* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *JSON* file path.
+
+    Returns
+    -------
+    OrderedDict
+        Benchmarks results.
+    """
+
+    with open(path) as file_:
+        return json.load(file_, object_pairs_hook=OrderedDict)
+
+
+def compare_results(baseline, contender, threshold=REGRESSION_THRESHOLD):
+    """
+    Compares given benchmarks results.
+
+    Parameters
+    ----------
+    baseline : dict_like
+        Baseline benchmarks results.
+    contender : dict_like
+        Contender benchmarks results.
+    threshold : numeric, optional
+        Relative change of the median time above which a benchmark is flagged
+        as a regression or an improvement.
+
+    Returns
+    -------
+    list
+        Benchmarks comparisons.
+
+    Examples
+    --------
+    >>> baseline = {'results': {'a': {'median': 1.0}, 'b': {'median': 1.0}}}
+    >>> contender = {'results': {'a': {'median': 1.5}, 'b': {'median': 1.05}}}
+    >>> [c.status for c in compare_results(baseline, contender)]
+    ['Regression', 'Unchanged']
+    """
+
+    baseline, contender = baseline['results'], contender['results']
+
+    comparisons = []
+    for name in list(baseline.keys()) + [
+            name for name in contender.keys() if name not in baseline
+    ]:
+        b = baseline.get(name, {}).get('median')
+        c = contender.get(name, {}).get('median')
+
+        if name not in baseline:
+            status, ratio = 'New', None
+        elif name not in contender:
+            status, ratio = 'Missing', None
+        elif b is None or c is None:
+            status, ratio = 'Failed', None
+        else:
+            ratio = c / b
+            if ratio > 1 + threshold:
+                status = 'Regression'
+            elif ratio < 1 / (1 + threshold):
+                status = 'Improvement'
+            else:
+                status = 'Unchanged'
+
+        comparisons.append(BenchmarkComparison(name, b, c, ratio, status))
+
+    return comparisons
+
+
+def format_comparison(comparisons):
+    """
+    Formats given benchmarks comparisons as a table.
+
+    Parameters
+    ----------
+    comparisons : list
+        Benchmarks comparisons.
+
+    Returns
+    -------
+    unicode
+        Benchmarks comparisons table.
+    """
+
+    def time(value):
+        """
+        Formats given time.
+        """
+
+        return '-' if value is None else '{0:.4g}s'.format(value)
+
+    rows = [('Benchmark', 'Baseline', 'Contender', 'Ratio', 'Status')]
+    rows.extend((comparison.name, time(comparison.baseline),
+                 time(comparison.contender), '-' if comparison.ratio is None
+                 else '{0:.2f}'.format(comparison.ratio), comparison.status)
+                for comparison in comparisons)
+
+    widths = [max(len(row[i]) for row in rows) for i in range(5)]
+
+    return '\n'.join('  '.join(
+        value.ljust(width) for value, width in zip(row, widths)).rstrip()
+                     for row in rows)
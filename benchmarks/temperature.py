@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Temperature Benchmarks
+=============================
+
+Defines the benchmarks for :mod:`colour.temperature` package.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.temperature import uv_to_CCT
+
+from benchmarks.common import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TimeUvToCCT']
+
+
+class TimeUvToCCT(object):
+    """
+    Benchmarks :func:`colour.uv_to_CCT` definition.
+    """
+
+    params = [['Ohno 2013', 'Robertson 1968'], ['scalar', '1K']]
+    param_names = ['method', 'size']
+
+    def setup(self, method, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        # Chromaticity coordinates in the vicinity of the planckian locus.
+        self.uv = (np.array([0.1978, 0.3122]) +
+                   random_array(size, 2, -0.01, 0.01))
+
+    def time_uv_to_CCT(self, method, size):
+        """
+        Benchmarks :func:`colour.uv_to_CCT` definition.
+        """
+
+        uv_to_CCT(self.uv, method)
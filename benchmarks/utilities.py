@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Utilities Benchmarks
+====================
+
+Defines the micro-benchmarks for :mod:`colour.utilities` package errors and
+warnings handling, the ``time_errstate`` and ``time_catch_warnings`` methods
+time the per-call mechanisms the decorators previously relied on.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import warnings
+
+from colour.utilities import (ignore_numpy_errors, ignore_python_warnings,
+                              numpy_errors_state, set_warnings_rate_limit,
+                              suppress_warnings, warning)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TimeNumpyErrors', 'TimePythonWarnings', 'TimeWarning']
+
+_ERRSTATE = np.errstate(all='ignore')
+
+
+def _function():
+    """
+    Definition doing nothing.
+    """
+
+    return None
+
+
+class TimeNumpyErrors(object):
+    """
+    Benchmarks the *Numpy* errors handling per-call overhead.
+    """
+
+    def setup(self):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.decorated = ignore_numpy_errors(_function)
+
+    def time_undecorated(self):
+        """
+        Benchmarks an undecorated definition.
+        """
+
+        _function()
+
+    def time_errstate(self):
+        """
+        Benchmarks a definition called within a :class:`np.errstate` class
+        instance.
+        """
+
+        with _ERRSTATE:
+            _function()
+
+    def time_ignore_numpy_errors(self):
+        """
+        Benchmarks a definition decorated with
+        :func:`colour.utilities.ignore_numpy_errors` definition.
+        """
+
+        self.decorated()
+
+    def time_ignore_numpy_errors_hoisted(self):
+        """
+        Benchmarks 100 calls of a definition decorated with
+        :func:`colour.utilities.ignore_numpy_errors` definition within
+        :func:`colour.utilities.numpy_errors_state` definition.
+        """
+
+        with numpy_errors_state(all='ignore'):
+            for _ in range(100):
+                self.decorated()
+
+
+class TimePythonWarnings(object):
+    """
+    Benchmarks the *Python* warnings handling per-call overhead.
+    """
+
+    def setup(self):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.decorated = ignore_python_warnings(_function)
+        self.nested = ignore_python_warnings(
+            lambda: [self.decorated() for _ in range(100)])
+
+    def time_catch_warnings(self):
+        """
+        Benchmarks a definition called within a
+        :class:`warnings.catch_warnings` class instance.
+        """
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+
+            _function()
+
+    def time_ignore_python_warnings(self):
+        """
+        Benchmarks a definition decorated with
+        :func:`colour.utilities.ignore_python_warnings` definition.
+        """
+
+        self.decorated()
+
+    def time_ignore_python_warnings_nested(self):
+        """
+        Benchmarks 100 calls of a definition decorated with
+        :func:`colour.utilities.ignore_python_warnings` definition by a
+        decorated definition.
+        """
+
+        self.nested()
+
+
+class TimeWarning(object):
+    """
+    Benchmarks :func:`colour.utilities.warning` definition per-call overhead
+    with filtered warnings.
+    """
+
+    params = [[None, 1]]
+    param_names = ['limit']
+
+    def setup(self, limit):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.context = suppress_warnings()
+        self.context.__enter__()
+        set_warnings_rate_limit(limit)
+
+    def teardown(self, limit):
+        """
+        Restores the warnings state.
+        """
+
+        set_warnings_rate_limit()
+        self.context.__exit__(None, None, None)
+
+    def time_warning(self, limit):
+        """
+        Benchmarks :func:`colour.utilities.warning` definition.
+        """
+
+        warning('"domain" and "range" variables have different size!')
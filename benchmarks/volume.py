@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Volume Benchmarks
+========================
+
+Defines the benchmarks for :mod:`colour.volume` package.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.models import RGB_COLOURSPACES
+from colour.volume import (RGB_colourspace_volume_MonteCarlo,
+                           is_within_macadam_limits, is_within_pointer_gamut,
+                           is_within_visible_spectrum)
+
+from benchmarks.common import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TimeRGBColourspaceVolumeMonteCarlo', 'TimeIsWithin',
+    'TimeIsWithinVisibleSpectrum'
+]
+
+
+class TimeRGBColourspaceVolumeMonteCarlo(object):
+    """
+    Benchmarks :func:`colour.RGB_colourspace_volume_MonteCarlo` definition.
+    """
+
+    params = [[10000, 100000]]
+    param_names = ['samples']
+
+    def setup(self, samples):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.colourspace = RGB_COLOURSPACES['sRGB']
+
+    def time_RGB_colourspace_volume_MonteCarlo(self, samples):
+        """
+        Benchmarks :func:`colour.RGB_colourspace_volume_MonteCarlo`
+        definition.
+        """
+
+        RGB_colourspace_volume_MonteCarlo(
+            self.colourspace,
+            samples,
+            random_state=np.random.RandomState(4),
+            processes=1)
+
+
+class TimeIsWithin(object):
+    """
+    Benchmarks the *is within* definitions.
+    """
+
+    params = [['scalar', '1K', 'HD', '4K']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.XYZ = random_array(size)
+        self.xyY = random_array(size)
+
+    def time_is_within_macadam_limits(self, size):
+        """
+        Benchmarks :func:`colour.is_within_macadam_limits` definition.
+        """
+
+        is_within_macadam_limits(self.xyY, 'A')
+
+    def time_is_within_pointer_gamut(self, size):
+        """
+        Benchmarks :func:`colour.is_within_pointer_gamut` definition.
+        """
+
+        is_within_pointer_gamut(self.XYZ)
+
+
+class TimeIsWithinVisibleSpectrum(object):
+    """
+    Benchmarks :func:`colour.is_within_visible_spectrum` definition.
+
+    Notes
+    -----
+    -   *HD* and *4K* sizes are not benchmarked as they take tens of seconds.
+    """
+
+    params = [['scalar', '1K']]
+    param_names = ['size']
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        self.XYZ = random_array(size)
+
+    def time_is_within_visible_spectrum(self, size):
+        """
+        Benchmarks :func:`colour.is_within_visible_spectrum` definition.
+        """
+
+        is_within_visible_spectrum(self.XYZ)
@@ -37,102 +37,12 @@ from __future__ import absolute_import
 
 import numpy as np
 import sys
+from collections import OrderedDict
 
 from .utilities.deprecation import (FutureAccessChange, FutureAccessRemove,
                                     ModuleAPI, Removed, Renamed)
 from .utilities.documentation import is_documentation_building
-
-from .adaptation import (CHROMATIC_ADAPTATION_METHODS,
-                         CHROMATIC_ADAPTATION_TRANSFORMS,
-                         CMCCAT2000_VIEWING_CONDITIONS, chromatic_adaptation)
-from .algebra import (
-    CubicSplineInterpolator, Extrapolator, KernelInterpolator,
-    LinearInterpolator, NullInterpolator, PchipInterpolator,
-    SpragueInterpolator, kernel_cardinal_spline, kernel_lanczos, kernel_linear,
-    kernel_nearest_neighbour, kernel_sinc, lagrange_coefficients)
-from .colorimetry import (
-    ASTME30815_PRACTISE_SHAPE, BANDPASS_CORRECTION_METHODS,
-    CIE_standard_illuminant_A_function, CMFS, DEFAULT_SPECTRAL_SHAPE,
-    D_illuminant_relative_spd, HUNTERLAB_ILLUMINANTS, ILLUMINANTS,
-    ILLUMINANTS_SPDS, LEFS, LIGHTNESS_METHODS, LIGHT_SOURCES,
-    LIGHT_SOURCES_SPDS, LMS_CMFS, LUMINANCE_METHODS,
-    MULTI_SPECTRAL_TO_XYZ_METHODS, MultiSpectralPowerDistribution,
-    PHOTOPIC_LEFS, RGB_CMFS, SCOTOPIC_LEFS, SPECTRAL_TO_XYZ_METHODS,
-    STANDARD_OBSERVERS_CMFS, SpectralPowerDistribution, SpectralShape,
-    WHITENESS_METHODS, YELLOWNESS_METHODS, bandpass_correction, blackbody_spd,
-    colorimetric_purity, complementary_wavelength, constant_spd,
-    dominant_wavelength, excitation_purity, lightness, luminance,
-    luminous_efficacy, luminous_efficiency, luminous_flux,
-    mesopic_luminous_efficiency_function, multi_spectral_to_XYZ, ones_spd,
-    spectral_to_XYZ, wavelength_to_XYZ, whiteness, yellowness, zeros_spd)
-from .blindness import (
-    CVD_MATRICES_MACHADO2010, anomalous_trichromacy_cmfs_Machado2009,
-    anomalous_trichromacy_matrix_Machado2009, cvd_matrix_Machado2009)
-from .appearance import (
-    ATD95_Specification, CAM16_Specification, CAM16_VIEWING_CONDITIONS,
-    CAM16_to_XYZ, CIECAM02_Specification, CIECAM02_VIEWING_CONDITIONS,
-    CIECAM02_to_XYZ, HUNT_VIEWING_CONDITIONS, Hunt_Specification,
-    LLAB_Specification, LLAB_VIEWING_CONDITIONS, Nayatani95_Specification,
-    RLAB_D_FACTOR, RLAB_Specification, RLAB_VIEWING_CONDITIONS, XYZ_to_ATD95,
-    XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt, XYZ_to_LLAB, XYZ_to_Nayatani95,
-    XYZ_to_RLAB)
-from .difference import DELTA_E_METHODS, delta_E
-from .characterisation import (CAMERAS_RGB_SPECTRAL_SENSITIVITIES,
-                               COLOURCHECKERS, COLOURCHECKERS_SPDS,
-                               DISPLAYS_RGB_PRIMARIES, first_order_colour_fit)
-from .io import (IES_TM2714_Spd, read_image, read_spds_from_csv_file,
-                 read_spds_from_xrite_file, read_spectral_data_from_csv_file,
-                 write_image, write_spds_to_csv_file)
-from .models import (
-    CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
-    CAM02UCS_to_JMh_CIECAM02, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
-    CAM16UCS_to_JMh_CAM16, CMYK_to_CMY, CMY_to_CMYK, CMY_to_RGB, CV_range,
-    DIN99_to_Lab, EOTFS, EOTFS_REVERSE, HDR_CIELAB_METHODS, HDR_IPT_METHODS,
-    HSL_to_RGB, HSV_to_RGB, Hunter_Lab_to_XYZ, Hunter_Rdab_to_XYZ,
-    ICTCP_to_RGB, IPT_hue_angle, IPT_to_XYZ, JMh_CAM16_to_CAM16LCD,
-    JMh_CAM16_to_CAM16SCD, JMh_CAM16_to_CAM16UCS, JMh_CIECAM02_to_CAM02LCD,
-    JMh_CIECAM02_to_CAM02SCD, JMh_CIECAM02_to_CAM02UCS, JzAzBz_to_XYZ,
-    LCHab_to_Lab, LCHuv_to_Luv, LOG_DECODING_CURVES, LOG_ENCODING_CURVES,
-    Lab_to_DIN99, Lab_to_LCHab, Lab_to_XYZ, Luv_to_LCHuv, Luv_to_XYZ,
-    Luv_to_uv, Luv_uv_to_xy, OETFS, OETFS_REVERSE, OOTFS, OOTFS_REVERSE,
-    OSA_UCS_to_XYZ, POINTER_GAMUT_BOUNDARIES, POINTER_GAMUT_DATA,
-    POINTER_GAMUT_ILLUMINANT, Prismatic_to_RGB, RGB_COLOURSPACES,
-    RGB_Colourspace, RGB_luminance, RGB_luminance_equation, RGB_to_CMY,
-    RGB_to_HSL, RGB_to_HSV, RGB_to_ICTCP, RGB_to_Prismatic, RGB_to_RGB,
-    RGB_to_RGB_matrix, RGB_to_XYZ, RGB_to_YCbCr, RGB_to_YcCbcCrc, RGB_to_YCoCg,
-    UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy, UVW_to_XYZ, XYZ_to_Hunter_Lab,
-    XYZ_to_Hunter_Rdab, XYZ_to_IPT, XYZ_to_JzAzBz, XYZ_to_K_ab_HunterLab1966,
-    XYZ_to_Lab, XYZ_to_Luv, XYZ_to_OSA_UCS, XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW,
-    XYZ_to_hdr_CIELab, XYZ_to_hdr_IPT, XYZ_to_sRGB, XYZ_to_xy, XYZ_to_xyY,
-    YCBCR_WEIGHTS, YCbCr_to_RGB, YcCbcCrc_to_RGB, YCoCg_to_RGB,
-    chromatically_adapted_primaries, eotf, eotf_reverse, full_to_legal,
-    function_gamma, function_linear, hdr_CIELab_to_XYZ, hdr_IPT_to_XYZ,
-    legal_to_full, log_decoding_curve, log_encoding_curve,
-    normalised_primary_matrix, oetf, oetf_reverse, ootf, ootf_reverse,
-    primaries_whitepoint, sRGB_to_XYZ,
-    spectral_to_aces_relative_exposure_values, xyY_to_XYZ, xyY_to_xy,
-    xy_to_Luv_uv, xy_to_UCS_uv, xy_to_XYZ, xy_to_xyY)
-from .corresponding import (BRENEMAN_EXPERIMENTS,
-                            BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES,
-                            CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS,
-                            corresponding_chromaticities_prediction)
-from .phenomena import (rayleigh_scattering, rayleigh_scattering_spd,
-                        scattering_cross_section)
-from .notation import (MUNSELL_COLOURS, MUNSELL_VALUE_METHODS,
-                       munsell_colour_to_xyY, munsell_value,
-                       xyY_to_munsell_colour)
-from .quality import (colour_quality_scale, colour_rendering_index)
-from .recovery import (REFLECTANCE_RECOVERY_METHODS, XYZ_to_spectral)
-from .temperature import (CCT_TO_UV_METHODS, CCT_TO_XY_METHODS, CCT_to_uv,
-                          CCT_to_xy, UV_TO_CCT_METHODS, XY_TO_CCT_METHODS,
-                          uv_to_CCT, xy_to_CCT)
-from .volume import (
-    ILLUMINANTS_OPTIMAL_COLOUR_STIMULI, RGB_colourspace_limits,
-    RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
-    RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
-    RGB_colourspace_volume_MonteCarlo,
-    RGB_colourspace_volume_coverage_MonteCarlo, is_within_macadam_limits,
-    is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
+from .utilities.instrumentation import _setup_instrumentation_from_environment
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -141,121 +51,167 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
+_SUBPACKAGES_ATTRIBUTES = OrderedDict((
+    ('adaptation', [
+        'CHROMATIC_ADAPTATION_METHODS', 'CHROMATIC_ADAPTATION_TRANSFORMS',
+        'CMCCAT2000_VIEWING_CONDITIONS', 'chromatic_adaptation'
+    ]),
+    ('algebra', [
+        'CubicSplineInterpolator', 'Extrapolator', 'KernelInterpolator',
+        'LinearInterpolator', 'NullInterpolator', 'PchipInterpolator',
+        'SpragueInterpolator', 'kernel_cardinal_spline', 'kernel_lanczos',
+        'kernel_linear', 'kernel_nearest_neighbour', 'kernel_sinc',
+        'lagrange_coefficients'
+    ]),
+    ('colorimetry', [
+        'ASTME30815_PRACTISE_SHAPE', 'BANDPASS_CORRECTION_METHODS',
+        'CIE_standard_illuminant_A_function', 'CMFS', 'DEFAULT_SPECTRAL_SHAPE',
+        'D_illuminant_relative_spd', 'HUNTERLAB_ILLUMINANTS', 'ILLUMINANTS',
+        'ILLUMINANTS_SPDS', 'LEFS', 'LIGHTNESS_METHODS', 'LIGHT_SOURCES',
+        'LIGHT_SOURCES_SPDS', 'LMS_CMFS', 'LUMINANCE_METHODS',
+        'MULTI_SPECTRAL_TO_XYZ_METHODS', 'MultiSpectralPowerDistribution',
+        'PHOTOPIC_LEFS', 'RGB_CMFS', 'SCOTOPIC_LEFS',
+        'SPECTRAL_TO_XYZ_METHODS', 'STANDARD_OBSERVERS_CMFS',
+        'SpectralPowerDistribution', 'SpectralShape', 'WHITENESS_METHODS',
+        'YELLOWNESS_METHODS', 'bandpass_correction', 'blackbody_spd',
+        'colorimetric_purity', 'complementary_wavelength', 'constant_spd',
+        'dominant_wavelength', 'excitation_purity', 'lightness', 'luminance',
+        'luminous_efficacy', 'luminous_efficiency', 'luminous_flux',
+        'multi_spectral_to_XYZ', 'mesopic_luminous_efficiency_function',
+        'ones_spd', 'spectral_to_XYZ', 'wavelength_to_XYZ', 'whiteness',
+        'yellowness', 'zeros_spd'
+    ]),
+    ('blindness', [
+        'CVD_MATRICES_MACHADO2010', 'anomalous_trichromacy_cmfs_Machado2009',
+        'anomalous_trichromacy_matrix_Machado2009', 'cvd_matrix_Machado2009',
+        'cvd_simulation_Machado2009'
+    ]),
+    ('appearance', [
+        'ATD95_Specification', 'CAM16_Specification',
+        'CAM16_VIEWING_CONDITIONS', 'CAM16_to_XYZ', 'CIECAM02_Specification',
+        'CIECAM02_VIEWING_CONDITIONS', 'CIECAM02_to_XYZ',
+        'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification', 'LLAB_Specification',
+        'LLAB_VIEWING_CONDITIONS', 'Nayatani95_Specification', 'RLAB_D_FACTOR',
+        'RLAB_Specification', 'RLAB_VIEWING_CONDITIONS', 'XYZ_to_ATD95',
+        'XYZ_to_CAM16', 'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB',
+        'XYZ_to_Nayatani95', 'XYZ_to_RLAB'
+    ]),
+    ('difference', [
+        'DELTA_E_METHODS', 'delta_E'
+    ]),
+    ('characterisation', [
+        'CAMERAS_RGB_SPECTRAL_SENSITIVITIES', 'COLOURCHECKERS',
+        'COLOURCHECKERS_SPDS', 'DISPLAYS_RGB_PRIMARIES',
+        'POLYNOMIAL_EXPANSION_METHODS', 'colour_correction',
+        'colour_correction_matrix', 'first_order_colour_fit',
+        'polynomial_expansion'
+    ]),
+    ('io', [
+        'IES_TM2714_Spd', 'READ_IMAGE_METHODS', 'WRITE_IMAGE_METHODS',
+        'read_image', 'read_multi_spd_from_csv_file',
+        'read_multi_spd_from_IES_TM2714_directory', 'read_spds_from_csv_file',
+        'read_spds_from_xrite_file', 'read_spectral_array_from_csv_file',
+        'read_spectral_data_from_csv_file', 'write_image',
+        'write_multi_spd_to_csv_file',
+        'write_multi_spd_to_IES_TM2714_directory', 'write_spds_to_csv_file',
+        'write_spectral_array_to_csv_file'
+    ]),
+    ('models', [
+        'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
+        'CAM02UCS_to_JMh_CIECAM02', 'CAM16LCD_to_JMh_CAM16',
+        'CAM16SCD_to_JMh_CAM16', 'CAM16UCS_to_JMh_CAM16', 'CMYK_to_CMY',
+        'CMY_to_CMYK', 'CMY_to_RGB', 'CV_lookup', 'CV_range', 'CV_table',
+        'DIN99_to_Lab', 'EOTFS', 'EOTFS_REVERSE', 'HDR_CIELAB_METHODS',
+        'HDR_IPT_METHODS', 'HSL_to_RGB',
+        'HSV_to_RGB', 'Hunter_Lab_to_XYZ', 'Hunter_Rdab_to_XYZ',
+        'ICTCP_to_RGB', 'IPT_hue_angle', 'IPT_to_XYZ', 'JMh_CAM16_to_CAM16LCD',
+        'JMh_CAM16_to_CAM16SCD', 'JMh_CAM16_to_CAM16UCS',
+        'JMh_CIECAM02_to_CAM02LCD', 'JMh_CIECAM02_to_CAM02SCD',
+        'JMh_CIECAM02_to_CAM02UCS', 'JzAzBz_to_XYZ', 'LCHab_to_Lab',
+        'LCHuv_to_Luv', 'LOG_DECODING_CURVES', 'LOG_ENCODING_CURVES',
+        'Lab_to_DIN99', 'Lab_to_LCHab', 'Lab_to_XYZ', 'Luv_to_LCHuv',
+        'Luv_to_XYZ', 'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS', 'OETFS_REVERSE',
+        'OOTFS', 'OOTFS_REVERSE', 'OSA_UCS_to_XYZ', 'POINTER_GAMUT_BOUNDARIES',
+        'POINTER_GAMUT_DATA', 'POINTER_GAMUT_ILLUMINANT', 'Prismatic_to_RGB',
+        'RGB_COLOURSPACES', 'RGB_Colourspace', 'RGB_luminance',
+        'RGB_luminance_equation', 'RGB_to_CMY', 'RGB_to_HSL', 'RGB_to_HSV',
+        'RGB_to_ICTCP', 'RGB_to_Prismatic', 'RGB_to_RGB', 'RGB_to_RGB_matrix',
+        'RGB_to_XYZ', 'RGB_to_YCbCr', 'RGB_to_YcCbcCrc', 'RGB_to_YCoCg',
+        'UCS_to_XYZ', 'UCS_to_uv', 'UCS_uv_to_xy', 'UVW_to_XYZ',
+        'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab', 'XYZ_to_IPT',
+        'XYZ_to_JzAzBz', 'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab',
+        'XYZ_to_Luv', 'XYZ_to_OSA_UCS', 'XYZ_to_RGB', 'XYZ_to_UCS',
+        'XYZ_to_UVW', 'XYZ_to_hdr_CIELab', 'XYZ_to_hdr_IPT', 'XYZ_to_sRGB',
+        'XYZ_to_xy', 'XYZ_to_xyY', 'YCBCR_SUBSAMPLINGS', 'YCBCR_WEIGHTS',
+        'YCbCr_to_RGB', 'YCbCr_to_planar', 'YcCbcCrc_to_RGB', 'YCoCg_to_RGB',
+        'chromatically_adapted_primaries',
+        'eotf', 'eotf_reverse', 'full_to_legal', 'function_gamma',
+        'function_linear', 'hdr_CIELab_to_XYZ', 'hdr_IPT_to_XYZ',
+        'legal_to_full', 'log_decoding_curve', 'log_encoding_curve',
+        'normalised_primary_matrix', 'oetf', 'oetf_reverse', 'ootf',
+        'ootf_reverse', 'planar_to_YCbCr', 'primaries_whitepoint',
+        'sRGB_to_XYZ',
+        'spectral_to_aces_relative_exposure_values', 'xyY_to_XYZ', 'xyY_to_xy',
+        'xy_to_Luv_uv', 'xy_to_UCS_uv', 'xy_to_XYZ', 'xy_to_xyY'
+    ]),
+    ('corresponding', [
+        'BRENEMAN_EXPERIMENTS',
+        'BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES',
+        'CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS',
+        'corresponding_chromaticities_prediction'
+    ]),
+    ('phenomena', [
+        'rayleigh_scattering', 'rayleigh_scattering_spd',
+        'scattering_cross_section'
+    ]),
+    ('notation', [
+        'MUNSELL_COLOURS', 'MUNSELL_VALUE_METHODS', 'munsell_colour_to_xyY',
+        'munsell_value', 'xyY_to_munsell_colour'
+    ]),
+    ('quality', [
+        'colour_quality_scale', 'colour_rendering_index',
+        'multi_colour_quality_scale', 'multi_colour_rendering_index'
+    ]),
+    ('recovery', [
+        'REFLECTANCE_RECOVERY_METHODS', 'XYZ_to_spectral'
+    ]),
+    ('temperature', [
+        'CCT_TO_UV_METHODS', 'CCT_TO_XY_METHODS', 'CCT_to_uv', 'CCT_to_xy',
+        'UV_TO_CCT_METHODS', 'XY_TO_CCT_METHODS', 'uv_to_CCT', 'xy_to_CCT'
+    ]),
+    ('volume', [
+        'ILLUMINANTS_OPTIMAL_COLOUR_STIMULI', 'RGB_colourspace_limits',
+        'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
+        'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+        'RGB_colourspace_volume_MonteCarlo',
+        'RGB_colourspace_volume_coverage_MonteCarlo',
+        'is_within_macadam_limits', 'is_within_mesh_volume',
+        'is_within_pointer_gamut', 'is_within_visible_spectrum'
+    ]),
+    ('biochemistry', []),
+    ('continuous', []),
+    ('plotting', []),
+))
+"""
+*Colour* sub-packages and their top-level attributes, the sub-packages are
+lazily imported on first access of either them or their top-level attributes.
+
+_SUBPACKAGES_ATTRIBUTES : OrderedDict
+"""
+
 __all__ = []
-__all__ += [
-    'CHROMATIC_ADAPTATION_METHODS', 'CHROMATIC_ADAPTATION_TRANSFORMS',
-    'CMCCAT2000_VIEWING_CONDITIONS', 'chromatic_adaptation'
-]
-__all__ += [
-    'CubicSplineInterpolator', 'Extrapolator', 'KernelInterpolator',
-    'LinearInterpolator', 'NullInterpolator', 'PchipInterpolator',
-    'SpragueInterpolator', 'kernel_cardinal_spline', 'kernel_lanczos',
-    'kernel_linear', 'kernel_nearest_neighbour', 'kernel_sinc',
-    'lagrange_coefficients'
-]
-__all__ += [
-    'ASTME30815_PRACTISE_SHAPE', 'BANDPASS_CORRECTION_METHODS',
-    'CIE_standard_illuminant_A_function', 'CMFS', 'DEFAULT_SPECTRAL_SHAPE',
-    'D_illuminant_relative_spd', 'HUNTERLAB_ILLUMINANTS', 'ILLUMINANTS',
-    'ILLUMINANTS_SPDS', 'LEFS', 'LIGHTNESS_METHODS', 'LIGHT_SOURCES',
-    'LIGHT_SOURCES_SPDS', 'LMS_CMFS', 'LUMINANCE_METHODS',
-    'MULTI_SPECTRAL_TO_XYZ_METHODS', 'MultiSpectralPowerDistribution',
-    'PHOTOPIC_LEFS', 'RGB_CMFS', 'SCOTOPIC_LEFS', 'SPECTRAL_TO_XYZ_METHODS',
-    'STANDARD_OBSERVERS_CMFS', 'SpectralPowerDistribution', 'SpectralShape',
-    'WHITENESS_METHODS', 'YELLOWNESS_METHODS', 'bandpass_correction',
-    'blackbody_spd', 'colorimetric_purity', 'complementary_wavelength',
-    'constant_spd', 'dominant_wavelength', 'excitation_purity', 'lightness',
-    'luminance', 'luminous_efficacy', 'luminous_efficiency', 'luminous_flux',
-    'multi_spectral_to_XYZ', 'mesopic_luminous_efficiency_function',
-    'ones_spd', 'spectral_to_XYZ', 'wavelength_to_XYZ', 'whiteness',
-    'yellowness', 'zeros_spd'
-]
-__all__ += [
-    'CVD_MATRICES_MACHADO2010', 'anomalous_trichromacy_cmfs_Machado2009',
-    'anomalous_trichromacy_matrix_Machado2009', 'cvd_matrix_Machado2009'
-]
-__all__ += [
-    'ATD95_Specification', 'CAM16_Specification', 'CAM16_VIEWING_CONDITIONS',
-    'CAM16_to_XYZ', 'CIECAM02_Specification', 'CIECAM02_VIEWING_CONDITIONS',
-    'CIECAM02_to_XYZ', 'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification',
-    'LLAB_Specification', 'LLAB_VIEWING_CONDITIONS',
-    'Nayatani95_Specification', 'RLAB_D_FACTOR', 'RLAB_Specification',
-    'RLAB_VIEWING_CONDITIONS', 'XYZ_to_ATD95', 'XYZ_to_CAM16',
-    'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB', 'XYZ_to_Nayatani95',
-    'XYZ_to_RLAB'
-]
-__all__ += ['DELTA_E_METHODS', 'delta_E']
-__all__ += [
-    'CAMERAS_RGB_SPECTRAL_SENSITIVITIES', 'COLOURCHECKERS',
-    'COLOURCHECKERS_SPDS', 'DISPLAYS_RGB_PRIMARIES', 'first_order_colour_fit'
-]
-__all__ += [
-    'IES_TM2714_Spd', 'read_image', 'read_spds_from_csv_file',
-    'read_spds_from_xrite_file', 'read_spectral_data_from_csv_file',
-    'write_image', 'write_spds_to_csv_file'
-]
-__all__ += [
-    'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
-    'CAM02UCS_to_JMh_CIECAM02', 'CAM16LCD_to_JMh_CAM16',
-    'CAM16SCD_to_JMh_CAM16', 'CAM16UCS_to_JMh_CAM16', 'CMYK_to_CMY',
-    'CMY_to_CMYK', 'CMY_to_RGB', 'CV_range', 'DIN99_to_Lab', 'EOTFS',
-    'EOTFS_REVERSE', 'HDR_CIELAB_METHODS', 'HDR_IPT_METHODS', 'HSL_to_RGB',
-    'HSV_to_RGB', 'Hunter_Lab_to_XYZ', 'Hunter_Rdab_to_XYZ', 'ICTCP_to_RGB',
-    'IPT_hue_angle', 'IPT_to_XYZ', 'JMh_CAM16_to_CAM16LCD',
-    'JMh_CAM16_to_CAM16SCD', 'JMh_CAM16_to_CAM16UCS',
-    'JMh_CIECAM02_to_CAM02LCD', 'JMh_CIECAM02_to_CAM02SCD',
-    'JMh_CIECAM02_to_CAM02UCS', 'JzAzBz_to_XYZ', 'LCHab_to_Lab',
-    'LCHuv_to_Luv', 'LOG_DECODING_CURVES', 'LOG_ENCODING_CURVES',
-    'Lab_to_DIN99', 'Lab_to_LCHab', 'Lab_to_XYZ', 'Luv_to_LCHuv', 'Luv_to_XYZ',
-    'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS', 'OETFS_REVERSE', 'OOTFS',
-    'OOTFS_REVERSE', 'OSA_UCS_to_XYZ', 'POINTER_GAMUT_BOUNDARIES',
-    'POINTER_GAMUT_DATA', 'POINTER_GAMUT_ILLUMINANT', 'Prismatic_to_RGB',
-    'RGB_COLOURSPACES', 'RGB_Colourspace', 'RGB_luminance',
-    'RGB_luminance_equation', 'RGB_to_CMY', 'RGB_to_HSL', 'RGB_to_HSV',
-    'RGB_to_ICTCP', 'RGB_to_Prismatic', 'RGB_to_RGB', 'RGB_to_RGB_matrix',
-    'RGB_to_XYZ', 'RGB_to_YCbCr', 'RGB_to_YcCbcCrc', 'RGB_to_YCoCg',
-    'UCS_to_XYZ', 'UCS_to_uv', 'UCS_uv_to_xy', 'UVW_to_XYZ',
-    'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab', 'XYZ_to_IPT', 'XYZ_to_JzAzBz',
-    'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab', 'XYZ_to_Luv', 'XYZ_to_OSA_UCS',
-    'XYZ_to_RGB', 'XYZ_to_UCS', 'XYZ_to_UVW', 'XYZ_to_hdr_CIELab',
-    'XYZ_to_hdr_IPT', 'XYZ_to_sRGB', 'XYZ_to_xy', 'XYZ_to_xyY',
-    'YCBCR_WEIGHTS', 'YCbCr_to_RGB', 'YcCbcCrc_to_RGB', 'YCoCg_to_RGB',
-    'chromatically_adapted_primaries', 'eotf', 'eotf_reverse', 'full_to_legal',
-    'function_gamma', 'function_linear', 'hdr_CIELab_to_XYZ', 'hdr_IPT_to_XYZ',
-    'legal_to_full', 'log_decoding_curve', 'log_encoding_curve',
-    'normalised_primary_matrix', 'oetf', 'oetf_reverse', 'ootf',
-    'ootf_reverse', 'primaries_whitepoint', 'sRGB_to_XYZ',
-    'spectral_to_aces_relative_exposure_values', 'xyY_to_XYZ', 'xyY_to_xy',
-    'xy_to_Luv_uv', 'xy_to_UCS_uv', 'xy_to_XYZ', 'xy_to_xyY'
-]
-__all__ += [
-    'BRENEMAN_EXPERIMENTS', 'BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES',
-    'CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS',
-    'corresponding_chromaticities_prediction'
-]
-__all__ += [
-    'rayleigh_scattering', 'rayleigh_scattering_spd',
-    'scattering_cross_section'
-]
-__all__ += [
-    'MUNSELL_COLOURS', 'MUNSELL_VALUE_METHODS', 'munsell_colour_to_xyY',
-    'munsell_value', 'xyY_to_munsell_colour'
-]
-__all__ += ['colour_quality_scale', 'colour_rendering_index']
-__all__ += ['REFLECTANCE_RECOVERY_METHODS', 'XYZ_to_spectral']
-__all__ += [
-    'CCT_TO_UV_METHODS', 'CCT_TO_XY_METHODS', 'CCT_to_uv', 'CCT_to_xy',
-    'UV_TO_CCT_METHODS', 'XY_TO_CCT_METHODS', 'uv_to_CCT', 'xy_to_CCT'
-]
-__all__ += [
-    'ILLUMINANTS_OPTIMAL_COLOUR_STIMULI', 'RGB_colourspace_limits',
-    'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
-    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
-    'RGB_colourspace_volume_MonteCarlo',
-    'RGB_colourspace_volume_coverage_MonteCarlo', 'is_within_macadam_limits',
-    'is_within_mesh_volume', 'is_within_pointer_gamut',
-    'is_within_visible_spectrum'
-]
+_LAZY_ATTRIBUTES = {}
+for _subpackage, _attributes in _SUBPACKAGES_ATTRIBUTES.items():
+    __all__ += _attributes
+
+    _LAZY_ATTRIBUTES[_subpackage] = 'colour.{0}'.format(_subpackage)
+    for _attribute in _attributes:
+        _LAZY_ATTRIBUTES[_attribute] = 'colour.{0}.{1}'.format(
+            _subpackage, _attribute)
+
+del OrderedDict, _subpackage, _attributes, _attribute
+
+
 __application_name__ = 'Colour'
 
 __major_version__ = '0'
@@ -1628,6 +1584,22 @@ if not is_documentation_building():
     del is_documentation_building
     del _setup_api_changes
 
-    sys.modules['colour'] = colour(sys.modules['colour'], API_CHANGES)
+    sys.modules['colour'] = colour(sys.modules['colour'], API_CHANGES,
+                                   _LAZY_ATTRIBUTES)
 
     del sys
+else:
+    # Documentation tools inspect the module namespace directly, thus the
+    # lazy attributes are imported eagerly.
+    for _attribute in __all__:
+        getattr(colour(sys.modules['colour'], lazy=_LAZY_ATTRIBUTES),
+                _attribute)
+
+    del _attribute
+
+# ----------------------------------------------------------------------------#
+# ---                           Instrumentation                            ---#
+# ----------------------------------------------------------------------------#
+_setup_instrumentation_from_environment()
+
+del _setup_instrumentation_from_environment
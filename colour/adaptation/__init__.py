@@ -35,7 +35,8 @@ from .fairchild1990 import chromatic_adaptation_Fairchild1990
 from .cmccat2000 import (
     CMCCAT2000_InductionFactors, CMCCAT2000_VIEWING_CONDITIONS,
     chromatic_adaptation_forward_CMCCAT2000,
-    chromatic_adaptation_reverse_CMCCAT2000, chromatic_adaptation_CMCCAT2000)
+    chromatic_adaptation_reverse_CMCCAT2000,
+    chromatic_adaptation_matrix_CMCCAT2000, chromatic_adaptation_CMCCAT2000)
 from .cie1994 import chromatic_adaptation_CIE1994
 
 __all__ = []
@@ -48,7 +49,7 @@ __all__ += [
     'CMCCAT2000_InductionFactors', 'CMCCAT2000_VIEWING_CONDITIONS',
     'chromatic_adaptation_forward_CMCCAT2000',
     'chromatic_adaptation_reverse_CMCCAT2000',
-    'chromatic_adaptation_CMCCAT2000'
+    'chromatic_adaptation_matrix_CMCCAT2000', 'chromatic_adaptation_CMCCAT2000'
 ]
 __all__ += ['chromatic_adaptation_CIE1994']
 
@@ -9,6 +9,7 @@ Defines *CMCCAT2000* chromatic adaptation model objects:
 -   :class:`colour.CMCCAT2000_VIEWING_CONDITIONS`
 -   :func:`colour.adaptation.chromatic_adaptation_forward_CMCCAT2000`
 -   :func:`colour.adaptation.chromatic_adaptation_reverse_CMCCAT2000`
+-   :func:`colour.adaptation.chromatic_adaptation_matrix_CMCCAT2000`
 -   :func:`colour.adaptation.chromatic_adaptation_CMCCAT2000`
 
 See Also
@@ -33,7 +34,8 @@ import numpy as np
 from collections import namedtuple
 
 from colour.adaptation import CMCCAT2000_CAT
-from colour.utilities import CaseInsensitiveMapping, dot_vector
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              dot_vector, float_dtype)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -46,7 +48,7 @@ __all__ = [
     'CMCCAT2000_INVERSE_CAT', 'CMCCAT2000_InductionFactors',
     'CMCCAT2000_VIEWING_CONDITIONS', 'chromatic_adaptation_forward_CMCCAT2000',
     'chromatic_adaptation_reverse_CMCCAT2000',
-    'chromatic_adaptation_CMCCAT2000'
+    'chromatic_adaptation_matrix_CMCCAT2000', 'chromatic_adaptation_CMCCAT2000'
 ]
 
 CMCCAT2000_INVERSE_CAT = np.linalg.inv(CMCCAT2000_CAT)
@@ -92,6 +94,51 @@ CMCCAT2000_VIEWING_CONDITIONS : CaseInsensitiveMapping
 """
 
 
+def _cone_responses_gains_CMCCAT2000(XYZ_w, XYZ_wr, L_A1, L_A2, surround,
+                                     dtype):
+    """
+    Computes the *CMCCAT2000* forward chromatic adaptation gains of the cone
+    responses, i.e. the diagonal of the adaptation in the cone space.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        Test viewing condition *CIE XYZ* tristimulus values of the whitepoint.
+    XYZ_wr : array_like
+        Reference viewing condition *CIE XYZ* tristimulus values of the
+        whitepoint.
+    L_A1 : numeric or array_like
+        Luminance of test adapting field :math:`L_{A1}` in :math:`cd/m^2`.
+    L_A2 : numeric or array_like
+        Luminance of reference adapting field :math:`L_{A2}` in :math:`cd/m^2`.
+    surround : CMCCAT2000_InductionFactors
+        Surround viewing conditions induction factors.
+    dtype : object
+        Type the inputs are cast to.
+
+    Returns
+    -------
+    ndarray
+        Cone responses gains.
+    """
+
+    XYZ_w = as_float_array(XYZ_w, dtype)
+    XYZ_wr = as_float_array(XYZ_wr, dtype)
+    L_A1 = as_float_array(L_A1, dtype)
+    L_A2 = as_float_array(L_A2, dtype)
+
+    RGB_w = dot_vector(CMCCAT2000_CAT, XYZ_w)
+    RGB_wr = dot_vector(CMCCAT2000_CAT, XYZ_wr)
+
+    D = (surround.F * (0.08 * np.log10(0.5 * (L_A1 + L_A2)) + 0.76 - 0.45 *
+                       (L_A1 - L_A2) / (L_A1 + L_A2)))
+
+    D = as_float_array(np.clip(D, 0, 1), dtype)
+    a = D * XYZ_w[..., 1] / XYZ_wr[..., 1]
+
+    return a[..., np.newaxis] * (RGB_wr / RGB_w) + 1 - D[..., np.newaxis]
+
+
 def chromatic_adaptation_forward_CMCCAT2000(
         XYZ,
         XYZ_w,
@@ -153,23 +200,11 @@ def chromatic_adaptation_forward_CMCCAT2000(
     """
 
     XYZ = np.asarray(XYZ)
-    XYZ_w = np.asarray(XYZ_w)
-    XYZ_wr = np.asarray(XYZ_wr)
-    L_A1 = np.asarray(L_A1)
-    L_A2 = np.asarray(L_A2)
 
     RGB = dot_vector(CMCCAT2000_CAT, XYZ)
-    RGB_w = dot_vector(CMCCAT2000_CAT, XYZ_w)
-    RGB_wr = dot_vector(CMCCAT2000_CAT, XYZ_wr)
-
-    D = (surround.F * (0.08 * np.log10(0.5 * (L_A1 + L_A2)) + 0.76 - 0.45 *
-                       (L_A1 - L_A2) / (L_A1 + L_A2)))
 
-    D = np.clip(D, 0, 1)
-    a = D * XYZ_w[..., 1] / XYZ_wr[..., 1]
-
-    RGB_c = (RGB * (a[..., np.newaxis] *
-                    (RGB_wr / RGB_w) + 1 - D[..., np.newaxis]))
+    RGB_c = RGB * _cone_responses_gains_CMCCAT2000(
+        XYZ_w, XYZ_wr, L_A1, L_A2, surround, float_dtype(XYZ))
     XYZ_c = dot_vector(CMCCAT2000_INVERSE_CAT, RGB_c)
 
     return XYZ_c
@@ -237,28 +272,89 @@ def chromatic_adaptation_reverse_CMCCAT2000(
     """
 
     XYZ_c = np.asarray(XYZ_c)
-    XYZ_w = np.asarray(XYZ_w)
-    XYZ_wr = np.asarray(XYZ_wr)
-    L_A1 = np.asarray(L_A1)
-    L_A2 = np.asarray(L_A2)
 
     RGB_c = dot_vector(CMCCAT2000_CAT, XYZ_c)
-    RGB_w = dot_vector(CMCCAT2000_CAT, XYZ_w)
-    RGB_wr = dot_vector(CMCCAT2000_CAT, XYZ_wr)
-
-    D = (surround.F * (0.08 * np.log10(0.5 * (L_A1 + L_A2)) + 0.76 - 0.45 *
-                       (L_A1 - L_A2) / (L_A1 + L_A2)))
-
-    D = np.clip(D, 0, 1)
-    a = D * XYZ_w[..., 1] / XYZ_wr[..., 1]
 
-    RGB = (RGB_c / (a[..., np.newaxis] *
-                    (RGB_wr / RGB_w) + 1 - D[..., np.newaxis]))
+    RGB = RGB_c / _cone_responses_gains_CMCCAT2000(
+        XYZ_w, XYZ_wr, L_A1, L_A2, surround, float_dtype(XYZ_c))
     XYZ = dot_vector(CMCCAT2000_INVERSE_CAT, RGB)
 
     return XYZ
 
 
+def chromatic_adaptation_matrix_CMCCAT2000(
+        XYZ_w,
+        XYZ_wr,
+        L_A1,
+        L_A2,
+        surround=CMCCAT2000_VIEWING_CONDITIONS['Average'],
+        direction='Forward'):
+    """
+    Computes the *CMCCAT2000* chromatic adaptation matrix, or matrices, of
+    given viewing conditions.
+
+    The *CMCCAT2000* chromatic adaptation model is linear for given viewing
+    conditions, the returned matrices adapt the stimuli *CIE XYZ* tristimulus
+    values with :func:`colour.utilities.dot_vector` definition.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        Test viewing condition *CIE XYZ* tristimulus values of the whitepoint.
+    XYZ_wr : array_like
+        Reference viewing condition *CIE XYZ* tristimulus values of the
+        whitepoint.
+    L_A1 : numeric or array_like
+        Luminance of test adapting field :math:`L_{A1}` in :math:`cd/m^2`.
+    L_A2 : numeric or array_like
+        Luminance of reference adapting field :math:`L_{A2}` in :math:`cd/m^2`.
+    surround : CMCCAT2000_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    direction : unicode, optional
+        **{'Forward', 'Reverse'}**,
+        Chromatic adaptation direction.
+
+    Returns
+    -------
+    ndarray
+        Chromatic adaptation matrix, or matrices of shape (..., 3, 3) if
+        per-pixel or per-region whitepoints or adapting fields luminances are
+        given.
+
+    Notes
+    -----
+    -   Input *CIE XYZ_w* and *CIE XYZ_wr* tristimulus values are normalised
+        to domain [0, 100].
+
+    References
+    ----------
+    -   :cite:`Li2002a`
+    -   :cite:`Westland2012k`
+
+    Examples
+    --------
+    >>> XYZ = np.array([22.48, 22.74, 8.54])
+    >>> XYZ_w = np.array([111.15, 100.00, 35.20])
+    >>> XYZ_wr = np.array([94.81, 100.00, 107.30])
+    >>> L_A1 = 200
+    >>> L_A2 = 200
+    >>> from colour.utilities import dot_vector
+    >>> M = chromatic_adaptation_matrix_CMCCAT2000(XYZ_w, XYZ_wr, L_A1, L_A2)
+    >>> dot_vector(M, XYZ)  # doctest: +ELLIPSIS
+    array([ 19.5269832...,  23.0683396...,  24.9717522...])
+    """
+
+    XYZ_w = np.asarray(XYZ_w)
+
+    gains = _cone_responses_gains_CMCCAT2000(XYZ_w, XYZ_wr, L_A1, L_A2,
+                                             surround, float_dtype(XYZ_w))
+    if direction.lower() != 'forward':
+        gains = 1 / gains
+
+    return np.einsum('ij,...j,jk->...ik', CMCCAT2000_INVERSE_CAT, gains,
+                     CMCCAT2000_CAT)
+
+
 def chromatic_adaptation_CMCCAT2000(
         XYZ,
         XYZ_w,
@@ -27,7 +27,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.adaptation import VON_KRIES_CAT
-from colour.utilities import dot_vector, row_as_diagonal, tsplit, tstack
+from colour.utilities import (as_float_array, dot_vector, float_dtype,
+                              tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -116,9 +117,10 @@ def chromatic_adaptation_Fairchild1990(XYZ_1,
     """
 
     XYZ_1 = np.asarray(XYZ_1)
-    XYZ_n = np.asarray(XYZ_n)
-    XYZ_r = np.asarray(XYZ_r)
-    Y_n = np.asarray(Y_n)
+    dtype = float_dtype(XYZ_1)
+    XYZ_n = as_float_array(XYZ_n, dtype)
+    XYZ_r = as_float_array(XYZ_r, dtype)
+    Y_n = as_float_array(Y_n, dtype)
 
     LMS_1 = dot_vector(FAIRCHILD1990_XYZ_TO_RGB_MATRIX, XYZ_1)
     LMS_n = dot_vector(FAIRCHILD1990_XYZ_TO_RGB_MATRIX, XYZ_n)
@@ -130,18 +132,17 @@ def chromatic_adaptation_Fairchild1990(XYZ_1,
     a_LMS_1 = p_LMS / LMS_n
     a_LMS_2 = p_LMS / LMS_r
 
-    A_1 = row_as_diagonal(a_LMS_1)
-    A_2 = row_as_diagonal(a_LMS_2)
-
-    LMSp_1 = dot_vector(A_1, LMS_1)
+    # The :math:`A_1`, :math:`A_2` and :math:`C` matrices are diagonal, they
+    # are applied and inverted element-wise so that per-pixel or per-region
+    # whitepoints do not require building and inverting (..., 3, 3) matrices.
+    LMSp_1 = a_LMS_1 * LMS_1
 
-    c = 0.219 - 0.0784 * np.log10(Y_n)
-    C = row_as_diagonal(tstack((c, c, c)))
+    c = as_float_array(0.219 - 0.0784 * np.log10(Y_n), dtype)
 
-    LMS_a = dot_vector(C, LMSp_1)
-    LMSp_2 = dot_vector(np.linalg.inv(C), LMS_a)
+    LMS_a = c[..., np.newaxis] * LMSp_1
+    LMSp_2 = LMS_a / c[..., np.newaxis]
 
-    LMS_c = dot_vector(np.linalg.inv(A_2), LMSp_2)
+    LMS_c = LMSp_2 / a_LMS_2
     XYZ_c = dot_vector(FAIRCHILD1990_RGB_TO_XYZ_MATRIX, LMS_c)
 
     return XYZ_c
@@ -235,7 +236,7 @@ def degrees_of_adaptation(LMS, Y_n, v=1 / 3, discount_illuminant=False):
 
     L, M, S = tsplit(LMS)
 
-    LMS_E = dot_vector(VON_KRIES_CAT, np.ones(LMS.shape))  # E illuminant.
+    LMS_E = dot_vector(VON_KRIES_CAT, np.ones(3))  # E illuminant.
     L_E, M_E, S_E = tsplit(LMS_E)
 
     Ye_n = Y_n ** v
@@ -12,9 +12,10 @@ from itertools import permutations
 
 from colour.adaptation.cmccat2000 import (
     chromatic_adaptation_forward_CMCCAT2000,
-    chromatic_adaptation_reverse_CMCCAT2000)
+    chromatic_adaptation_reverse_CMCCAT2000,
+    chromatic_adaptation_matrix_CMCCAT2000)
 
-from colour.utilities import ignore_numpy_errors
+from colour.utilities import dot_vector, ignore_numpy_errors
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -25,7 +26,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestChromaticAdaptationForwardCMCCAT2000',
-    'TestChromaticAdaptationReverseCMCCAT2000'
+    'TestChromaticAdaptationReverseCMCCAT2000',
+    'TestChromaticAdaptationMatrixCMCCAT2000'
 ]
 
 
@@ -243,5 +245,62 @@ chromatic_adaptation_reverse_CMCCAT2000` definition nan support.
                                                     L_A2)
 
 
+class TestChromaticAdaptationMatrixCMCCAT2000(unittest.TestCase):
+    """
+    Defines :func:`colour.adaptation.cmccat2000.\
+chromatic_adaptation_matrix_CMCCAT2000` definition unit tests methods.
+    """
+
+    def test_chromatic_adaptation_matrix_CMCCAT2000(self):
+        """
+        Tests :func:`colour.adaptation.cmccat2000.\
+chromatic_adaptation_matrix_CMCCAT2000` definition.
+        """
+
+        XYZ = np.array([22.48, 22.74, 8.54])
+        XYZ_w = np.array([111.15, 100.00, 35.20])
+        XYZ_wr = np.array([94.81, 100.00, 107.30])
+
+        M = chromatic_adaptation_matrix_CMCCAT2000(XYZ_w, XYZ_wr, 200, 200)
+        np.testing.assert_almost_equal(
+            dot_vector(M, XYZ),
+            np.array([19.52698326, 23.06833960, 24.97175229]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            chromatic_adaptation_matrix_CMCCAT2000(
+                XYZ_w, XYZ_wr, 200, 200, direction='Reverse'),
+            np.linalg.inv(M),
+            decimal=7)
+
+    def test_whitepoints_map_chromatic_adaptation_matrix_CMCCAT2000(self):
+        """
+        Tests :func:`colour.adaptation.cmccat2000.\
+chromatic_adaptation_matrix_CMCCAT2000` definition whitepoints map support.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(10, 90, (2, 3, 3))
+        XYZ_w = np.random.RandomState(8).uniform(50, 150, (2, 3, 3))
+        XYZ_wr = np.array([94.81, 100.00, 107.30])
+        L_A1 = np.random.RandomState(16).uniform(50, 500, (2, 3))
+
+        M = chromatic_adaptation_matrix_CMCCAT2000(XYZ_w, XYZ_wr, L_A1, 200)
+        self.assertEqual(M.shape, (2, 3, 3, 3))
+        np.testing.assert_almost_equal(
+            dot_vector(M, XYZ),
+            chromatic_adaptation_forward_CMCCAT2000(XYZ, XYZ_w, XYZ_wr, L_A1,
+                                                    200),
+            decimal=7)
+
+        XYZ_c = chromatic_adaptation_forward_CMCCAT2000(
+            XYZ, XYZ_w, XYZ_wr, L_A1, 200)
+        for i in np.ndindex(2, 3):
+            np.testing.assert_almost_equal(
+                XYZ_c[i],
+                chromatic_adaptation_forward_CMCCAT2000(
+                    XYZ[i], XYZ_w[i], XYZ_wr, L_A1[i], 200),
+                decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -100,6 +100,25 @@ chromatic_adaptation_Fairchild1990` definition n-dimensional arrays support.
             XYZ_c,
             decimal=7)
 
+    def test_whitepoints_map_chromatic_adaptation_Fairchild1990(self):
+        """
+        Tests :func:`colour.adaptation.fairchild1990.\
+chromatic_adaptation_Fairchild1990` definition whitepoints map support.
+        """
+
+        XYZ_1 = np.random.RandomState(4).uniform(10, 90, (2, 3, 3))
+        XYZ_n = np.random.RandomState(8).uniform(50, 150, (2, 3, 3))
+        XYZ_r = np.array([94.81, 100.00, 107.30])
+        Y_n = np.random.RandomState(16).uniform(50, 500, (2, 3))
+
+        XYZ_c = chromatic_adaptation_Fairchild1990(XYZ_1, XYZ_n, XYZ_r, Y_n)
+        for i in np.ndindex(2, 3):
+            np.testing.assert_almost_equal(
+                XYZ_c[i],
+                chromatic_adaptation_Fairchild1990(XYZ_1[i], XYZ_n[i], XYZ_r,
+                                                   Y_n[i]),
+                decimal=7)
+
     @ignore_numpy_errors
     def test_nan_chromatic_adaptation_Fairchild1990(self):
         """
@@ -10,7 +10,8 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.adaptation import (chromatic_adaptation_matrix_VonKries,
+from colour.adaptation import (CHROMATIC_ADAPTATION_TRANSFORMS,
+                               chromatic_adaptation_matrix_VonKries,
                                chromatic_adaptation_VonKries)
 from colour.utilities import ignore_numpy_errors
 
@@ -133,6 +134,60 @@ chromatic_adaptation_matrix_VonKries` definition n-dimensional arrays support.
         np.testing.assert_almost_equal(
             chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr), M, decimal=7)
 
+    def test_cache_chromatic_adaptation_matrix_VonKries(self):
+        """
+        Tests :func:`colour.adaptation.vonkries.\
+chromatic_adaptation_matrix_VonKries` definition matrices cache.
+        """
+
+        XYZ_w = np.array([1.09846607, 1.00000000, 0.35582280])
+        XYZ_wr = np.array([0.95042855, 1.00000000, 1.08890037])
+
+        M = chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, 'Bradford')
+        M[...] = 0
+
+        np.testing.assert_almost_equal(
+            chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, 'bradford'),
+            np.array([
+                [0.84467949, -0.11793553, 0.39489408],
+                [-0.13664085, 1.10412369, 0.12919812],
+                [0.07986716, -0.13493155, 3.19288296],
+            ]),
+            decimal=7)
+
+        np.testing.assert_equal(
+            chromatic_adaptation_matrix_VonKries(XYZ_w + 1e-12, XYZ_wr),
+            chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr))
+
+        M = CHROMATIC_ADAPTATION_TRANSFORMS['Bradford']
+        try:
+            CHROMATIC_ADAPTATION_TRANSFORMS['Bradford'] = np.identity(3)
+            np.testing.assert_almost_equal(
+                chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr,
+                                                     'Bradford'),
+                np.diag(XYZ_wr / XYZ_w),
+                decimal=7)
+        finally:
+            CHROMATIC_ADAPTATION_TRANSFORMS['Bradford'] = M
+
+    def test_whitepoints_map_chromatic_adaptation_matrix_VonKries(self):
+        """
+        Tests :func:`colour.adaptation.vonkries.\
+chromatic_adaptation_matrix_VonKries` definition whitepoints map support.
+        """
+
+        XYZ_w = np.random.RandomState(4).uniform(0.5, 1.5, (2, 3, 3))
+        XYZ_wr = np.array([0.95042855, 1.00000000, 1.08890037])
+
+        M = chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, 'Bradford')
+        self.assertEqual(M.shape, (2, 3, 3, 3))
+        for i in np.ndindex(2, 3):
+            np.testing.assert_almost_equal(
+                M[i],
+                chromatic_adaptation_matrix_VonKries(XYZ_w[i], XYZ_wr,
+                                                     'Bradford'),
+                decimal=7)
+
     @ignore_numpy_errors
     def test_nan_chromatic_adaptation_matrix_VonKries(self):
         """
@@ -244,6 +299,29 @@ class TestChromaticAdaptationVonKries(unittest.TestCase):
             XYZ_a,
             decimal=7)
 
+    def test_whitepoints_map_chromatic_adaptation_VonKries(self):
+        """
+        Tests :func:`colour.adaptation.vonkries.chromatic_adaptation_VonKries`
+        definition whitepoints map support.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0, 1, (2, 3, 3))
+        XYZ_w = np.random.RandomState(8).uniform(0.5, 1.5, (2, 3, 3))
+        XYZ_wr = np.array([0.95042855, 1.00000000, 1.08890037])
+
+        XYZ_a = chromatic_adaptation_VonKries(XYZ, XYZ_w, XYZ_wr)
+        for i in np.ndindex(2, 3):
+            np.testing.assert_almost_equal(
+                XYZ_a[i],
+                chromatic_adaptation_VonKries(XYZ[i], XYZ_w[i], XYZ_wr),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            chromatic_adaptation_VonKries(XYZ, XYZ_w[:, :1], XYZ_wr),
+            chromatic_adaptation_VonKries(
+                XYZ, np.repeat(XYZ_w[:, :1], 3, axis=1), XYZ_wr),
+            decimal=7)
+
     @ignore_numpy_errors
     def test_nan_chromatic_adaptation_VonKries(self):
         """
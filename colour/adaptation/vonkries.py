@@ -26,7 +26,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.adaptation import CHROMATIC_ADAPTATION_TRANSFORMS
-from colour.utilities import dot_matrix, dot_vector, row_as_diagonal
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import dot_vector
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -36,9 +37,105 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
+    'CHROMATIC_ADAPTATION_MATRICES_CACHE_DECIMALS',
+    'CHROMATIC_ADAPTATION_MATRICES_CACHE_SIZE',
     'chromatic_adaptation_matrix_VonKries', 'chromatic_adaptation_VonKries'
 ]
 
+CHROMATIC_ADAPTATION_MATRICES_CACHE_DECIMALS = 10
+"""
+Decimals the whitepoints *CIE XYZ* tristimulus values are rounded to when
+keying the *chromatic adaptation* matrices cache, the cached matrices are
+computed with the rounded whitepoints so that they do not depend on the calls
+order.
+
+CHROMATIC_ADAPTATION_MATRICES_CACHE_DECIMALS : integer
+"""
+
+CHROMATIC_ADAPTATION_MATRICES_CACHE_SIZE = 1024
+"""
+Maximum count of *chromatic adaptation* matrices cached, the cache is cleared
+when it is reached.
+
+CHROMATIC_ADAPTATION_MATRICES_CACHE_SIZE : integer
+"""
+
+_CHROMATIC_ADAPTATION_MATRICES_CACHE = {}
+
+_CHROMATIC_ADAPTATION_TRANSFORMS_CACHE = {}
+
+
+def _chromatic_adaptation_transform(transform):
+    """
+    Returns given chromatic adaptation transform matrix and its inverse and
+    caches them if not existing.
+
+    The cache is keyed by the transform matrix values so that replacing a
+    :attr:`colour.CHROMATIC_ADAPTATION_TRANSFORMS` attribute item is honoured.
+
+    Parameters
+    ----------
+    transform : unicode
+        Chromatic adaptation transform.
+
+    Returns
+    -------
+    tuple
+        Chromatic adaptation transform matrix and its inverse.
+
+    Raises
+    ------
+    KeyError
+        If chromatic adaptation method is not defined.
+    """
+
+    M = CHROMATIC_ADAPTATION_TRANSFORMS.get(transform)
+
+    if M is None:
+        raise KeyError(
+            '"{0}" chromatic adaptation transform is not defined! Supported '
+            'methods: "{1}".'.format(transform,
+                                     CHROMATIC_ADAPTATION_TRANSFORMS.keys()))
+
+    M = np.asarray(M, dtype=DEFAULT_FLOAT_DTYPE)
+    key = M.tobytes()
+    matrices = _CHROMATIC_ADAPTATION_TRANSFORMS_CACHE.get(key)
+    if matrices is not None:
+        return matrices
+
+    matrices = _CHROMATIC_ADAPTATION_TRANSFORMS_CACHE[key] = (
+        M, np.linalg.inv(M))
+
+    return matrices
+
+
+def _chromatic_adaptation_matrix(XYZ_w, XYZ_wr, M, M_i):
+    """
+    Computes the *chromatic adaptation* matrices of given test and reference
+    viewing conditions whitepoints, i.e. :math:`M^{-1}DM` where :math:`D` is
+    the diagonal matrix of the cone responses ratios.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        Test viewing condition *CIE XYZ* tristimulus values of whitepoint.
+    XYZ_wr : array_like
+        Reference viewing condition *CIE XYZ* tristimulus values of whitepoint.
+    M : array_like
+        Chromatic adaptation transform matrix.
+    M_i : array_like
+        Chromatic adaptation transform inverse matrix.
+
+    Returns
+    -------
+    ndarray
+        Chromatic adaptation matrices of shape (..., 3, 3).
+    """
+
+    D = dot_vector(M, XYZ_wr) / dot_vector(M, XYZ_w)
+
+    return np.einsum('ij,...j,jk->...ik', M_i, D, M)
+
 
 def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     """
@@ -60,13 +157,24 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     Returns
     -------
     ndarray
-        Chromatic adaptation matrix.
+        Chromatic adaptation matrix, or matrices of shape (..., 3, 3) if
+        per-pixel or per-region whitepoints are given.
 
     Raises
     ------
     KeyError
         If chromatic adaptation method is not defined.
 
+    Notes
+    -----
+    -   The matrices of single test and reference whitepoints are cached,
+        keyed by the transform matrix and the whitepoints rounded to
+        :attr:`colour.adaptation.vonkries.\
+CHROMATIC_ADAPTATION_MATRICES_CACHE_DECIMALS` attribute decimals.
+    -   Whitepoints maps of shape (..., 3), e.g. for a spatially varying
+        white balance, are converted at once to matrices of shape
+        (..., 3, 3) with :func:`np.einsum` definition.
+
     References
     ----------
     -   :cite:`Fairchild2013t`
@@ -91,27 +199,37 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     array([[ 0.8446794..., -0.1179355...,  0.3948940...],
            [-0.1366408...,  1.1041236...,  0.1291981...],
            [ 0.0798671..., -0.1349315...,  3.1928829...]])
-    """
 
-    M = CHROMATIC_ADAPTATION_TRANSFORMS.get(transform)
+    Using a whitepoints map:
 
-    if M is None:
-        raise KeyError(
-            '"{0}" chromatic adaptation transform is not defined! Supported '
-            'methods: "{1}".'.format(transform,
-                                     CHROMATIC_ADAPTATION_TRANSFORMS.keys()))
+    >>> XYZ_w = np.array([[[1.09846607, 1.00000000, 0.35582280],
+    ...                    [0.95042855, 1.00000000, 1.08890037]]])
+    >>> chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr).shape
+    (1, 2, 3, 3)
+    """
 
-    rgb_w = np.einsum('...i,...ij->...j', XYZ_w, np.transpose(M))
-    rgb_wr = np.einsum('...i,...ij->...j', XYZ_wr, np.transpose(M))
+    M, M_i = _chromatic_adaptation_transform(transform)
 
-    D = rgb_wr / rgb_w
+    XYZ_w = np.asarray(XYZ_w)
+    XYZ_wr = np.asarray(XYZ_wr)
 
-    D = row_as_diagonal(D)
+    if XYZ_w.shape != (3, ) or XYZ_wr.shape != (3, ):
+        return _chromatic_adaptation_matrix(XYZ_w, XYZ_wr, M, M_i)
 
-    cat = dot_matrix(np.linalg.inv(M), D)
-    cat = dot_matrix(cat, M)
+    XYZ_wwr = np.around(
+        np.hstack([XYZ_w, XYZ_wr]),
+        CHROMATIC_ADAPTATION_MATRICES_CACHE_DECIMALS)
+    key = (M.tobytes(), XYZ_wwr.tobytes())
+    cat = _CHROMATIC_ADAPTATION_MATRICES_CACHE.get(key)
+    if cat is None:
+        if (len(_CHROMATIC_ADAPTATION_MATRICES_CACHE) >=
+                CHROMATIC_ADAPTATION_MATRICES_CACHE_SIZE):
+            _CHROMATIC_ADAPTATION_MATRICES_CACHE.clear()
 
-    return cat
+        cat = _CHROMATIC_ADAPTATION_MATRICES_CACHE[key] = (
+            _chromatic_adaptation_matrix(XYZ_wwr[:3], XYZ_wwr[3:], M, M_i))
+
+    return np.copy(cat)
 
 
 def chromatic_adaptation_VonKries(XYZ, XYZ_w, XYZ_wr, transform='CAT02'):
@@ -138,6 +256,12 @@ def chromatic_adaptation_VonKries(XYZ, XYZ_w, XYZ_wr, transform='CAT02'):
     ndarray
         *CIE XYZ_c* tristimulus values of the stimulus corresponding colour.
 
+    Notes
+    -----
+    -   Whitepoints maps of shape (..., 3) broadcasting against the stimulus,
+        e.g. for a spatially varying white balance, adapt the stimulus
+        without building the per-pixel *chromatic adaptation* matrices.
+
     References
     ----------
     -   :cite:`Fairchild2013t`
@@ -161,6 +285,16 @@ def chromatic_adaptation_VonKries(XYZ, XYZ_w, XYZ_wr, transform='CAT02'):
     array([ 0.0854032...,  0.1140122...,  0.2972149...])
     """
 
+    XYZ_w = np.asarray(XYZ_w)
+    XYZ_wr = np.asarray(XYZ_wr)
+
+    if XYZ_w.ndim > 1 or XYZ_wr.ndim > 1:
+        M, M_i = _chromatic_adaptation_transform(transform)
+
+        D = dot_vector(M, XYZ_wr) / dot_vector(M, XYZ_w)
+
+        return dot_vector(M_i, D * dot_vector(M, XYZ))
+
     cat = chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform)
     XYZ_a = dot_vector(cat, XYZ)
 
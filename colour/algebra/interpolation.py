@@ -49,6 +49,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 import scipy.interpolate
 from collections import OrderedDict, Mapping
+from fractions import Fraction
 from six.moves import reduce
 
 from colour.constants import DEFAULT_FLOAT_DTYPE
@@ -261,7 +262,8 @@ class KernelInterpolator(object):
         variable.
     y : array_like
         Dependent and already known :math:`y` variable values to
-        interpolate.
+        interpolate, a 2-D array of shape *(len(x), signals)* interpolates
+        the signals with a single set of kernel weights.
     window : int, optional
         Width of the window in samples on each side.
     kernel : callable, optional
@@ -271,6 +273,10 @@ class KernelInterpolator(object):
     padding_args : dict, optional
          Arguments to use when padding :math:`y` variable values with the
          :func:`np.pad` definition.
+    memory_budget : int, optional
+        Approximate memory in bytes used by the kernel weights and the
+        windowed :math:`y` variable values, the points are evaluated in
+        chunks fitting the budget.
     dtype : type
         Data type used for internal conversions.
 
@@ -282,6 +288,7 @@ class KernelInterpolator(object):
     kernel
     kernel_args
     padding_args
+    memory_budget
 
     Methods
     -------
@@ -324,6 +331,13 @@ class KernelInterpolator(object):
     ...     kernel_args={'a': 16})
     >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
     array([ 5.396179...,  5.652109...])
+
+    Interpolating multiple signals at once:
+
+    >>> f = KernelInterpolator(x, np.transpose([y, y * 2]))
+    >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
+    array([[  6.1806208...,  12.3612416...],
+           [  8.0823848...,  16.1647697...]])
     """
 
     def __init__(self,
@@ -333,9 +347,11 @@ class KernelInterpolator(object):
                  kernel=kernel_lanczos,
                  kernel_args=None,
                  padding_args=None,
+                 memory_budget=2 ** 26,
                  dtype=DEFAULT_FLOAT_DTYPE):
         self._x_p = None
         self._y_p = None
+        self._weights_cache = None
 
         self._x = None
         self._y = None
@@ -352,6 +368,8 @@ class KernelInterpolator(object):
         self.kernel = kernel
         self._kernel_args = {}
         self.kernel_args = kernel_args
+        self._memory_budget = None
+        self.memory_budget = memory_budget
 
         self._validate_dimensions()
 
@@ -392,6 +410,7 @@ class KernelInterpolator(object):
                          'unpredictable results may occur!'))
 
             self._x = value
+            self._weights_cache = None
 
             if self._window is not None:
                 self._x_p = np.pad(
@@ -430,13 +449,18 @@ class KernelInterpolator(object):
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
             self._y = value
 
             if self._window is not None:
-                self._y_p = np.pad(self._y, **self._padding_args)
+                padding_args = dict(self._padding_args)
+                pad_width = tuple(
+                    np.resize(np.ravel(padding_args.pop('pad_width')), 2))
+                self._y_p = np.pad(
+                    self._y, [pad_width] + [(0, 0)] * (value.ndim - 1),
+                    **padding_args)
 
     @property
     def window(self):
@@ -508,6 +532,7 @@ class KernelInterpolator(object):
                     'kernel', value))
 
             self._kernel = value
+            self._weights_cache = None
 
     @property
     def kernel_args(self):
@@ -539,6 +564,7 @@ class KernelInterpolator(object):
             ).format('kernel_args', value)
 
             self._kernel_args = value
+            self._weights_cache = None
 
     @property
     def padding_args(self):
@@ -575,6 +601,38 @@ class KernelInterpolator(object):
             if self._y is not None:
                 self.y = self._y
 
+    @property
+    def memory_budget(self):
+        """
+        Getter and setter property for the memory budget.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the memory budget with.
+
+        Returns
+        -------
+        int
+            Memory budget in bytes.
+        """
+
+        return self._memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, value):
+        """
+        Setter for the **self.memory_budget** property.
+        """
+
+        if value is not None:
+            assert is_integer(value), '"memory_budget" must be an integer!'
+
+            assert value >= 1, (
+                '"memory_budget" must be equal or superior to 1!')
+
+            self._memory_budget = int(value)
+
     def __call__(self, x):
         """
         Evaluates the interpolator at given point(s).
@@ -590,11 +648,17 @@ class KernelInterpolator(object):
             Interpolated value(s).
         """
 
+        is_scalar = np.ndim(x) == 0
         x = np.atleast_1d(x).astype(self._dtype)
 
-        xi = as_numeric(self._evaluate(x))
+        xi = self._evaluate(x)
 
-        return xi
+        # Multiple signals evaluated at a single point are returned without
+        # the points axis, as a single signal is returned as a scalar.
+        if is_scalar:
+            xi = xi[0]
+
+        return as_numeric(xi)
 
     def _evaluate(self, x):
         """
@@ -614,6 +678,62 @@ class KernelInterpolator(object):
         self._validate_dimensions()
         self._validate_interpolation_range(x)
 
+        shape = x.shape
+        x = np.ravel(x)
+
+        y_p = self._y_p
+        signals = y_p[0].size
+        chunk_size = max(
+            1, self._memory_budget // (
+                2 * self._window * (2 + signals) * y_p.itemsize))
+
+        periodic_weights = self._periodic_weights(x)
+
+        xi = np.empty((x.size, ) + y_p.shape[1:], dtype=self._dtype)
+        for i in range(0, x.size, chunk_size):
+            chunk = slice(i, i + chunk_size)
+            if periodic_weights is None:
+                windows, weights = self._weights(x[chunk])
+            else:
+                # The kernel is only evaluated where the kernel arguments
+                # differ from those of the first period, e.g. because of
+                # rounding, so that the weights are exactly those that would
+                # be computed for the points.
+                indexes = np.arange(i, min(i + chunk_size, x.size)) % (
+                    periodic_weights[0])
+                windows, arguments = self._kernel_arguments(x[chunk])
+                weights = periodic_weights[3][indexes]
+                mismatch = arguments != self._weights_cache[2][indexes]
+                if np.any(mismatch):
+                    weights = np.copy(weights)
+                    weights[mismatch] = self._kernel(arguments[mismatch],
+                                                     **self._kernel_args)
+
+            # Same reduction as the unchunked evaluation, i.e. a sum over the
+            # windows axis, so that the results do not depend on chunking.
+            weights = np.reshape(weights,
+                                 weights.shape + (1, ) * (y_p.ndim - 1))
+            xi[chunk] = np.sum(y_p[windows] * weights, axis=1)
+
+        return np.reshape(xi, shape + y_p.shape[1:])
+
+    def _kernel_arguments(self, x):
+        """
+        Returns the padded :math:`y` variable windows indexes and the kernel
+        arguments at given points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points to evaluate the kernel arguments at.
+
+        Returns
+        -------
+        tuple
+            Windows indexes and kernel arguments, both of shape
+            *(len(x), 2 * window)*.
+        """
+
         x_interval = interval(self._x)[0]
         x_f = np.floor(x / x_interval)
 
@@ -624,11 +744,82 @@ class KernelInterpolator(object):
         windows = np.clip(windows, clip_l, clip_h) - clip_l
         windows = np.around(windows).astype(np.int_)
 
-        return np.sum(
-            self._y_p[windows] *
-            self._kernel(x[:, np.newaxis] / x_interval - windows -
-                         min(self._x_p) / x_interval, **self._kernel_args),
-            axis=-1)
+        arguments = (x[:, np.newaxis] / x_interval - windows -
+                     min(self._x_p) / x_interval)
+
+        return windows, arguments
+
+    def _weights(self, x):
+        """
+        Returns the padded :math:`y` variable windows indexes and the kernel
+        weights at given points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points to evaluate the kernel weights at.
+
+        Returns
+        -------
+        tuple
+            Windows indexes and kernel weights, both of shape
+            *(len(x), 2 * window)*.
+        """
+
+        windows, arguments = self._kernel_arguments(x)
+
+        return windows, self._kernel(arguments, **self._kernel_args)
+
+    def _periodic_weights(self, x):
+        """
+        Returns the kernel weights of given points if they are uniformly
+        spaced and their kernel weights repeat with a period shorter than the
+        points count, i.e. the ratio of the points interval and the
+        independent :math:`x` variable interval is a rational number
+        :math:`p / q` with :math:`q` small enough.
+
+        The kernel weights and arguments of the first period are cached and
+        the weights are reused by subsequent calls with the same points grid
+        wherever the kernel arguments are identical.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points to evaluate the kernel weights at.
+
+        Returns
+        -------
+        tuple or None
+            Period, windows indexes shift per period, windows indexes and
+            kernel weights of the first period, *None* if the kernel weights
+            are not periodic.
+        """
+
+        if x.size < 4:
+            return None
+
+        step = (x[-1] - x[0]) / (x.size - 1)
+        if not step > 0 or not np.allclose(
+                np.diff(x), step, rtol=0,
+                atol=np.max(np.abs(x[[0, -1]])) * 1e-12):
+            return None
+
+        x_interval = interval(self._x)[0]
+        ratio = step / x_interval
+        fraction = Fraction(ratio).limit_denominator(x.size // 2)
+        period, shift = fraction.denominator, fraction.numerator
+        # Accumulated drift of the windows indexes over the points.
+        if abs(ratio * period - shift) * x.size / period > 1e-9:
+            return None
+
+        key = (x[0], step, period)
+        if self._weights_cache is None or self._weights_cache[0] != key:
+            windows, arguments = self._kernel_arguments(x[:period])
+            weights = self._kernel(arguments, **self._kernel_args)
+            self._weights_cache = (key, (period, shift, windows, weights),
+                                   arguments)
+
+        return self._weights_cache[1]
 
     def _validate_dimensions(self):
         """
@@ -921,6 +1112,7 @@ class SpragueInterpolator(object):
     def __init__(self, x, y, dtype=DEFAULT_FLOAT_DTYPE):
         self._xp = None
         self._yp = None
+        self._coefficients = None
 
         self._x = None
         self._y = None
@@ -1022,6 +1214,7 @@ class SpragueInterpolator(object):
                                        (6, 1)))) / 209)[0]
 
             self._yp = np.concatenate(((yp1, yp2), value, (yp3, yp4)))
+            self._coefficients = None
 
         self._y = value
 
@@ -1062,10 +1255,39 @@ class SpragueInterpolator(object):
         self._validate_dimensions()
         self._validate_interpolation_range(x)
 
+        if self._coefficients is None:
+            self._coefficients = self._polynomial_coefficients()
+
         i = np.searchsorted(self._xp, x) - 1
         X = (x - self._xp[i]) / (self._xp[i + 1] - self._xp[i])
 
+        # The coefficients of the first valid interval are stored first.
+        a0p, a1p, a2p, a3p, a4p, a5p = self._coefficients[:, i - 1]
+
+        y = (a0p + a1p * X + a2p * X ** 2 + a3p * X ** 3 + a4p * X ** 4 +
+             a5p * X ** 5)
+
+        return y
+
+    def _polynomial_coefficients(self):
+        """
+        Computes the fifth-order polynomials coefficients of every interval
+        the interpolation range can be evaluated in.
+
+        The coefficients only depend on the dependent variable :math:`y` and
+        are thus computed once and reused by the subsequent evaluations.
+
+        Returns
+        -------
+        ndarray
+            Polynomials coefficients of shape *(6, len(xp) - 4)*, the first
+            column being the coefficients of the interval starting at
+            *xp[1]*.
+        """
+
         r = self._yp
+        # The interpolation range maps to the [1, len(xp) - 4] intervals.
+        i = np.arange(1, len(r) - 3)
 
         a0p = r[i]
         a1p = ((2 * r[i - 2] - 16 * r[i - 1] + 16 * r[i + 1] -
@@ -1079,10 +1301,7 @@ class SpragueInterpolator(object):
         a5p = ((-5 * r[i - 2] + 25 * r[i - 1] - 50 * r[i] + 50 * r[i + 1] -
                 25 * r[i + 2] + 5 * r[i + 3]) / 24)
 
-        y = (a0p + a1p * X + a2p * X ** 2 + a3p * X ** 3 + a4p * X ** 4 +
-             a5p * X ** 5)
-
-        return y
+        return np.array([a0p, a1p, a2p, a3p, a4p, a5p])
 
     def _validate_dimensions(self):
         """
@@ -308,7 +308,7 @@ class TestKernelInterpolator(unittest.TestCase):
         """
 
         required_attributes = ('x', 'y', 'window', 'kernel', 'kernel_args',
-                               'padding_args')
+                               'padding_args', 'memory_budget')
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(KernelInterpolator))
@@ -412,6 +412,80 @@ class TestKernelInterpolator(unittest.TestCase):
             KernelInterpolator(x_3, y)(x_i / 10),
             decimal=7)
 
+        x = np.arange(11, 26, 1)
+        y = np.sin(x / len(x) * np.pi * 6) / (x / len(x)) + np.pi
+        x_i = np.linspace(11, 25, 25)
+
+        kernel_interpolator = KernelInterpolator(
+            x, np.transpose([y, y * 2, y * 3]))
+        np.testing.assert_array_almost_equal(
+            kernel_interpolator(x_i),
+            np.transpose([
+                KernelInterpolator(x, y)(x_i),
+                KernelInterpolator(x, y * 2)(x_i),
+                KernelInterpolator(x, y * 3)(x_i)
+            ]),
+            decimal=7)
+
+        np.testing.assert_array_almost_equal(
+            kernel_interpolator(np.reshape(x_i, (5, 5))),
+            np.reshape(kernel_interpolator(x_i), (5, 5, 3)),
+            decimal=7)
+
+        self.assertTupleEqual(kernel_interpolator(x_i[3]).shape, (3, ))
+        self.assertTupleEqual(kernel_interpolator(x_i[3:4]).shape, (1, 3))
+        np.testing.assert_array_almost_equal(
+            kernel_interpolator(x_i[3]), kernel_interpolator(x_i)[3],
+            decimal=7)
+
+        kernel_interpolator.memory_budget = 1
+        np.testing.assert_array_almost_equal(
+            kernel_interpolator(x_i),
+            np.transpose([
+                KernelInterpolator(x, y)(x_i),
+                KernelInterpolator(x, y * 2)(x_i),
+                KernelInterpolator(x, y * 3)(x_i)
+            ]),
+            decimal=7)
+
+    def test__periodic_weights(self):
+        """
+        Tests :func:`colour.algebra.interpolation.KernelInterpolator.\
+_periodic_weights` method.
+        """
+
+        x = np.arange(11, 26, 1)
+        y = np.sin(x / len(x) * np.pi * 6) / (x / len(x)) + np.pi
+        kernel_interpolator = KernelInterpolator(x, y)
+
+        x_i = np.linspace(11, 25, 25)
+        period, shift, windows, weights = (
+            kernel_interpolator._periodic_weights(x_i))
+        self.assertEqual(period, 12)
+        self.assertEqual(shift, 7)
+        self.assertTupleEqual(weights.shape, (12, 6))
+
+        self.assertIs(kernel_interpolator._periodic_weights(x_i)[2], windows)
+
+        windows, weights = kernel_interpolator._weights(x_i)
+        np.testing.assert_array_almost_equal(
+            kernel_interpolator(x_i),
+            np.sum(kernel_interpolator._y_p[windows] * weights, axis=-1),
+            decimal=7)
+
+        for x_i in (np.linspace(11, 25, 57), np.linspace(11, 25, 1401)):
+            self.assertIsNotNone(kernel_interpolator._periodic_weights(x_i))
+            windows, weights = kernel_interpolator._weights(x_i)
+            np.testing.assert_array_equal(
+                kernel_interpolator(x_i),
+                np.sum(kernel_interpolator._y_p[windows] * weights, axis=-1))
+
+        self.assertIsNone(
+            kernel_interpolator._periodic_weights(np.array([11, 12, 14, 15])))
+        self.assertIsNone(
+            kernel_interpolator._periodic_weights(
+                np.linspace(11, 25, 10 ** 4)))
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -541,6 +615,12 @@ class TestSpragueInterpolator(unittest.TestCase):
                 np.arange(0, len(POINTS_DATA_A) - 1 + interval, interval)),
             SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES)
 
+        sprague_interpolator.y = np.array(POINTS_DATA_A) * 2
+        np.testing.assert_almost_equal(
+            sprague_interpolator(
+                np.arange(0, len(POINTS_DATA_A) - 1 + interval, interval)),
+            np.array(SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES) * 2)
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
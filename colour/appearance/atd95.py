@@ -36,7 +36,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.utilities.array import dot_vector, tsplit, tstack
+from colour.utilities.array import (as_float_array, dot_vector, float_dtype,
+                                    tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -197,10 +198,13 @@ A_1=0.1787931... T_1=0.0286942..., D_1=0.0107584..., A_2=0.0192182..., \
 T_2=0.0205377..., D_2=0.0107584...)
     """
 
-    Y_0 = np.asarray(Y_0)
-    k_1 = np.asarray(k_1)
-    k_2 = np.asarray(k_2)
-    sigma = np.asarray(sigma)
+    XYZ = np.asarray(XYZ)
+    dtype = float_dtype(XYZ)
+    XYZ_0 = as_float_array(XYZ_0, dtype)
+    Y_0 = as_float_array(Y_0, dtype)
+    k_1 = as_float_array(k_1, dtype)
+    k_2 = as_float_array(k_2, dtype)
+    sigma = as_float_array(sigma, dtype)
 
     XYZ = luminance_to_retinal_illuminance(XYZ, Y_0)
     XYZ_0 = luminance_to_retinal_illuminance(XYZ_0, Y_0)
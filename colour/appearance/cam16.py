@@ -41,8 +41,8 @@ from colour.appearance.ciecam02 import (
     post_adaptation_non_linear_response_compression_matrix,
     saturation_correlate, temporary_magnitude_quantity_reverse,
     viewing_condition_dependent_parameters)
-from colour.utilities import (CaseInsensitiveMapping, as_namedtuple,
-                              dot_vector, tsplit)
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              as_namedtuple, dot_vector, float_dtype, tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2015-2018 - Colour Developers'
@@ -217,20 +217,26 @@ def XYZ_to_CAM16(XYZ,
 s=25.3564036..., Q=193.0617673..., M=12.4128523..., H=267.0983345..., HC=None)
     """
 
+    XYZ = np.asarray(XYZ)
+    dtype = float_dtype(XYZ)
+    XYZ_w = as_float_array(XYZ_w, dtype)
+    L_A = as_float_array(L_A, dtype)
+    Y_b = as_float_array(Y_b, dtype)
+
     _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = np.asarray(L_A)
-    Y_b = np.asarray(Y_b)
 
     # Step 0
     # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
     RGB_w = dot_vector(M_16, XYZ_w)
 
     # Computing degree of adaptation :math:`D`.
-    D = (np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
-         if not discount_illuminant else np.ones(L_A.shape))
+    D = as_float_array(
+        np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
+        if not discount_illuminant else np.ones(L_A.shape), dtype)
 
     n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
+        as_float_array(
+            viewing_condition_dependent_parameters(Y_b, Y_w, L_A), dtype))
 
     D_RGB = D[..., np.newaxis] * XYZ_w / RGB_w + 1 - D[..., np.newaxis]
     RGB_wc = D_RGB * RGB_w
@@ -363,6 +369,10 @@ def CAM16_to_XYZ(CAM16_specification,
 
     J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CAM16_specification,
                                                 CAM16_Specification)
+    dtype = float_dtype(J)
+    XYZ_w = as_float_array(XYZ_w, dtype)
+    L_A = as_float_array(L_A, dtype)
+    Y_b = as_float_array(Y_b, dtype)
 
     _X_w, Y_w, _Zw = tsplit(XYZ_w)
 
@@ -371,11 +381,13 @@ def CAM16_to_XYZ(CAM16_specification,
     RGB_w = dot_vector(M_16, XYZ_w)
 
     # Computing degree of adaptation :math:`D`.
-    D = (np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
-         if not discount_illuminant else np.ones(L_A.shape))
+    D = as_float_array(
+        np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
+        if not discount_illuminant else np.ones(L_A.shape), dtype)
 
     n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
+        as_float_array(
+            viewing_condition_dependent_parameters(Y_b, Y_w, L_A), dtype))
 
     D_RGB = D[..., np.newaxis] * XYZ_w / RGB_w + 1 - D[..., np.newaxis]
     RGB_wc = D_RGB * RGB_w
@@ -43,9 +43,9 @@ from colour.adaptation import CAT02_CAT
 from colour.appearance.hunt import (HPE_TO_XYZ_MATRIX, XYZ_TO_HPE_MATRIX,
                                     luminance_level_adaptation_factor)
 from colour.constants import EPSILON
-from colour.utilities import (CaseInsensitiveMapping, as_namedtuple,
-                              as_numeric, dot_matrix, dot_vector, tsplit,
-                              tstack)
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              as_namedtuple, as_numeric, dot_matrix,
+                              dot_vector, float_dtype, tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -245,12 +245,17 @@ def XYZ_to_CIECAM02(XYZ,
 s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., HC=None)
     """
 
+    XYZ = np.asarray(XYZ)
+    dtype = float_dtype(XYZ)
+    XYZ_w = as_float_array(XYZ_w, dtype)
+    L_A = as_float_array(L_A, dtype)
+    Y_b = as_float_array(Y_b, dtype)
+
     _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = np.asarray(L_A)
-    Y_b = np.asarray(Y_b)
 
     n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
+        as_float_array(
+            viewing_condition_dependent_parameters(Y_b, Y_w, L_A), dtype))
 
     # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
     # sharpened *RGB* values.
@@ -258,7 +263,9 @@ s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., HC=None)
     RGB_w = dot_vector(CAT02_CAT, XYZ_w)
 
     # Computing degree of adaptation :math:`D`.
-    D = degree_of_adaptation(surround.F, L_A) if not discount_illuminant else 1
+    D = as_float_array(
+        degree_of_adaptation(surround.F, L_A)
+        if not discount_illuminant else 1, dtype)
 
     # Computing full chromatic adaptation.
     RGB_c = full_chromatic_adaptation_forward(RGB, RGB_w, Y_w, D)
@@ -381,11 +388,16 @@ def CIECAM02_to_XYZ(CIECAM02_specification,
 
     J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CIECAM02_specification,
                                                 CIECAM02_Specification)
+    dtype = float_dtype(J)
+    XYZ_w = as_float_array(XYZ_w, dtype)
+    L_A = as_float_array(L_A, dtype)
+    Y_b = as_float_array(Y_b, dtype)
 
     _X_w, Y_w, _Zw = tsplit(XYZ_w)
 
     n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
+        as_float_array(
+            viewing_condition_dependent_parameters(Y_b, Y_w, L_A), dtype))
 
     if C is None and M is not None:
         C = M / F_L ** 0.25
@@ -398,7 +410,9 @@ def CIECAM02_to_XYZ(CIECAM02_specification,
     RGB_w = dot_vector(CAT02_CAT, XYZ_w)
 
     # Computing degree of adaptation :math:`D`.
-    D = degree_of_adaptation(surround.F, L_A) if not discount_illuminant else 1
+    D = as_float_array(
+        degree_of_adaptation(surround.F, L_A)
+        if not discount_illuminant else 1, dtype)
 
     # Computing full chromatic adaptation.
     RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
@@ -861,8 +875,8 @@ def opponent_colour_dimensions_reverse(P_n, h):
     P_5 = P_1 / cos_hr
     n = P_2 * (2 + P_3) * (460 / 1403)
 
-    a = np.zeros(hr.shape)
-    b = np.zeros(hr.shape)
+    a = np.zeros(hr.shape, float_dtype(hr))
+    b = np.zeros(hr.shape, float_dtype(hr))
 
     b = np.where(
         np.isfinite(P_1) * np.abs(sin_hr) >= np.abs(cos_hr),
@@ -941,9 +955,10 @@ def hue_quadrature(h):
 
     h = np.asarray(h)
 
-    h_i = HUE_DATA_FOR_HUE_QUADRATURE['h_i']
-    e_i = HUE_DATA_FOR_HUE_QUADRATURE['e_i']
-    H_i = HUE_DATA_FOR_HUE_QUADRATURE['H_i']
+    dtype = float_dtype(h)
+    h_i = as_float_array(HUE_DATA_FOR_HUE_QUADRATURE['h_i'], dtype)
+    e_i = as_float_array(HUE_DATA_FOR_HUE_QUADRATURE['e_i'], dtype)
+    H_i = as_float_array(HUE_DATA_FOR_HUE_QUADRATURE['H_i'], dtype)
 
     # *np.searchsorted* returns an erroneous index if a *nan* is used as input.
     h[np.asarray(np.isnan(h))] = 0
@@ -1403,7 +1418,7 @@ def P(N_c, N_cb, e_t, t, A, N_bb):
 
     P_1 = ((50000 / 13) * N_c * N_cb * e_t) / t
     P_2 = A / N_bb + 0.305
-    P_3 = np.ones(P_1.shape) * (21 / 20)
+    P_3 = np.ones(P_1.shape, float_dtype(P_1)) * (21 / 20)
 
     P_n = tstack((P_1, P_2, P_3))
 
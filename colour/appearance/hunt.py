@@ -29,8 +29,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.utilities import (CaseInsensitiveMapping, dot_vector, tsplit,
-                              tstack, warning)
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              dot_vector, float_dtype, tsplit, tstack,
+                              warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -333,6 +334,12 @@ def XYZ_to_Hunt(XYZ,
 s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
     """
 
+    XYZ = np.asarray(XYZ)
+    dtype = float_dtype(XYZ)
+    XYZ_w = as_float_array(XYZ_w, dtype)
+    XYZ_b = as_float_array(XYZ_b, dtype)
+    L_A = as_float_array(L_A, dtype)
+
     _X, Y, _Z = tsplit(XYZ)
     X_b, Y_b, _Z_b = tsplit(XYZ_b)
     _X_w, Y_w, _Z_w = tsplit(XYZ_w)
@@ -384,7 +391,7 @@ s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
     XYZ_p = tstack((X_p, Y_p, Z_p))
 
     # Computing luminance level adaptation factor :math:`F_L`.
-    F_L = luminance_level_adaptation_factor(L_A)
+    F_L = as_float_array(luminance_level_adaptation_factor(L_A), dtype)
 
     # Computing test sample chromatic adaptation.
     rgb_a = chromatic_adaptation(XYZ, XYZ_w, XYZ_b, L_A, F_L, XYZ_p, p,
@@ -647,17 +654,17 @@ def chromatic_adaptation(XYZ,
         F_rgb = ((1 + (L_A ** (1 / 3)) + h_rgb) / (1 + (L_A ** (1 / 3)) +
                                                    (1 / h_rgb)))
     else:
-        F_rgb = np.ones(h_rgb.shape)
+        F_rgb = np.ones(h_rgb.shape, float_dtype(h_rgb))
 
     # Computing Helson-Judd effect parameters.
     if helson_judd_effect:
         D_rgb = (f_n((Y_b / Y_w) * F_L * F_rgb[..., 1]) - f_n(
             (Y_b / Y_w) * F_L * F_rgb))
     else:
-        D_rgb = np.zeros(F_rgb.shape)
+        D_rgb = np.zeros(F_rgb.shape, float_dtype(F_rgb))
 
     # Computing cone bleach factors.
-    B_rgb = (10 ** 7) / ((10 ** 7) + 5 * L_A[..., np.newaxis] * (rgb_w / 100))
+    B_rgb = 10e6 / (10e6 + 5 * L_A[..., np.newaxis] * (rgb_w / 100))
 
     # Computing adjusted reference white signals.
     if XYZ_p is not None and p is not None:
@@ -842,7 +849,7 @@ def eccentricity_factor(hue):
     h_s = HUE_DATA_FOR_HUE_QUADRATURE['h_s']
     e_s = HUE_DATA_FOR_HUE_QUADRATURE['e_s']
 
-    x = np.interp(hue, h_s, e_s)
+    x = as_float_array(np.interp(hue, h_s, e_s), float_dtype(hue))
     x = np.where(hue < 20.14, 0.856 - (hue / 20.14) * 0.056, x)
     x = np.where(hue > 237.53, 0.856 + 0.344 * (360 - hue) / (360 - 237.53), x)
 
@@ -34,7 +34,8 @@ from colour.adaptation.cie1994 import (CIE1994_XYZ_TO_RGB_MATRIX, beta_1,
                                        exponential_factors,
                                        intermediate_values)
 from colour.models import XYZ_to_xy
-from colour.utilities import dot_vector, tsplit, tstack
+from colour.utilities import (as_float_array, dot_vector, float_dtype,
+                              tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -201,9 +202,12 @@ h=257.5232268..., s=0.0133550..., Q=62.6266734..., M=0.0167262..., H=None, \
 HC=None, Lstar_N=50.0039154...)
     """
 
-    Y_o = np.asarray(Y_o)
-    E_o = np.asarray(E_o)
-    E_or = np.asarray(E_or)
+    XYZ = np.asarray(XYZ)
+    dtype = float_dtype(XYZ)
+    XYZ_n = as_float_array(XYZ_n, dtype)
+    Y_o = as_float_array(Y_o, dtype)
+    E_o = as_float_array(E_o, dtype)
+    E_or = as_float_array(E_or, dtype)
 
     # Computing adapting luminance :math:`L_o` and normalising luminance
     # :math:`L_{or}` in in :math:`cd/m^2`.
@@ -358,7 +362,7 @@ def scaling_coefficient(x, y):
     x = np.asarray(x)
     y = np.asarray(y)
 
-    return np.where(x >= (20 * y), 1.758, 1)
+    return np.where(x >= (20 * y), 1.758, 1).astype(float_dtype(x))
 
 
 def achromatic_response(RGB, bRGB_o, xez, bL_or, eR, eG, n=1):
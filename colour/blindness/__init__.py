@@ -6,12 +6,18 @@ from __future__ import absolute_import
 from .dataset import *  # noqa
 from . import dataset
 from .machado2009 import (
+    CVD_MATRICES_TABLE_SAMPLES,
     anomalous_trichromacy_cmfs_Machado2009,
     anomalous_trichromacy_matrix_Machado2009,
-    cvd_matrix_Machado2009)
+    cvd_matrix_Machado2009,
+    cvd_matrices_table_Machado2009,
+    cvd_simulation_Machado2009)
 
 __all__ = []
 __all__ += dataset.__all__
-__all__ += ['anomalous_trichromacy_cmfs_Machado2009',
+__all__ += ['CVD_MATRICES_TABLE_SAMPLES',
+            'anomalous_trichromacy_cmfs_Machado2009',
             'anomalous_trichromacy_matrix_Machado2009',
-            'cvd_matrix_Machado2009']
+            'cvd_matrix_Machado2009',
+            'cvd_matrices_table_Machado2009',
+            'cvd_simulation_Machado2009']
@@ -9,6 +9,8 @@ deficiency:
 -   :func:`colour.anomalous_trichromacy_cmfs_Machado2009`
 -   :func:`colour.anomalous_trichromacy_matrix_Machado2009`
 -   :func:`colour.cvd_matrix_Machado2009`
+-   :func:`colour.blindness.cvd_matrices_table_Machado2009`
+-   :func:`colour.cvd_simulation_Machado2009`
 
 See Also
 --------
@@ -38,8 +40,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.blindness import CVD_MATRICES_MACHADO2010
-from colour.colorimetry import SpectralShape
-from colour.utilities import dot_matrix, dot_vector, tsplit, tstack, warning
+from colour.colorimetry import LMS_CMFS, SpectralShape
+from colour.utilities import (CaseInsensitiveMapping, dot_matrix, dot_vector,
+                              tsplit, tstack, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -49,9 +52,10 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'LMS_TO_WSYBRG_MATRIX', 'RGB_to_WSYBRG_matrix',
-    'anomalous_trichromacy_cmfs_Machado2009',
-    'anomalous_trichromacy_matrix_Machado2009', 'cvd_matrix_Machado2009'
+    'LMS_TO_WSYBRG_MATRIX', 'CVD_MATRICES_TABLE_SAMPLES',
+    'RGB_to_WSYBRG_matrix', 'anomalous_trichromacy_cmfs_Machado2009',
+    'anomalous_trichromacy_matrix_Machado2009', 'cvd_matrix_Machado2009',
+    'cvd_matrices_table_Machado2009', 'cvd_simulation_Machado2009'
 ]
 
 LMS_TO_WSYBRG_MATRIX = np.array([
@@ -66,6 +70,23 @@ opponent-colour space.
 LMS_TO_WSYBRG_MATRIX : array_like, (3, 3)
 """
 
+CVD_MATRICES_TABLE_SAMPLES = 101
+"""
+Default severity samples count of the *CVD* matrices tables computed for
+given *LMS* cone fundamentals colour matching functions and display
+primaries, i.e. a 0.01 severity interval.
+
+CVD_MATRICES_TABLE_SAMPLES : integer
+"""
+
+_CVD_DEFICIENCIES_CONES = CaseInsensitiveMapping({
+    'Protanomaly': 0,
+    'Deuteranomaly': 1,
+    'Tritanomaly': 2
+})
+
+_CVD_MATRICES_TABLES_CACHE = {}
+
 
 def RGB_to_WSYBRG_matrix(cmfs, primaries):
     """
@@ -97,43 +118,134 @@ def RGB_to_WSYBRG_matrix(cmfs, primaries):
            [-11.1518474...,  15.2534789...,  -3.1016315...]])
     """
 
-    wavelengths = cmfs.wavelengths
-    WSYBRG = dot_vector(LMS_TO_WSYBRG_MATRIX, cmfs.values)
-    WS, YB, RG = tsplit(WSYBRG)
+    return _RGB_to_WSYBRG_matrices(cmfs.values, cmfs.wavelengths,
+                                   _align_primaries(primaries, cmfs))
+
+
+def _align_primaries(primaries, cmfs):
+    """
+    Returns given display primaries tri-spectral power distributions values
+    aligned to given *LMS* cone fundamentals colour matching functions shape.
+
+    Parameters
+    ----------
+    primaries : RGB_DisplayPrimaries
+        *RGB* display primaries tri-spectral power distributions.
+    cmfs : LMS_ConeFundamentals
+        *LMS* cone fundamentals colour matching functions.
+
+    Returns
+    -------
+    ndarray
+        Aligned display primaries tri-spectral power distributions values.
+    """
 
     extrapolator_args = {'method': 'Constant', 'left': 0, 'right': 0}
-    primaries = primaries.copy().align(
-        cmfs.shape, extrapolator_args=extrapolator_args)
 
-    R, G, B = tsplit(primaries.values)
+    return primaries.copy().align(
+        cmfs.shape, extrapolator_args=extrapolator_args).values
 
-    WS_R = np.trapz(R * WS, wavelengths)
-    WS_G = np.trapz(G * WS, wavelengths)
-    WS_B = np.trapz(B * WS, wavelengths)
 
-    YB_R = np.trapz(R * YB, wavelengths)
-    YB_G = np.trapz(G * YB, wavelengths)
-    YB_B = np.trapz(B * YB, wavelengths)
+def _RGB_to_WSYBRG_matrices(LMS, wavelengths, RGB):
+    """
+    Computes the matrices transforming from *RGB* colourspace to
+    opponent-colour space of given stacked *LMS* cone fundamentals colour
+    matching functions values.
 
-    RG_R = np.trapz(R * RG, wavelengths)
-    RG_G = np.trapz(G * RG, wavelengths)
-    RG_B = np.trapz(B * RG, wavelengths)
+    Parameters
+    ----------
+    LMS : array_like
+        *LMS* cone fundamentals colour matching functions values of shape
+        (..., wavelengths, 3).
+    wavelengths : array_like
+        Wavelengths :math:`\lambda`.
+    RGB : array_like
+        *RGB* display primaries tri-spectral power distributions values of
+        shape (wavelengths, 3).
 
-    M_G = np.array([
-        [WS_R, WS_G, WS_B],
-        [YB_R, YB_G, YB_B],
-        [RG_R, RG_G, RG_B],
-    ])
+    Returns
+    -------
+    ndarray
+        Matrices transforming from *RGB* colourspace to opponent-colour
+        space of shape (..., 3, 3).
+    """
+
+    WSYBRG = dot_vector(LMS_TO_WSYBRG_MATRIX, LMS)
 
-    PWS = 1 / (WS_R + WS_G + WS_B)
-    PYB = 1 / (YB_R + YB_G + YB_B)
-    PRG = 1 / (RG_R + RG_G + RG_B)
+    # The trapezoidal integrals of the opponent-colour and primaries
+    # products are computed at once for all the colour matching functions.
+    M_G = np.trapz(
+        WSYBRG[..., np.newaxis] * RGB[..., np.newaxis, :], wavelengths,
+        axis=-3)
 
-    M_G *= np.array([PWS, PYB, PRG])[:, np.newaxis]
+    M_G /= np.sum(M_G, axis=-1)[..., np.newaxis]
 
     return M_G
 
 
+def _anomalous_trichromacy_LMS(cmfs, d_LMS):
+    """
+    Returns the values of given *LMS* cone fundamentals colour matching
+    functions shifted with given :math:`\Delta_{LMS}` shift amounts in
+    nanometers.
+
+    Parameters
+    ----------
+    cmfs : LMS_ConeFundamentals
+        *LMS* cone fundamentals colour matching functions with 1 nanometer
+        interval.
+    d_LMS : array_like
+        :math:`\Delta_{LMS}` shift amounts in nanometers of shape (..., 3).
+
+    Returns
+    -------
+    ndarray
+        Anomalous trichromacy *LMS* cone fundamentals colour matching
+        functions values of shape (..., wavelengths, 3).
+    """
+
+    d_L, d_M, d_S = tsplit(d_LMS)
+
+    if np.any(d_S != 0):
+        warning(
+            '"Machado et alii (2009)" simulation of tritanomaly is based on '
+            'the shift paradigm as an approximation to the actual phenomenon '
+            'and restrain the model from trying to model tritanopia.\n'
+            'The pre-generated matrices are using a shift value in domain '
+            '[5, 59] contrary to the domain [0, 20] used for protanomaly and '
+            'deuteranomaly simulation.')
+
+    cmfs = cmfs.copy()
+    cmfs.extrapolator_args = {'method': 'Constant', 'left': 0, 'right': 0}
+
+    wavelengths = cmfs.wavelengths
+    L, M, _S = tsplit(cmfs.values)
+
+    area_L = np.trapz(L, wavelengths)
+    area_M = np.trapz(M, wavelengths)
+
+    def alpha(x):
+        """
+        Computes :math:`alpha` factor.
+        """
+
+        return ((20 - x) / 20)[..., np.newaxis]
+
+    # Corrected equations as per:
+    # http://www.inf.ufrgs.br/~oliveira/pubs_files/
+    # CVD_Simulation/CVD_Simulation.html#Errata
+    L_a = alpha(d_L) * L + 0.96 * area_L / area_M * (1 - alpha(d_L)) * M
+    M_a = alpha(d_M) * M + 1 / 0.96 * area_M / area_L * (1 - alpha(d_M)) * L
+
+    # The shifted short-wavelength cones sensitivities are evaluated at once
+    # for all the shift amounts.
+    shifted_wavelengths = wavelengths - np.asarray(d_S)[..., np.newaxis]
+    S_a = np.reshape(cmfs[np.ravel(shifted_wavelengths)][..., 2],
+                     shifted_wavelengths.shape)
+
+    return tstack((L_a, M_a, S_a))
+
+
 def anomalous_trichromacy_cmfs_Machado2009(cmfs, d_LMS):
     """
     Shifts given *LMS* cone fundamentals colour matching functions with given
@@ -193,37 +305,9 @@ def anomalous_trichromacy_cmfs_Machado2009(cmfs, d_LMS):
 
     cmfs.extrapolator_args = {'method': 'Constant', 'left': 0, 'right': 0}
 
-    L, M, _S = tsplit(cmfs.values)
     d_L, d_M, d_S = tsplit(d_LMS)
 
-    if d_S != 0:
-        warning(
-            '"Machado et alii (2009)" simulation of tritanomaly is based on '
-            'the shift paradigm as an approximation to the actual phenomenon '
-            'and restrain the model from trying to model tritanopia.\n'
-            'The pre-generated matrices are using a shift value in domain '
-            '[5, 59] contrary to the domain [0, 20] used for protanomaly and '
-            'deuteranomaly simulation.')
-
-    area_L = np.trapz(L, cmfs.wavelengths)
-    area_M = np.trapz(M, cmfs.wavelengths)
-
-    def alpha(x):
-        """
-        Computes :math:`alpha` factor.
-        """
-
-        return (20 - x) / 20
-
-    # Corrected equations as per:
-    # http://www.inf.ufrgs.br/~oliveira/pubs_files/
-    # CVD_Simulation/CVD_Simulation.html#Errata
-    L_a = alpha(d_L) * L + 0.96 * area_L / area_M * (1 - alpha(d_L)) * M
-    M_a = alpha(d_M) * M + 1 / 0.96 * area_M / area_L * (1 - alpha(d_M)) * L
-    S_a = cmfs[cmfs.wavelengths - d_S][:, 2]
-
-    LMS_a = tstack((L_a, M_a, S_a))
-    cmfs[cmfs.wavelengths] = LMS_a
+    cmfs[cmfs.wavelengths] = _anomalous_trichromacy_LMS(cmfs, d_LMS)
 
     severity = '{0}, {1}, {2}'.format(d_L, d_M, d_S)
     template = '{0} - Anomalous Trichromacy ({1})'
@@ -247,7 +331,8 @@ def anomalous_trichromacy_matrix_Machado2009(cmfs, primaries, d_LMS):
     primaries : RGB_DisplayPrimaries
         *RGB* display primaries tri-spectral power distributions.
     d_LMS : array_like
-        :math:`\Delta_{LMS}` shift amount in nanometers.
+        :math:`\Delta_{LMS}` shift amount in nanometers, or shift amounts of
+        shape (..., 3).
 
     Notes
     -----
@@ -255,11 +340,14 @@ def anomalous_trichromacy_matrix_Machado2009(cmfs, primaries, d_LMS):
         expected to be 1 nanometer, incompatible input will be interpolated
         at 1 nanometer interval.
     -   Input :math:`\Delta_{LMS}` shift amount is in domain [0, 20].
+    -   The matrices of stacked :math:`\Delta_{LMS}` shift amounts are
+        computed at once, the *LMS* cone fundamentals colour matching
+        functions being shifted and integrated in bulk.
 
     Returns
     -------
     ndarray
-        Anomalous trichromacy matrix.
+        Anomalous trichromacy matrix, or matrices of shape (..., 3, 3).
 
     References
     ----------
@@ -284,13 +372,84 @@ def anomalous_trichromacy_matrix_Machado2009(cmfs, primaries, d_LMS):
     if cmfs.shape.interval != 1:
         cmfs = cmfs.copy().interpolate(SpectralShape(interval=1))
 
-    M_n = RGB_to_WSYBRG_matrix(cmfs, primaries)
-    cmfs_a = anomalous_trichromacy_cmfs_Machado2009(cmfs, d_LMS)
-    M_a = RGB_to_WSYBRG_matrix(cmfs_a, primaries)
+    RGB = _align_primaries(primaries, cmfs)
+
+    M_n = _RGB_to_WSYBRG_matrices(cmfs.values, cmfs.wavelengths, RGB)
+    M_a = _RGB_to_WSYBRG_matrices(
+        _anomalous_trichromacy_LMS(cmfs, np.asarray(d_LMS)), cmfs.wavelengths,
+        RGB)
 
     return dot_matrix(np.linalg.inv(M_n), M_a)
 
 
+def _interpolate_matrices(samples, matrices, severity):
+    """
+    Interpolates given matrices sampled at given severities for given
+    severity array.
+
+    Parameters
+    ----------
+    samples : array_like
+        Ascending severity samples.
+    matrices : array_like
+        Matrices of shape (samples, 3, 3).
+    severity : numeric or array_like
+        Severity of the colour vision deficiency.
+
+    Returns
+    -------
+    ndarray
+        Interpolated matrices of shape (..., 3, 3).
+
+    Notes
+    -----
+    -   The matrix of a severity is interpolated from the segment starting at
+        its left insertion point in the samples, as with the original
+        :func:`colour.cvd_matrix_Machado2009` definition.
+    """
+
+    severity = np.asarray(severity)
+
+    index = np.minimum(np.searchsorted(samples, severity), len(samples) - 1)
+    index_b = np.minimum(index + 1, len(samples) - 1)
+
+    a, b = samples[index], samples[index_b]
+    m1, m2 = matrices[index], matrices[index_b]
+
+    # The last sample matrix, i.e. 1.0 severity, is returned directly.
+    d = np.where(a == b, 1, b - a)
+    t = np.where(a == b, 0, severity - a)[..., np.newaxis, np.newaxis]
+
+    return m1 + t * ((m2 - m1) / d[..., np.newaxis, np.newaxis])
+
+
+def _dataset_matrices(deficiency):
+    """
+    Returns the severity samples and stacked matrices of given deficiency
+    from the pre-computed matrices dataset.
+
+    Parameters
+    ----------
+    deficiency : unicode
+        {'Protanomaly', 'Deuteranomaly', 'Tritanomaly'}
+        Colour blindness / vision deficiency type.
+
+    Returns
+    -------
+    tuple
+        Severity samples and matrices of shape (samples, 3, 3).
+    """
+
+    key = deficiency.lower()
+    if key not in _CVD_MATRICES_TABLES_CACHE:
+        matrices = CVD_MATRICES_MACHADO2010[deficiency]
+        samples = np.array(sorted(matrices.keys()))
+        _CVD_MATRICES_TABLES_CACHE[key] = (
+            samples, np.array([matrices[sample] for sample in samples]))
+
+    return _CVD_MATRICES_TABLES_CACHE[key]
+
+
 def cvd_matrix_Machado2009(deficiency, severity):
     """
     Computes *Machado et alii (2009)* *CVD* matrix for given deficiency and
@@ -309,13 +468,13 @@ def cvd_matrix_Machado2009(deficiency, severity):
         - *Tritanomaly* : defective short-wavelength cones (S-cones), an
         alleviated form of blue-yellow color blindness. The complete absence of
         S-cones is called *Tritanopia*.
-    severity : numeric
+    severity : numeric or array_like
         Severity of the colour vision deficiency in domain [0, 1].
 
     Returns
     -------
     ndarray
-        *CVD* matrix.
+        *CVD* matrix, or matrices of shape (..., 3, 3) for a severity array.
 
     References
     ----------
@@ -330,6 +489,8 @@ def cvd_matrix_Machado2009(deficiency, severity):
     array([[ 0.786987...,  0.269487..., -0.056473...],
            [ 0.043169...,  0.933774...,  0.023058...],
            [-0.004238..., -0.002451...,  1.006689...]])
+    >>> cvd_matrix_Machado2009('Protanomaly', np.array([0.15, 1.0])).shape
+    (2, 3, 3)
     """
 
     if deficiency.lower() == 'tritanomaly':
@@ -341,17 +502,187 @@ def cvd_matrix_Machado2009(deficiency, severity):
             '[5, 59] contrary to the domain [0, 20] used for protanomaly and '
             'deuteranomaly simulation.')
 
-    matrices = CVD_MATRICES_MACHADO2010[deficiency]
-    samples = np.array(sorted(matrices.keys()))
-    index = min(np.searchsorted(samples, severity), len(samples) - 1)
+    samples, matrices = _dataset_matrices(deficiency)
+
+    return _interpolate_matrices(samples, matrices, severity)
+
+
+def _severity_to_d_LMS(deficiency, severity):
+    """
+    Converts given deficiency severities to :math:`\Delta_{LMS}` shift
+    amounts in nanometers as used by the pre-computed matrices dataset.
+
+    Parameters
+    ----------
+    deficiency : unicode
+        {'Protanomaly', 'Deuteranomaly', 'Tritanomaly'}
+        Colour blindness / vision deficiency type.
+    severity : array_like
+        Severity of the colour vision deficiency in domain [0, 1].
+
+    Returns
+    -------
+    ndarray
+        :math:`\Delta_{LMS}` shift amounts of shape (..., 3).
+
+    Notes
+    -----
+    -   *Protanomaly* and *Deuteranomaly* severities map to a shift in domain
+        [0, 20] while *Tritanomaly* severities map to a shift in domain
+        [5, 59] for severities in domain [0.1, 1], the shift being clipped to
+        0 for a null severity.
+    """
+
+    severity = np.asarray(severity)
+    cone = _CVD_DEFICIENCIES_CONES[deficiency]
+
+    d_LMS = np.zeros(severity.shape + (3, ))
+    d_LMS[..., cone] = (np.maximum(60 * severity - 1, 0)
+                        if cone == 2 else 20 * severity)
+
+    return d_LMS
 
-    a = samples[index]
-    b = samples[min(index + 1, len(samples) - 1)]
 
-    m1, m2 = matrices[a], matrices[b]
+def cvd_matrices_table_Machado2009(deficiency,
+                                   cmfs,
+                                   primaries,
+                                   samples=CVD_MATRICES_TABLE_SAMPLES):
+    """
+    Computes *Machado et alii (2009)* *CVD* matrices table for given
+    deficiency, *LMS* cone fundamentals colour matching functions and display
+    primaries.
+
+    The table is computed once, the anomalous trichromacy matrices of all the
+    severity samples being computed at once, and is cached for subsequent
+    calls with the same deficiency, colour matching functions, primaries and
+    samples count.
+
+    Parameters
+    ----------
+    deficiency : unicode
+        {'Protanomaly', 'Deuteranomaly', 'Tritanomaly'}
+        Colour blindness / vision deficiency type.
+    cmfs : LMS_ConeFundamentals
+        *LMS* cone fundamentals colour matching functions.
+    primaries : RGB_DisplayPrimaries
+        *RGB* display primaries tri-spectral power distributions.
+    samples : integer, optional
+        Severity samples count in domain [0, 1].
+
+    Returns
+    -------
+    tuple
+        Severity samples and *CVD* matrices of shape (samples, 3, 3).
+
+    Notes
+    -----
+    -   The severities are converted to :math:`\Delta_{LMS}` shift amounts
+        matching the pre-computed matrices dataset, i.e. in domain [0, 20]
+        for *Protanomaly* and *Deuteranomaly* and in domain [5, 59] for
+        *Tritanomaly*.
+
+    Examples
+    --------
+    >>> from colour import DISPLAYS_RGB_PRIMARIES, LMS_CMFS
+    >>> cmfs = LMS_CMFS['Smith & Pokorny 1975 Normal Trichromats']
+    >>> primaries = DISPLAYS_RGB_PRIMARIES['Typical CRT Brainard 1997']
+    >>> severities, matrices = cvd_matrices_table_Machado2009(
+    ...     'Protanomaly', cmfs, primaries)
+    >>> matrices.shape
+    (101, 3, 3)
+    >>> matrices[-1]  # doctest: +ELLIPSIS
+    array([[ 0.1522762...,  1.0525135..., -0.2047897...],
+           [ 0.1145060...,  0.7863072...,  0.0991867...],
+           [-0.0038829..., -0.0481046...,  1.0519875...]])
+    """
+
+    key = (deficiency.lower(), hash(cmfs.values.tobytes()),
+           hash(cmfs.wavelengths.tobytes()),
+           hash(primaries.values.tobytes()),
+           hash(primaries.wavelengths.tobytes()), samples)
+
+    if key not in _CVD_MATRICES_TABLES_CACHE:
+        severities = np.linspace(0, 1, samples)
+        d_LMS = _severity_to_d_LMS(deficiency, severities)
+
+        _CVD_MATRICES_TABLES_CACHE[key] = (
+            severities,
+            anomalous_trichromacy_matrix_Machado2009(cmfs, primaries, d_LMS))
+
+    return _CVD_MATRICES_TABLES_CACHE[key]
 
-    if a == b:
-        # 1.0 severity CVD matrix, returning directly.
-        return m1
+
+def cvd_simulation_Machado2009(RGB,
+                               deficiency='Protanomaly',
+                               severity=1,
+                               cmfs=None,
+                               primaries=None):
+    """
+    Simulates given *RGB* colourspace array as perceived with given colour
+    vision deficiency using *Machado et alii (2009)* method.
+
+    The *CVD* matrices of all the severities are interpolated in bulk and
+    applied at once, allowing a per-pixel severity.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array, e.g. an image of shape (height, width, 3).
+    deficiency : unicode, optional
+        {'Protanomaly', 'Deuteranomaly', 'Tritanomaly'}
+        Colour blindness / vision deficiency type.
+    severity : numeric or array_like, optional
+        Severity of the colour vision deficiency in domain [0, 1], either
+        shared by all the *RGB* colourspace array values or per value, e.g. of
+        shape (height, width).
+    cmfs : LMS_ConeFundamentals, optional
+        *LMS* cone fundamentals colour matching functions, if neither of
+        ``cmfs`` and ``primaries`` arguments are given, the pre-computed
+        matrices dataset is used, otherwise a *CVD* matrices table is
+        computed with *Smith & Pokorny 1975 Normal Trichromats* colour
+        matching functions as default.
+    primaries : RGB_DisplayPrimaries, optional
+        *RGB* display primaries tri-spectral power distributions, default to
+        *Typical CRT Brainard 1997* display primaries when a *CVD* matrices
+        table is computed.
+
+    Returns
+    -------
+    ndarray
+        Simulated *RGB* colourspace array.
+
+    Notes
+    -----
+    -   The *CVD* matrices table computed for given colour matching functions
+        and primaries is cached, see
+        :func:`colour.blindness.cvd_matrices_table_Machado2009` definition.
+
+    Examples
+    --------
+    >>> RGB = np.array([[0.45620519, 0.03081071, 0.04091952],
+    ...                 [0.19391300, 0.26590600, 0.11924800]])
+    >>> cvd_simulation_Machado2009(RGB, 'Protanomaly', np.array([0.5, 1.0]))
+    ... # doctest: +ELLIPSIS
+    array([[ 0.2242772...,  0.0708965...,  0.0379772...],
+           [ 0.2849882...,  0.2431117...,  0.1119015...]])
+    """
+
+    RGB = np.asarray(RGB)
+
+    if cmfs is None and primaries is None:
+        M = cvd_matrix_Machado2009(deficiency, severity)
     else:
-        return m1 + (severity - a) * ((m2 - m1) / (b - a))
+        # Avoiding circular import issues.
+        from colour.characterisation import DISPLAYS_RGB_PRIMARIES
+
+        if cmfs is None:
+            cmfs = LMS_CMFS['Smith & Pokorny 1975 Normal Trichromats']
+
+        if primaries is None:
+            primaries = DISPLAYS_RGB_PRIMARIES['Typical CRT Brainard 1997']
+
+        samples, matrices = cvd_matrices_table_Machado2009(
+            deficiency, cmfs, primaries)
+        M = _interpolate_matrices(samples, matrices, severity)
+
+    return dot_vector(M, RGB)
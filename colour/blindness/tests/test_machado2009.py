@@ -11,7 +11,9 @@ import unittest
 from colour.blindness import (CVD_MATRICES_MACHADO2010,
                               cvd_matrix_Machado2009,
                               anomalous_trichromacy_cmfs_Machado2009,
-                              anomalous_trichromacy_matrix_Machado2009)
+                              anomalous_trichromacy_matrix_Machado2009,
+                              cvd_matrices_table_Machado2009,
+                              cvd_simulation_Machado2009)
 from colour.characterisation import DISPLAYS_RGB_PRIMARIES
 from colour.colorimetry import LMS_CMFS
 from colour.utilities import ignore_numpy_errors
@@ -25,7 +27,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestAnomalousTrichromacyCmfsMachado2009',
-    'TestAnomalousTrichromacyMatrixMachado2009', 'TestCvdMatrixMachado2009'
+    'TestAnomalousTrichromacyMatrixMachado2009', 'TestCvdMatrixMachado2009',
+    'TestCvdMatricesTableMachado2009', 'TestCvdSimulationMachado2009'
 ]
 
 
@@ -147,6 +150,31 @@ anomalous_trichromacy_matrix_Machado2009` definition.
             rtol=0.001,
             atol=0.001)
 
+    def test_n_dimensional_anomalous_trichromacy_matrix_Machado2009(self):
+        """
+        Tests :func:`colour.blindness.machado2009.\
+anomalous_trichromacy_matrix_Machado2009` definition n-dimensional arrays
+        support.
+        """
+
+        cmfs = LMS_CMFS.get('Smith & Pokorny 1975 Normal Trichromats')
+        primaries = DISPLAYS_RGB_PRIMARIES['Typical CRT Brainard 1997']
+        d_LMS = np.array([[2, 0, 0], [0, 15, 0], [0, 0, 5], [10, 5, 20]])
+        M = anomalous_trichromacy_matrix_Machado2009(cmfs, primaries, d_LMS)
+        self.assertEqual(M.shape, (4, 3, 3))
+        for i in range(4):
+            np.testing.assert_almost_equal(
+                M[i],
+                anomalous_trichromacy_matrix_Machado2009(
+                    cmfs, primaries, d_LMS[i]),
+                decimal=7)
+
+        d_LMS = np.reshape(d_LMS, (2, 2, 3))
+        np.testing.assert_almost_equal(
+            anomalous_trichromacy_matrix_Machado2009(cmfs, primaries, d_LMS),
+            np.reshape(M, (2, 2, 3, 3)),
+            decimal=7)
+
 
 class TestCvdMatrixMachado2009(unittest.TestCase):
     """
@@ -196,6 +224,28 @@ class TestCvdMatrixMachado2009(unittest.TestCase):
             ]),
             decimal=7)
 
+    def test_n_dimensional_cvd_matrix_Machado2009(self):
+        """
+        Tests :func:`colour.blindness.machado2009.cvd_matrix_Machado2009`
+        definition n-dimensional arrays support.
+        """
+
+        severity = np.array([0.0, 0.15, 0.55, 0.9, 1.0, 1.2])
+        for deficiency in ('Protanomaly', 'Deuteranomaly', 'Tritanomaly'):
+            M = cvd_matrix_Machado2009(deficiency, severity)
+            self.assertEqual(M.shape, (6, 3, 3))
+            for i, value in enumerate(severity):
+                np.testing.assert_almost_equal(
+                    M[i],
+                    cvd_matrix_Machado2009(deficiency, value),
+                    decimal=7)
+
+            np.testing.assert_almost_equal(
+                cvd_matrix_Machado2009(deficiency,
+                                       np.reshape(severity, (2, 3))),
+                np.reshape(M, (2, 3, 3, 3)),
+                decimal=7)
+
     @ignore_numpy_errors
     def test_nan_cvd_matrix_Machado2009(self):
         """
@@ -206,6 +256,153 @@ class TestCvdMatrixMachado2009(unittest.TestCase):
         for case in [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]:
             cvd_matrix_Machado2009('Tritanomaly', case)
 
+        cvd_matrix_Machado2009('Tritanomaly',
+                               np.array([-1.0, 0.0, 1.0, -np.inf, np.inf,
+                                         np.nan]))
+
+
+class TestCvdMatricesTableMachado2009(unittest.TestCase):
+    """
+    Defines :func:`colour.blindness.machado2009.\
+cvd_matrices_table_Machado2009` definition unit tests methods.
+    """
+
+    def test_cvd_matrices_table_Machado2009(self):
+        """
+        Tests :func:`colour.blindness.machado2009.\
+cvd_matrices_table_Machado2009` definition.
+        """
+
+        cmfs = LMS_CMFS.get('Smith & Pokorny 1975 Normal Trichromats')
+        primaries = DISPLAYS_RGB_PRIMARIES['Typical CRT Brainard 1997']
+
+        for deficiency, tolerance in (('Protanomaly', 0.0001),
+                                      ('Deuteranomaly', 0.0001),
+                                      ('Tritanomaly', 0.001)):
+            severities, matrices = cvd_matrices_table_Machado2009(
+                deficiency, cmfs, primaries)
+            self.assertEqual(matrices.shape, (101, 3, 3))
+            np.testing.assert_almost_equal(
+                severities, np.linspace(0, 1, 101), decimal=7)
+            np.testing.assert_almost_equal(
+                matrices[0], np.identity(3), decimal=7)
+
+            for severity in range(1, 11):
+                np.testing.assert_allclose(
+                    matrices[severity * 10],
+                    CVD_MATRICES_MACHADO2010[deficiency][severity / 10],
+                    rtol=tolerance,
+                    atol=tolerance)
+
+        severities, matrices = cvd_matrices_table_Machado2009(
+            'Protanomaly', cmfs, primaries, 11)
+        self.assertEqual(matrices.shape, (11, 3, 3))
+
+    def test_cache_cvd_matrices_table_Machado2009(self):
+        """
+        Tests :func:`colour.blindness.machado2009.\
+cvd_matrices_table_Machado2009` definition cache.
+        """
+
+        cmfs = LMS_CMFS.get('Smith & Pokorny 1975 Normal Trichromats')
+        primaries = DISPLAYS_RGB_PRIMARIES['Typical CRT Brainard 1997']
+
+        self.assertIs(
+            cvd_matrices_table_Machado2009('Protanomaly', cmfs, primaries),
+            cvd_matrices_table_Machado2009('protanomaly', cmfs, primaries))
+
+        self.assertIsNot(
+            cvd_matrices_table_Machado2009('Protanomaly', cmfs, primaries),
+            cvd_matrices_table_Machado2009(
+                'Protanomaly', cmfs,
+                DISPLAYS_RGB_PRIMARIES['Apple Studio Display']))
+
+    def test_raise_exception_cvd_matrices_table_Machado2009(self):
+        """
+        Tests :func:`colour.blindness.machado2009.\
+cvd_matrices_table_Machado2009` definition raised exception.
+        """
+
+        self.assertRaises(
+            KeyError, cvd_matrices_table_Machado2009, 'Achromatopsia',
+            LMS_CMFS.get('Smith & Pokorny 1975 Normal Trichromats'),
+            DISPLAYS_RGB_PRIMARIES['Typical CRT Brainard 1997'])
+
+
+class TestCvdSimulationMachado2009(unittest.TestCase):
+    """
+    Defines :func:`colour.blindness.machado2009.cvd_simulation_Machado2009`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._RGB = np.random.RandomState(4).uniform(0, 1, (5, 7, 3))
+
+    def test_cvd_simulation_Machado2009(self):
+        """
+        Tests :func:`colour.blindness.machado2009.cvd_simulation_Machado2009`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            cvd_simulation_Machado2009(self._RGB, 'Deuteranomaly', 0.15),
+            np.einsum('ij,...j->...i',
+                      cvd_matrix_Machado2009('Deuteranomaly', 0.15),
+                      self._RGB),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            cvd_simulation_Machado2009(self._RGB, 'Protanomaly', 0),
+            self._RGB,
+            decimal=7)
+
+        severity = np.random.RandomState(8).uniform(0, 1, (5, 7))
+        RGB = cvd_simulation_Machado2009(self._RGB, 'Protanomaly', severity)
+        for i in range(5):
+            for j in range(7):
+                np.testing.assert_almost_equal(
+                    RGB[i, j],
+                    np.dot(
+                        cvd_matrix_Machado2009('Protanomaly', severity[i, j]),
+                        self._RGB[i, j]),
+                    decimal=7)
+
+    def test_cvd_simulation_Machado2009_table(self):
+        """
+        Tests :func:`colour.blindness.machado2009.cvd_simulation_Machado2009`
+        definition with computed *CVD* matrices tables.
+        """
+
+        cmfs = LMS_CMFS.get('Smith & Pokorny 1975 Normal Trichromats')
+        primaries = DISPLAYS_RGB_PRIMARIES['Typical CRT Brainard 1997']
+
+        severity = np.random.RandomState(8).uniform(0, 1, (5, 7))
+        d_LMS = np.zeros((5, 7, 3))
+        d_LMS[..., 1] = severity * 20
+        np.testing.assert_allclose(
+            cvd_simulation_Machado2009(
+                self._RGB, 'Deuteranomaly', severity, cmfs=cmfs),
+            np.einsum('...ij,...j->...i',
+                      anomalous_trichromacy_matrix_Machado2009(
+                          cmfs, primaries, d_LMS), self._RGB),
+            atol=0.001)
+
+        _severities, matrices = cvd_matrices_table_Machado2009(
+            'Deuteranomaly', cmfs,
+            DISPLAYS_RGB_PRIMARIES['Apple Studio Display'])
+        np.testing.assert_almost_equal(
+            cvd_simulation_Machado2009(
+                self._RGB,
+                'Deuteranomaly',
+                0.37,
+                primaries=DISPLAYS_RGB_PRIMARIES['Apple Studio Display']),
+            np.einsum('ij,...j->...i', matrices[37], self._RGB),
+            decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,10 +6,28 @@ from .cameras import RGB_SpectralSensitivities
 from .displays import RGB_DisplayPrimaries
 from .dataset import *  # noqa
 from . import dataset
-from .fitting import first_order_colour_fit
+from .fitting import (
+    FITTING_LOSSES, HUBER_THRESHOLD, first_order_colour_fit,
+    augmented_matrix_Cheung2004, polynomial_expansion_Finlayson2015,
+    POLYNOMIAL_EXPANSION_METHODS, polynomial_expansion,
+    colour_correction_matrix, apply_colour_correction_matrix,
+    colour_correction, cross_validate_colour_correction)
+from .idt import (IDT_OPTIMISATION_METHODS, IDT_TARGETS,
+                  training_data_spds_to_RGB, training_data_spds_to_XYZ,
+                  idt_matrix)
 
 __all__ = []
 __all__ += ['RGB_SpectralSensitivities']
 __all__ += ['RGB_DisplayPrimaries']
 __all__ += dataset.__all__
-__all__ += ['first_order_colour_fit']
+__all__ += [
+    'FITTING_LOSSES', 'HUBER_THRESHOLD', 'first_order_colour_fit',
+    'augmented_matrix_Cheung2004', 'polynomial_expansion_Finlayson2015',
+    'POLYNOMIAL_EXPANSION_METHODS', 'polynomial_expansion',
+    'colour_correction_matrix', 'apply_colour_correction_matrix',
+    'colour_correction', 'cross_validate_colour_correction'
+]
+__all__ += [
+    'IDT_OPTIMISATION_METHODS', 'IDT_TARGETS', 'training_data_spds_to_RGB',
+    'training_data_spds_to_XYZ', 'idt_matrix'
+]
@@ -3,7 +3,16 @@
 Colour Fitting
 ==============
 
-Defines various objects for colour fitting, like colour matching two images.
+Defines various objects for colour fitting, like colour matching two images:
+
+-   :func:`colour.characterisation.first_order_colour_fit`
+-   :func:`colour.characterisation.augmented_matrix_Cheung2004`
+-   :func:`colour.characterisation.polynomial_expansion_Finlayson2015`
+-   :func:`colour.characterisation.polynomial_expansion`
+-   :func:`colour.characterisation.colour_correction_matrix`
+-   :func:`colour.characterisation.apply_colour_correction_matrix`
+-   :func:`colour.characterisation.colour_correction`
+-   :func:`colour.characterisation.cross_validate_colour_correction`
 
 See Also
 --------
@@ -14,8 +23,14 @@ blob/master/notebooks/characterisation/fitting.ipynb>`_
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
+import multiprocessing.pool
 import numpy as np
 
+from colour.constants import EPSILON
+from colour.utilities import (CaseInsensitiveMapping, dot_vector,
+                              filter_kwargs, tsplit, tstack)
+
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
 __license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
@@ -23,7 +38,34 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['first_order_colour_fit']
+__all__ = [
+    'FITTING_LOSSES', 'HUBER_THRESHOLD', 'first_order_colour_fit',
+    'augmented_matrix_Cheung2004', 'polynomial_expansion_Finlayson2015',
+    'POLYNOMIAL_EXPANSION_METHODS', 'polynomial_expansion',
+    'colour_correction_matrix', 'apply_colour_correction_matrix',
+    'colour_correction', 'cross_validate_colour_correction'
+]
+
+FITTING_LOSSES = ('Linear', 'Huber')
+"""
+Supported colour correction matrices fitting losses:
+
+-   *Linear*: Ordinary, optionally weighted, least squares.
+-   *Huber*: Robust least squares using iteratively reweighted least squares
+    with *Huber* weights, reducing the influence of outlier samples, e.g.
+    clipped or mis-detected *ColorChecker* patches.
+
+FITTING_LOSSES : tuple
+    **{'Linear', 'Huber'}**
+"""
+
+HUBER_THRESHOLD = 1.345
+"""
+*Huber* loss threshold in units of the residuals robust scale, yielding 95%
+efficiency with normally distributed residuals.
+
+HUBER_THRESHOLD : numeric
+"""
 
 
 def first_order_colour_fit(m_1, m_2):
@@ -108,3 +150,689 @@ def first_order_colour_fit(m_1, m_2):
     """
 
     return np.transpose(np.linalg.lstsq(m_1, m_2)[0])
+
+
+def augmented_matrix_Cheung2004(RGB, terms=3):
+    """
+    Performs polynomial expansion of given *RGB* colourspace array using
+    *Cheung et al. (2004)* method.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array to expand.
+    terms : integer, optional
+        **{3, 5, 7, 8, 10, 11, 14, 16, 17, 19, 20, 22}**,
+        Number of terms of the expanded polynomial.
+
+    Returns
+    -------
+    ndarray
+        Expanded *RGB* colourspace array of shape (..., terms).
+
+    Raises
+    ------
+    ValueError
+        If the number of terms is not supported.
+
+    Examples
+    --------
+    >>> RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+    >>> augmented_matrix_Cheung2004(RGB, terms=5)  # doctest: +ELLIPSIS
+    array([ 0.1722481 ,  0.0917066 ,  0.06416938,  0.00101364,  1.        ])
+    """
+
+    R, G, B = tsplit(RGB)
+    ones = np.ones(R.shape)
+
+    quadratic = [R * G, R * B, G * B]
+    squares = [R ** 2, G ** 2, B ** 2]
+    cubes = [R ** 3, G ** 3, B ** 3]
+    mixed = [R ** 2 * G, G ** 2 * B, B ** 2 * R]
+    mixed_r = [R ** 2 * B, G ** 2 * R, B ** 2 * G]
+
+    expansions = {
+        3: [R, G, B],
+        5: [R, G, B, R * G * B, ones],
+        7: [R, G, B] + quadratic + [ones],
+        8: [R, G, B] + quadratic + [R * G * B, ones],
+        10: [R, G, B] + quadratic + squares + [ones],
+        11: [R, G, B] + quadratic + squares + [R * G * B, ones],
+        14: [R, G, B] + quadratic + squares + [R * G * B] + cubes + [ones],
+        16: [R, G, B] + quadratic + squares + [R * G * B] + mixed + cubes,
+        17: ([R, G, B] + quadratic + squares + [R * G * B] + mixed + cubes +
+             [ones]),
+        19: ([R, G, B] + quadratic + squares + [R * G * B] + mixed + mixed_r +
+             cubes),
+        20: ([R, G, B] + quadratic + squares + [R * G * B] + mixed + mixed_r +
+             cubes + [ones]),
+        22: ([R, G, B] + quadratic + squares + [R * G * B] + mixed + mixed_r +
+             cubes + [R ** 2 * G ** 2, G ** 2 * B ** 2, B ** 2 * R ** 2]),
+    }
+
+    if terms not in expansions:
+        raise ValueError(
+            '"{0}" terms count is invalid, it must be one of {1}!'.format(
+                terms, sorted(expansions.keys())))
+
+    return tstack(expansions[terms])
+
+
+def polynomial_expansion_Finlayson2015(RGB,
+                                       degree=1,
+                                       root_polynomial_expansion=True):
+    """
+    Performs polynomial expansion of given *RGB* colourspace array using
+    *Finlayson et al. (2015)* method.
+
+    The root-polynomial expansion terms are homogeneous of degree one, thus
+    the fitted colour correction is invariant to exposure changes.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array to expand.
+    degree : integer, optional
+        **{1, 2, 3, 4}**,
+        Expanded polynomial degree.
+    root_polynomial_expansion : bool, optional
+        Whether to use the root-polynomial set of terms or the polynomial set
+        of terms.
+
+    Returns
+    -------
+    ndarray
+        Expanded *RGB* colourspace array.
+
+    Raises
+    ------
+    ValueError
+        If the degree is not supported.
+
+    Notes
+    -----
+    -   The root-polynomial expansion of degree 1, 2, 3 and 4 has respectively
+        3, 6, 13 and 22 terms while the polynomial expansion has respectively
+        3, 9, 19 and 34 terms.
+
+    Examples
+    --------
+    >>> RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+    >>> polynomial_expansion_Finlayson2015(RGB, degree=2)
+    ... # doctest: +ELLIPSIS
+    array([ 0.1722481 ,  0.0917066 ,  0.06416938,  0.12568328,  0.07671216,
+            0.1051335 ])
+    """
+
+    if degree not in (1, 2, 3, 4):
+        raise ValueError(
+            '"{0}" degree is invalid, it must be one of {1}!'.format(
+                degree, [1, 2, 3, 4]))
+
+    R, G, B = tsplit(RGB)
+
+    if root_polynomial_expansion:
+
+        def root(a, n):
+            """
+            Returns the sign preserving :math:`n`-th root of given array.
+            """
+
+            return np.sign(a) * np.abs(a) ** (1 / n)
+
+        terms = [R, G, B]
+        if degree >= 2:
+            terms += [
+                root(R * G, 2),
+                root(G * B, 2),
+                root(R * B, 2),
+            ]
+        if degree >= 3:
+            terms += [
+                root(R * G ** 2, 3),
+                root(G * B ** 2, 3),
+                root(R * B ** 2, 3),
+                root(G * R ** 2, 3),
+                root(B * G ** 2, 3),
+                root(B * R ** 2, 3),
+                root(R * G * B, 3),
+            ]
+        if degree == 4:
+            terms += [
+                root(R ** 3 * G, 4),
+                root(R ** 3 * B, 4),
+                root(G ** 3 * R, 4),
+                root(G ** 3 * B, 4),
+                root(B ** 3 * R, 4),
+                root(B ** 3 * G, 4),
+                root(R ** 2 * G * B, 4),
+                root(G ** 2 * R * B, 4),
+                root(B ** 2 * R * G, 4),
+            ]
+    else:
+        terms = [R, G, B]
+        if degree >= 2:
+            terms += [R ** 2, G ** 2, B ** 2, R * G, G * B, R * B]
+        if degree >= 3:
+            terms += [
+                R ** 3, G ** 3, B ** 3, R * G ** 2, G * B ** 2, R * B ** 2,
+                G * R ** 2, B * G ** 2, B * R ** 2, R * G * B
+            ]
+        if degree == 4:
+            terms += [
+                R ** 4, G ** 4, B ** 4, R ** 3 * G, R ** 3 * B, G ** 3 * R,
+                G ** 3 * B, B ** 3 * R, B ** 3 * G, R ** 2 * G ** 2,
+                G ** 2 * B ** 2, R ** 2 * B ** 2, R ** 2 * G * B,
+                G ** 2 * R * B, B ** 2 * R * G
+            ]
+
+    return tstack(terms)
+
+
+POLYNOMIAL_EXPANSION_METHODS = CaseInsensitiveMapping({
+    'Cheung 2004': augmented_matrix_Cheung2004,
+    'Finlayson 2015': polynomial_expansion_Finlayson2015
+})
+POLYNOMIAL_EXPANSION_METHODS.__doc__ = """
+Supported polynomial expansion methods.
+
+POLYNOMIAL_EXPANSION_METHODS : CaseInsensitiveMapping
+    **{'Cheung 2004', 'Finlayson 2015'}**
+"""
+
+
+def polynomial_expansion(a, method='Cheung 2004', **kwargs):
+    """
+    Performs polynomial expansion of given :math:`a` array, i.e. computes the
+    design matrix of the colour correction.
+
+    Parameters
+    ----------
+    a : array_like
+        :math:`a` array to expand.
+    method : unicode, optional
+        **{'Cheung 2004', 'Finlayson 2015'}**,
+        Computation method.
+
+    Other Parameters
+    ----------------
+    terms : integer
+        {:func:`colour.characterisation.augmented_matrix_Cheung2004`},
+        Number of terms of the expanded polynomial.
+    degree : integer
+        {:func:`colour.characterisation.polynomial_expansion_Finlayson2015`},
+        Expanded polynomial degree.
+    root_polynomial_expansion : bool
+        {:func:`colour.characterisation.polynomial_expansion_Finlayson2015`},
+        Whether to use the root-polynomial set of terms or the polynomial set
+        of terms.
+
+    Returns
+    -------
+    ndarray
+        Expanded :math:`a` array.
+
+    Examples
+    --------
+    >>> RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+    >>> polynomial_expansion(RGB)  # doctest: +ELLIPSIS
+    array([ 0.1722481...,  0.0917066...,  0.0641693...])
+    >>> polynomial_expansion(RGB, 'Cheung 2004', terms=5)
+    ... # doctest: +ELLIPSIS
+    array([ 0.1722481 ,  0.0917066 ,  0.06416938,  0.00101364,  1.        ])
+    """
+
+    function = POLYNOMIAL_EXPANSION_METHODS[method]
+
+    return function(a, **filter_kwargs(function, **kwargs))
+
+
+def _least_squares(X, Y, weights=None):
+    """
+    Solves given stacked weighted linear least squares problems.
+
+    Parameters
+    ----------
+    X : array_like
+        Design matrices of shape (..., n, k).
+    Y : array_like
+        Target arrays of shape (..., n, c).
+    weights : array_like, optional
+        Samples weights of shape (..., n).
+
+    Returns
+    -------
+    ndarray
+        Solutions of shape (..., k, c).
+    """
+
+    if weights is not None:
+        weights = np.sqrt(weights)[..., np.newaxis]
+        X, Y = X * weights, Y * weights
+
+    return np.matmul(np.linalg.pinv(X), Y)
+
+
+def _residuals(X, Y, B):
+    """
+    Returns the Euclidean norm of the residuals of given stacked linear least
+    squares problems solutions.
+
+    Parameters
+    ----------
+    X : array_like
+        Design matrices of shape (..., n, k).
+    Y : array_like
+        Target arrays of shape (..., n, c).
+    B : array_like
+        Solutions of shape (..., k, c).
+
+    Returns
+    -------
+    ndarray
+        Residuals of shape (..., n).
+    """
+
+    return np.linalg.norm(np.matmul(X, B) - Y, axis=-1)
+
+
+def _fit_colour_correction(X, Y, weights, loss, iterations):
+    """
+    Fits the colour correction solutions of given stacked design matrices
+    and target arrays.
+
+    Parameters
+    ----------
+    X : ndarray
+        Design matrices of shape (..., n, k).
+    Y : ndarray
+        Target arrays of shape (..., n, c).
+    weights : ndarray
+        Samples weights of shape (..., n) or *None*.
+    loss : unicode
+        **{'Linear', 'Huber'}**,
+        Fitting loss.
+    iterations : integer
+        Maximum iterations count of the iteratively reweighted least squares.
+
+    Returns
+    -------
+    ndarray
+        Solutions of shape (..., k, c).
+    """
+
+    B = _least_squares(X, Y, weights)
+
+    if loss == 'Huber':
+        w_s = np.ones(X.shape[:-1]) if weights is None else weights
+        for _ in range(iterations):
+            r = _residuals(X, Y, B)
+
+            # Robust scale estimation using the median of the residuals
+            # norms, i.e. their median absolute deviation from zero, floored
+            # so that the samples are not discarded when more than half of
+            # the residuals are zero.
+            scale = HUBER_THRESHOLD * np.maximum(
+                1.4826 * np.median(r, axis=-1),
+                EPSILON * np.max(r, axis=-1))[..., np.newaxis]
+            w = np.where(r > scale, scale / np.where(r == 0, 1, r), 1)
+
+            B_p, B = B, _least_squares(X, Y, w_s * w)
+            if np.allclose(B, B_p, rtol=0, atol=1e-10):
+                break
+
+    return B
+
+
+def colour_correction_matrix(M_T,
+                             M_R,
+                             method='Cheung 2004',
+                             weights=None,
+                             loss='Linear',
+                             iterations=20,
+                             **kwargs):
+    """
+    Computes the colour correction matrix fitting given :math:`M_T` colour
+    array to :math:`M_R` colour array.
+
+    The design matrix is expanded once with given polynomial expansion method
+    and stacked :math:`M_T` and :math:`M_R` colour arrays, e.g. the
+    *ColorChecker* measurements of many cameras, are solved at once.
+
+    Parameters
+    ----------
+    M_T : array_like
+        Test array :math:`M_T` of shape (..., n, 3) to fit onto array
+        :math:`M_R`.
+    M_R : array_like
+        Reference array :math:`M_R` of shape (..., n, 3) the array
+        :math:`M_T` will be colour fitted against.
+    method : unicode, optional
+        **{'Cheung 2004', 'Finlayson 2015'}**,
+        Polynomial expansion method.
+    weights : array_like, optional
+        Samples weights of shape (..., n).
+    loss : unicode, optional
+        **{'Linear', 'Huber'}**,
+        Fitting loss.
+    iterations : integer, optional
+        Maximum iterations count of the iteratively reweighted least squares
+        with the *Huber* loss.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments for the polynomial expansion method, see
+        :func:`colour.characterisation.polynomial_expansion` definition.
+
+    Returns
+    -------
+    ndarray
+        Colour correction matrix of shape (..., 3, terms).
+
+    Raises
+    ------
+    ValueError
+        If the fitting loss is not supported.
+
+    Examples
+    --------
+    >>> M_T = np.array(
+    ...     [[0.17224810, 0.09170660, 0.06416938],
+    ...      [0.49189645, 0.27802050, 0.21923399],
+    ...      [0.10999751, 0.18658946, 0.29938611],
+    ...      [0.11666120, 0.14327905, 0.05713804],
+    ...      [0.18988879, 0.18227649, 0.36056247],
+    ...      [0.12501329, 0.42223442, 0.37027445],
+    ...      [0.64785606, 0.22396782, 0.03365194],
+    ...      [0.06761093, 0.11076896, 0.39779139],
+    ...      [0.49101797, 0.09448929, 0.11623839],
+    ...      [0.11622386, 0.04425753, 0.14469986],
+    ...      [0.36867946, 0.44545230, 0.06028681],
+    ...      [0.61632937, 0.32323906, 0.02437089],
+    ...      [0.03016472, 0.06153243, 0.29014596],
+    ...      [0.11103655, 0.30553067, 0.08149137],
+    ...      [0.41162190, 0.05816656, 0.04845934],
+    ...      [0.73339206, 0.53075188, 0.02475212],
+    ...      [0.47347718, 0.08834792, 0.30310315],
+    ...      [0.00000000, 0.25187016, 0.35062450],
+    ...      [0.76809639, 0.78486240, 0.77808297],
+    ...      [0.53822392, 0.54307997, 0.54710883],
+    ...      [0.35458526, 0.35318419, 0.35524431],
+    ...      [0.17976704, 0.18000531, 0.17991488],
+    ...      [0.09351417, 0.09510603, 0.09675027],
+    ...      [0.03405071, 0.03295077, 0.03702047]]
+    ... )
+    >>> M_R = np.array(
+    ...     [[0.15579559, 0.09715755, 0.07514556],
+    ...      [0.39113140, 0.25943419, 0.21266708],
+    ...      [0.12824821, 0.18463570, 0.31508023],
+    ...      [0.12028974, 0.13455659, 0.07408400],
+    ...      [0.19368988, 0.21158946, 0.37955964],
+    ...      [0.19957425, 0.36085439, 0.40678123],
+    ...      [0.48896605, 0.20691688, 0.05816533],
+    ...      [0.09775522, 0.16710693, 0.47147724],
+    ...      [0.39358649, 0.12233400, 0.10526425],
+    ...      [0.10780332, 0.07258529, 0.16151473],
+    ...      [0.27502671, 0.34705454, 0.09728099],
+    ...      [0.43980441, 0.26880559, 0.05430533],
+    ...      [0.05887212, 0.11126272, 0.38552469],
+    ...      [0.12705825, 0.25787860, 0.13566464],
+    ...      [0.35612929, 0.07933258, 0.05118732],
+    ...      [0.48131976, 0.42082843, 0.07120612],
+    ...      [0.34665585, 0.15170714, 0.24969804],
+    ...      [0.08261116, 0.24588716, 0.48707733],
+    ...      [0.66054904, 0.65941137, 0.66376412],
+    ...      [0.48051509, 0.47870296, 0.48230082],
+    ...      [0.33045354, 0.32904184, 0.33228886],
+    ...      [0.18001305, 0.17978567, 0.18004416],
+    ...      [0.10283975, 0.10424680, 0.10384975],
+    ...      [0.04742204, 0.04772203, 0.04914226]]
+    ... )
+    >>> colour_correction_matrix(M_T, M_R)  # doctest: +ELLIPSIS
+    array([[ 0.6982266...,  0.0307162...,  0.1621042...],
+           [ 0.0689349...,  0.6757961...,  0.1643038...],
+           [-0.0631495...,  0.0921247...,  0.9713415...]])
+    >>> colour_correction_matrix(M_T, M_R, 'Finlayson 2015', degree=2).shape
+    (3, 6)
+    """
+
+    if loss not in FITTING_LOSSES:
+        raise ValueError(
+            '"{0}" fitting loss is invalid, it must be one of {1}!'.format(
+                loss, FITTING_LOSSES))
+
+    X = polynomial_expansion(M_T, method, **kwargs)
+    Y = np.asarray(M_R)
+
+    if weights is not None:
+        weights = np.asarray(weights)
+
+    return np.swapaxes(
+        _fit_colour_correction(X, Y, weights, loss, iterations), -1, -2)
+
+
+def apply_colour_correction_matrix(RGB, CCM, method='Cheung 2004', **kwargs):
+    """
+    Applies given colour correction matrix to given *RGB* colourspace array.
+
+    The *RGB* colourspace array is expanded and the colour correction matrix
+    applied in a single vectorised pass.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array to colour correct, e.g. an image.
+    CCM : array_like
+        Colour correction matrix of shape (3, terms) or matrices of shape
+        (..., 3, terms) broadcasting against the *RGB* colourspace array
+        leading dimensions.
+    method : unicode, optional
+        **{'Cheung 2004', 'Finlayson 2015'}**,
+        Polynomial expansion method the colour correction matrix was computed
+        with.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments for the polynomial expansion method, see
+        :func:`colour.characterisation.polynomial_expansion` definition.
+
+    Returns
+    -------
+    ndarray
+        Colour corrected *RGB* colourspace array.
+
+    Examples
+    --------
+    >>> RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+    >>> CCM = np.array(
+    ...     [[0.69822661, 0.03071629, 0.16210422],
+    ...      [0.06893499, 0.67579611, 0.16430385],
+    ...      [-0.06314955, 0.09212470, 0.97134152]])
+    >>> apply_colour_correction_matrix(RGB, CCM)  # doctest: +ELLIPSIS
+    array([ 0.1334872...,  0.0843921...,  0.0599014...])
+    """
+
+    return dot_vector(CCM, polynomial_expansion(RGB, method, **kwargs))
+
+
+def colour_correction(RGB, M_T, M_R, method='Cheung 2004', **kwargs):
+    """
+    Performs colour correction of given *RGB* colourspace array using the
+    colour correction matrix fitting given :math:`M_T` colour array to
+    :math:`M_R` colour array.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array to colour correct, e.g. an image.
+    M_T : array_like
+        Test array :math:`M_T` of shape (..., n, 3) to fit onto array
+        :math:`M_R`.
+    M_R : array_like
+        Reference array :math:`M_R` of shape (..., n, 3) the array
+        :math:`M_T` will be colour fitted against.
+    method : unicode, optional
+        **{'Cheung 2004', 'Finlayson 2015'}**,
+        Polynomial expansion method.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        {:func:`colour.characterisation.colour_correction_matrix`,
+        :func:`colour.characterisation.polynomial_expansion`},
+        Please refer to the documentation of the previously listed
+        definitions.
+
+    Returns
+    -------
+    ndarray
+        Colour corrected *RGB* colourspace array.
+
+    Examples
+    --------
+    >>> RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+    >>> M_T = np.array(
+    ...     [[0.17224810, 0.09170660, 0.06416938],
+    ...      [0.49189645, 0.27802050, 0.21923399],
+    ...      [0.10999751, 0.18658946, 0.29938611],
+    ...      [0.11666120, 0.14327905, 0.05713804]]
+    ... )
+    >>> M_R = np.array(
+    ...     [[0.15579559, 0.09715755, 0.07514556],
+    ...      [0.39113140, 0.25943419, 0.21266708],
+    ...      [0.12824821, 0.18463570, 0.31508023],
+    ...      [0.12028974, 0.13455659, 0.07408400]]
+    ... )
+    >>> colour_correction(RGB, M_T, M_R)  # doctest: +ELLIPSIS
+    array([ 0.1375371...,  0.0864620...,  0.0627849...])
+    """
+
+    CCM = colour_correction_matrix(M_T, M_R, method, **kwargs)
+
+    return apply_colour_correction_matrix(RGB, CCM, method, **kwargs)
+
+
+def cross_validate_colour_correction(M_T,
+                                     M_R,
+                                     folds=5,
+                                     processes=None,
+                                     method='Cheung 2004',
+                                     weights=None,
+                                     loss='Linear',
+                                     iterations=20,
+                                     **kwargs):
+    """
+    Performs the :math:`k`-fold cross-validation of the colour correction
+    fitting given :math:`M_T` colour array to :math:`M_R` colour array.
+
+    The samples are assigned to the folds in an interleaved manner, the
+    design matrix is expanded once and the folds are fitted concurrently, all
+    the stacked :math:`M_T` and :math:`M_R` colour arrays being solved at
+    once for each fold.
+
+    Parameters
+    ----------
+    M_T : array_like
+        Test array :math:`M_T` of shape (..., n, 3) to fit onto array
+        :math:`M_R`.
+    M_R : array_like
+        Reference array :math:`M_R` of shape (..., n, 3) the array
+        :math:`M_T` will be colour fitted against.
+    folds : integer, optional
+        Folds count :math:`k`.
+    processes : integer, optional
+        Threads count fitting the folds, default to
+        :func:`multiprocessing.cpu_count` definition.
+    method : unicode, optional
+        **{'Cheung 2004', 'Finlayson 2015'}**,
+        Polynomial expansion method.
+    weights : array_like, optional
+        Samples weights of shape (..., n).
+    loss : unicode, optional
+        **{'Linear', 'Huber'}**,
+        Fitting loss.
+    iterations : integer, optional
+        Maximum iterations count of the iteratively reweighted least squares
+        with the *Huber* loss.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments for the polynomial expansion method, see
+        :func:`colour.characterisation.polynomial_expansion` definition.
+
+    Returns
+    -------
+    ndarray
+        Root mean square error of the held-out samples of each fold of shape
+        (..., folds).
+
+    Raises
+    ------
+    ValueError
+        If the fitting loss is not supported or if the folds count is not in
+        domain [2, n].
+
+    Examples
+    --------
+    >>> M_T = np.random.RandomState(4).uniform(0, 1, (24, 3))
+    >>> M_R = np.dot(M_T, np.array(
+    ...     [[0.69822661, 0.03071629, 0.16210422],
+    ...      [0.06893499, 0.67579611, 0.16430385],
+    ...      [-0.06314955, 0.09212470, 0.97134152]]).T) ** 0.9
+    >>> cross_validate_colour_correction(M_T, M_R, 4)  # doctest: +ELLIPSIS
+    array([ 0.0299620...,  0.0248145...,  0.0233795...,  0.0291239...])
+    """
+
+    if loss not in FITTING_LOSSES:
+        raise ValueError(
+            '"{0}" fitting loss is invalid, it must be one of {1}!'.format(
+                loss, FITTING_LOSSES))
+
+    X = polynomial_expansion(M_T, method, **kwargs)
+    Y = np.asarray(M_R)
+
+    samples = X.shape[-2]
+    if not 2 <= folds <= samples:
+        raise ValueError(
+            '"{0}" folds count is invalid, it must be in domain '
+            '[2, {1}]!'.format(folds, samples))
+
+    if weights is not None:
+        weights = np.asarray(weights) * np.ones(X.shape[:-1])
+
+    indexes = np.arange(samples)
+
+    def validate(fold):
+        """
+        Fits the colour correction without given fold samples and returns the
+        held-out samples root mean square error.
+        """
+
+        test = indexes % folds == fold
+        train = ~test
+
+        B = _fit_colour_correction(
+            X[..., train, :], Y[..., train, :],
+            None if weights is None else weights[..., train], loss,
+            iterations)
+
+        r = _residuals(X[..., test, :], Y[..., test, :], B)
+
+        return np.sqrt(np.mean(r ** 2, axis=-1))
+
+    processes = processes if processes else multiprocessing.cpu_count()
+
+    if processes == 1:
+        errors = [validate(fold) for fold in range(folds)]
+    else:
+        pool = multiprocessing.pool.ThreadPool(processes=processes)
+        try:
+            errors = pool.map(validate, range(folds))
+        finally:
+            pool.close()
+            pool.join()
+
+    return tstack(errors)
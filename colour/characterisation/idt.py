@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+"""
+Input Device Transform
+======================
+
+Defines the objects to compute the *Input Device Transform* (IDT) matrix of a
+camera from its *RGB* spectral sensitivities:
+
+-   :func:`colour.characterisation.training_data_spds_to_RGB`
+-   :func:`colour.characterisation.training_data_spds_to_XYZ`
+-   :func:`colour.characterisation.idt_matrix`
+
+The training data reflectances are integrated against the camera *RGB*
+spectral sensitivities and the colour matching functions under one or many
+illuminants at once, the matrices of all the illuminants being solved in
+bulk.
+
+See Also
+--------
+:func:`colour.models.spectral_to_aces_relative_exposure_values`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import Mapping
+
+from colour.adaptation import chromatic_adaptation_matrix_VonKries
+from colour.characterisation import COLOURCHECKERS_SPDS
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                STANDARD_OBSERVERS_CMFS,
+                                SpectralPowerDistribution)
+from colour.difference import delta_E_CIE1976, delta_E_CIE2000
+from colour.models import (ACES_2065_1_COLOURSPACE, XYZ_to_Lab, XYZ_to_xy,
+                           xy_to_XYZ)
+from colour.utilities import dot_matrix, dot_vector, ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'IDT_OPTIMISATION_METHODS', 'IDT_TARGETS', 'training_data_spds_to_RGB',
+    'training_data_spds_to_XYZ', 'idt_matrix'
+]
+
+IDT_OPTIMISATION_METHODS = ('Linear', 'CIE 1976', 'CIE 2000')
+"""
+Supported *IDT* matrix optimisation methods:
+
+-   *Linear*: White preserving linear least squares in the target space,
+    solved in closed form for all the illuminants at once.
+-   *CIE 1976*: White preserving minimisation of the *CIE 1976* colour
+    differences in *CIE L\\*a\\*b\\** colourspace.
+-   *CIE 2000*: White preserving minimisation of the *CIE 2000* colour
+    differences in *CIE L\\*a\\*b\\** colourspace.
+
+IDT_OPTIMISATION_METHODS : tuple
+    **{'Linear', 'CIE 1976', 'CIE 2000'}**
+"""
+
+IDT_TARGETS = ('ACES2065-1', 'CIE XYZ')
+"""
+Supported *IDT* matrix target spaces:
+
+-   *ACES2065-1*: *ACES2065-1* colourspace, the training data *CIE XYZ*
+    tristimulus values being chromatically adapted to *ACES2065-1*
+    colourspace whitepoint.
+-   *CIE XYZ*: *CIE XYZ* tristimulus values under the illuminant.
+
+IDT_TARGETS : tuple
+    **{'ACES2065-1', 'CIE XYZ'}**
+"""
+
+_IDT_MATRICES_CACHE = {}
+
+
+def _spectral_values(data, shape):
+    """
+    Returns given spectral data values aligned to given spectral shape with
+    wavelengths in the last axis.
+
+    Parameters
+    ----------
+    data : SpectralPowerDistribution or MultiSpectralPowerDistribution or \
+dict_like or array_like
+        Spectral data, e.g. a mapping of spectral power distributions. Arrays
+        are expected to be already aligned to given spectral shape.
+    shape : SpectralShape
+        Spectral shape to align the spectral data to.
+
+    Returns
+    -------
+    ndarray
+        Spectral data values of shape (..., wavelengths).
+    """
+
+    if isinstance(data,
+                  (SpectralPowerDistribution, MultiSpectralPowerDistribution)):
+        values = data.copy().align(shape).values
+
+        return values if values.ndim == 1 else np.transpose(values)
+    elif isinstance(data, Mapping):
+        return np.array(
+            [_spectral_values(spd, shape) for spd in data.values()])
+    else:
+        return np.asarray(data)
+
+
+def _spectral_hash(data):
+    """
+    Returns the hash of given spectral data.
+
+    Parameters
+    ----------
+    data : SpectralPowerDistribution or MultiSpectralPowerDistribution or \
+dict_like or array_like
+        Spectral data.
+
+    Returns
+    -------
+    integer
+        Spectral data hash.
+    """
+
+    if isinstance(data,
+                  (SpectralPowerDistribution, MultiSpectralPowerDistribution)):
+        return hash((data.values.tobytes(), data.wavelengths.tobytes()))
+    elif isinstance(data, Mapping):
+        return hash(tuple(_spectral_hash(spd) for spd in data.values()))
+    else:
+        data = np.asarray(data)
+
+        return hash((data.tobytes(), data.shape))
+
+
+def training_data_spds_to_RGB(training_data, sensitivities, illuminant):
+    """
+    Converts given training data reflectances to white balanced camera *RGB*
+    values under given illuminants.
+
+    Parameters
+    ----------
+    training_data : MultiSpectralPowerDistribution or dict_like or \
+array_like
+        Training data reflectances, arrays are of shape (n, wavelengths).
+    sensitivities : RGB_SpectralSensitivities
+        Camera *RGB* spectral sensitivities.
+    illuminant : SpectralPowerDistribution or \
+MultiSpectralPowerDistribution or array_like
+        Illuminant or illuminants, arrays are of shape (..., wavelengths).
+
+    Returns
+    -------
+    ndarray
+        White balanced camera *RGB* values of shape (..., n, 3).
+
+    Notes
+    -----
+    -   The spectral data are aligned to the camera *RGB* spectral
+        sensitivities shape.
+    -   The camera *RGB* values are white balanced so that a perfect
+        reflecting diffuser yields *RGB* values of 1.
+
+    Examples
+    --------
+    >>> from colour import (CAMERAS_RGB_SPECTRAL_SENSITIVITIES,
+    ...                     COLOURCHECKERS_SPDS, ILLUMINANTS_SPDS)
+    >>> sensitivities = CAMERAS_RGB_SPECTRAL_SENSITIVITIES['Nikon 5100 (NPL)']
+    >>> training_data = COLOURCHECKERS_SPDS['ColorChecker N Ohta']
+    >>> RGB = training_data_spds_to_RGB(
+    ...     training_data, sensitivities, ILLUMINANTS_SPDS['D55'])
+    >>> RGB[0]  # doctest: +ELLIPSIS
+    array([ 0.1369774...,  0.0790186...,  0.0580646...])
+    """
+
+    shape = sensitivities.shape
+
+    R = _spectral_values(training_data, shape)
+    I = _spectral_values(illuminant, shape)
+    S = sensitivities.values
+
+    RGB_w = np.dot(I, S)
+    RGB = np.einsum('...w,nw,wc->...nc', I, R, S)
+
+    return RGB / RGB_w[..., np.newaxis, :]
+
+
+def training_data_spds_to_XYZ(training_data, cmfs, illuminant, shape=None):
+    """
+    Converts given training data reflectances to *CIE XYZ* tristimulus values
+    under given illuminants.
+
+    Parameters
+    ----------
+    training_data : MultiSpectralPowerDistribution or dict_like or \
+array_like
+        Training data reflectances, arrays are of shape (n, wavelengths).
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution or \
+MultiSpectralPowerDistribution or array_like
+        Illuminant or illuminants, arrays are of shape (..., wavelengths).
+    shape : SpectralShape, optional
+        Spectral shape to align the spectral data to, default to the
+        colour matching functions shape.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values of shape (..., n, 3).
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are normalised so that a perfect
+        reflecting diffuser has a luminance :math:`Y` of 1.
+
+    Examples
+    --------
+    >>> from colour import (COLOURCHECKERS_SPDS, ILLUMINANTS_SPDS,
+    ...                     STANDARD_OBSERVERS_CMFS)
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> training_data = COLOURCHECKERS_SPDS['ColorChecker N Ohta']
+    >>> XYZ = training_data_spds_to_XYZ(
+    ...     training_data, cmfs, ILLUMINANTS_SPDS['D55'])
+    >>> XYZ[0]  # doctest: +ELLIPSIS
+    array([ 0.1138213...,  0.0987147...,  0.0512009...])
+    """
+
+    if shape is None:
+        shape = cmfs.shape
+
+    R = _spectral_values(training_data, shape)
+    I = _spectral_values(illuminant, shape)
+    x_bar = cmfs.copy().align(shape).values
+
+    XYZ = np.einsum('...w,nw,wc->...nc', I, R, x_bar)
+
+    return XYZ / np.dot(I, x_bar[..., 1])[..., np.newaxis, np.newaxis]
+
+
+def _white_preserving_least_squares(X, Y, c):
+    """
+    Solves given stacked linear least squares problems with the constraint
+    that the matrices map *RGB* values of 1 to given white.
+
+    Parameters
+    ----------
+    X : ndarray
+        White balanced camera *RGB* values of shape (..., n, 3).
+    Y : ndarray
+        Target values of shape (..., n, 3).
+    c : ndarray
+        Target white of shape (..., 3).
+
+    Returns
+    -------
+    ndarray
+        Matrices of shape (..., 3, 3).
+    """
+
+    X_T = np.swapaxes(X, -1, -2)
+    A_i = np.linalg.inv(np.matmul(X_T, X))
+
+    B = np.matmul(A_i, np.matmul(X_T, Y))
+    u = np.sum(A_i, axis=-1)
+
+    # Lagrange multipliers enforcing the rows of the matrices to sum to the
+    # target white.
+    d = (c - np.sum(B, axis=-2)) / np.sum(u, axis=-1)[..., np.newaxis]
+    B += u[..., np.newaxis] * d[..., np.newaxis, :]
+
+    return np.swapaxes(B, -1, -2)
+
+
+def idt_matrix(sensitivities,
+               illuminant,
+               training_data=None,
+               cmfs=None,
+               optimisation='Linear',
+               target='ACES2065-1',
+               chromatic_adaptation_transform='CAT02'):
+    """
+    Computes the *Input Device Transform* (IDT) matrix for given camera *RGB*
+    spectral sensitivities and illuminants.
+
+    The matrices of all the illuminants are computed at once, the training
+    data being integrated in a single batched product. They are cached per
+    camera, illuminants, training data, colour matching functions,
+    optimisation method, target and chromatic adaptation transform.
+
+    Parameters
+    ----------
+    sensitivities : RGB_SpectralSensitivities
+        Camera *RGB* spectral sensitivities.
+    illuminant : SpectralPowerDistribution or \
+MultiSpectralPowerDistribution or array_like
+        Illuminant or illuminants, arrays are of shape (..., wavelengths) and
+        expected to be aligned to the camera *RGB* spectral sensitivities
+        shape.
+    training_data : MultiSpectralPowerDistribution or dict_like or \
+array_like, optional
+        Training data reflectances, default to *ColorChecker N Ohta*
+        reflectances.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions, default to
+        *CIE 1931 2 Degree Standard Observer*.
+    optimisation : unicode, optional
+        **{'Linear', 'CIE 1976', 'CIE 2000'}**,
+        Optimisation method.
+    target : unicode, optional
+        **{'ACES2065-1', 'CIE XYZ'}**,
+        Target space.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* transform used with *ACES2065-1* target.
+
+    Returns
+    -------
+    ndarray
+        *IDT* matrix of shape (3, 3) or matrices of shape (..., 3, 3),
+        converting white balanced camera *RGB* values to the target space.
+
+    Raises
+    ------
+    ValueError
+        If the optimisation method or the target space is not supported.
+
+    Notes
+    -----
+    -   The *IDT* matrices preserve the white, i.e. a perfect reflecting
+        diffuser white balanced camera *RGB* values are mapped to the target
+        space white.
+    -   The *CIE 1976* and *CIE 2000* optimisation methods minimise the
+        colour differences with :func:`scipy.optimize.minimize` definition
+        for each illuminant, starting from the *Linear* method matrices.
+
+    Examples
+    --------
+    >>> from colour import CAMERAS_RGB_SPECTRAL_SENSITIVITIES, ILLUMINANTS_SPDS
+    >>> sensitivities = CAMERAS_RGB_SPECTRAL_SENSITIVITIES['Nikon 5100 (NPL)']
+    >>> idt_matrix(sensitivities, ILLUMINANTS_SPDS['D55'])
+    ... # doctest: +ELLIPSIS
+    array([[ 0.7150135...,  0.2222911...,  0.0626953...],
+           [ 0.0304468...,  1.1871127..., -0.2175595...],
+           [ 0.0680150..., -0.3205436...,  1.2525286...]])
+    """
+
+    if optimisation not in IDT_OPTIMISATION_METHODS:
+        raise ValueError(
+            '"{0}" optimisation method is invalid, it must be one of '
+            '{1}!'.format(optimisation, IDT_OPTIMISATION_METHODS))
+
+    if target not in IDT_TARGETS:
+        raise ValueError(
+            '"{0}" target is invalid, it must be one of {1}!'.format(
+                target, IDT_TARGETS))
+
+    if training_data is None:
+        training_data = COLOURCHECKERS_SPDS['ColorChecker N Ohta']
+
+    if cmfs is None:
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+
+    key = (_spectral_hash(sensitivities), _spectral_hash(illuminant),
+           _spectral_hash(training_data), _spectral_hash(cmfs), optimisation,
+           target, chromatic_adaptation_transform)
+
+    if key in _IDT_MATRICES_CACHE:
+        return np.copy(_IDT_MATRICES_CACHE[key])
+
+    shape = sensitivities.shape
+
+    R = _spectral_values(training_data, shape)
+    I = _spectral_values(illuminant, shape)
+
+    RGB = training_data_spds_to_RGB(R, sensitivities, I)
+
+    # The perfect reflecting diffuser is appended to the training data to
+    # compute the illuminants whitepoints in the same product.
+    XYZ = training_data_spds_to_XYZ(
+        np.vstack([R, np.ones(R.shape[-1])]), cmfs, I, shape)
+    XYZ, XYZ_w = XYZ[..., :-1, :], XYZ[..., -1, :]
+
+    if target == 'ACES2065-1':
+        XYZ_wr = xy_to_XYZ(ACES_2065_1_COLOURSPACE.whitepoint)
+        M_CAT = chromatic_adaptation_matrix_VonKries(
+            XYZ_w, XYZ_wr, chromatic_adaptation_transform)
+        M_T = dot_matrix(ACES_2065_1_COLOURSPACE.XYZ_to_RGB_matrix, M_CAT)
+        M_T_i = ACES_2065_1_COLOURSPACE.RGB_to_XYZ_matrix
+        xy_w = np.resize(ACES_2065_1_COLOURSPACE.whitepoint,
+                         XYZ_w.shape[:-1] + (2, ))
+    else:
+        M_T = np.identity(3) * np.ones(XYZ_w.shape[:-1] + (3, 3))
+        M_T_i = np.identity(3)
+        xy_w = XYZ_to_xy(XYZ_w)
+
+    Y = dot_vector(M_T[..., np.newaxis, :, :], XYZ)
+    c = dot_vector(M_T, XYZ_w)
+
+    M = _white_preserving_least_squares(RGB, Y, c)
+
+    if optimisation != 'Linear':
+        from scipy.optimize import minimize
+
+        delta_E = (delta_E_CIE1976
+                   if optimisation == 'CIE 1976' else delta_E_CIE2000)
+
+        M = np.reshape(M, (-1, 3, 3))
+        RGB_f = np.reshape(RGB, (-1, ) + RGB.shape[-2:])
+        Y_f = np.reshape(Y, (-1, ) + Y.shape[-2:])
+        c_f = np.reshape(c, (-1, 3))
+        xy_f = np.reshape(xy_w, (-1, 2))
+
+        for i in range(M.shape[0]):
+            Lab_r = XYZ_to_Lab(dot_vector(M_T_i, Y_f[i]), xy_f[i])
+
+            def matrix(x, i=i):
+                """
+                Returns the white preserving *IDT* matrix of given free
+                parameters.
+                """
+
+                x = np.reshape(x, (3, 2))
+
+                return np.hstack([x, (c_f[i] - np.sum(x, axis=-1))[:, None]])
+
+            @ignore_numpy_errors
+            def objective(x, i=i, Lab_r=Lab_r):
+                """
+                Returns the sum of the squared colour differences of given
+                free parameters.
+                """
+
+                Lab_t = XYZ_to_Lab(
+                    dot_vector(M_T_i, dot_vector(matrix(x), RGB_f[i])),
+                    xy_f[i])
+
+                return np.sum(delta_E(Lab_r, Lab_t) ** 2)
+
+            M[i] = matrix(minimize(objective, np.ravel(M[i, :, :2])).x)
+
+        M = np.reshape(M, c.shape + (3, ))
+
+    _IDT_MATRICES_CACHE[key] = M
+
+    return np.copy(M)
@@ -10,7 +10,11 @@ import unittest
 from itertools import permutations
 from numpy.linalg import LinAlgError
 
-from colour.characterisation.fitting import first_order_colour_fit
+from colour.characterisation.fitting import (
+    first_order_colour_fit, augmented_matrix_Cheung2004,
+    polynomial_expansion_Finlayson2015, polynomial_expansion,
+    colour_correction_matrix, apply_colour_correction_matrix,
+    colour_correction, cross_validate_colour_correction)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -20,7 +24,12 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['M1', 'M2', 'TestFirstOrderColourFit']
+__all__ = [
+    'M1', 'M2', 'TestFirstOrderColourFit', 'TestAugmentedMatrixCheung2004',
+    'TestPolynomialExpansionFinlayson2015', 'TestPolynomialExpansion',
+    'TestColourCorrectionMatrix', 'TestApplyColourCorrectionMatrix',
+    'TestColourCorrection', 'TestCrossValidateColourCorrection'
+]
 
 M1 = np.array([
     [0.17224810, 0.09170660, 0.06416938],
@@ -120,5 +129,377 @@ class TestFirstOrderColourFit(unittest.TestCase):
                 pass
 
 
+class TestAugmentedMatrixCheung2004(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.fitting.\
+augmented_matrix_Cheung2004` definition unit tests methods.
+    """
+
+    def test_augmented_matrix_Cheung2004(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+augmented_matrix_Cheung2004` definition.
+        """
+
+        RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+        R, G, B = RGB
+
+        for terms in (3, 5, 7, 8, 10, 11, 14, 16, 17, 19, 20, 22):
+            self.assertEqual(
+                augmented_matrix_Cheung2004(RGB, terms).shape, (terms, ))
+
+        np.testing.assert_almost_equal(
+            augmented_matrix_Cheung2004(RGB, 3), RGB, decimal=7)
+
+        np.testing.assert_almost_equal(
+            augmented_matrix_Cheung2004(RGB, 8),
+            np.array([R, G, B, R * G, R * B, G * B, R * G * B, 1]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            augmented_matrix_Cheung2004(RGB, 22)[-3:],
+            np.array([R ** 2 * G ** 2, G ** 2 * B ** 2, B ** 2 * R ** 2]),
+            decimal=7)
+
+    def test_n_dimensional_augmented_matrix_Cheung2004(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+augmented_matrix_Cheung2004` definition n-dimensional arrays support.
+        """
+
+        RGB = np.reshape(M1, (4, 6, 3))
+        np.testing.assert_almost_equal(
+            augmented_matrix_Cheung2004(RGB, 10),
+            np.reshape(augmented_matrix_Cheung2004(M1, 10), (4, 6, 10)),
+            decimal=7)
+
+    def test_raise_exception_augmented_matrix_Cheung2004(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+augmented_matrix_Cheung2004` definition raised exception.
+        """
+
+        self.assertRaises(ValueError, augmented_matrix_Cheung2004, M1, 4)
+
+
+class TestPolynomialExpansionFinlayson2015(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.fitting.\
+polynomial_expansion_Finlayson2015` definition unit tests methods.
+    """
+
+    def test_polynomial_expansion_Finlayson2015(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+polynomial_expansion_Finlayson2015` definition.
+        """
+
+        for degree, root_terms, terms in ((1, 3, 3), (2, 6, 9), (3, 13, 19),
+                                          (4, 22, 34)):
+            self.assertEqual(
+                polynomial_expansion_Finlayson2015(M1, degree).shape,
+                (24, root_terms))
+            self.assertEqual(
+                polynomial_expansion_Finlayson2015(M1, degree, False).shape,
+                (24, terms))
+
+            # Root-polynomial terms are homogeneous of degree one.
+            np.testing.assert_almost_equal(
+                polynomial_expansion_Finlayson2015(M1 * 2, degree),
+                polynomial_expansion_Finlayson2015(M1, degree) * 2,
+                decimal=7)
+
+        RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+        R, G, B = RGB
+        np.testing.assert_almost_equal(
+            polynomial_expansion_Finlayson2015(RGB, 2),
+            np.array([
+                R, G, B,
+                np.sqrt(R * G),
+                np.sqrt(G * B),
+                np.sqrt(R * B)
+            ]),
+            decimal=7)
+
+        self.assertFalse(
+            np.any(np.isnan(polynomial_expansion_Finlayson2015(-RGB, 4))))
+
+    def test_raise_exception_polynomial_expansion_Finlayson2015(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+polynomial_expansion_Finlayson2015` definition raised exception.
+        """
+
+        self.assertRaises(ValueError, polynomial_expansion_Finlayson2015, M1,
+                          5)
+
+
+class TestPolynomialExpansion(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.fitting.polynomial_expansion`
+    definition unit tests methods.
+    """
+
+    def test_polynomial_expansion(self):
+        """
+        Tests :func:`colour.characterisation.fitting.polynomial_expansion`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            polynomial_expansion(M1, 'Cheung 2004', terms=7),
+            augmented_matrix_Cheung2004(M1, 7),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            polynomial_expansion(M1, 'Finlayson 2015', degree=3),
+            polynomial_expansion_Finlayson2015(M1, 3),
+            decimal=7)
+
+        self.assertRaises(KeyError, polynomial_expansion, M1, 'Undefined')
+
+
+class TestColourCorrectionMatrix(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.fitting.colour_correction_matrix`
+    definition unit tests methods.
+    """
+
+    def test_colour_correction_matrix(self):
+        """
+        Tests :func:`colour.characterisation.fitting.colour_correction_matrix`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            colour_correction_matrix(M1, M2),
+            first_order_colour_fit(M1, M2),
+            decimal=7)
+
+        M = np.array([
+            [0.69822661, 0.03071629, 0.16210422, 0.10, 0.01],
+            [0.06893499, 0.67579611, 0.16430385, 0.20, 0.02],
+            [-0.06314955, 0.09212470, 0.97134152, 0.30, 0.03],
+        ])
+        M_R = apply_colour_correction_matrix(M1, M, terms=5)
+        np.testing.assert_almost_equal(
+            colour_correction_matrix(M1, M_R, terms=5), M, decimal=7)
+
+        self.assertEqual(
+            colour_correction_matrix(M1, M2, 'Finlayson 2015',
+                                     degree=3).shape, (3, 13))
+
+    def test_n_dimensional_colour_correction_matrix(self):
+        """
+        Tests :func:`colour.characterisation.fitting.colour_correction_matrix`
+        definition n-dimensional arrays support.
+        """
+
+        M_T = np.stack([M1, M1 * 0.8, M1 ** 1.1])
+        M_R = np.stack([M2, M2, M2])
+        CCM = colour_correction_matrix(M_T, M_R, terms=10)
+        self.assertEqual(CCM.shape, (3, 3, 10))
+        for i in range(3):
+            np.testing.assert_almost_equal(
+                CCM[i],
+                colour_correction_matrix(M_T[i], M_R[i], terms=10),
+                decimal=7)
+
+        weights = np.linspace(1, 2, 24)
+        CCM = colour_correction_matrix(M_T, M_R, weights=weights)
+        for i in range(3):
+            np.testing.assert_almost_equal(
+                CCM[i],
+                colour_correction_matrix(M_T[i], M_R[i], weights=weights),
+                decimal=7)
+
+    def test_colour_correction_matrix_weights(self):
+        """
+        Tests :func:`colour.characterisation.fitting.colour_correction_matrix`
+        definition weights support.
+        """
+
+        weights = np.ones(24)
+        weights[:6] = 0
+        np.testing.assert_almost_equal(
+            colour_correction_matrix(M1, M2, weights=weights),
+            first_order_colour_fit(M1[6:], M2[6:]),
+            decimal=7)
+
+    def test_colour_correction_matrix_Huber(self):
+        """
+        Tests :func:`colour.characterisation.fitting.colour_correction_matrix`
+        definition *Huber* loss.
+        """
+
+        M = first_order_colour_fit(M1, M2)
+        M_R = np.dot(M1, np.transpose(M))
+        M_R[3] = [1, 0, 0]
+        M_R[11] = [0, 1, 1]
+
+        self.assertGreater(
+            np.max(np.abs(colour_correction_matrix(M1, M_R) - M)), 0.1)
+
+        np.testing.assert_almost_equal(
+            colour_correction_matrix(M1, M_R, loss='Huber'), M, decimal=5)
+
+        np.testing.assert_almost_equal(
+            colour_correction_matrix(M1, M2, loss='Huber', iterations=0),
+            colour_correction_matrix(M1, M2),
+            decimal=7)
+
+    def test_raise_exception_colour_correction_matrix(self):
+        """
+        Tests :func:`colour.characterisation.fitting.colour_correction_matrix`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError, colour_correction_matrix, M1, M2, loss='Cauchy')
+
+
+class TestApplyColourCorrectionMatrix(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.fitting.\
+apply_colour_correction_matrix` definition unit tests methods.
+    """
+
+    def test_apply_colour_correction_matrix(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+apply_colour_correction_matrix` definition.
+        """
+
+        CCM = first_order_colour_fit(M1, M2)
+        np.testing.assert_almost_equal(
+            apply_colour_correction_matrix(M1, CCM),
+            np.dot(M1, np.transpose(CCM)),
+            decimal=7)
+
+        RGB = np.random.RandomState(4).uniform(0, 1, (5, 7, 3))
+        CCM = colour_correction_matrix(M1, M2, 'Finlayson 2015', degree=2)
+        np.testing.assert_almost_equal(
+            apply_colour_correction_matrix(
+                RGB, CCM, 'Finlayson 2015', degree=2),
+            np.einsum('ij,...j->...i', CCM,
+                      polynomial_expansion_Finlayson2015(RGB, 2)),
+            decimal=7)
+
+        CCMs = np.stack([CCM, CCM * 0.5])
+        np.testing.assert_almost_equal(
+            apply_colour_correction_matrix(
+                RGB[..., np.newaxis, :], CCMs, 'Finlayson 2015',
+                degree=2)[..., 1, :],
+            apply_colour_correction_matrix(
+                RGB, CCM, 'Finlayson 2015', degree=2) * 0.5,
+            decimal=7)
+
+
+class TestColourCorrection(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.fitting.colour_correction`
+    definition unit tests methods.
+    """
+
+    def test_colour_correction(self):
+        """
+        Tests :func:`colour.characterisation.fitting.colour_correction`
+        definition.
+        """
+
+        RGB = np.random.RandomState(4).uniform(0, 1, (5, 7, 3))
+        np.testing.assert_almost_equal(
+            colour_correction(RGB, M1, M2, terms=7),
+            apply_colour_correction_matrix(
+                RGB, colour_correction_matrix(M1, M2, terms=7), terms=7),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            colour_correction(M1, M1, M2, loss='Huber'),
+            apply_colour_correction_matrix(
+                M1, colour_correction_matrix(M1, M2, loss='Huber')),
+            decimal=7)
+
+
+class TestCrossValidateColourCorrection(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.fitting.\
+cross_validate_colour_correction` definition unit tests methods.
+    """
+
+    def test_cross_validate_colour_correction(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+cross_validate_colour_correction` definition.
+        """
+
+        errors = cross_validate_colour_correction(M1, M2, 4, processes=1)
+        self.assertEqual(errors.shape, (4, ))
+
+        indexes = np.arange(24)
+        for fold in range(4):
+            test = indexes % 4 == fold
+            M_T = apply_colour_correction_matrix(
+                M1[test], first_order_colour_fit(M1[~test], M2[~test]))
+            np.testing.assert_almost_equal(
+                errors[fold],
+                np.sqrt(np.mean(np.sum((M_T - M2[test]) ** 2, axis=-1))),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            cross_validate_colour_correction(M1, M2, 4, processes=4),
+            errors,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            cross_validate_colour_correction(
+                M1, np.dot(M1, np.transpose(first_order_colour_fit(M1, M2))),
+                6),
+            np.zeros(6),
+            decimal=7)
+
+    def test_n_dimensional_cross_validate_colour_correction(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+cross_validate_colour_correction` definition n-dimensional arrays support.
+        """
+
+        M_T = np.stack([M1, M1 ** 1.1])
+        M_R = np.stack([M2, M2])
+        errors = cross_validate_colour_correction(
+            M_T, M_R, 3, method='Finlayson 2015', degree=2, loss='Huber')
+        self.assertEqual(errors.shape, (2, 3))
+        for i in range(2):
+            np.testing.assert_almost_equal(
+                errors[i],
+                cross_validate_colour_correction(
+                    M_T[i],
+                    M_R[i],
+                    3,
+                    method='Finlayson 2015',
+                    degree=2,
+                    loss='Huber'),
+                decimal=7)
+
+    def test_raise_exception_cross_validate_colour_correction(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+cross_validate_colour_correction` definition raised exception.
+        """
+
+        self.assertRaises(ValueError, cross_validate_colour_correction, M1,
+                          M2, 1)
+
+        self.assertRaises(ValueError, cross_validate_colour_correction, M1,
+                          M2, 25)
+
+        self.assertRaises(
+            ValueError,
+            cross_validate_colour_correction,
+            M1,
+            M2,
+            loss='Cauchy')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.characterisation.idt` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.characterisation import (CAMERAS_RGB_SPECTRAL_SENSITIVITIES,
+                                     COLOURCHECKERS_SPDS)
+from colour.characterisation.idt import (
+    training_data_spds_to_RGB, training_data_spds_to_XYZ, idt_matrix)
+from colour.colorimetry import (ILLUMINANTS_SPDS, STANDARD_OBSERVERS_CMFS,
+                                spectral_to_XYZ)
+from colour.difference import delta_E_CIE2000
+from colour.models import (ACES_2065_1_COLOURSPACE, XYZ_to_Lab,
+                           xy_to_XYZ)
+from colour.adaptation import chromatic_adaptation_VonKries
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'SENSITIVITIES', 'TRAINING_DATA', 'CMFS', 'TestTrainingDataSpdsToRGB',
+    'TestTrainingDataSpdsToXYZ', 'TestIdtMatrix'
+]
+
+SENSITIVITIES = CAMERAS_RGB_SPECTRAL_SENSITIVITIES['Nikon 5100 (NPL)']
+
+TRAINING_DATA = COLOURCHECKERS_SPDS['ColorChecker N Ohta']
+
+CMFS = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+
+
+def _illuminants(names):
+    """
+    Returns given illuminants values aligned to the tests camera *RGB*
+    spectral sensitivities shape.
+    """
+
+    return np.array([
+        ILLUMINANTS_SPDS[name].copy().align(SENSITIVITIES.shape).values
+        for name in names
+    ])
+
+
+class TestTrainingDataSpdsToRGB(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.idt.training_data_spds_to_RGB`
+    definition unit tests methods.
+    """
+
+    def test_training_data_spds_to_RGB(self):
+        """
+        Tests :func:`colour.characterisation.idt.training_data_spds_to_RGB`
+        definition.
+        """
+
+        RGB = training_data_spds_to_RGB(TRAINING_DATA, SENSITIVITIES,
+                                        ILLUMINANTS_SPDS['D55'])
+        self.assertEqual(RGB.shape, (24, 3))
+        np.testing.assert_almost_equal(
+            RGB[0],
+            np.array([0.13697749, 0.07901862, 0.05806468]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            training_data_spds_to_RGB(
+                np.ones((1, 81)), SENSITIVITIES, ILLUMINANTS_SPDS['A']),
+            np.ones((1, 3)),
+            decimal=7)
+
+    def test_n_dimensional_training_data_spds_to_RGB(self):
+        """
+        Tests :func:`colour.characterisation.idt.training_data_spds_to_RGB`
+        definition n-dimensional arrays support.
+        """
+
+        names = ('A', 'D50', 'D65', 'F2')
+        RGB = training_data_spds_to_RGB(TRAINING_DATA, SENSITIVITIES,
+                                        _illuminants(names))
+        self.assertEqual(RGB.shape, (4, 24, 3))
+        for i, name in enumerate(names):
+            np.testing.assert_almost_equal(
+                RGB[i],
+                training_data_spds_to_RGB(TRAINING_DATA, SENSITIVITIES,
+                                          ILLUMINANTS_SPDS[name]),
+                decimal=7)
+
+
+class TestTrainingDataSpdsToXYZ(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.idt.training_data_spds_to_XYZ`
+    definition unit tests methods.
+    """
+
+    def test_training_data_spds_to_XYZ(self):
+        """
+        Tests :func:`colour.characterisation.idt.training_data_spds_to_XYZ`
+        definition.
+        """
+
+        XYZ = training_data_spds_to_XYZ(TRAINING_DATA, CMFS,
+                                        ILLUMINANTS_SPDS['D55'],
+                                        SENSITIVITIES.shape)
+        self.assertEqual(XYZ.shape, (24, 3))
+
+        spd = TRAINING_DATA['dark skin']
+        illuminant = ILLUMINANTS_SPDS['D55'].copy().align(SENSITIVITIES.shape)
+        np.testing.assert_almost_equal(
+            XYZ[0],
+            spectral_to_XYZ(
+                spd, CMFS.copy().align(SENSITIVITIES.shape), illuminant) /
+            100,
+            decimal=7)
+
+    def test_n_dimensional_training_data_spds_to_XYZ(self):
+        """
+        Tests :func:`colour.characterisation.idt.training_data_spds_to_XYZ`
+        definition n-dimensional arrays support.
+        """
+
+        names = ('A', 'D50', 'D65', 'F2')
+        XYZ = training_data_spds_to_XYZ(TRAINING_DATA, CMFS,
+                                        _illuminants(names),
+                                        SENSITIVITIES.shape)
+        self.assertEqual(XYZ.shape, (4, 24, 3))
+        for i, name in enumerate(names):
+            np.testing.assert_almost_equal(
+                XYZ[i],
+                training_data_spds_to_XYZ(TRAINING_DATA, CMFS,
+                                          ILLUMINANTS_SPDS[name],
+                                          SENSITIVITIES.shape),
+                decimal=7)
+
+
+class TestIdtMatrix(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.idt.idt_matrix` definition unit
+    tests methods.
+    """
+
+    def test_idt_matrix(self):
+        """
+        Tests :func:`colour.characterisation.idt.idt_matrix` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            idt_matrix(SENSITIVITIES, ILLUMINANTS_SPDS['D55']),
+            np.array([
+                [0.71501354, 0.22229114, 0.06269531],
+                [0.03044683, 1.18711272, -0.21755954],
+                [0.06801502, -0.32054362, 1.25252860],
+            ]),
+            decimal=7)
+
+        for optimisation in ('Linear', 'CIE 1976', 'CIE 2000'):
+            np.testing.assert_almost_equal(
+                np.sum(
+                    idt_matrix(
+                        SENSITIVITIES,
+                        ILLUMINANTS_SPDS['D55'],
+                        optimisation=optimisation),
+                    axis=-1),
+                np.ones(3),
+                decimal=7)
+
+        M = idt_matrix(SENSITIVITIES, ILLUMINANTS_SPDS['A'], target='CIE XYZ')
+        XYZ = training_data_spds_to_XYZ(
+            np.ones((1, 81)), CMFS, ILLUMINANTS_SPDS['A'], SENSITIVITIES.shape)
+        np.testing.assert_almost_equal(
+            np.sum(M, axis=-1), XYZ[0], decimal=7)
+
+    def test_idt_matrix_optimisation(self):
+        """
+        Tests :func:`colour.characterisation.idt.idt_matrix` definition
+        perceptual optimisation.
+        """
+
+        RGB = training_data_spds_to_RGB(TRAINING_DATA, SENSITIVITIES,
+                                        ILLUMINANTS_SPDS['D55'])
+        XYZ = training_data_spds_to_XYZ(TRAINING_DATA, CMFS,
+                                        ILLUMINANTS_SPDS['D55'],
+                                        SENSITIVITIES.shape)
+        XYZ_w = training_data_spds_to_XYZ(
+            np.ones((1, 81)), CMFS, ILLUMINANTS_SPDS['D55'],
+            SENSITIVITIES.shape)[0]
+        XYZ_wr = xy_to_XYZ(ACES_2065_1_COLOURSPACE.whitepoint)
+        Lab_r = XYZ_to_Lab(
+            chromatic_adaptation_VonKries(XYZ, XYZ_w, XYZ_wr),
+            ACES_2065_1_COLOURSPACE.whitepoint)
+
+        def delta_E(M):
+            """
+            Returns the mean *CIE 2000* colour difference of given *IDT*
+            matrix.
+            """
+
+            XYZ_t = np.einsum('ij,jk,...k->...i',
+                              ACES_2065_1_COLOURSPACE.RGB_to_XYZ_matrix, M,
+                              RGB)
+
+            return np.mean(
+                delta_E_CIE2000(
+                    Lab_r,
+                    XYZ_to_Lab(XYZ_t, ACES_2065_1_COLOURSPACE.whitepoint)))
+
+        self.assertLess(
+            delta_E(
+                idt_matrix(
+                    SENSITIVITIES,
+                    ILLUMINANTS_SPDS['D55'],
+                    optimisation='CIE 2000')),
+            delta_E(idt_matrix(SENSITIVITIES, ILLUMINANTS_SPDS['D55'])))
+
+    def test_n_dimensional_idt_matrix(self):
+        """
+        Tests :func:`colour.characterisation.idt.idt_matrix` definition
+        n-dimensional arrays support.
+        """
+
+        names = ('A', 'D50', 'D65', 'F2')
+        for optimisation in ('Linear', 'CIE 1976'):
+            M = idt_matrix(
+                SENSITIVITIES,
+                _illuminants(names),
+                optimisation=optimisation)
+            self.assertEqual(M.shape, (4, 3, 3))
+            for i, name in enumerate(names):
+                np.testing.assert_almost_equal(
+                    M[i],
+                    idt_matrix(
+                        SENSITIVITIES,
+                        ILLUMINANTS_SPDS[name],
+                        optimisation=optimisation),
+                    decimal=5)
+
+        self.assertEqual(
+            idt_matrix(SENSITIVITIES,
+                       np.reshape(_illuminants(names), (2, 2, 81))).shape,
+            (2, 2, 3, 3))
+
+    def test_cache_idt_matrix(self):
+        """
+        Tests :func:`colour.characterisation.idt.idt_matrix` definition
+        cache.
+        """
+
+        M = idt_matrix(SENSITIVITIES, ILLUMINANTS_SPDS['D65'])
+        M[...] = 0
+
+        self.assertFalse(
+            np.any(idt_matrix(SENSITIVITIES, ILLUMINANTS_SPDS['D65']) == 0))
+
+        self.assertFalse(
+            np.allclose(
+                idt_matrix(SENSITIVITIES, ILLUMINANTS_SPDS['D65']),
+                idt_matrix(CAMERAS_RGB_SPECTRAL_SENSITIVITIES[
+                    'Sigma SDMerill (NPL)'], ILLUMINANTS_SPDS['D65'])))
+
+    def test_raise_exception_idt_matrix(self):
+        """
+        Tests :func:`colour.characterisation.idt.idt_matrix` definition
+        raised exception.
+        """
+
+        self.assertRaises(
+            ValueError,
+            idt_matrix,
+            SENSITIVITIES,
+            ILLUMINANTS_SPDS['D65'],
+            optimisation='CIE 1994')
+
+        self.assertRaises(
+            ValueError,
+            idt_matrix,
+            SENSITIVITIES,
+            ILLUMINANTS_SPDS['D65'],
+            target='ACEScg')
+
+
+if __name__ == '__main__':
+    unittest.main()
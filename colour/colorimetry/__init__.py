@@ -5,11 +5,13 @@ from __future__ import absolute_import
 from .spectrum import (SpectralShape, SpectralPowerDistribution,
                        MultiSpectralPowerDistribution, DEFAULT_SPECTRAL_SHAPE,
                        constant_spd, zeros_spd, ones_spd)
-from .blackbody import (blackbody_spd, blackbody_spectral_radiance, planck_law)
+from .resampling import resampling_matrix, resample_multi_spectral_array
 from .cmfs import (LMS_ConeFundamentals, RGB_ColourMatchingFunctions,
                    XYZ_ColourMatchingFunctions)
 from .dataset import *  # noqa
 from . import dataset
+from .blackbody import (blackbody_spd, blackbody_spectral_radiance, planck_law)
+from .blackbody import blackbody_msa, blackbody_multi_spd, blackbody_XYZ
 from .tristimulus import (SPECTRAL_TO_XYZ_METHODS,
                           MULTI_SPECTRAL_TO_XYZ_METHODS)
 from .tristimulus import spectral_to_XYZ, multi_spectral_to_XYZ
@@ -24,10 +26,12 @@ from .tristimulus import (
 from .correction import BANDPASS_CORRECTION_METHODS
 from .correction import bandpass_correction
 from .correction import bandpass_correction_Stearns1988
-from .illuminants import (D_illuminant_relative_spd,
-                          CIE_standard_illuminant_A_function)
+from .illuminants import (
+    D_illuminant_relative_spd, D_illuminant_relative_msa,
+    D_illuminant_relative_multi_spd, D_illuminant_relative_XYZ,
+    CIE_standard_illuminant_A_function)
 from .lefs import (mesopic_luminous_efficiency_function,
-                   mesopic_weighting_function)
+                   mesopic_luminous_efficiency_msa, mesopic_weighting_function)
 from .lightness import LIGHTNESS_METHODS
 from .lightness import lightness
 from .lightness import (lightness_Glasser1958, lightness_Wyszecki1963,
@@ -38,9 +42,11 @@ from .luminance import luminance
 from .luminance import (luminance_Newhall1943, luminance_ASTMD153508,
                         luminance_CIE1976, luminance_Fairchild2010,
                         luminance_Fairchild2011)
+from .inversion import monotone_inverse_table, monotone_inverse
 from .dominant import (dominant_wavelength, complementary_wavelength,
                        excitation_purity, colorimetric_purity)
 from .photometry import luminous_flux, luminous_efficiency, luminous_efficacy
+from .photometry import mesopic_luminous_flux
 from .transformations import RGB_10_degree_cmfs_to_LMS_10_degree_cmfs
 from .transformations import RGB_2_degree_cmfs_to_XYZ_2_degree_cmfs
 from .transformations import RGB_10_degree_cmfs_to_XYZ_10_degree_cmfs
@@ -60,12 +66,14 @@ __all__ = [
     'MultiSpectralPowerDistribution', 'DEFAULT_SPECTRAL_SHAPE', 'constant_spd',
     'zeros_spd', 'ones_spd'
 ]
-__all__ += ['blackbody_spd', 'blackbody_spectral_radiance', 'planck_law']
+__all__ += ['resampling_matrix', 'resample_multi_spectral_array']
 __all__ += [
     'LMS_ConeFundamentals', 'RGB_ColourMatchingFunctions',
     'XYZ_ColourMatchingFunctions'
 ]
 __all__ += dataset.__all__
+__all__ += ['blackbody_spd', 'blackbody_spectral_radiance', 'planck_law']
+__all__ += ['blackbody_msa', 'blackbody_multi_spd', 'blackbody_XYZ']
 __all__ += ['SPECTRAL_TO_XYZ_METHODS', 'MULTI_SPECTRAL_TO_XYZ_METHODS']
 __all__ += ['spectral_to_XYZ', 'multi_spectral_to_XYZ']
 __all__ += [
@@ -80,9 +88,14 @@ __all__ += [
 __all__ += ['BANDPASS_CORRECTION_METHODS']
 __all__ += ['bandpass_correction']
 __all__ += ['bandpass_correction_Stearns1988']
-__all__ += ['D_illuminant_relative_spd', 'CIE_standard_illuminant_A_function']
 __all__ += [
-    'mesopic_luminous_efficiency_function', 'mesopic_weighting_function'
+    'D_illuminant_relative_spd', 'D_illuminant_relative_msa',
+    'D_illuminant_relative_multi_spd', 'D_illuminant_relative_XYZ',
+    'CIE_standard_illuminant_A_function'
+]
+__all__ += [
+    'mesopic_luminous_efficiency_function', 'mesopic_luminous_efficiency_msa',
+    'mesopic_weighting_function'
 ]
 __all__ += ['LIGHTNESS_METHODS']
 __all__ += ['lightness']
@@ -96,11 +109,13 @@ __all__ += [
     'luminance_Newhall1943', 'luminance_ASTMD153508', 'luminance_CIE1976',
     'luminance_Fairchild2010', 'luminance_Fairchild2011'
 ]
+__all__ += ['monotone_inverse_table', 'monotone_inverse']
 __all__ += [
     'dominant_wavelength', 'complementary_wavelength', 'excitation_purity',
     'colorimetric_purity'
 ]
 __all__ += ['luminous_flux', 'luminous_efficiency', 'luminous_efficacy']
+__all__ += ['mesopic_luminous_flux']
 __all__ += ['RGB_10_degree_cmfs_to_LMS_10_degree_cmfs']
 __all__ += ['RGB_2_degree_cmfs_to_XYZ_2_degree_cmfs']
 __all__ += ['RGB_10_degree_cmfs_to_XYZ_10_degree_cmfs']
@@ -4,7 +4,13 @@ Blackbody - Planckian Radiator
 ==============================
 
 Defines objects to compute the spectral radiance of a planckian radiator and
-its spectral power distribution.
+its spectral power distribution:
+
+-   :func:`colour.colorimetry.planck_law`
+-   :func:`colour.blackbody_spd`
+-   :func:`colour.colorimetry.blackbody_multi_spd`
+-   :func:`colour.colorimetry.blackbody_msa`
+-   :func:`colour.colorimetry.blackbody_XYZ`
 
 See Also
 --------
@@ -23,8 +29,10 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE,
-                                SpectralPowerDistribution)
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.colorimetry import (
+    DEFAULT_SPECTRAL_SHAPE, MultiSpectralPowerDistribution,
+    STANDARD_OBSERVERS_CMFS, SpectralPowerDistribution)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -35,13 +43,28 @@ __status__ = 'Production'
 
 __all__ = [
     'C1', 'C2', 'N', 'planck_law', 'blackbody_spectral_radiance',
-    'blackbody_spd'
+    'blackbody_spd', 'blackbody_msa', 'blackbody_multi_spd', 'blackbody_XYZ'
 ]
 
 C1 = 3.741771e-16  # 2 * math.pi * PLANCK_CONSTANT * LIGHT_SPEED ** 2
 C2 = 1.4388e-2  # PLANCK_CONSTANT * LIGHT_SPEED / BOLTZMANN_CONSTANT
 N = 1
 
+_BLACKBODY_XYZ_WEIGHTS_CACHE = {}
+"""
+Planckian radiators *CIE XYZ* tristimulus values weights cache.
+
+_BLACKBODY_XYZ_WEIGHTS_CACHE : dict
+"""
+
+_BLACKBODY_CHUNK_SIZE = 2 ** 20
+"""
+Spectral radiance values count above which the planckian radiators are
+processed in chunks to bound the memory footprint.
+
+_BLACKBODY_CHUNK_SIZE : int
+"""
+
 
 def planck_law(wavelength, temperature, c1=C1, c2=C2, n=N):
     """
@@ -79,6 +102,11 @@ def planck_law(wavelength, temperature, c1=C1, c2=C2, n=N):
     -----
     -   The following form implementation is expressed in term of wavelength.
     -   The SI unit of radiance is *watts per steradian per square metre*.
+    -   The wavelengths and temperatures are broadcast against each other, the
+        spectral radiance of :math:`n` temperatures for :math:`m` wavelengths
+        is computed by passing the temperatures with shape *(n, 1)*, e.g.
+        ``temperature[..., np.newaxis]``, yielding an array with shape
+        *(n, m)*.
 
     References
     ----------
@@ -89,6 +117,11 @@ def planck_law(wavelength, temperature, c1=C1, c2=C2, n=N):
     >>> # Doctests ellipsis for Python 2.x compatibility.
     >>> planck_law(500 * 1e-9, 5500)  # doctest: +ELLIPSIS
     20472701909806.5...
+    >>> wl = np.array([400, 500, 600]) * 1e-9
+    >>> T = np.array([4000, 5500])
+    >>> planck_law(wl, T[..., np.newaxis])  # doctest: +ELLIPSIS
+    array([[  1.4463994...e+12,   2.8647657...e+12,   3.8252420...e+12],
+           [  1.6825549...e+13,   2.0472701...e+13,   1.9825880...e+13]])
     """
 
     l = np.asarray(wavelength)  # noqa
@@ -627,3 +660,229 @@ def blackbody_spd(temperature, shape=DEFAULT_SPECTRAL_SHAPE, c1=C1, c2=C2,
             zip(wavelengths,
                 planck_law(wavelengths * 1e-9, temperature, c1, c2, n))),
         name='{0}K Blackbody'.format(temperature))
+
+
+def blackbody_msa(temperature, shape=DEFAULT_SPECTRAL_SHAPE, c1=C1, c2=C2,
+                  n=N):
+    """
+    Returns the multi-spectral array of the planckian radiators for given
+    temperatures :math:`T[K]`.
+
+    Parameters
+    ----------
+    temperature : numeric or array_like
+        Temperatures :math:`T[K]` in kelvin degrees.
+    shape : SpectralShape, optional
+        Spectral shape used to create the multi-spectral array of the
+        planckian radiators.
+    c1 : numeric, optional
+        The official value of :math:`c1` is provided by the Committee on Data
+        for Science and Technology (CODATA) and is
+        :math:`c1=3,741771x10.16\ W/m_2` *(Mohr and Taylor, 2000)*.
+    c2 : numeric, optional
+        Since :math:`T` is measured on the International Temperature Scale,
+        the value of :math:`c2` used in colorimetry should follow that adopted
+        in the current International Temperature Scale (ITS-90)
+        *(Preston-Thomas, 1990; Mielenz et aI., 1991)*, namely
+        :math:`c2=1,4388x10.2\ m/K`.
+    n : numeric, optional
+        Medium index of refraction.
+
+    Returns
+    -------
+    ndarray
+        Planckian radiators multi-spectral array with shape *(..., bins)*.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> blackbody_msa(np.array([4000, 5500]), SpectralShape(400, 600, 100))
+    ... # doctest: +ELLIPSIS
+    array([[  1.4463994...e+12,   2.8647657...e+12,   3.8252420...e+12],
+           [  1.6825549...e+13,   2.0472701...e+13,   1.9825880...e+13]])
+    """
+
+    temperature = np.asarray(temperature, dtype=DEFAULT_FLOAT_DTYPE)
+
+    with np.errstate(over='ignore'):
+        return planck_law(shape.range() * 1e-9, temperature[..., np.newaxis],
+                          c1, c2, n)
+
+
+def blackbody_multi_spd(temperature,
+                        shape=DEFAULT_SPECTRAL_SHAPE,
+                        c1=C1,
+                        c2=C2,
+                        n=N):
+    """
+    Returns the multi-spectral power distribution of the planckian radiators
+    for given temperatures :math:`T[K]`, each planckian radiator being stored
+    as a column.
+
+    Parameters
+    ----------
+    temperature : array_like
+        Temperatures :math:`T[K]` in kelvin degrees.
+    shape : SpectralShape, optional
+        Spectral shape used to create the multi-spectral power distribution
+        of the planckian radiators.
+    c1 : numeric, optional
+        The official value of :math:`c1` is provided by the Committee on Data
+        for Science and Technology (CODATA) and is
+        :math:`c1=3,741771x10.16\ W/m_2` *(Mohr and Taylor, 2000)*.
+    c2 : numeric, optional
+        Since :math:`T` is measured on the International Temperature Scale,
+        the value of :math:`c2` used in colorimetry should follow that adopted
+        in the current International Temperature Scale (ITS-90)
+        *(Preston-Thomas, 1990; Mielenz et aI., 1991)*, namely
+        :math:`c2=1,4388x10.2\ m/K`.
+    n : numeric, optional
+        Medium index of refraction.
+
+    Returns
+    -------
+    MultiSpectralPowerDistribution
+        Planckian radiators multi-spectral power distribution.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> multi_spd = blackbody_multi_spd(
+    ...     [4000, 5500], SpectralShape(400, 650, 50))
+    >>> multi_spd.labels
+    ['4000K Blackbody', '5500K Blackbody']
+    >>> multi_spd[500]  # doctest: +ELLIPSIS
+    array([  2.8647657...e+12,   2.0472701...e+13])
+    """
+
+    temperature = np.ravel(temperature)
+
+    return MultiSpectralPowerDistribution(
+        np.transpose(blackbody_msa(temperature, shape, c1, c2, n)),
+        shape.range(),
+        labels=[
+            '{0}K Blackbody'.format(T) for T in temperature.tolist()
+        ],
+        name='Blackbody')
+
+
+def _blackbody_XYZ_weights(cmfs):
+    """
+    Returns the wavelengths in metres and the weights converting the spectral
+    radiance of planckian radiators to *CIE XYZ* tristimulus values for given
+    colour matching functions.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    tuple
+        Wavelengths and weights with shape *(bins, 3)*.
+    """
+
+    shape = cmfs.shape
+    key = (cmfs.name, float(shape.start), float(shape.end),
+           float(shape.interval))
+    weights = _BLACKBODY_XYZ_WEIGHTS_CACHE.get(key)
+    if weights is not None:
+        return weights
+
+    wavelengths = cmfs.wavelengths * 1e-9
+    W = cmfs.values * (100 / np.sum(cmfs.values[..., 1]))
+    wavelengths.setflags(write=False)
+    W.setflags(write=False)
+
+    weights = _BLACKBODY_XYZ_WEIGHTS_CACHE[key] = wavelengths, W
+
+    return weights
+
+
+def blackbody_XYZ(
+        temperature,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        c1=C1,
+        c2=C2,
+        n=N):
+    """
+    Returns the *CIE XYZ* tristimulus values of the planckian radiators for
+    given temperatures :math:`T[K]` by direct integration of their spectral
+    radiance with given colour matching functions.
+
+    Parameters
+    ----------
+    temperature : numeric or array_like
+        Temperatures :math:`T[K]` in kelvin degrees.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions, the planckian radiators
+        are computed with their spectral shape.
+    c1 : numeric, optional
+        The official value of :math:`c1` is provided by the Committee on Data
+        for Science and Technology (CODATA) and is
+        :math:`c1=3,741771x10.16\ W/m_2` *(Mohr and Taylor, 2000)*.
+    c2 : numeric, optional
+        Since :math:`T` is measured on the International Temperature Scale,
+        the value of :math:`c2` used in colorimetry should follow that adopted
+        in the current International Temperature Scale (ITS-90)
+        *(Preston-Thomas, 1990; Mielenz et aI., 1991)*, namely
+        :math:`c2=1,4388x10.2\ m/K`.
+    n : numeric, optional
+        Medium index of refraction.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values with shape *(..., 3)*.
+
+    Warning
+    -------
+    -   The integration weights are cached in
+        :attr:`colour.colorimetry.blackbody._BLACKBODY_XYZ_WEIGHTS_CACHE`
+        attribute. Their identifier key is defined by the colour matching
+        functions name and spectral shape, thus one should be mindful that
+        using similar colour matching functions names but with different
+        spectral data will lead to unexpected behaviour.
+    -   The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   The *CIE XYZ* tristimulus values are normalised as
+        :func:`colour.colorimetry.spectral_to_XYZ_integration` definition does
+        with an equal-energy illuminant, i.e. they are equal to the output of
+        :func:`colour.spectral_to_XYZ` definition with the colour matching
+        functions trimmed to :attr:`colour.ASTME30815_PRACTISE_SHAPE`
+        attribute and a 1 or 5 nm measurement interval.
+
+    Examples
+    --------
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> blackbody_XYZ(np.array([4000, 5500]), cmfs)  # doctest: +ELLIPSIS
+    array([[  3.4974997...e+14,   3.4635419...e+14,   2.2322030...e+14],
+           [  1.9680634...e+15,   2.0189798...e+15,   1.9330773...e+15]])
+    """
+
+    temperature = np.asarray(temperature, dtype=DEFAULT_FLOAT_DTYPE)
+
+    wavelengths, W = _blackbody_XYZ_weights(cmfs)
+
+    # The wavelength dependent factors of *Planck's law* are folded into the
+    # weights so that only the exponential term is evaluated per temperature.
+    W = W * ((c1 * n ** -2 * wavelengths ** -5) / np.pi)[..., np.newaxis]
+    c2_nl = c2 / (n * wavelengths)
+
+    T_r = 1 / np.ravel(temperature)
+    chunk_size = max(_BLACKBODY_CHUNK_SIZE // wavelengths.size, 1)
+
+    XYZ = np.empty((T_r.shape[0], 3), dtype=DEFAULT_FLOAT_DTYPE)
+    with np.errstate(over='ignore'):
+        for i in range(0, T_r.shape[0], chunk_size):
+            E = np.multiply.outer(T_r[i:i + chunk_size], c2_nl)
+            np.exp(E, out=E)
+            E -= 1
+            np.reciprocal(E, out=E)
+            XYZ[i:i + chunk_size] = np.dot(E, W)
+
+    return np.reshape(XYZ, temperature.shape + (3, ))
@@ -31,12 +31,10 @@ whitepaper_howtocalculateluminositywavelengthandpurity.pdf
 from __future__ import division, unicode_literals
 
 import numpy as np
-import scipy.spatial.distance
 
-from colour.algebra import (euclidean_distance, extend_line_segment,
-                            intersect_line_segments)
+from colour.algebra import euclidean_distance
 from colour.colorimetry import CMFS
-from colour.models import XYZ_to_xy
+from colour.utilities import tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -50,6 +48,317 @@ __all__ = [
     'complementary_wavelength', 'excitation_purity', 'colorimetric_purity'
 ]
 
+_SPECTRAL_LOCUS_ANGULAR_INDEXES_CACHE = {}
+"""
+Spectral locus angular indexes cache.
+
+_SPECTRAL_LOCUS_ANGULAR_INDEXES_CACHE : dict
+"""
+
+_SPECTRAL_LOCUS_KDTREES_CACHE = {}
+"""
+Spectral locus *KD-Trees* cache.
+
+_SPECTRAL_LOCUS_KDTREES_CACHE : dict
+"""
+
+_SPECTRAL_LOCUS_CACHE_SIZE = 64
+"""
+Maximum count of spectral locus angular indexes and *KD-Trees* cached, the
+caches are cleared when it is reached.
+
+_SPECTRAL_LOCUS_CACHE_SIZE : int
+"""
+
+_SPECTRAL_LOCUS_INDEXED_ACHROMATIC_STIMULI = 16
+"""
+Maximum count of unique achromatic stimuli for which the spectral locus
+segments are resolved with angular indexes, the segments of colour stimuli
+with more unique achromatic stimuli, e.g. per-pixel achromatic stimuli, are
+resolved by intersecting them with all the spectral locus segments.
+
+_SPECTRAL_LOCUS_INDEXED_ACHROMATIC_STIMULI : int
+"""
+
+_SPECTRAL_LOCUS_SEGMENTS_CHUNK_SIZE = 4096
+"""
+Count of colour stimuli intersected at once with all the spectral locus
+segments.
+
+_SPECTRAL_LOCUS_SEGMENTS_CHUNK_SIZE : int
+"""
+
+
+def _spectral_locus_angular_index(xy_n, xy_s):
+    """
+    Returns the angular index of given spectral locus *xy* chromaticity
+    coordinates around given achromatic stimulus and caches it if not
+    existing.
+
+    The spectral locus, closed by the line of purples, is partitioned into
+    angular intervals around the achromatic stimulus, each interval being
+    resolved to the single spectral locus segment bounding it so that any
+    colour stimulus hue angle can be mapped to a segment with a binary
+    search.
+
+    Parameters
+    ----------
+    xy_n : array_like
+        Achromatic stimulus *xy* chromaticity coordinates.
+    xy_s : array_like
+        Spectral locus *xy* chromaticity coordinates.
+
+    Returns
+    -------
+    tuple
+        Sorted spectral locus hue angles, segment index for each angular
+        interval (-1 if the interval is not bounded by any segment),
+        segments start points and segments end points.
+    """
+
+    xy_n = np.asarray(xy_n, dtype=np.float_)
+    xy_s = np.asarray(xy_s, dtype=np.float_)
+
+    key = (tuple(xy_n), hash(xy_s.tobytes()), xy_s.shape)
+    angular_index = _SPECTRAL_LOCUS_ANGULAR_INDEXES_CACHE.get(key)
+    if angular_index is not None:
+        return angular_index
+
+    # Segments are defined from each spectral locus point to the next one,
+    # the last segment being the line of purples.
+    xy_a = xy_s
+    xy_b = np.roll(xy_s, -1, axis=0)
+
+    x_s, y_s = tsplit(xy_s - xy_n)
+    angles = np.sort(np.arctan2(y_s, x_s))
+    midpoints = (angles + np.append(angles[1:], angles[0] + 2 * np.pi)) / 2
+
+    d = tstack((np.cos(midpoints), np.sin(midpoints)))
+    segments = _intersected_segments(xy_n, d, xy_a, xy_b)
+
+    if (len(_SPECTRAL_LOCUS_ANGULAR_INDEXES_CACHE) >=
+            _SPECTRAL_LOCUS_CACHE_SIZE):
+        _SPECTRAL_LOCUS_ANGULAR_INDEXES_CACHE.clear()
+
+    angular_index = _SPECTRAL_LOCUS_ANGULAR_INDEXES_CACHE[key] = (
+        angles, segments, xy_a, xy_b)
+
+    return angular_index
+
+
+def _spectral_locus_kdtree(xy_s):
+    """
+    Returns the *KD-Tree* of given spectral locus *xy* chromaticity
+    coordinates and caches it if not existing.
+
+    Parameters
+    ----------
+    xy_s : array_like
+        Spectral locus *xy* chromaticity coordinates.
+
+    Returns
+    -------
+    tuple
+        Spectral locus *KD-Tree* and canonical spectral locus indexes, i.e.
+        the first index of each set of identical spectral locus *xy*
+        chromaticity coordinates.
+    """
+
+    xy_s = np.asarray(xy_s, dtype=np.float_)
+
+    key = (hash(xy_s.tobytes()), xy_s.shape)
+    kdtree = _SPECTRAL_LOCUS_KDTREES_CACHE.get(key)
+    if kdtree is not None:
+        return kdtree
+
+    _unique, canonical, inverse = np.unique(
+        xy_s, axis=0, return_index=True, return_inverse=True)
+
+    from scipy.spatial import cKDTree
+
+    if len(_SPECTRAL_LOCUS_KDTREES_CACHE) >= _SPECTRAL_LOCUS_CACHE_SIZE:
+        _SPECTRAL_LOCUS_KDTREES_CACHE.clear()
+
+    kdtree = _SPECTRAL_LOCUS_KDTREES_CACHE[key] = (cKDTree(xy_s),
+                                                   canonical[inverse])
+
+    return kdtree
+
+
+def _intersect_rays_segments(xy_o, d, xy_a, xy_b):
+    """
+    Intersects the rays defined by given origin and direction with the line
+    segments defined by given start and end points.
+
+    Parameters
+    ----------
+    xy_o : array_like
+        Rays origin.
+    d : array_like
+        Rays direction.
+    xy_a : array_like
+        Line segments start points.
+    xy_b : array_like
+        Line segments end points.
+
+    Returns
+    -------
+    tuple
+        Rays parameter :math:`t` and line segments parameter :math:`s` at the
+        intersection, i.e. :math:`xy_o + t d = xy_a + s (xy_b - xy_a)`.
+    """
+
+    x_d, y_d = tsplit(d)
+    x_ao, y_ao = tsplit(xy_a - xy_o)
+    x_ab, y_ab = tsplit(xy_b - xy_a)
+
+    denominator = x_d * y_ab - y_d * x_ab
+
+    t = (x_ao * y_ab - y_ao * x_ab) / denominator
+    s = (x_ao * y_d - y_ao * x_d) / denominator
+
+    return t, s
+
+
+def _intersected_segments(xy_o, d, xy_a, xy_b):
+    """
+    Returns the index of the farthest line segment intersected by the rays
+    defined by given origin and direction.
+
+    Parameters
+    ----------
+    xy_o : array_like
+        Rays origin.
+    d : array_like
+        Rays direction.
+    xy_a : array_like
+        Line segments start points.
+    xy_b : array_like
+        Line segments end points.
+
+    Returns
+    -------
+    ndarray
+        Line segments index, -1 if a ray does not intersect any line segment.
+    """
+
+    xy_o = np.asarray(xy_o)[..., np.newaxis, :]
+    d = np.asarray(d)[..., np.newaxis, :]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t, s = _intersect_rays_segments(xy_o, d, xy_a, xy_b)
+
+        valid = np.logical_and.reduce((t > 0, s >= 0, s <= 1))
+    t = np.where(valid, t, -np.inf)
+
+    return np.where(np.any(valid, axis=-1), np.argmax(t, axis=-1), -1)
+
+
+def _closest_spectral_locus_segment(xy, xy_n, xy_s, reverse=False):
+    """
+    Returns the spectral locus segment index and intersection point with the
+    line defined by given achromatic stimulus :math:`xy_n` to colour stimulus
+    :math:`xy` *xy* chromaticity coordinates.
+
+    Parameters
+    ----------
+    xy : array_like
+        Colour stimulus *xy* chromaticity coordinates.
+    xy_n : array_like
+        Achromatic stimulus *xy* chromaticity coordinates.
+    xy_s : array_like
+        Spectral locus *xy* chromaticity coordinates.
+    reverse : bool, optional
+        The intersection will be computed using the colour stimulus :math:`xy`
+        to achromatic stimulus :math:`xy_n` reverse direction.
+
+    Returns
+    -------
+    tuple
+        Spectral locus segment index, the last segment being the line of
+        purples, intersection point *xy* chromaticity coordinates.
+
+    Raises
+    ------
+    ValueError
+        If no intersection is found for any of the colour stimuli.
+    """
+
+    xy = np.asarray(xy, dtype=np.float_)
+    xy_n = np.resize(xy_n, xy.shape)
+    xy_s = np.asarray(xy_s)
+
+    shape = xy.shape
+    xy = np.reshape(xy, (-1, 2))
+    xy_n = np.reshape(xy_n, (-1, 2))
+
+    i_s = np.zeros(xy.shape[0], dtype=np.int_)
+    xy_wl = np.full(xy.shape, np.nan)
+    valid = np.zeros(xy.shape[0], dtype=np.bool_)
+
+    # Samples are processed per achromatic stimulus, the common case being a
+    # single one for the whole array.
+    if xy_n.shape[0] and np.all(xy_n == xy_n[0]):
+        unique, inverse = xy_n[0:1], None
+    else:
+        unique, inverse = np.unique(xy_n, axis=0, return_inverse=True)
+
+    d = -(xy - xy_n) if reverse else xy - xy_n
+
+    if len(unique) <= _SPECTRAL_LOCUS_INDEXED_ACHROMATIC_STIMULI:
+        groups = ([(unique[0], slice(None))] if inverse is None else
+                  [(xy_n_u, inverse == i) for i, xy_n_u in enumerate(unique)])
+    else:
+        # Too many achromatic stimuli for their angular indexes to be worth
+        # building and caching, the colour stimuli are intersected with all
+        # the spectral locus segments.
+        xy_a = xy_s
+        xy_b = np.roll(xy_s, -1, axis=0)
+        for i in range(0, xy.shape[0], _SPECTRAL_LOCUS_SEGMENTS_CHUNK_SIZE):
+            chunk = slice(i, i + _SPECTRAL_LOCUS_SEGMENTS_CHUNK_SIZE)
+            i_s[chunk] = _intersected_segments(xy_n[chunk], d[chunk], xy_a,
+                                               xy_b)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t, _s = _intersect_rays_segments(xy_n, d, xy_a[i_s], xy_b[i_s])
+            xy_wl = xy_n + t[..., np.newaxis] * d
+
+        valid = np.logical_and(i_s != -1, np.all(np.isfinite(xy_wl), axis=-1))
+        groups = []
+
+    for xy_n_g, mask in groups:
+        if not np.all(np.isfinite(xy_n_g)):
+            continue
+
+        angles, segments, xy_a, xy_b = _spectral_locus_angular_index(
+            xy_n_g, xy_s)
+
+        d_g = d[mask]
+
+        x_d, y_d = tsplit(d_g)
+        with np.errstate(invalid='ignore'):
+            i_i = np.searchsorted(angles, np.arctan2(y_d, x_d), 'right') - 1
+        i_g = segments[i_i % len(angles)]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t, _s = _intersect_rays_segments(xy_n_g, d_g, xy_a[i_g],
+                                             xy_b[i_g])
+            xy_g = xy_n_g + t[..., np.newaxis] * d_g
+
+        i_s[mask] = i_g
+        xy_wl[mask] = xy_g
+        valid[mask] = np.logical_and(i_g != -1,
+                                     np.all(np.isfinite(xy_g), axis=-1))
+
+    if not np.all(valid):
+        raise ValueError(
+            'No closest spectral locus wavelength index and coordinates found '
+            'for "{0}" colour stimulus and "{1}" achromatic stimulus "xy" '
+            'chromaticity coordinates!'.format(
+                np.reshape(xy, shape), np.reshape(xy_n, shape)))
+
+    return np.reshape(i_s, shape[0:-1]), np.reshape(xy_wl, shape)
+
 
 def closest_spectral_locus_wavelength(xy, xy_n, xy_s, reverse=False):
     """
@@ -83,6 +392,7 @@ def closest_spectral_locus_wavelength(xy, xy_n, xy_s, reverse=False):
 
     Examples
     --------
+    >>> from colour.models import XYZ_to_xy
     >>> xy = np.array([0.26415, 0.37770])
     >>> xy_n = np.array([0.31270, 0.32900])
     >>> xy_s = XYZ_to_xy(CMFS['CIE 1931 2 Degree Standard Observer'].values)
@@ -90,32 +400,38 @@ def closest_spectral_locus_wavelength(xy, xy_n, xy_s, reverse=False):
     (array(144), array([ 0.0036969...,  0.6389577...]))
     """
 
-    xy = np.asarray(xy)
-    xy_n = np.resize(xy_n, xy.shape)
     xy_s = np.asarray(xy_s)
 
-    xy_e = (extend_line_segment(xy, xy_n)
-            if reverse else extend_line_segment(xy_n, xy))
+    _i_s, xy_wl = _closest_spectral_locus_segment(xy, xy_n, xy_s, reverse)
 
-    # Closing horse-shoe shape to handle line of purples intersections.
-    xy_s = np.vstack((xy_s, xy_s[0, :]))
+    i_wl = _closest_spectral_locus_index(xy_wl, xy_s)
 
-    xy_wl = intersect_line_segments(
-        np.concatenate((xy_n, xy_e), -1),
-        np.hstack((xy_s, np.roll(xy_s, 1, axis=0)))).xy
-    xy_wl = xy_wl[~np.isnan(xy_wl).any(axis=-1)]
-    if not len(xy_wl):
-        raise ValueError(
-            'No closest spectral locus wavelength index and coordinates found '
-            'for "{0}" colour stimulus and "{1}" achromatic stimulus "xy" '
-            'chromaticity coordinates!'.format(xy, xy_n))
+    return i_wl, xy_wl
 
-    i_wl = np.argmin(scipy.spatial.distance.cdist(xy_wl, xy_s), axis=-1)
 
-    i_wl = np.reshape(i_wl, xy.shape[0:-1])
-    xy_wl = np.reshape(xy_wl, xy.shape)
+def _closest_spectral_locus_index(xy_wl, xy_s):
+    """
+    Returns the closest spectral locus wavelength index to given intersection
+    points *xy* chromaticity coordinates.
 
-    return i_wl, xy_wl
+    Parameters
+    ----------
+    xy_wl : array_like
+        Intersection points *xy* chromaticity coordinates.
+    xy_s : array_like
+        Spectral locus *xy* chromaticity coordinates.
+
+    Returns
+    -------
+    ndarray
+        Closest spectral locus wavelength index.
+    """
+
+    kdtree, canonical = _spectral_locus_kdtree(xy_s)
+
+    _distance, i_wl = kdtree.query(xy_wl)
+
+    return np.asarray(canonical[i_wl])
 
 
 def dominant_wavelength(xy,
@@ -183,28 +499,28 @@ def dominant_wavelength(xy,
      array([ 0.0743553...,  0.8338050...]))
     """
 
+    from colour.models import XYZ_to_xy
+
     xy = np.asarray(xy)
     xy_n = np.resize(xy_n, xy.shape)
 
     xy_s = XYZ_to_xy(cmfs.values)
 
-    i_wl, xy_wl = closest_spectral_locus_wavelength(xy, xy_n, xy_s, reverse)
+    i_s, xy_wl = _closest_spectral_locus_segment(xy, xy_n, xy_s, reverse)
     xy_cwl = xy_wl
-    wl = cmfs.wavelengths[i_wl]
-
-    xy_e = (extend_line_segment(xy, xy_n)
-            if reverse else extend_line_segment(xy_n, xy))
-    intersect = intersect_line_segments(
-        np.concatenate((xy_n, xy_e), -1), np.hstack((xy_s[0],
-                                                     xy_s[-1]))).intersect
-    intersect = np.reshape(intersect, wl.shape)
-
-    i_wl_r, xy_cwl_r = closest_spectral_locus_wavelength(
-        xy, xy_n, xy_s, not reverse)
-    wl_r = -cmfs.wavelengths[i_wl_r]
-
-    wl = np.where(intersect, wl_r, wl)
-    xy_cwl = np.where(intersect[..., np.newaxis], xy_cwl_r, xy_cwl)
+    wl = np.asarray(
+        cmfs.wavelengths[_closest_spectral_locus_index(xy_wl, xy_s)])
+
+    # The last spectral locus segment is the line of purples.
+    intersect = i_s == len(xy_s) - 1
+    if np.any(intersect):
+        _i_s_r, xy_cwl_r = _closest_spectral_locus_segment(
+            xy, xy_n, xy_s, not reverse)
+        wl_r = -cmfs.wavelengths[_closest_spectral_locus_index(
+            xy_cwl_r, xy_s)]
+
+        wl = np.where(intersect, wl_r, wl)
+        xy_cwl = np.where(intersect[..., np.newaxis], xy_cwl_r, xy_cwl)
 
     return wl, np.squeeze(xy_wl), np.squeeze(xy_cwl)
 
@@ -6,6 +6,9 @@ Illuminants
 Defines *CIE* illuminants computation related objects:
 
 -   :func:`colour.D_illuminant_relative_spd`
+-   :func:`colour.colorimetry.D_illuminant_relative_msa`
+-   :func:`colour.colorimetry.D_illuminant_relative_multi_spd`
+-   :func:`colour.colorimetry.D_illuminant_relative_XYZ`
 -   :func:`colour.CIE_standard_illuminant_A_function`
 
 See Also
@@ -30,7 +33,10 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.colorimetry import D_ILLUMINANTS_S_SPDS, SpectralPowerDistribution
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.colorimetry import (
+    D_ILLUMINANTS_S_SPDS, MultiSpectralPowerDistribution,
+    STANDARD_OBSERVERS_CMFS, SpectralPowerDistribution)
 from colour.utilities import tsplit
 
 __author__ = 'Colour Developers'
@@ -40,7 +46,105 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['D_illuminant_relative_spd', 'CIE_standard_illuminant_A_function']
+__all__ = [
+    'D_illuminant_relative_spd', 'D_illuminant_relative_msa',
+    'D_illuminant_relative_multi_spd', 'D_illuminant_relative_XYZ',
+    'CIE_standard_illuminant_A_function'
+]
+
+_D_ILLUMINANTS_S_VALUES_CACHE = {}
+"""
+*CIE Standard Illuminant D Series* :math:`S_n(\lambda)` distributions values
+cache.
+
+_D_ILLUMINANTS_S_VALUES_CACHE : dict
+"""
+
+_D_ILLUMINANTS_S_XYZ_CACHE = {}
+"""
+*CIE Standard Illuminant D Series* :math:`S_n(\lambda)` distributions
+*CIE XYZ* tristimulus values cache.
+
+_D_ILLUMINANTS_S_XYZ_CACHE : dict
+"""
+
+
+def _shape_key(shape):
+    """
+    Returns a hashable key for given spectral shape.
+    """
+
+    return (float(shape.start), float(shape.end), float(shape.interval))
+
+
+def _D_illuminant_M1_M2(xy, M1_M2_rounding=True):
+    """
+    Returns the :math:`M1` and :math:`M2` variables of the
+    *CIE Standard Illuminant D Series* for given *xy* chromaticity coordinates.
+
+    Parameters
+    ----------
+    xy : array_like
+        *xy* chromaticity coordinates.
+    M1_M2_rounding : bool, optional
+        Whether to round :math:`M1` and :math:`M2` variables to 3 decimal
+        places in order to yield the internationally agreed values.
+
+    Returns
+    -------
+    tuple
+        :math:`M1` and :math:`M2` variables.
+    """
+
+    x, y = tsplit(xy)
+
+    M = 0.0241 + 0.2562 * x - 0.7341 * y
+    M1 = (-1.3515 - 1.7703 * x + 5.9114 * y) / M
+    M2 = (0.0300 - 31.4424 * x + 30.0717 * y) / M
+
+    if M1_M2_rounding:
+        M1 = np.around(M1, 3)
+        M2 = np.around(M2, 3)
+
+    return M1, M2
+
+
+def _D_illuminants_S_values(shape=None):
+    """
+    Returns the values of the *CIE Standard Illuminant D Series*
+    :math:`S_n(\lambda)` distributions aligned to given spectral shape.
+
+    Parameters
+    ----------
+    shape : SpectralShape, optional
+        Spectral shape to align the distributions to, their own spectral shape
+        is used if not given.
+
+    Returns
+    -------
+    ndarray
+        :math:`S_n(\lambda)` distributions values with shape *(3, bins)*.
+    """
+
+    S_n = [D_ILLUMINANTS_S_SPDS[name] for name in ('S0', 'S1', 'S2')]
+
+    if shape is None:
+        shape = S_n[0].shape
+
+    key = _shape_key(shape)
+    values = _D_ILLUMINANTS_S_VALUES_CACHE.get(key)
+    if values is not None:
+        return values
+
+    values = np.array([
+        S.values if S.shape == shape else S.copy().align(shape).values
+        for S in S_n
+    ])
+    values.setflags(write=False)
+
+    _D_ILLUMINANTS_S_VALUES_CACHE[key] = values
+
+    return values
 
 
 def D_illuminant_relative_spd(xy, M1_M2_rounding=True):
@@ -197,15 +301,7 @@ def D_illuminant_relative_spd(xy, M1_M2_rounding=True):
                               extrapolator_args={...})
     """
 
-    x, y = tsplit(xy)
-
-    M = 0.0241 + 0.2562 * x - 0.7341 * y
-    M1 = (-1.3515 - 1.7703 * x + 5.9114 * y) / M
-    M2 = (0.0300 - 31.4424 * x + 30.0717 * y) / M
-
-    if M1_M2_rounding:
-        M1 = np.around(M1, 3)
-        M2 = np.around(M2, 3)
+    M1, M2 = _D_illuminant_M1_M2(xy, M1_M2_rounding)
 
     S0 = D_ILLUMINANTS_S_SPDS['S0']
     S1 = D_ILLUMINANTS_S_SPDS['S1']
@@ -217,6 +313,171 @@ def D_illuminant_relative_spd(xy, M1_M2_rounding=True):
         distribution, S0.wavelengths, name='CIE Standard Illuminant D Series')
 
 
+def D_illuminant_relative_msa(xy, shape=None, M1_M2_rounding=True):
+    """
+    Returns the multi-spectral array of the *CIE Standard Illuminant D Series*
+    relative spectral power distributions using given *xy* chromaticity
+    coordinates.
+
+    Parameters
+    ----------
+    xy : array_like
+        *xy* chromaticity coordinates.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral array, the
+        *CIE Standard Illuminant D Series* :math:`S_n(\lambda)` distributions
+        spectral shape is used if not given.
+    M1_M2_rounding : bool, optional
+        Whether to round :math:`M1` and :math:`M2` variables to 3 decimal
+        places in order to yield the internationally agreed values.
+
+    Returns
+    -------
+    ndarray
+        *CIE Standard Illuminant D Series* multi-spectral array with shape
+        *(..., bins)*.
+
+    Notes
+    -----
+    -   The :math:`S_n(\lambda)` distributions aligned to given spectral shape
+        are cached in :attr:`colour.colorimetry.illuminants.\
+_D_ILLUMINANTS_S_VALUES_CACHE` attribute.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> from colour.temperature import CCT_to_xy_CIE_D
+    >>> xy = CCT_to_xy_CIE_D(np.array([5000, 6500]) * 1.4388 / 1.4380)
+    >>> D_illuminant_relative_msa(xy, SpectralShape(400, 450, 10))
+    ... # doctest: +ELLIPSIS +NORMALIZE_WHITESPACE
+    array([[  49.3081...,   56.5128...,   60.0338...,   57.8175...,
+              74.8249...,   87.2472...],
+           [  82.7549...,   91.486 ...,   93.4318...,   86.6823...,
+             104.8649...,  117.0076...]])
+    """
+
+    M1, M2 = _D_illuminant_M1_M2(xy, M1_M2_rounding)
+
+    S0, S1, S2 = _D_illuminants_S_values(shape)
+
+    return (S0 + np.asarray(M1)[..., np.newaxis] * S1 +
+            np.asarray(M2)[..., np.newaxis] * S2)
+
+
+def D_illuminant_relative_multi_spd(xy, M1_M2_rounding=True):
+    """
+    Returns the multi-spectral power distribution of given
+    *CIE Standard Illuminant D Series* using given *xy* chromaticity
+    coordinates, each illuminant being stored as a column.
+
+    Parameters
+    ----------
+    xy : array_like
+        *xy* chromaticity coordinates.
+    M1_M2_rounding : bool, optional
+        Whether to round :math:`M1` and :math:`M2` variables to 3 decimal
+        places in order to yield the internationally agreed values.
+
+    Returns
+    -------
+    MultiSpectralPowerDistribution
+        *CIE Standard Illuminant D Series* relative multi-spectral power
+        distribution.
+
+    Examples
+    --------
+    >>> from colour.temperature import CCT_to_xy_CIE_D
+    >>> xy = CCT_to_xy_CIE_D(np.array([5000, 6500]) * 1.4388 / 1.4380)
+    >>> multi_spd = D_illuminant_relative_multi_spd(xy)
+    >>> multi_spd.labels
+    ['0', '1']
+    >>> multi_spd[560]  # doctest: +ELLIPSIS
+    array([ 100.,  100.])
+    """
+
+    xy = np.reshape(xy, (-1, 2))
+
+    return MultiSpectralPowerDistribution(
+        np.transpose(D_illuminant_relative_msa(xy, None, M1_M2_rounding)),
+        D_ILLUMINANTS_S_SPDS['S0'].wavelengths,
+        labels=[str(i) for i in range(xy.shape[0])],
+        name='CIE Standard Illuminant D Series')
+
+
+def D_illuminant_relative_XYZ(
+        xy,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        M1_M2_rounding=True):
+    """
+    Returns the *CIE XYZ* tristimulus values of given
+    *CIE Standard Illuminant D Series* using given *xy* chromaticity
+    coordinates by direct integration with given colour matching functions.
+
+    The *CIE Standard Illuminant D Series* relative spectral power distribution
+    being a linear combination of the :math:`S_n(\lambda)` distributions, so
+    are its *CIE XYZ* tristimulus values which are computed from the cached
+    tristimulus values of the :math:`S_n(\lambda)` distributions.
+
+    Parameters
+    ----------
+    xy : array_like
+        *xy* chromaticity coordinates.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions, the
+        :math:`S_n(\lambda)` distributions are aligned to their spectral
+        shape.
+    M1_M2_rounding : bool, optional
+        Whether to round :math:`M1` and :math:`M2` variables to 3 decimal
+        places in order to yield the internationally agreed values.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values with shape *(..., 3)*.
+
+    Warning
+    -------
+    -   The :math:`S_n(\lambda)` distributions *CIE XYZ* tristimulus values
+        are cached in :attr:`colour.colorimetry.illuminants.\
+_D_ILLUMINANTS_S_XYZ_CACHE` attribute. Their identifier key is defined by the
+        colour matching functions name and spectral shape, thus one should be
+        mindful that using similar colour matching functions names but with
+        different spectral data will lead to unexpected behaviour.
+    -   The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   The *CIE XYZ* tristimulus values are normalised as
+        :func:`colour.colorimetry.spectral_to_XYZ_integration` definition does
+        with an equal-energy illuminant.
+
+    Examples
+    --------
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> from colour.temperature import CCT_to_xy_CIE_D
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> xy = CCT_to_xy_CIE_D(np.array([5000, 6500]) * 1.4388 / 1.4380)
+    >>> D_illuminant_relative_XYZ(xy, cmfs)  # doctest: +ELLIPSIS
+    array([[  9478.4781368...,   9830.2195020...,   8112.0007958...],
+           [  9399.3590882...,   9889.2049040...,  10769.0289310...]])
+    """
+
+    shape = cmfs.shape
+    key = (cmfs.name, ) + _shape_key(shape)
+    XYZ_S = _D_ILLUMINANTS_S_XYZ_CACHE.get(key)
+    if XYZ_S is None:
+        W = cmfs.values * (100 / np.sum(cmfs.values[..., 1]))
+        XYZ_S = np.dot(_D_illuminants_S_values(shape), W)
+        XYZ_S.setflags(write=False)
+        _D_ILLUMINANTS_S_XYZ_CACHE[key] = XYZ_S
+
+    M1, M2 = _D_illuminant_M1_M2(xy, M1_M2_rounding)
+    M1 = np.asarray(M1, dtype=DEFAULT_FLOAT_DTYPE)[..., np.newaxis]
+    M2 = np.asarray(M2, dtype=DEFAULT_FLOAT_DTYPE)[..., np.newaxis]
+
+    return XYZ_S[0] + M1 * XYZ_S[1] + M2 * XYZ_S[2]
+
+
 def CIE_standard_illuminant_A_function(wl):
     """
     *CIE Standard Illuminant A* is intended to represent typical, domestic,
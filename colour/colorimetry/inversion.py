@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+"""
+Monotone Inversion
+==================
+
+Defines the objects to invert strictly monotonic curves, e.g. the *luminance*
+:math:`Y`, *Lightness* :math:`L` or *Munsell* value :math:`V` computation
+objects, with cached inverse tables:
+
+-   :func:`colour.colorimetry.monotone_inverse_table`
+-   :func:`colour.colorimetry.monotone_inverse`
+
+The inverse of a strictly monotonic curve is sampled at uniformly spaced
+curve values and interpolated with cubic *Hermite* segments, thus evaluating
+the inverse is a table lookup per sample whatever the curve is. The table is
+refined until its interpolation error, measured against the inverse computed
+by bisection at the midpoints and quarter points of all the table intervals,
+is lower than a given tolerance. The intervals that cannot reach the
+tolerance, e.g. around the breakpoint of a piecewise curve, are split into
+segments with their own uniformly spaced tables.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import as_numeric
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['monotone_inverse_table', 'monotone_inverse']
+
+_MONOTONE_INVERSE_TABLES_CACHE = {}
+"""
+Monotone inverse tables cache.
+
+_MONOTONE_INVERSE_TABLES_CACHE : dict
+"""
+
+_MONOTONE_INVERSE_TABLE_INITIAL_SIZE = 64
+"""
+Initial intervals count of the monotone inverse tables.
+
+_MONOTONE_INVERSE_TABLE_INITIAL_SIZE : int
+"""
+
+_MONOTONE_INVERSE_TABLE_MAXIMUM_SIZE = 2 ** 13
+"""
+Maximum intervals count of the monotone inverse tables segments.
+
+_MONOTONE_INVERSE_TABLE_MAXIMUM_SIZE : int
+"""
+
+_MONOTONE_INVERSE_TABLE_MAXIMUM_SEGMENTS = 64
+"""
+Maximum segments count of the monotone inverse tables.
+
+_MONOTONE_INVERSE_TABLE_MAXIMUM_SEGMENTS : int
+"""
+
+_MONOTONE_INVERSE_MONOTONICITY_SAMPLES = 4097
+"""
+Samples count used to check the monotonicity of the curves.
+
+_MONOTONE_INVERSE_MONOTONICITY_SAMPLES : int
+"""
+
+
+def _bisection(function, y, x_a, x_b, is_increasing, **kwargs):
+    """
+    Returns the values of given strictly monotonic function inverse at given
+    values by vectorised bisection within given brackets.
+    """
+
+    x_a = np.array(x_a, dtype=DEFAULT_FLOAT_DTYPE)
+    x_b = np.array(x_b, dtype=DEFAULT_FLOAT_DTYPE)
+
+    # 64 iterations reduce any bracket to adjacent floating point numbers.
+    for _ in range(64):
+        x_m = (x_a + x_b) / 2
+        if np.all(np.logical_or(x_m == x_a, x_m == x_b)):
+            break
+
+        y_m = np.asarray(function(x_m, **kwargs))
+        is_below = y_m < y if is_increasing else y_m > y
+
+        x_a = np.where(is_below, x_m, x_a)
+        x_b = np.where(is_below, x_b, x_m)
+
+    return (x_a + x_b) / 2
+
+
+def _hermite_coefficients(x):
+    """
+    Returns the cubic *Hermite* segments coefficients of given uniformly
+    sampled values with slopes computed with fourth order finite differences.
+    """
+
+    d = np.empty(x.shape, dtype=DEFAULT_FLOAT_DTYPE)
+    d[2:-2] = (x[:-4] - 8 * x[1:-3] + 8 * x[3:-1] - x[4:]) / 12
+    d[0] = (-25 * x[0] + 48 * x[1] - 36 * x[2] + 16 * x[3] - 3 * x[4]) / 12
+    d[1] = (-3 * x[0] - 10 * x[1] + 18 * x[2] - 6 * x[3] + x[4]) / 12
+    d[-1] = (25 * x[-1] - 48 * x[-2] + 36 * x[-3] - 16 * x[-4] + 3 * x[-5]
+             ) / 12
+    d[-2] = (3 * x[-1] + 10 * x[-2] - 18 * x[-3] + 6 * x[-4] - x[-5]) / 12
+
+    x_0, x_1, d_0, d_1 = x[:-1], x[1:], d[:-1], d[1:]
+
+    return np.stack(
+        [
+            x_0, d_0, 3 * (x_1 - x_0) - 2 * d_0 - d_1,
+            2 * (x_0 - x_1) + d_0 + d_1
+        ],
+        axis=-1)
+
+
+def _hermite_evaluate(coefficients, t, n, offset=0):
+    """
+    Evaluates given cubic *Hermite* segments coefficients at given fractional
+    indexes of the tables with given intervals counts and coefficients
+    offsets, values outside the first and last tables are linearly
+    extrapolated.
+    """
+
+    t = np.asarray(t, dtype=DEFAULT_FLOAT_DTYPE)
+
+    i = np.nan_to_num(np.clip(np.floor(t), 0, n - 1)).astype(np.int_)
+    u = np.clip(t - i, 0, 1)
+
+    c = np.take(coefficients, i + offset, axis=0)
+    x = ((c[..., 3] * u + c[..., 2]) * u + c[..., 1]) * u + c[..., 0]
+
+    # Linear extrapolation using the slopes at the table ends.
+    c_0, c_n = coefficients[0], coefficients[-1]
+    x = np.where(
+        np.logical_and(t < 0, offset == 0), c_0[0] + c_0[1] * t, x)
+    x = np.where(
+        np.logical_and(t > n, offset + n == coefficients.shape[0]),
+        np.sum(c_n) + (c_n[1] + 2 * c_n[2] + 3 * c_n[3]) * (t - n), x)
+
+    return x
+
+
+def _hermite_table(function, y_a, y_b, x_a, x_b, is_increasing, tolerance,
+                   **kwargs):
+    """
+    Returns the inverse table of given strictly monotonic function between
+    given function values, its cubic *Hermite* segments coefficients and the
+    interpolation error of its intervals.
+
+    The table size is doubled until the interpolation error is lower than
+    given tolerance or the table has
+    :attr:`colour.colorimetry.inversion._MONOTONE_INVERSE_TABLE_MAXIMUM_SIZE`
+    intervals.
+    """
+
+    n = _MONOTONE_INVERSE_TABLE_INITIAL_SIZE
+    x = _bisection(function, np.linspace(y_a, y_b, n + 1), x_a, x_b,
+                   is_increasing, **kwargs)
+    x[0], x[-1] = x_a, x_b
+    while True:
+        # Inverse at the midpoints of the table intervals.
+        t_m = np.arange(n) + 0.5
+        x_m = _bisection(function, y_a + t_m * (y_b - y_a) / n, x[:-1], x[1:],
+                         is_increasing, **kwargs)
+
+        x_r = np.empty(2 * n + 1, dtype=DEFAULT_FLOAT_DTYPE)
+        x_r[0::2], x_r[1::2] = x, x_m
+
+        coefficients = _hermite_coefficients(x)
+        error = np.abs(_hermite_evaluate(coefficients, t_m, n) - x_m)
+        if np.max(error) <= tolerance:
+            # Inverse at the quarter points of the table intervals.
+            t_q = np.arange(2 * n) / 2 + 0.25
+            x_q = _bisection(function, y_a + t_q * (y_b - y_a) / n, x_r[:-1],
+                             x_r[1:], is_increasing, **kwargs)
+            error = np.maximum(
+                error,
+                np.max(
+                    np.reshape(
+                        np.abs(_hermite_evaluate(coefficients, t_q, n) - x_q),
+                        (n, 2)),
+                    axis=-1))
+
+        if (np.max(error) <= tolerance or
+                2 * n > _MONOTONE_INVERSE_TABLE_MAXIMUM_SIZE):
+            return x, coefficients, error
+
+        x, n = x_r, 2 * n
+
+
+def _monotone_inverse_coefficients(function, domain, tolerance, **kwargs):
+    """
+    Returns the inverse table, the cubic *Hermite* segments coefficients and
+    the segments of the inverse of given strictly monotonic function and
+    caches them if not existing.
+
+    The inverse is split into segments, each with its own uniformly spaced
+    table, around the table intervals exceeding the tolerance whenever it
+    cannot be reached with a single table, e.g. because of a breakpoint of a
+    piecewise function or a large inverse slope at the domain edges.
+    """
+
+    x_a, x_b = (float(value) for value in domain)
+    key = (function, x_a, x_b, float(tolerance), repr(sorted(kwargs.items())))
+    entry = _MONOTONE_INVERSE_TABLES_CACHE.get(key)
+    if entry is not None:
+        return entry
+
+    y = np.asarray(
+        function(
+            np.linspace(x_a, x_b, _MONOTONE_INVERSE_MONOTONICITY_SAMPLES),
+            **kwargs))
+    y_d = np.diff(y)
+    if (not np.all(np.isfinite(y)) or
+            not (np.all(y_d > 0) or np.all(y_d < 0))):
+        raise ValueError(
+            '"{0}" function is not strictly monotonic over "{1}" '
+            'domain!'.format(function.__name__, domain))
+
+    is_increasing = y[-1] > y[0]
+
+    tables = []
+    segments = [(y[0], y[-1], x_a, x_b)]
+    while segments:
+        y_0, y_1, x_0, x_1 = segments.pop()
+        x, coefficients, error = _hermite_table(
+            function, y_0, y_1, x_0, x_1, is_increasing, tolerance, **kwargs)
+        if np.max(error) <= tolerance:
+            tables.append((y_0, y_1, x, coefficients))
+            continue
+
+        # The intervals whose error or slopes stencils involve intervals
+        # exceeding the tolerance are split from the others.
+        n = coefficients.shape[0]
+        is_failing = np.convolve(error > tolerance, np.ones(5), 'same') > 0
+        i = np.hstack(
+            [0, np.flatnonzero(np.diff(is_failing.astype(np.int_))) + 1, n])
+        y_s = np.linspace(y_0, y_1, n + 1)[i]
+        x_s = x[i]
+        if (len(tables) + len(segments) + len(i) - 1 >
+                _MONOTONE_INVERSE_TABLE_MAXIMUM_SEGMENTS or len(i) == 2 or
+                np.any(np.diff(y_s) == 0)):
+            raise ValueError(
+                '"{0}" function inverse error over "{1}" domain cannot be '
+                'reduced below "{2}" tolerance, the error is "{3}" with "{4}" '
+                'intervals!'.format(function.__name__, domain, tolerance,
+                                    np.max(error), n))
+
+        # The segments are processed in reverse order so that the tables are
+        # appended in order.
+        segments.extend(
+            reversed(list(zip(y_s[:-1], y_s[1:], x_s[:-1], x_s[1:]))))
+
+    y_0 = np.array([table_s[0] for table_s in tables])
+    y_1 = np.array([table_s[1] for table_s in tables])
+    n = np.array([table_s[3].shape[0] for table_s in tables])
+    segments = (y_0, n / (y_1 - y_0), n, np.cumsum(n) - n)
+
+    table = np.concatenate(
+        [[[y[0], x_a]]] + [
+            np.stack(
+                [np.linspace(table_s[0], table_s[1], n_s + 1), table_s[2]],
+                axis=-1)[1:] for n_s, table_s in zip(n, tables)
+        ],
+        axis=0)
+    coefficients = np.concatenate([table_s[3] for table_s in tables])
+
+    for array in (table, coefficients) + segments:
+        array.setflags(write=False)
+
+    entry = table, coefficients, segments
+    _MONOTONE_INVERSE_TABLES_CACHE[key] = entry
+
+    return entry
+
+
+def monotone_inverse_table(function, domain, tolerance=1e-10, **kwargs):
+    """
+    Returns the inverse table of given strictly monotonic function, e.g.
+    :func:`colour.colorimetry.luminance_ASTMD153508` definition, over given
+    domain.
+
+    The inverse is sampled at uniformly spaced function values and the table
+    size is doubled until the cubic *Hermite* interpolation of the table
+    matches the inverse computed by bisection at the midpoints and quarter
+    points of all the table intervals within given tolerance. If the
+    tolerance is not reached with :attr:`colour.colorimetry.inversion.\
+_MONOTONE_INVERSE_TABLE_MAXIMUM_SIZE` intervals, e.g. around the breakpoint of
+    a piecewise function such as :func:`colour.colorimetry.lightness_CIE1976`
+    definition, the failing intervals are split from the others into
+    segments with their own uniformly spaced function values.
+
+    Parameters
+    ----------
+    function : callable
+        Strictly monotonic function to invert.
+    domain : array_like
+        Domain of the function to invert, i.e. range of the inverse.
+    tolerance : numeric, optional
+        Maximum absolute error of the inverse.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Scalar keywords arguments for the function.
+
+    Returns
+    -------
+    ndarray
+        Inverse table of shape *(samples, 2)*, the first column is the
+        function values, uniformly spaced per segment, and the second column
+        is the inverse values.
+
+    Raises
+    ------
+    ValueError
+        If the function is not strictly monotonic over the domain or if the
+        tolerance cannot be reached, e.g. because the inverse slope is too
+        large for the function values precision.
+
+    Warning
+    -------
+    The tables are cached in :attr:`colour.colorimetry.inversion.\
+_MONOTONE_INVERSE_TABLES_CACHE` attribute. Their identifier key is defined by
+    the function, the domain, the tolerance and the keywords arguments, thus
+    one should be mindful that modifying the function in place will lead to
+    unexpected behaviour.
+
+    Examples
+    --------
+    >>> from colour.colorimetry import luminance_ASTMD153508
+    >>> table = monotone_inverse_table(luminance_ASTMD153508, (0, 10))
+    >>> table.shape
+    (8193, 2)
+    >>> table[[0, -1]]
+    array([[   0.,    0.],
+           [ 100.,   10.]])
+    """
+
+    return _monotone_inverse_coefficients(function, domain, tolerance,
+                                          **kwargs)[0]
+
+
+def monotone_inverse(a, function, domain, tolerance=1e-10, **kwargs):
+    """
+    Evaluates the inverse of given strictly monotonic function, e.g.
+    :func:`colour.colorimetry.luminance_ASTMD153508` definition, at given
+    values with a cached inverse table.
+
+    Each value is evaluated with a single cubic *Hermite* segment of the
+    table built by
+    :func:`colour.colorimetry.monotone_inverse_table` definition, no root
+    finding is performed per value.
+
+    Parameters
+    ----------
+    a : numeric or array_like
+        Values of the function to invert.
+    function : callable
+        Strictly monotonic function to invert.
+    domain : array_like
+        Domain of the function to invert, i.e. range of the inverse.
+    tolerance : numeric, optional
+        Maximum absolute error of the inverse over the domain.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Scalar keywords arguments for the function.
+
+    Returns
+    -------
+    numeric or ndarray
+        Inverse values.
+
+    Notes
+    -----
+    -   Values outside the function range over the domain are linearly
+        extrapolated.
+
+    Examples
+    --------
+    >>> from colour.colorimetry import luminance_ASTMD153508
+    >>> monotone_inverse(10.1488096782, luminance_ASTMD153508, (0, 10))
+    ... # doctest: +ELLIPSIS
+    3.7462971...
+    """
+
+    table, coefficients, (y_0, scale, n, offset) = (
+        _monotone_inverse_coefficients(function, domain, tolerance, **kwargs))
+
+    a = np.asarray(a, dtype=DEFAULT_FLOAT_DTYPE)
+
+    if y_0.size == 1:
+        i = 0
+    elif table[-1, 0] > table[0, 0]:
+        i = np.searchsorted(y_0[1:], a, side='right')
+    else:
+        i = np.searchsorted(-y_0[1:], -a, side='right')
+
+    t = (a - y_0[i]) * scale[i]
+
+    return as_numeric(_hermite_evaluate(coefficients, t, n[i], offset[i]))
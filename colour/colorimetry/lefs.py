@@ -3,7 +3,11 @@
 Luminous Efficiency Functions Spectral Power Distributions
 ==========================================================
 
-Defines luminous efficiency functions computation related objects.
+Defines luminous efficiency functions computation related objects:
+
+-   :func:`colour.mesopic_weighting_function`
+-   :func:`colour.mesopic_luminous_efficiency_function`
+-   :func:`colour.colorimetry.mesopic_luminous_efficiency_msa`
 
 See Also
 --------
@@ -20,6 +24,8 @@ Mesopic_vision#Mesopic_weighting_function
 
 from __future__ import division, unicode_literals
 
+import numpy as np
+
 from colour.colorimetry import (PHOTOPIC_LEFS, SCOTOPIC_LEFS,
                                 SpectralPowerDistribution, SpectralShape)
 from colour.colorimetry.dataset.lefs import MESOPIC_X_DATA
@@ -33,9 +39,17 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'mesopic_weighting_function', 'mesopic_luminous_efficiency_function'
+    'mesopic_weighting_function', 'mesopic_luminous_efficiency_function',
+    'mesopic_luminous_efficiency_msa'
 ]
 
+_MESOPIC_LUMINOUS_EFFICIENCY_TABLES_CACHE = {}
+"""
+Mesopic luminous efficiency functions tables cache.
+
+_MESOPIC_LUMINOUS_EFFICIENCY_TABLES_CACHE : dict
+"""
+
 
 def mesopic_weighting_function(
         wavelength,
@@ -537,22 +551,191 @@ def mesopic_luminous_efficiency_function(
                               extrapolator_args={...})
     """
 
+    levels, wavelengths, table = _mesopic_luminous_efficiency_table(
+        source, method, photopic_lef, scotopic_lef)
+
+    return SpectralPowerDistribution(
+        table[_mesopic_luminance_levels_indexes(levels, Lp)],
+        wavelengths,
+        name='{0} Lp Mesopic Luminous Efficiency Function'.format(Lp))
+
+
+def _mesopic_luminance_levels_indexes(levels, Lp):
+    """
+    Returns the indexes of the photopic luminance levels closest to given
+    photopic luminance :math:`L_p` values, ties being resolved to the lowest
+    level as :func:`colour.utilities.closest` definition does.
+
+    Parameters
+    ----------
+    levels : ndarray
+        Sorted photopic luminance levels.
+    Lp : numeric or array_like
+        Photopic luminance :math:`L_p`.
+
+    Returns
+    -------
+    integer or ndarray
+        Photopic luminance levels indexes.
+    """
+
+    return np.searchsorted((levels[1:] + levels[:-1]) / 2, Lp)
+
+
+def _mesopic_luminous_efficiency_table(source, method, photopic_lef,
+                                       scotopic_lef, shape=None):
+    """
+    Returns the table of the mesopic luminous efficiency functions
+    :math:`V_m(\lambda)` at the photopic luminance levels of
+    :attr:`colour.colorimetry.dataset.lefs.MESOPIC_X_DATA` attribute.
+
+    The mesopic weighting factor being a step function of the photopic
+    luminance :math:`L_p`, quantising :math:`L_p` to the closest level of the
+    table is exact.
+
+    Parameters
+    ----------
+    source : unicode
+        **{'Blue Heavy', 'Red Heavy'}**,
+        Light source colour temperature.
+    method : unicode
+        **{'MOVE', 'LRC'}**,
+        Method to calculate the weighting factor.
+    photopic_lef : SpectralPowerDistribution
+        :math:`V(\lambda)` photopic luminous efficiency function.
+    scotopic_lef : SpectralPowerDistribution
+        :math:`V^\prime(\lambda)` scotopic luminous efficiency function.
+    shape : SpectralShape, optional
+        Spectral shape to align the mesopic luminous efficiency functions to
+        with zero extrapolation, the common shape of the photopic and scotopic
+        luminous efficiency functions is used if not given.
+
+    Returns
+    -------
+    tuple
+        Photopic luminance levels, wavelengths and mesopic luminous efficiency
+        functions values with shape *(levels, bins)*.
+    """
+
+    key = (source.lower(), method.lower(), photopic_lef.name,
+           scotopic_lef.name, str(photopic_lef.shape), str(scotopic_lef.shape),
+           str(shape))
+    table = _MESOPIC_LUMINOUS_EFFICIENCY_TABLES_CACHE.get(key)
+    if table is not None:
+        return table
+
     photopic_lef_shape = photopic_lef.shape
     scotopic_lef_shape = scotopic_lef.shape
-    shape = SpectralShape(
+    lef_shape = SpectralShape(
         max(photopic_lef_shape.start, scotopic_lef_shape.start),
         min(photopic_lef_shape.end, scotopic_lef_shape.end),
         max(photopic_lef_shape.interval, scotopic_lef_shape.interval))
 
-    wavelengths = shape.range()
+    wavelengths = lef_shape.range()
+    levels = np.array(sorted(MESOPIC_X_DATA.keys()), dtype=np.float_)
 
-    spd_data = dict(
-        zip(wavelengths,
-            mesopic_weighting_function(wavelengths, Lp, source, method,
-                                       photopic_lef, scotopic_lef)))
+    values = []
+    for Lp in levels:
+        Vm = mesopic_weighting_function(wavelengths, Lp, source, method,
+                                        photopic_lef, scotopic_lef)
+        Vm = Vm * (1 / np.max(Vm))
 
-    spd = SpectralPowerDistribution(
-        spd_data,
-        name='{0} Lp Mesopic Luminous Efficiency Function'.format(Lp))
+        if shape is not None:
+            Vm = SpectralPowerDistribution(Vm, wavelengths).align(
+                shape,
+                extrapolator_args={
+                    'method': 'Constant',
+                    'left': 0,
+                    'right': 0
+                }).values
+
+        values.append(Vm)
+
+    if shape is not None:
+        wavelengths = shape.range()
+
+    values = np.array(values)
+    for array in (levels, wavelengths, values):
+        array.setflags(write=False)
+
+    table = _MESOPIC_LUMINOUS_EFFICIENCY_TABLES_CACHE[key] = (levels,
+                                                              wavelengths,
+                                                              values)
+
+    return table
+
+
+def mesopic_luminous_efficiency_msa(
+        Lp,
+        shape=None,
+        source='Blue Heavy',
+        method='MOVE',
+        photopic_lef=PHOTOPIC_LEFS['CIE 1924 Photopic Standard Observer'],
+        scotopic_lef=SCOTOPIC_LEFS['CIE 1951 Scotopic Standard Observer']):
+    """
+    Returns the multi-spectral array of the mesopic luminous efficiency
+    functions :math:`V_m(\lambda)` for given photopic luminance :math:`L_p`
+    values, e.g. a luminance map.
+
+    Parameters
+    ----------
+    Lp : numeric or array_like
+        Photopic luminance :math:`L_p`.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral array, the mesopic luminous
+        efficiency functions are aligned to it with zero extrapolation. The
+        common spectral shape of the photopic and scotopic luminous efficiency
+        functions is used if not given.
+    source : unicode, optional
+        **{'Blue Heavy', 'Red Heavy'}**,
+        Light source colour temperature.
+    method : unicode, optional
+        **{'MOVE', 'LRC'}**,
+        Method to calculate the weighting factor.
+    photopic_lef : SpectralPowerDistribution, optional
+        :math:`V(\lambda)` photopic luminous efficiency function.
+    scotopic_lef : SpectralPowerDistribution, optional
+        :math:`V^\prime(\lambda)` scotopic luminous efficiency function.
+
+    Returns
+    -------
+    ndarray
+        Mesopic luminous efficiency functions :math:`V_m(\lambda)`
+        multi-spectral array with shape *(..., bins)*.
+
+    Warning
+    -------
+    The mesopic luminous efficiency functions at the photopic luminance levels
+    of :attr:`colour.colorimetry.dataset.lefs.MESOPIC_X_DATA` attribute are
+    cached in :attr:`colour.colorimetry.lefs.\
+_MESOPIC_LUMINOUS_EFFICIENCY_TABLES_CACHE` attribute. Their identifier key is
+    defined by the luminous efficiency functions names and spectral shapes,
+    thus one should be mindful that using similar luminous efficiency
+    functions names but with different spectral data will lead to unexpected
+    behaviour.
+
+    Notes
+    -----
+    -   The mesopic weighting factor is a step function of the photopic
+        luminance :math:`L_p`, the returned values are thus exactly those of
+        :func:`colour.mesopic_luminous_efficiency_function` definition.
+    -   The multi-spectral array is a read-only view of the cached table when
+        given photopic luminance :math:`L_p` is a scalar.
+
+    References
+    ----------
+    -   :cite:`Wikipediacc`
+
+    Examples
+    --------
+    >>> msa = mesopic_luminous_efficiency_msa(np.array([0.1, 1, 10]))
+    >>> msa.shape
+    (3, 401)
+    >>> msa[..., 120]  # doctest: +ELLIPSIS
+    array([ 0.8352251...,  0.6032501...,  0.3402310...])
+    """
+
+    levels, _wavelengths, table = _mesopic_luminous_efficiency_table(
+        source, method, photopic_lef, scotopic_lef, shape)
 
-    return spd.normalise()
+    return table[_mesopic_luminance_levels_indexes(levels, Lp)]
@@ -3,7 +3,12 @@
 Photometry
 ==========
 
-Defines photometric quantities computation related objects.
+Defines photometric quantities computation related objects:
+
+-   :func:`colour.luminous_flux`
+-   :func:`colour.luminous_efficiency`
+-   :func:`colour.luminous_efficacy`
+-   :func:`colour.colorimetry.mesopic_luminous_flux`
 
 See Also
 --------
@@ -13,6 +18,9 @@ blob/master/notebooks/colorimetry/photometry.ipynb>`_
 
 References
 ----------
+-   :cite:`Wikipediacc` : Wikipedia. (n.d.). Mesopic weighting function.
+    Retrieved June 20, 2014, from http://en.wikipedia.org/wiki/\
+Mesopic_vision#Mesopic_weighting_function
 -   :cite:`Wikipediacm` : Wikipedia. (n.d.). Luminous Efficacy. Retrieved April
     3, 2016, from https://en.wikipedia.org/wiki/Luminous_efficacy
 -   :cite:`Wikipediacq` : Wikipedia. (n.d.). Luminosity function. Retrieved
@@ -24,7 +32,9 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.colorimetry import PHOTOPIC_LEFS
+from colour.colorimetry import PHOTOPIC_LEFS, SCOTOPIC_LEFS
+from colour.colorimetry.lefs import (_mesopic_luminance_levels_indexes,
+                                     _mesopic_luminous_efficiency_table)
 from colour.constants import K_M
 
 __author__ = 'Colour Developers'
@@ -34,7 +44,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['luminous_flux', 'luminous_efficiency', 'luminous_efficacy']
+__all__ = [
+    'luminous_flux', 'luminous_efficiency', 'luminous_efficacy',
+    'mesopic_luminous_flux'
+]
 
 
 def luminous_flux(spd,
@@ -158,3 +171,79 @@ def luminous_efficacy(
     efficacy = K_M * luminous_efficiency(spd, lef)
 
     return efficacy
+
+
+def mesopic_luminous_flux(
+        spd,
+        Lp,
+        source='Blue Heavy',
+        method='MOVE',
+        photopic_lef=PHOTOPIC_LEFS['CIE 1924 Photopic Standard Observer'],
+        scotopic_lef=SCOTOPIC_LEFS['CIE 1951 Scotopic Standard Observer'],
+        K_m=K_M):
+    """
+    Returns the *mesopic luminous flux* of given spectral power distribution
+    for given photopic luminance :math:`L_p` values, e.g. a luminance map.
+
+    The luminous flux is computed once for every photopic luminance level of
+    :attr:`colour.colorimetry.dataset.lefs.MESOPIC_X_DATA` attribute and
+    looked up for each photopic luminance :math:`L_p` value.
+
+    Parameters
+    ----------
+    spd : SpectralPowerDistribution or MultiSpectralPowerDistribution
+        Test spectral power distribution, a spectral radiance yields the
+        *mesopic luminance*.
+    Lp : numeric or array_like
+        Photopic luminance :math:`L_p`.
+    source : unicode, optional
+        **{'Blue Heavy', 'Red Heavy'}**,
+        Light source colour temperature.
+    method : unicode, optional
+        **{'MOVE', 'LRC'}**,
+        Method to calculate the weighting factor.
+    photopic_lef : SpectralPowerDistribution, optional
+        :math:`V(\lambda)` photopic luminous efficiency function.
+    scotopic_lef : SpectralPowerDistribution, optional
+        :math:`V^\prime(\lambda)` scotopic luminous efficiency function.
+    K_m : numeric, optional
+        :math:`lm\cdot W^{-1}` maximum photopic luminous efficiency
+
+    Returns
+    -------
+    numeric or ndarray
+        Mesopic luminous flux with shape *Lp.shape*, or *Lp.shape + (m, )* for
+        a multi-spectral power distribution with :math:`m` distributions.
+
+    Notes
+    -----
+    -   The output is equal to that of :func:`colour.luminous_flux` definition
+        with the luminous efficiency function returned by
+        :func:`colour.mesopic_luminous_efficiency_function` definition.
+
+    References
+    ----------
+    -   :cite:`Wikipediacc`
+    -   :cite:`Wikipediacq`
+
+    Examples
+    --------
+    >>> from colour import LIGHT_SOURCES_SPDS
+    >>> spd = LIGHT_SOURCES_SPDS['Neodimium Incandescent']
+    >>> mesopic_luminous_flux(spd, np.array([0.1, 1, 10]))
+    ... # doctest: +ELLIPSIS
+    array([ 21834.1242781...,  24362.8684827...,  23907.0673722...])
+    """
+
+    levels, wavelengths, V_m = _mesopic_luminous_efficiency_table(
+        source, method, photopic_lef, scotopic_lef, spd.shape)
+
+    values = spd.values
+    R = np.reshape(values, (values.shape[0], -1))
+
+    flux = K_m * np.trapz(
+        V_m[..., np.newaxis] * R[np.newaxis], wavelengths, axis=1)
+    if values.ndim == 1:
+        flux = flux[..., 0]
+
+    return flux[_mesopic_luminance_levels_indexes(levels, Lp)]
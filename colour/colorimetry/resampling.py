@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Spectral Resampling
+===================
+
+Defines the objects to resample spectral data between spectral shapes with
+precomputed sparse operators:
+
+-   :func:`colour.colorimetry.resampling_matrix`
+-   :func:`colour.colorimetry.resample_multi_spectral_array`
+
+The interpolation methods used to align spectral data, e.g.
+*Sprague (1880)*, linear, kernel or cubic spline interpolation, and the
+*Constant* and *Linear* extrapolation methods are linear in the spectral
+values, thus the alignment of any spectral data with a given source spectral
+shape to a target spectral shape is a *(target_bins, source_bins)* matrix
+product. The matrix is mostly sparse, e.g. *Sprague (1880)* interpolation
+only involves 6 source bins per target bin.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import scipy.sparse
+
+from colour.constants import DEFAULT_FLOAT_DTYPE, EPSILON
+from colour.colorimetry import (SpectralPowerDistribution,
+                                MultiSpectralPowerDistribution)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['resampling_matrix', 'resample_multi_spectral_array']
+
+_RESAMPLING_MATRICES_CACHE = {}
+"""
+Resampling matrices cache.
+
+_RESAMPLING_MATRICES_CACHE : dict
+"""
+
+
+def _shape_key(shape):
+    """
+    Returns a hashable key for given spectral shape.
+    """
+
+    return (float(shape.start), float(shape.end), float(shape.interval))
+
+
+def _arguments_key(arguments):
+    """
+    Returns a hashable key for given interpolator or extrapolator arguments.
+    """
+
+    if arguments is None:
+        return None
+
+    return repr(sorted(arguments.items()))
+
+
+def resampling_matrix(source_shape,
+                      target_shape,
+                      interpolator=None,
+                      interpolator_args=None,
+                      extrapolator=None,
+                      extrapolator_args=None):
+    """
+    Returns the sparse matrix resampling spectral data with given source
+    spectral shape to given target spectral shape, i.e. aligning it as
+    :meth:`colour.SpectralPowerDistribution.align` method does.
+
+    The matrices are cached by spectral shapes, interpolator and extrapolator.
+
+    Parameters
+    ----------
+    source_shape : SpectralShape
+        Spectral shape of the spectral data to resample.
+    target_shape : SpectralShape
+        Spectral shape to resample the spectral data to.
+    interpolator : object, optional
+        Interpolator class type to use as interpolating function, it must be
+        linear in the dependent variable, e.g.
+        :class:`colour.PchipInterpolator` class is not supported.
+    interpolator_args : dict_like, optional
+        Arguments to use when instantiating the interpolating function.
+    extrapolator : object, optional
+        Extrapolator class type to use as extrapolating function.
+    extrapolator_args : dict_like, optional
+        Arguments to use when instantiating the extrapolating function, the
+        *left* and *right* values, if any, must be zero.
+
+    Returns
+    -------
+    csr_matrix
+        Resampling matrix of shape *(target_bins, source_bins)*.
+
+    Raises
+    ------
+    ValueError
+        If the interpolator or the extrapolator are not linear.
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SpectralShape
+    >>> M = resampling_matrix(
+    ...     SpectralShape(400, 700, 10), SpectralShape(400, 700, 5))
+    >>> M.shape
+    (61, 31)
+    >>> M.nnz
+    211
+    """
+
+    key = (_shape_key(source_shape), _shape_key(target_shape), interpolator,
+           _arguments_key(interpolator_args), extrapolator,
+           _arguments_key(extrapolator_args))
+    matrix = _RESAMPLING_MATRICES_CACHE.get(key)
+    if matrix is not None:
+        return matrix
+
+    wavelengths = source_shape.range()
+    bins = len(wavelengths)
+
+    def align(spd):
+        """
+        Aligns given spectral power distribution to the target spectral
+        shape.
+        """
+
+        return spd.align(target_shape, interpolator, interpolator_args,
+                         extrapolator, extrapolator_args)
+
+    msa = np.identity(bins, dtype=DEFAULT_FLOAT_DTYPE)
+    matrix = align(MultiSpectralPowerDistribution(msa, wavelengths)).values
+
+    values = np.random.RandomState(4).uniform(0.5, 1.5, bins)
+    if not np.allclose(
+            np.dot(matrix, values),
+            align(SpectralPowerDistribution(values, wavelengths)).values,
+            rtol=1e-7,
+            atol=1e-10):
+        raise ValueError(
+            '"{0}" interpolator and "{1}" extrapolator with "{2}" and "{3}" '
+            'arguments are not linear!'.format(
+                interpolator, extrapolator, interpolator_args,
+                extrapolator_args))
+
+    # Weights below the rounding errors of the interpolators are discarded.
+    matrix[np.abs(matrix) < EPSILON * bins] = 0
+    matrix = scipy.sparse.csr_matrix(matrix)
+
+    _RESAMPLING_MATRICES_CACHE[key] = matrix
+
+    return matrix
+
+
+def resample_multi_spectral_array(msa,
+                                  source_shape,
+                                  target_shape,
+                                  interpolator=None,
+                                  interpolator_args=None,
+                                  extrapolator=None,
+                                  extrapolator_args=None):
+    """
+    Resamples given multi-spectral array with given source spectral shape to
+    given target spectral shape with a single sparse matrix product.
+
+    Parameters
+    ----------
+    msa : array_like
+        Multi-spectral array :math:`msa` of shape *(..., source_bins)*, e.g. a
+        spectral library or a multi-spectral image.
+    source_shape : SpectralShape
+        Spectral shape of the multi-spectral array.
+    target_shape : SpectralShape
+        Spectral shape to resample the multi-spectral array to.
+    interpolator : object, optional
+        Interpolator class type to use as interpolating function, see
+        :func:`colour.colorimetry.resampling_matrix` definition.
+    interpolator_args : dict_like, optional
+        Arguments to use when instantiating the interpolating function.
+    extrapolator : object, optional
+        Extrapolator class type to use as extrapolating function.
+    extrapolator_args : dict_like, optional
+        Arguments to use when instantiating the extrapolating function.
+
+    Returns
+    -------
+    ndarray
+        Resampled multi-spectral array of shape *(..., target_bins)*.
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SpectralShape
+    >>> msa = np.array([[0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651,
+    ...                  0.0705, 0.0772, 0.0870, 0.1128, 0.1360]])
+    >>> resample_multi_spectral_array(
+    ...     msa, SpectralShape(400, 500, 10), SpectralShape(400, 430, 5))
+    ... # doctest: +ELLIPSIS +NORMALIZE_WHITESPACE
+    array([[ 0.0641    ,  0.0653158...,  0.0645    ,  0.0605431...,
+             0.0562    ,  0.0541507...,  0.0537    ]])
+    """
+
+    msa = np.asarray(msa, dtype=DEFAULT_FLOAT_DTYPE)
+
+    matrix = resampling_matrix(source_shape, target_shape, interpolator,
+                               interpolator_args, extrapolator,
+                               extrapolator_args)
+
+    shape = msa.shape
+    msa = np.reshape(msa, (-1, shape[-1]))
+
+    return np.reshape(
+        matrix.dot(np.transpose(msa)).T, shape[:-1] + (matrix.shape[0], ))
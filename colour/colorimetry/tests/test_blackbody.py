@@ -9,7 +9,10 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.colorimetry import (SpectralShape, planck_law, blackbody_spd)
+from colour.colorimetry import (
+    ASTME30815_PRACTISE_SHAPE, STANDARD_OBSERVERS_CMFS, SpectralShape,
+    planck_law, blackbody_spd, blackbody_msa, blackbody_multi_spd,
+    blackbody_XYZ, spectral_to_XYZ)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -21,7 +24,8 @@ __status__ = 'Production'
 
 __all__ = [
     'PLANCK_LAW_DATA', 'BLACKBODY_SPD_DATA', 'TestPlanckLaw',
-    'TestBlackbodySpd'
+    'TestBlackbodySpd', 'TestBlackbodyMsa', 'TestBlackbodyMultiSpd',
+    'TestBlackbodyXYZ'
 ]
 
 PLANCK_LAW_DATA = {
@@ -4547,6 +4551,13 @@ class TestPlanckLaw(unittest.TestCase):
         p = np.reshape(p, (2, 3, 1))
         np.testing.assert_almost_equal(planck_law(wl, 5500), p)
 
+        wl = np.array([400, 500, 600]) * 1e-9
+        T = np.array([4000, 5500, 6500])
+        p = planck_law(wl, T[..., np.newaxis])
+        self.assertTupleEqual(p.shape, (3, 3))
+        for i, temperature in enumerate(T):
+            np.testing.assert_almost_equal(p[i], planck_law(wl, temperature))
+
     @ignore_numpy_errors
     def test_nan_planck_law(self):
         """
@@ -4581,5 +4592,111 @@ class TestBlackbodySpd(unittest.TestCase):
             atol=0.0000001)
 
 
+class TestBlackbodyMsa(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.blackbody.blackbody_msa` definition unit
+    tests methods.
+    """
+
+    def test_blackbody_msa(self):
+        """
+        Tests :func:`colour.colorimetry.blackbody.blackbody_msa` definition.
+        """
+
+        msa = blackbody_msa(
+            np.array([5000, 6500]), SpectralShape(360, 830, 1))
+        self.assertTupleEqual(msa.shape, (2, 471))
+        np.testing.assert_allclose(
+            msa[0], BLACKBODY_SPD_DATA, rtol=0.0000001, atol=0.0000001)
+        np.testing.assert_allclose(
+            msa[1],
+            blackbody_spd(6500, SpectralShape(360, 830, 1)).values,
+            rtol=0.0000001,
+            atol=0.0000001)
+
+    def test_n_dimensional_blackbody_msa(self):
+        """
+        Tests :func:`colour.colorimetry.blackbody.blackbody_msa` definition
+        n-dimensional arrays support.
+        """
+
+        shape = SpectralShape(400, 700, 10)
+        msa = blackbody_msa(5000, shape)
+        self.assertTupleEqual(msa.shape, (31, ))
+
+        T = np.reshape(np.linspace(1000, 10000, 6), (2, 3))
+        msa = blackbody_msa(T, shape)
+        self.assertTupleEqual(msa.shape, (2, 3, 31))
+        np.testing.assert_almost_equal(msa[1, 2], blackbody_msa(10000, shape))
+
+
+class TestBlackbodyMultiSpd(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.blackbody.blackbody_multi_spd`
+    definition unit tests methods.
+    """
+
+    def test_blackbody_multi_spd(self):
+        """
+        Tests :func:`colour.colorimetry.blackbody.blackbody_multi_spd`
+        definition.
+        """
+
+        multi_spd = blackbody_multi_spd([5000, 6500],
+                                        SpectralShape(360, 830, 1))
+        self.assertListEqual(multi_spd.labels,
+                             ['5000K Blackbody', '6500K Blackbody'])
+        np.testing.assert_allclose(
+            multi_spd.values[..., 0],
+            BLACKBODY_SPD_DATA,
+            rtol=0.0000001,
+            atol=0.0000001)
+
+
+class TestBlackbodyXYZ(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.blackbody.blackbody_XYZ` definition unit
+    tests methods.
+    """
+
+    def test_blackbody_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.blackbody.blackbody_XYZ` definition.
+        """
+
+        for name in ('CIE 1931 2 Degree Standard Observer',
+                     'CIE 1964 10 Degree Standard Observer'):
+            cmfs = STANDARD_OBSERVERS_CMFS[name].copy().trim(
+                ASTME30815_PRACTISE_SHAPE)
+            for temperature in (1000, 5000, 6500, 25000):
+                np.testing.assert_allclose(
+                    blackbody_XYZ(temperature, cmfs),
+                    spectral_to_XYZ(
+                        blackbody_spd(temperature, cmfs.shape), cmfs),
+                    rtol=0.0000001)
+
+    def test_n_dimensional_blackbody_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.blackbody.blackbody_XYZ` definition
+        n-dimensional arrays support.
+        """
+
+        XYZ = blackbody_XYZ(5000)
+
+        T = np.tile(5000, 6)
+        XYZ = np.tile(XYZ, (6, 1))
+        np.testing.assert_allclose(blackbody_XYZ(T), XYZ, rtol=0.0000001)
+
+        T = np.reshape(T, (2, 3))
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        np.testing.assert_allclose(blackbody_XYZ(T), XYZ, rtol=0.0000001)
+
+        T = np.linspace(1000, 25000, 100000)
+        np.testing.assert_allclose(
+            blackbody_XYZ(T)[::9999],
+            blackbody_XYZ(T[::9999]),
+            rtol=0.0000001)
+
+
 if __name__ == '__main__':
     unittest.main()
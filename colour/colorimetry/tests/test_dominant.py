@@ -6,13 +6,17 @@ Defines unit tests for :mod:`colour.colorimetry.dominant` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import scipy.spatial.distance
 import unittest
 from itertools import permutations
 
+from colour.algebra import extend_line_segment, intersect_line_segments
 from colour.colorimetry import (CMFS, ILLUMINANTS, dominant_wavelength,
                                 complementary_wavelength, excitation_purity,
                                 colorimetric_purity)
-from colour.colorimetry.dominant import (closest_spectral_locus_wavelength)
+from colour.colorimetry.dominant import (
+    _SPECTRAL_LOCUS_ANGULAR_INDEXES_CACHE, _SPECTRAL_LOCUS_CACHE_SIZE,
+    closest_spectral_locus_wavelength)
 from colour.models import XYZ_to_xy
 from colour.utilities import ignore_numpy_errors
 
@@ -24,7 +28,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'CIE_2_1931_CMFS', 'D65', 'TestClosestSpectralLocusWavelength',
+    'CIE_2_1931_CMFS', 'D65', 'dominant_wavelength_brute_force',
+    'TestClosestSpectralLocusWavelength',
     'TestDominantWavelength', 'TestComplementaryWavelength',
     'TestExcitationPurity', 'TestColorimetricPurity'
 ]
@@ -33,6 +38,53 @@ CIE_2_1931_CMFS = CMFS['CIE 1931 2 Degree Standard Observer']
 D65 = ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
 
 
+def dominant_wavelength_brute_force(xy, xy_n, cmfs, reverse=False):
+    """
+    Computes the *dominant wavelength* of given colour stimulus by intersecting
+    it with all the spectral locus segments and computing the distances to all
+    the spectral locus points, one colour stimulus at a time.
+    """
+
+    xy_s = XYZ_to_xy(cmfs.values)
+    xy_s_c = np.vstack((xy_s, xy_s[0, :]))
+
+    def closest(xy, xy_n, reverse):
+        """
+        Returns the closest spectral locus wavelength index and intersection
+        point.
+        """
+
+        xy_e = (extend_line_segment(xy, xy_n)
+                if reverse else extend_line_segment(xy_n, xy))
+        xy_wl = intersect_line_segments(
+            np.concatenate((xy_n, xy_e), -1),
+            np.hstack((xy_s_c, np.roll(xy_s_c, 1, axis=0)))).xy
+        xy_wl = xy_wl[~np.isnan(xy_wl).any(axis=-1)][0]
+
+        return np.argmin(
+            scipy.spatial.distance.cdist([xy_wl], xy_s_c), axis=-1)[0], xy_wl
+
+    wl, xy_wl, xy_cwl = [], [], []
+    xy, xy_n = np.reshape(xy, (-1, 2)), np.reshape(xy_n, (-1, 2))
+    for xy_i, xy_n_i in zip(xy, xy_n):
+        i_wl, xy_wl_i = closest(xy_i, xy_n_i, reverse)
+        wl_i, xy_cwl_i = cmfs.wavelengths[i_wl], xy_wl_i
+
+        xy_e = (extend_line_segment(xy_i, xy_n_i)
+                if reverse else extend_line_segment(xy_n_i, xy_i))
+        if intersect_line_segments(
+                np.concatenate((xy_n_i, xy_e), -1),
+                np.hstack((xy_s[0], xy_s[-1]))).intersect:
+            i_wl_r, xy_cwl_i = closest(xy_i, xy_n_i, not reverse)
+            wl_i = -cmfs.wavelengths[i_wl_r]
+
+        wl.append(wl_i)
+        xy_wl.append(xy_wl_i)
+        xy_cwl.append(xy_cwl_i)
+
+    return np.array(wl), np.array(xy_wl), np.array(xy_cwl)
+
+
 class TestClosestSpectralLocusWavelength(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.dominant.\
@@ -178,6 +230,47 @@ class TestDominantWavelength(unittest.TestCase):
         np.testing.assert_almost_equal(xy_wl, xy_wl_r)
         np.testing.assert_almost_equal(xy_cwl, xy_cwl_r)
 
+    def test_dominant_wavelength_brute_force(self):
+        """
+        Tests :func:`colour.colorimetry.dominant.dominant_wavelength`
+        definition against the spectral locus brute force intersection, for
+        a single, a few and per colour stimulus achromatic stimuli.
+        """
+
+        random_state = np.random.RandomState(4)
+
+        xy_s = XYZ_to_xy(CIE_2_1931_CMFS.values)
+        # Spectral locus segments points, excluding its degenerate ends, and
+        # line of purples points.
+        xy_p = np.vstack([
+            xy_s[40:320:7] + 0.3 * (xy_s[41:321:7] - xy_s[40:320:7]),
+            xy_s[0] + np.linspace(0.05, 0.95, 12)[:, np.newaxis] *
+            (xy_s[-1] - xy_s[0])
+        ])
+        xy_p = np.tile(xy_p, (2, 1))
+
+        for xy_n in (D65,
+                     D65 + random_state.uniform(-0.02, 0.02, (4, 2))[
+                         random_state.randint(0, 4, len(xy_p))],
+                     D65 + random_state.uniform(-0.02, 0.02, xy_p.shape)):
+            xy = xy_n + (random_state.uniform(0.1, 0.9, len(xy_p))[
+                :, np.newaxis] * (xy_p - xy_n))
+            xy_n = np.resize(xy_n, xy.shape)
+            for reverse in (False, True):
+                wl, xy_wl, xy_cwl = dominant_wavelength(
+                    xy, xy_n, CIE_2_1931_CMFS, reverse)
+                wl_r, xy_wl_r, xy_cwl_r = dominant_wavelength_brute_force(
+                    xy, xy_n, CIE_2_1931_CMFS, reverse)
+
+                self.assertTrue(np.any(wl < 0))
+                np.testing.assert_equal(wl, wl_r)
+                np.testing.assert_almost_equal(xy_wl, xy_wl_r, decimal=10)
+                np.testing.assert_almost_equal(xy_cwl, xy_cwl_r, decimal=10)
+
+        self.assertLessEqual(
+            len(_SPECTRAL_LOCUS_ANGULAR_INDEXES_CACHE),
+            _SPECTRAL_LOCUS_CACHE_SIZE)
+
     @ignore_numpy_errors
     def test_nan_dominant_wavelength(self):
         """
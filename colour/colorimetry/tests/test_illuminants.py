@@ -8,9 +8,11 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.colorimetry import (D_illuminant_relative_spd,
-                                CIE_standard_illuminant_A_function,
-                                ILLUMINANTS_SPDS)
+from colour.colorimetry import (
+    ASTME30815_PRACTISE_SHAPE, D_illuminant_relative_spd,
+    D_illuminant_relative_msa, D_illuminant_relative_multi_spd,
+    D_illuminant_relative_XYZ, CIE_standard_illuminant_A_function,
+    ILLUMINANTS_SPDS, STANDARD_OBSERVERS_CMFS, SpectralShape, spectral_to_XYZ)
 from colour.temperature import CCT_to_xy_CIE_D
 
 __author__ = 'Colour Developers'
@@ -21,7 +23,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'A_DATA', 'TestD_illuminantRelativeSpd',
+    'A_DATA', 'TestD_illuminantRelativeSpd', 'TestD_illuminantRelativeMsa',
+    'TestD_illuminantRelativeMultiSpd', 'TestD_illuminantRelativeXYZ',
     'TestCIEStandardIlluminantAFunction'
 ]
 
@@ -153,6 +156,118 @@ class TestD_illuminantRelativeSpd(unittest.TestCase):
                 atol=tolerance)
 
 
+class TestD_illuminantRelativeMsa(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.illuminants.D_illuminant_relative_msa`
+    definition unit tests methods.
+    """
+
+    def test_D_illuminant_relative_msa(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.D_illuminant_relative_msa`
+        definition.
+        """
+
+        xy = CCT_to_xy_CIE_D(np.linspace(4000, 25000, 6))
+
+        msa = D_illuminant_relative_msa(xy)
+        for i in range(xy.shape[0]):
+            np.testing.assert_almost_equal(
+                msa[i], D_illuminant_relative_spd(xy[i]).values, decimal=7)
+
+        shape = SpectralShape(360, 830, 1)
+        msa = D_illuminant_relative_msa(xy, shape, False)
+        for i in range(xy.shape[0]):
+            np.testing.assert_almost_equal(
+                msa[i],
+                D_illuminant_relative_spd(xy[i], False).align(shape).values,
+                decimal=7)
+
+    def test_n_dimensional_D_illuminant_relative_msa(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.D_illuminant_relative_msa`
+        definition n-dimensional arrays support.
+        """
+
+        xy = CCT_to_xy_CIE_D(6504)
+        msa = D_illuminant_relative_msa(xy)
+
+        xy = np.tile(xy, (6, 1))
+        msa = np.tile(msa, (6, 1))
+        np.testing.assert_almost_equal(D_illuminant_relative_msa(xy), msa)
+
+        xy = np.reshape(xy, (2, 3, 2))
+        msa = np.reshape(msa, (2, 3, -1))
+        np.testing.assert_almost_equal(D_illuminant_relative_msa(xy), msa)
+
+
+class TestD_illuminantRelativeMultiSpd(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.illuminants.\
+D_illuminant_relative_multi_spd` definition unit tests methods.
+    """
+
+    def test_D_illuminant_relative_multi_spd(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.\
+D_illuminant_relative_multi_spd` definition.
+        """
+
+        xy = CCT_to_xy_CIE_D(np.array([5000, 6500, 7500]) * 1.4388 / 1.4380)
+        multi_spd = D_illuminant_relative_multi_spd(xy)
+
+        self.assertListEqual(multi_spd.labels, ['0', '1', '2'])
+        for i in range(xy.shape[0]):
+            np.testing.assert_almost_equal(
+                multi_spd.values[..., i],
+                D_illuminant_relative_spd(xy[i]).values,
+                decimal=7)
+
+
+class TestD_illuminantRelativeXYZ(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.illuminants.D_illuminant_relative_XYZ`
+    definition unit tests methods.
+    """
+
+    def test_D_illuminant_relative_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.D_illuminant_relative_XYZ`
+        definition.
+        """
+
+        xy = CCT_to_xy_CIE_D(np.linspace(4000, 25000, 6))
+        for name in ('CIE 1931 2 Degree Standard Observer',
+                     'CIE 1964 10 Degree Standard Observer'):
+            cmfs = STANDARD_OBSERVERS_CMFS[name].copy().trim(
+                ASTME30815_PRACTISE_SHAPE)
+            XYZ = D_illuminant_relative_XYZ(xy, cmfs)
+            for i in range(xy.shape[0]):
+                np.testing.assert_allclose(
+                    XYZ[i],
+                    spectral_to_XYZ(
+                        D_illuminant_relative_spd(xy[i]).align(cmfs.shape),
+                        cmfs),
+                    rtol=0.0000001)
+
+    def test_n_dimensional_D_illuminant_relative_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.D_illuminant_relative_XYZ`
+        definition n-dimensional arrays support.
+        """
+
+        xy = CCT_to_xy_CIE_D(6504)
+        XYZ = D_illuminant_relative_XYZ(xy)
+
+        xy = np.tile(xy, (6, 1))
+        XYZ = np.tile(XYZ, (6, 1))
+        np.testing.assert_almost_equal(D_illuminant_relative_XYZ(xy), XYZ)
+
+        xy = np.reshape(xy, (2, 3, 2))
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        np.testing.assert_almost_equal(D_illuminant_relative_XYZ(xy), XYZ)
+
+
 class TestCIEStandardIlluminantAFunction(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.illuminants.\
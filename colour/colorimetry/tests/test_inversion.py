@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.colorimetry.inversion` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.colorimetry import (
+    lightness_CIE1976, lightness_Fairchild2010, lightness_Fairchild2011,
+    luminance_ASTMD153508, luminance_CIE1976, luminance_Fairchild2010,
+    luminance_Fairchild2011, luminance_Newhall1943, monotone_inverse,
+    monotone_inverse_table)
+from colour.utilities import ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestMonotoneInverseTable', 'TestMonotoneInverse']
+
+
+def _decreasing_function(x):
+    """
+    Strictly decreasing unit test function.
+    """
+
+    return 1 / (1 + x)
+
+
+class TestMonotoneInverseTable(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.inversion.monotone_inverse_table`
+    definition unit tests methods.
+    """
+
+    def test_monotone_inverse_table(self):
+        """
+        Tests :func:`colour.colorimetry.inversion.monotone_inverse_table`
+        definition.
+        """
+
+        table = monotone_inverse_table(luminance_ASTMD153508, (0, 10))
+        np.testing.assert_almost_equal(
+            table[:, 0], np.linspace(0, 100, table.shape[0]), decimal=12)
+        np.testing.assert_almost_equal(
+            luminance_ASTMD153508(table[:, 1]), table[:, 0], decimal=10)
+        self.assertTrue(np.all(np.diff(table[:, 1]) > 0))
+
+        self.assertIs(
+            monotone_inverse_table(luminance_ASTMD153508, (0, 10)), table)
+        self.assertFalse(table.flags.writeable)
+
+        self.assertLess(
+            monotone_inverse_table(luminance_ASTMD153508, (0, 10),
+                                   1e-6).shape[0], table.shape[0])
+
+        # Piecewise function, the inverse is split into segments around the
+        # breakpoint.
+        table = monotone_inverse_table(lightness_CIE1976, (0, 100))
+        np.testing.assert_almost_equal(table[[0, -1], 0], (0, 100))
+        np.testing.assert_almost_equal(
+            lightness_CIE1976(table[:, 1]), table[:, 0], decimal=10)
+        self.assertTrue(np.all(np.diff(table[:, 0]) > 0))
+        self.assertTrue(np.all(np.diff(table[:, 1]) > 0))
+
+        table = monotone_inverse_table(_decreasing_function, (0, 10))
+        np.testing.assert_almost_equal(table[[0, -1], 0], (1, 1 / 11))
+        np.testing.assert_almost_equal(table[[0, -1], 1], (0, 10))
+
+    def test_raise_exception_monotone_inverse_table(self):
+        """
+        Tests :func:`colour.colorimetry.inversion.monotone_inverse_table`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, monotone_inverse_table, np.sin, (0, 4))
+
+        # The inverse slope is too large for the function values precision.
+        self.assertRaises(ValueError, monotone_inverse_table,
+                          lightness_Fairchild2010, (0, 100))
+
+
+class TestMonotoneInverse(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.inversion.monotone_inverse` definition
+    unit tests methods.
+    """
+
+    def test_monotone_inverse(self):
+        """
+        Tests :func:`colour.colorimetry.inversion.monotone_inverse`
+        definition.
+        """
+
+        V = np.linspace(0, 10, 1001)
+        for function in (luminance_ASTMD153508, luminance_Newhall1943):
+            np.testing.assert_allclose(
+                monotone_inverse(function(V), function, (0, 10)),
+                V,
+                atol=1e-10)
+
+        Y = np.linspace(0, 100, 100001)
+        np.testing.assert_allclose(
+            monotone_inverse(lightness_CIE1976(Y), lightness_CIE1976,
+                             (0, 100)),
+            Y,
+            atol=1e-10)
+
+        L = np.linspace(0, 100, 100001)
+        np.testing.assert_allclose(
+            monotone_inverse(luminance_CIE1976(L), luminance_CIE1976,
+                             (0, 100)),
+            L,
+            atol=1e-10)
+
+        L_hdr = np.linspace(0.02, 95, 1001)
+        np.testing.assert_allclose(
+            monotone_inverse(L_hdr, lightness_Fairchild2010, (0, 1)),
+            luminance_Fairchild2010(L_hdr),
+            atol=1e-10)
+
+        L_hdr = np.linspace(0.02, 230, 1001)
+        np.testing.assert_allclose(
+            monotone_inverse(L_hdr, lightness_Fairchild2011, (0, 1000)),
+            luminance_Fairchild2011(L_hdr),
+            atol=1e-10)
+
+        np.testing.assert_allclose(
+            monotone_inverse(
+                L_hdr, lightness_Fairchild2011, (0, 1000), method='hdr-IPT'),
+            luminance_Fairchild2011(L_hdr, method='hdr-IPT'),
+            atol=1e-10)
+
+        x = np.linspace(0, 10, 1001)
+        np.testing.assert_allclose(
+            monotone_inverse(_decreasing_function(x), _decreasing_function,
+                             (0, 10)),
+            x,
+            atol=1e-10)
+
+        self.assertAlmostEqual(
+            monotone_inverse(10.08, luminance_ASTMD153508, (0, 10)),
+            3.734476524328426,
+            places=10)
+
+        self.assertAlmostEqual(
+            monotone_inverse(110, luminance_ASTMD153508, (0, 10)),
+            10.3879834,
+            places=7)
+
+    def test_n_dimensional_monotone_inverse(self):
+        """
+        Tests :func:`colour.colorimetry.inversion.monotone_inverse`
+        definition n-dimensional arrays support.
+        """
+
+        Y = 10.08
+        V = monotone_inverse(Y, luminance_ASTMD153508, (0, 10))
+
+        V = np.tile(V, 6)
+        Y = np.tile(Y, 6)
+        np.testing.assert_almost_equal(
+            monotone_inverse(Y, luminance_ASTMD153508, (0, 10)),
+            V,
+            decimal=15)
+
+        V = np.reshape(V, (2, 3))
+        Y = np.reshape(Y, (2, 3))
+        np.testing.assert_almost_equal(
+            monotone_inverse(Y, luminance_ASTMD153508, (0, 10)),
+            V,
+            decimal=15)
+
+        V = np.reshape(V, (2, 3, 1))
+        Y = np.reshape(Y, (2, 3, 1))
+        np.testing.assert_almost_equal(
+            monotone_inverse(Y, luminance_ASTMD153508, (0, 10)),
+            V,
+            decimal=15)
+
+    @ignore_numpy_errors
+    def test_nan_monotone_inverse(self):
+        """
+        Tests :func:`colour.colorimetry.inversion.monotone_inverse`
+        definition nan support.
+        """
+
+        V = monotone_inverse(
+            np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]),
+            luminance_ASTMD153508, (0, 10))
+
+        np.testing.assert_equal(V[[3, 4, 5]], [-np.inf, np.inf, np.nan])
+
+
+if __name__ == '__main__':
+    unittest.main()
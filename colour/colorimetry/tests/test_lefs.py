@@ -8,8 +8,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.colorimetry import (mesopic_weighting_function,
-                                mesopic_luminous_efficiency_function)
+from colour.colorimetry import (SpectralShape, mesopic_weighting_function,
+                                mesopic_luminous_efficiency_function,
+                                mesopic_luminous_efficiency_msa)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -21,7 +22,8 @@ __status__ = 'Production'
 
 __all__ = [
     'MESOPIC_LEF_SPD_DATA', 'TestMesopicWeightingFunction',
-    'TestMesopicLuminousEfficiencyFunction'
+    'TestMesopicLuminousEfficiencyFunction',
+    'TestMesopicLuminousEfficiencyMsa'
 ]
 
 MESOPIC_LEF_SPD_DATA = (
@@ -206,5 +208,65 @@ mesopic_luminous_efficiency_function` definition.
             decimal=7)
 
 
+class TestMesopicLuminousEfficiencyMsa(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.lefs.mesopic_luminous_efficiency_msa`
+    definition unit tests methods.
+    """
+
+    def test_mesopic_luminous_efficiency_msa(self):
+        """
+        Tests :func:`colour.colorimetry.lefs.mesopic_luminous_efficiency_msa`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            mesopic_luminous_efficiency_msa(0.2),
+            MESOPIC_LEF_SPD_DATA,
+            decimal=7)
+
+        Lp = np.array([0.001, 0.05, 0.055, 0.2, 0.55, 5.5, 7.5, 100])
+        for source in ('Blue Heavy', 'Red Heavy'):
+            for method in ('MOVE', 'LRC'):
+                msa = mesopic_luminous_efficiency_msa(Lp, None, source,
+                                                      method)
+                for i, Lp_i in enumerate(Lp):
+                    np.testing.assert_equal(
+                        msa[i],
+                        mesopic_luminous_efficiency_function(
+                            Lp_i, source, method).values)
+
+        shape = SpectralShape(360, 830, 5)
+        np.testing.assert_almost_equal(
+            mesopic_luminous_efficiency_msa(0.2, shape),
+            mesopic_luminous_efficiency_function(0.2).align(
+                shape,
+                extrapolator_args={
+                    'method': 'Constant',
+                    'left': 0,
+                    'right': 0
+                }).values,
+            decimal=7)
+
+    def test_n_dimensional_mesopic_luminous_efficiency_msa(self):
+        """
+        Tests :func:`colour.colorimetry.lefs.mesopic_luminous_efficiency_msa`
+        definition n-dimensional arrays support.
+        """
+
+        Lp = 0.2
+        msa = mesopic_luminous_efficiency_msa(Lp)
+
+        Lp = np.tile(Lp, 6)
+        msa = np.tile(msa, (6, 1))
+        np.testing.assert_almost_equal(
+            mesopic_luminous_efficiency_msa(Lp), msa, decimal=7)
+
+        Lp = np.reshape(Lp, (2, 3))
+        msa = np.reshape(msa, (2, 3, -1))
+        np.testing.assert_almost_equal(
+            mesopic_luminous_efficiency_msa(Lp), msa, decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,11 +5,13 @@ Defines unit tests for :mod:`colour.colorimetry.photometry` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
 from colour.colorimetry import (
-    ILLUMINANTS_SPDS, LIGHT_SOURCES_SPDS, luminous_flux,
-    luminous_efficiency, luminous_efficacy, zeros_spd)
+    ILLUMINANTS_SPDS, LIGHT_SOURCES_SPDS, MultiSpectralPowerDistribution,
+    luminous_flux, luminous_efficiency, luminous_efficacy,
+    mesopic_luminous_efficiency_function, mesopic_luminous_flux, zeros_spd)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -19,7 +21,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'TestLuminousFlux', 'TestLuminousEfficiency', 'TestLuminousEfficacy'
+    'TestLuminousFlux', 'TestLuminousEfficiency', 'TestLuminousEfficacy',
+    'TestMesopicLuminousFlux'
 ]
 
 
@@ -118,5 +121,57 @@ class TestLuminousEfficacy(unittest.TestCase):
         self.assertAlmostEqual(luminous_efficacy(spd), 683.00000000, places=7)
 
 
+class TestMesopicLuminousFlux(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.photometry.mesopic_luminous_flux`
+    definition unit tests methods.
+    """
+
+    def test_mesopic_luminous_flux(self):
+        """
+        Tests :func:`colour.colorimetry.photometry.mesopic_luminous_flux`
+        definition.
+        """
+
+        Lp = np.array([0.001, 0.05, 0.2, 0.55, 5.5, 7.5, 100])
+        for spd in (ILLUMINANTS_SPDS['F2'].copy().normalise(),
+                    LIGHT_SOURCES_SPDS['Neodimium Incandescent']):
+            flux = mesopic_luminous_flux(spd, Lp)
+            for i, Lp_i in enumerate(Lp):
+                self.assertAlmostEqual(
+                    flux[i],
+                    luminous_flux(spd,
+                                  mesopic_luminous_efficiency_function(Lp_i)),
+                    places=7)
+
+    def test_n_dimensional_mesopic_luminous_flux(self):
+        """
+        Tests :func:`colour.colorimetry.photometry.mesopic_luminous_flux`
+        definition n-dimensional arrays support.
+        """
+
+        spd = LIGHT_SOURCES_SPDS['Neodimium Incandescent']
+
+        Lp = 0.2
+        flux = mesopic_luminous_flux(spd, Lp)
+
+        Lp = np.tile(Lp, 6)
+        flux = np.tile(flux, 6)
+        np.testing.assert_almost_equal(
+            mesopic_luminous_flux(spd, Lp), flux, decimal=7)
+
+        Lp = np.reshape(Lp, (2, 3))
+        flux = np.reshape(flux, (2, 3))
+        np.testing.assert_almost_equal(
+            mesopic_luminous_flux(spd, Lp), flux, decimal=7)
+
+        multi_spd = MultiSpectralPowerDistribution(
+            np.transpose([spd.values, spd.values * 2]), spd.wavelengths)
+        np.testing.assert_almost_equal(
+            mesopic_luminous_flux(multi_spd, Lp),
+            np.stack([flux, flux * 2], axis=-1),
+            decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
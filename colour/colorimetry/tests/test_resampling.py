@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.colorimetry.resampling` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.algebra import (CubicSplineInterpolator, Extrapolator,
+                            LinearInterpolator, PchipInterpolator)
+from colour.colorimetry import (SpectralPowerDistribution, SpectralShape,
+                                resample_multi_spectral_array,
+                                resampling_matrix)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestResamplingMatrix', 'TestResampleMultiSpectralArray']
+
+
+class TestResamplingMatrix(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.resampling.resampling_matrix`
+    definition unit tests methods.
+    """
+
+    def test_resampling_matrix(self):
+        """
+        Tests :func:`colour.colorimetry.resampling.resampling_matrix`
+        definition.
+        """
+
+        source_shape = SpectralShape(400, 700, 10)
+        values = np.random.RandomState(4).uniform(0, 1, len(source_shape))
+        spd = SpectralPowerDistribution(values, source_shape.range())
+
+        for target_shape, interpolator, extrapolator_args in (
+            (SpectralShape(400, 700, 1), None, None),
+            (SpectralShape(360, 780, 5), None, None),
+            (SpectralShape(380, 730, 2), LinearInterpolator, None),
+            (SpectralShape(400, 700, 3), CubicSplineInterpolator, None),
+            (SpectralShape(380, 720, 5), None, {
+                'method': 'Linear',
+                'left': None,
+                'right': None
+            }),
+            (SpectralShape(380, 720, 5), None, {
+                'method': 'Constant',
+                'left': 0,
+                'right': 0
+            }),
+        ):
+            M = resampling_matrix(
+                source_shape,
+                target_shape,
+                interpolator,
+                extrapolator=Extrapolator,
+                extrapolator_args=extrapolator_args)
+
+            aligned = spd.copy().align(
+                target_shape,
+                interpolator,
+                extrapolator=Extrapolator,
+                extrapolator_args=extrapolator_args)
+
+            self.assertTupleEqual(M.shape, (len(aligned), len(source_shape)))
+            np.testing.assert_almost_equal(
+                M.dot(values), aligned.values, decimal=10)
+
+        M = resampling_matrix(source_shape, SpectralShape(400, 700, 5))
+        self.assertTrue(np.all(np.diff(M.indptr) <= 6))
+        self.assertIs(
+            resampling_matrix(source_shape, SpectralShape(400, 700, 5)), M)
+
+    def test_raise_exception_resampling_matrix(self):
+        """
+        Tests :func:`colour.colorimetry.resampling.resampling_matrix`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, resampling_matrix,
+                          SpectralShape(400, 700, 10),
+                          SpectralShape(400, 700, 1), PchipInterpolator)
+
+        self.assertRaises(
+            ValueError,
+            resampling_matrix,
+            SpectralShape(400, 700, 10),
+            SpectralShape(360, 780, 1),
+            extrapolator_args={
+                'method': 'Constant',
+                'left': 1,
+                'right': 1
+            })
+
+
+class TestResampleMultiSpectralArray(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.resampling.\
+resample_multi_spectral_array` definition unit tests methods.
+    """
+
+    def test_resample_multi_spectral_array(self):
+        """
+        Tests :func:`colour.colorimetry.resampling.\
+resample_multi_spectral_array` definition.
+        """
+
+        source_shape = SpectralShape(380, 780, 10)
+        target_shape = SpectralShape(360, 830, 1)
+        msa = np.random.RandomState(4).uniform(0, 1,
+                                               (4, len(source_shape)))
+
+        resampled = resample_multi_spectral_array(msa, source_shape,
+                                                  target_shape)
+
+        self.assertTupleEqual(resampled.shape, (4, len(target_shape)))
+        for i in range(4):
+            np.testing.assert_almost_equal(
+                resampled[i],
+                SpectralPowerDistribution(msa[i], source_shape.range())
+                .align(target_shape).values,
+                decimal=10)
+
+    def test_n_dimensional_resample_multi_spectral_array(self):
+        """
+        Tests :func:`colour.colorimetry.resampling.\
+resample_multi_spectral_array` definition n-dimensional arrays support.
+        """
+
+        source_shape = SpectralShape(400, 700, 10)
+        target_shape = SpectralShape(400, 700, 5)
+        values = np.random.RandomState(4).uniform(0, 1, len(source_shape))
+
+        resampled = resample_multi_spectral_array(values, source_shape,
+                                                  target_shape)
+        self.assertTupleEqual(resampled.shape, (61, ))
+
+        msa = np.tile(values, (2, 3, 1))
+        np.testing.assert_almost_equal(
+            resample_multi_spectral_array(msa, source_shape, target_shape),
+            np.tile(resampled, (2, 3, 1)),
+            decimal=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
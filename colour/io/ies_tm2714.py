@@ -15,15 +15,18 @@ References
 
 from __future__ import division, unicode_literals
 
+import glob
+import multiprocessing.pool
+import numpy as np
 import os
-import re
 from collections import namedtuple
 from xml.etree import ElementTree
-from xml.dom import minidom
+from xml.sax.saxutils import escape
 
-from colour.colorimetry import SpectralPowerDistribution
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import Structure, is_numeric, is_string, tstack
+from colour.utilities import Structure, is_numeric, is_string
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -34,7 +37,9 @@ __status__ = 'Production'
 
 __all__ = [
     'IES_TM2714_VERSION', 'IES_TM2714_NAMESPACE',
-    'IES_TM2714_ElementSpecification', 'IES_TM2714_Header', 'IES_TM2714_Spd'
+    'IES_TM2714_ElementSpecification', 'IES_TM2714_Header', 'IES_TM2714_Spd',
+    'read_multi_spd_from_IES_TM2714_directory',
+    'write_multi_spd_to_IES_TM2714_directory'
 ]
 
 IES_TM2714_VERSION = '1.0'
@@ -950,36 +955,18 @@ class IES_TM2714_Spd(SpectralPowerDistribution):
         0.0339999...
         """
 
-        formatter = './{{{0}}}{1}/{{{0}}}{2}'
-
-        tree = ElementTree.parse(self._path)
-        root = tree.getroot()
-
-        namespace = re.match('{(.*)}', root.tag).group(1)
+        elements, wavelengths, values = _parse_IES_TM2714_file(
+            self._path, self.mapping.data)
 
         self.name = os.path.splitext(os.path.basename(self._path))[0]
 
-        iterator = root.iter
-
         for header_element in (self.header, self):
             mapping = header_element.mapping
             for specification in mapping.elements:
-                element = root.find(
-                    formatter.format(namespace, mapping.element,
-                                     specification.element))
-                if element is not None:
+                key = (mapping.element, specification.element)
+                if key in elements:
                     setattr(header_element, specification.attribute,
-                            specification.read_conversion(element.text))
-
-        # Reading spectral data.
-        wavelengths = []
-        values = []
-        for spectral_data in iterator(
-                '{{{0}}}{1}'.format(namespace, self.mapping.data.element)):
-            wavelengths.append(
-                DEFAULT_FLOAT_DTYPE(spectral_data.attrib[
-                    self.mapping.data.attribute]))
-            values.append(DEFAULT_FLOAT_DTYPE(spectral_data.text))
+                            specification.read_conversion(elements[key]))
 
         self.wavelengths = wavelengths
         self.values = values
@@ -1011,38 +998,265 @@ class IES_TM2714_Spd(SpectralPowerDistribution):
         >>> rmtree(temporary_directory)
         """
 
-        root = ElementTree.Element('IESTM2714')
-        root.attrib = {
-            'xmlns': IES_TM2714_NAMESPACE,
-            'version': IES_TM2714_VERSION
-        }
-
-        spectral_distribution = None
-        for header_element in (self.header, self):
-            mapping = header_element.mapping
-            element = ElementTree.SubElement(root, mapping.element)
-            for specification in mapping.elements:
-                element_child = ElementTree.SubElement(element,
-                                                       specification.element)
-                value = getattr(header_element, specification.attribute)
-                element_child.text = specification.write_conversion(value)
-
-            if header_element is self:
-                spectral_distribution = element
-
-        # Writing spectral data.
-        for (wavelength, value) in tstack([self.wavelengths, self.values]):
-            element_child = ElementTree.SubElement(spectral_distribution,
-                                                   mapping.data.element)
-            element_child.text = mapping.data.write_conversion(value)
-            element_child.attrib = {
-                mapping.data.attribute:
-                    mapping.data.write_conversion(wavelength)
-            }
-
-        xml = minidom.parseString(ElementTree.tostring(root)).toprettyxml()
+        xml = _format_IES_TM2714_document(self.header, self,
+                                          self.wavelengths, self.values)
 
         with open(self._path, 'w') as file:
             file.write(xml)
 
         return True
+
+
+def _parse_IES_TM2714_file(path, data_specification):
+    """
+    Parses incrementally given *IES TM-27-14* spectral data XML file, the
+    elements being cleared as soon as they have been read.
+
+    Parameters
+    ----------
+    path : unicode
+        Spectral data XML file path.
+    data_specification : IES_TM2714_ElementSpecification
+        Spectral data element specification.
+
+    Returns
+    -------
+    tuple
+        Header and spectral distribution elements text *dict* keyed by
+        *(parent element, element)* tuples, wavelengths and values
+        *ndarrays*.
+    """
+
+    elements, wavelengths, values = {}, [], []
+    for _event, element in ElementTree.iterparse(path):
+        tag = element.tag.rsplit('}', 1)[-1]
+
+        if tag == data_specification.element:
+            wavelengths.append(element.attrib[data_specification.attribute])
+            values.append(element.text)
+        elif tag in ('Header', 'SpectralDistribution'):
+            for child in element:
+                elements[(tag, child.tag.rsplit('}', 1)[-1])] = child.text
+        else:
+            continue
+
+        element.clear()
+
+    return (elements, np.array(wavelengths, dtype=DEFAULT_FLOAT_DTYPE),
+            np.array(values, dtype=DEFAULT_FLOAT_DTYPE))
+
+
+def _format_IES_TM2714_document(header, spd, wavelengths, values):
+    """
+    Formats given *IES TM-27-14* header, spectral power distribution
+    description and spectral data as a spectral data XML document.
+
+    Parameters
+    ----------
+    header : IES_TM2714_Header
+        *IES TM-27-14* spectral power distribution header.
+    spd : IES_TM2714_Spd
+        *IES TM-27-14* spectral power distribution providing the spectral
+        distribution description elements.
+    wavelengths : array_like
+        Spectral data wavelengths.
+    values : array_like
+        Spectral data values.
+
+    Returns
+    -------
+    unicode
+        Spectral data XML document.
+    """
+
+    lines = [
+        '<?xml version="1.0" ?>',
+        '<IESTM2714 version="{0}" xmlns="{1}">'.format(
+            IES_TM2714_VERSION, IES_TM2714_NAMESPACE)
+    ]
+
+    for header_element in (header, spd):
+        mapping = header_element.mapping
+        lines.append('\t<{0}>'.format(mapping.element))
+        for specification in mapping.elements:
+            value = getattr(header_element, specification.attribute)
+            lines.append('\t\t<{0}>{1}</{0}>'.format(
+                specification.element,
+                escape(specification.write_conversion(value))))
+
+        if header_element is spd:
+            data = mapping.data
+            row_format = '\t\t<{0} {1}="%r">%r</{0}>'.format(
+                data.element, data.attribute)
+            lines.extend(row_format % row for row in zip(
+                np.asarray(wavelengths, dtype=DEFAULT_FLOAT_DTYPE).tolist(),
+                np.asarray(values, dtype=DEFAULT_FLOAT_DTYPE).tolist()))
+
+        lines.append('\t</{0}>'.format(mapping.element))
+
+    lines.append('</IESTM2714>\n')
+
+    return '\n'.join(lines)
+
+
+def read_multi_spd_from_IES_TM2714_directory(directory,
+                                             shape=None,
+                                             processes=None):
+    """
+    Reads concurrently the *IES TM-27-14* spectral data XML files, i.e.
+    *.spdx* files, of given directory and returns their content as a
+    :class:`colour.MultiSpectralPowerDistribution` class instance.
+
+    Parameters
+    ----------
+    directory : unicode
+        Directory containing the spectral data XML files.
+    shape : SpectralShape, optional
+        Spectral shape the spectral power distributions are aligned to, it is
+        required if the files spectral data wavelengths are not identical.
+    processes : integer, optional
+        Threads count, default to :func:`multiprocessing.cpu_count`
+        definition.
+
+    Returns
+    -------
+    MultiSpectralPowerDistribution
+        Multi-spectral power distribution whose labels are the files names
+        without extension, sorted.
+
+    Raises
+    ------
+    RuntimeError
+        If the directory doesn't contain any spectral data XML file or if the
+        spectral data wavelengths are not identical and no spectral shape is
+        given.
+
+    Notes
+    -----
+    -   The headers and spectral distribution descriptions are not retained,
+        :class:`colour.IES_TM2714_Spd` class should be used to read them.
+
+    Examples
+    --------
+    >>> from os.path import dirname, join
+    >>> directory = join(dirname(__file__), 'tests', 'resources')
+    >>> multi_spd = read_multi_spd_from_IES_TM2714_directory(directory)
+    >>> multi_spd.labels  # doctest: +ELLIPSIS
+    [...'Fluorescent']
+    >>> multi_spd.values.shape
+    (85, 1)
+    """
+
+    paths = sorted(glob.glob(os.path.join(directory, '*.spdx')))
+    if not paths:
+        raise RuntimeError(
+            '"{0}" directory does not contain any "IES TM-27-14" spectral '
+            'data XML file!'.format(directory))
+
+    data_specification = IES_TM2714_Spd().mapping.data
+
+    pool = multiprocessing.pool.ThreadPool(
+        processes=processes if processes else multiprocessing.cpu_count())
+    try:
+        results = pool.map(
+            lambda x: _parse_IES_TM2714_file(x, data_specification), paths)
+    finally:
+        pool.close()
+        pool.join()
+
+    labels = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+
+    wavelengths = results[0][1]
+    if all(np.array_equal(wavelengths, result[1]) for result in results):
+        values = np.transpose([result[2] for result in results])
+        multi_spd = MultiSpectralPowerDistribution(values, wavelengths,
+                                                   labels)
+        if shape is None:
+            return multi_spd
+
+        values = multi_spd[shape.range()]
+    elif shape is None:
+        raise RuntimeError(
+            'Cannot read spectral data with different wavelengths from '
+            '"{0}" directory without a spectral shape!'.format(directory))
+    else:
+        values = np.transpose([
+            SpectralPowerDistribution(result[2], result[1])[shape.range()]
+            for result in results
+        ])
+
+    return MultiSpectralPowerDistribution(values, shape.range(), labels)
+
+
+def write_multi_spd_to_IES_TM2714_directory(multi_spd,
+                                            directory,
+                                            spd=None,
+                                            processes=None):
+    """
+    Writes concurrently the given multi-spectral power distribution to given
+    directory as *IES TM-27-14* spectral data XML files, one file per
+    multi-spectral power distribution label.
+
+    Parameters
+    ----------
+    multi_spd : MultiSpectralPowerDistribution
+        Multi-spectral power distribution to write.
+    directory : unicode
+        Directory the spectral data XML files are written to.
+    spd : IES_TM2714_Spd, optional
+        *IES TM-27-14* spectral power distribution providing the header and
+        spectral distribution description shared by all the files.
+    processes : integer, optional
+        Threads count, default to :func:`multiprocessing.cpu_count`
+        definition.
+
+    Returns
+    -------
+    list
+        Written spectral data XML files paths.
+
+    Examples
+    --------
+    >>> from os.path import dirname, join
+    >>> from shutil import rmtree
+    >>> from tempfile import mkdtemp
+    >>> directory = join(dirname(__file__), 'tests', 'resources')
+    >>> multi_spd = read_multi_spd_from_IES_TM2714_directory(directory)
+    >>> temporary_directory = mkdtemp()
+    >>> paths = write_multi_spd_to_IES_TM2714_directory(
+    ...     multi_spd, temporary_directory)
+    >>> [os.path.basename(path) for path in paths]  # doctest: +ELLIPSIS
+    [...'Fluorescent.spdx']
+    >>> rmtree(temporary_directory)
+    """
+
+    if spd is None:
+        spd = IES_TM2714_Spd()
+
+    wavelengths = multi_spd.wavelengths
+    values = multi_spd.values
+    paths = [
+        os.path.join(directory, '{0}.spdx'.format(label))
+        for label in multi_spd.labels
+    ]
+
+    def write(i):
+        """
+        Writes the spectral data XML file at given index.
+        """
+
+        xml = _format_IES_TM2714_document(spd.header, spd, wavelengths,
+                                          values[..., i])
+
+        with open(paths[i], 'w') as file:
+            file.write(xml)
+
+    pool = multiprocessing.pool.ThreadPool(
+        processes=processes if processes else multiprocessing.cpu_count())
+    try:
+        pool.map(write, range(len(paths)))
+    finally:
+        pool.close()
+        pool.join()
+
+    return paths
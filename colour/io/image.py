@@ -3,16 +3,31 @@
 Image Input / Output Utilities
 ==============================
 
-Defines image related input / output utilities objects.
+Defines image related input / output utilities objects:
+
+-   :func:`colour.io.read_image_OpenImageIO`
+-   :func:`colour.io.read_image_Numpy`
+-   :func:`colour.read_image`
+-   :func:`colour.io.write_image_OpenImageIO`
+-   :func:`colour.io.write_image_Numpy`
+-   :func:`colour.write_image`
+
+The *Numpy* backend only depends on *Numpy* and supports *PFM*, binary
+*PPM* / *PGM* (8-bit and 16-bit), *.npy* and uncompressed strip *TIFF* files.
+Pixel data is memory-mapped so that regions of interest of large images can
+be read or written without loading the whole image.
 """
 
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import struct
 from collections import namedtuple
 from six import string_types
 
-from colour.utilities import CaseInsensitiveMapping, is_openimageio_installed
+from colour.utilities import (CaseInsensitiveMapping, TILE_SIZE,
+                              filter_kwargs, is_openimageio_installed, tiles)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -23,7 +38,10 @@ __status__ = 'Production'
 
 __all__ = [
     'BitDepth_Specification', 'ImageAttribute_Specification',
-    'BIT_DEPTH_MAPPING', 'read_image', 'write_image'
+    'BIT_DEPTH_MAPPING', 'NUMPY_IMAGE_FORMATS', 'TIFF_STRIP_SIZE',
+    'read_image_OpenImageIO', 'read_image_Numpy', 'READ_IMAGE_METHODS',
+    'read_image', 'write_image_OpenImageIO', 'write_image_Numpy',
+    'WRITE_IMAGE_METHODS', 'write_image'
 ]
 
 BitDepth_Specification = namedtuple('BitDepth_Specification',
@@ -82,8 +100,668 @@ else:
             BitDepth_Specification('float32', np.float32, None, 1, False)
     })
 
+NUMPY_IMAGE_FORMATS = CaseInsensitiveMapping({
+    '.pfm': ('float32', ),
+    '.pgm': ('uint8', 'uint16'),
+    '.ppm': ('uint8', 'uint16'),
+    '.pnm': ('uint8', 'uint16'),
+    '.npy': ('uint8', 'uint16', 'float16', 'float32'),
+    '.tif': ('uint8', 'uint16', 'float16', 'float32'),
+    '.tiff': ('uint8', 'uint16', 'float16', 'float32'),
+})
+"""
+Image formats supported by the *Numpy* backend, keyed by file extension,
+with their writable bit depths.
+
+NUMPY_IMAGE_FORMATS : CaseInsensitiveMapping
+    **{'.pfm', '.pgm', '.ppm', '.pnm', '.npy', '.tif', '.tiff'}**
+"""
+
+TIFF_STRIP_SIZE = 2 ** 20
+"""
+Target byte count of the strips of the *TIFF* files written by the *Numpy*
+backend, the strips are stored contiguously so that the files can be
+memory-mapped.
+
+TIFF_STRIP_SIZE : integer
+"""
+
+_Raster_Specification = namedtuple(
+    '_Raster_Specification',
+    ('dtype', 'shape', 'offset', 'order', 'bottom_up', 'domain', 'strips',
+     'rows_per_strip'))
+
+_TIFF_TYPES = {1: 'B', 3: 'H', 4: 'I'}
+
+_TIFF_SAMPLE_FORMATS = {1: 'u', 3: 'f'}
+
+
+def _image_format(path):
+    """
+    Returns the *Numpy* backend image format of given path.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+
+    Returns
+    -------
+    unicode
+        Image format, i.e. the lower case file extension.
+
+    Raises
+    ------
+    ValueError
+        If the image format is not supported.
+    """
+
+    extension = os.path.splitext(path)[-1].lower()
+
+    if extension not in NUMPY_IMAGE_FORMATS:
+        raise ValueError(
+            '"{0}" image format is not supported by the "Numpy" backend, it '
+            'must be one of {1}!'.format(extension,
+                                         sorted(NUMPY_IMAGE_FORMATS.keys())))
+
+    return extension
+
+
+def _dtype_domain(dtype):
+    """
+    Returns the domain of the values stored with given dtype, i.e. the
+    maximum value for integer dtypes and 1 for floating point dtypes.
+
+    Parameters
+    ----------
+    dtype : object
+        Type to return the domain of.
+
+    Returns
+    -------
+    integer
+        Dtype domain.
+    """
+
+    dtype = np.dtype(dtype)
+
+    return np.iinfo(dtype).max if dtype.kind in 'ui' else 1
+
+
+def _read_header_tokens(file_, count):
+    """
+    Reads given count of whitespace separated tokens from given *Netpbm* or
+    *PFM* file header, skipping the comments and consuming the single
+    whitespace character following the last token.
+
+    Parameters
+    ----------
+    file_ : file
+        Binary file object.
+    count : integer
+        Tokens count.
+
+    Returns
+    -------
+    list
+        Header tokens.
+
+    Raises
+    ------
+    RuntimeError
+        If the header is truncated.
+    """
+
+    tokens, token = [], b''
+    while len(tokens) < count:
+        character = file_.read(1)
+        if not character:
+            raise RuntimeError('"{0}" file header is truncated!'.format(
+                file_.name))
+
+        if character == b'#' and not token:
+            file_.readline()
+        elif character.isspace():
+            if token:
+                tokens.append(token.decode('ascii'))
+                token = b''
+        else:
+            token += character
+
+    return tokens
+
+
+def _netpbm_specification(path):
+    """
+    Returns the raster specification of given *PFM*, *PPM* or *PGM* file.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+
+    Returns
+    -------
+    _Raster_Specification
+        Raster specification.
+
+    Raises
+    ------
+    RuntimeError
+        If the file is not a binary *PFM*, *PPM* or *PGM* file.
+    """
+
+    with open(path, 'rb') as file_:
+        magic, width, height, value = _read_header_tokens(file_, 4)
+        offset = file_.tell()
+
+    width, height = int(width), int(height)
+    if magic in ('PF', 'Pf'):
+        scale = float(value)
+        dtype = np.dtype('<f4' if scale < 0 else '>f4')
+        channels = 3 if magic == 'PF' else 1
+        bottom_up, domain = True, 1
+    elif magic in ('P6', 'P5'):
+        domain = int(value)
+        dtype = np.dtype('u1' if domain < 256 else '>u2')
+        channels = 3 if magic == 'P6' else 1
+        bottom_up = False
+    else:
+        raise RuntimeError(
+            '"{0}" file is not a binary "PFM", "PPM" or "PGM" file!'.format(
+                path))
+
+    shape = (height, width, channels) if channels > 1 else (height, width)
+
+    return _Raster_Specification(dtype, shape, offset, 'C', bottom_up, domain,
+                                 None, None)
+
+
+def _npy_specification(path):
+    """
+    Returns the raster specification of given *.npy* file.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+
+    Returns
+    -------
+    _Raster_Specification
+        Raster specification.
+    """
+
+    with open(path, 'rb') as file_:
+        version = np.lib.format.read_magic(file_)
+        if version == (1, 0):
+            shape, fortran_order, dtype = (
+                np.lib.format.read_array_header_1_0(file_))
+        else:
+            shape, fortran_order, dtype = (
+                np.lib.format.read_array_header_2_0(file_))
+        offset = file_.tell()
+
+    order = 'F' if fortran_order else 'C'
+
+    return _Raster_Specification(dtype, shape, offset, order, False,
+                                 _dtype_domain(dtype), None, None)
+
+
+def _read_tiff_tags(path):
+    """
+    Reads the numeric tags of the first image file directory of given *TIFF*
+    file.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+
+    Returns
+    -------
+    tuple
+        Byte order and tags values.
+
+    Raises
+    ------
+    RuntimeError
+        If the file is not a classic *TIFF* file.
+    """
+
+    with open(path, 'rb') as file_:
+        byte_order = {b'II': '<', b'MM': '>'}.get(file_.read(2))
+        if byte_order is None:
+            raise RuntimeError('"{0}" file is not a "TIFF" file!'.format(path))
+
+        magic, offset = struct.unpack(byte_order + 'HI', file_.read(6))
+        if magic != 42:
+            raise RuntimeError(
+                '"{0}" file is not a classic "TIFF" file, "BigTIFF" files '
+                'are not supported!'.format(path))
+
+        file_.seek(offset)
+        count = struct.unpack(byte_order + 'H', file_.read(2))[0]
+        entries = file_.read(12 * count)
+
+        tags = {}
+        for i in range(count):
+            tag, type_, length, value = struct.unpack(
+                byte_order + 'HHI4s', entries[i * 12:(i + 1) * 12])
+
+            code = _TIFF_TYPES.get(type_)
+            if code is None:
+                continue
+
+            size = struct.calcsize(code) * length
+            if size > 4:
+                file_.seek(struct.unpack(byte_order + 'I', value)[0])
+                value = file_.read(size)
+
+            tags[tag] = struct.unpack(
+                '{0}{1}{2}'.format(byte_order, length, code), value[:size])
+
+    return byte_order, tags
+
+
+def _tiff_specification(path):
+    """
+    Returns the raster specification of given uncompressed strip *TIFF*
+    file.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+
+    Returns
+    -------
+    _Raster_Specification
+        Raster specification, the strips are undefined if they are stored
+        contiguously.
 
-def read_image(path, bit_depth='float32'):
+    Raises
+    ------
+    RuntimeError
+        If the *TIFF* file layout is not supported.
+    """
+
+    byte_order, tags = _read_tiff_tags(path)
+
+    width, height = tags[256][0], tags[257][0]
+    channels = tags.get(277, (1, ))[0]
+    bits = set(tags.get(258, (1, )))
+    kind = _TIFF_SAMPLE_FORMATS.get(tags.get(339, (1, ))[0])
+
+    if tags.get(259, (1, ))[0] != 1:
+        raise RuntimeError(
+            '"{0}" file is compressed, only uncompressed "TIFF" files are '
+            'supported!'.format(path))
+
+    if 273 not in tags or tags.get(284, (1, ))[0] != 1:
+        raise RuntimeError(
+            '"{0}" file is not a contiguous strip "TIFF" file, tiled and '
+            'planar layouts are not supported!'.format(path))
+
+    if (len(bits) != 1 or kind is None or
+            '{0}{1}'.format(kind, list(bits)[0]) not in ('u8', 'u16', 'u32',
+                                                         'f16', 'f32', 'f64')):
+        raise RuntimeError(
+            '"{0}" file samples are not supported, they must be 8, 16 or 32 '
+            'bits unsigned integers or 16, 32 or 64 bits floating point '
+            'numbers!'.format(path))
+
+    bits = list(bits)[0]
+    dtype = np.dtype('{0}{1}{2}'.format(byte_order, kind, bits // 8))
+
+    rows_per_strip = min(tags.get(278, (height, ))[0], height)
+    row_size = width * channels * dtype.itemsize
+    offsets = tags[273]
+    strips = None
+    if any(offset != offsets[0] + i * rows_per_strip * row_size
+           for i, offset in enumerate(offsets)):
+        strips = offsets
+
+    shape = (height, width, channels) if channels > 1 else (height, width)
+
+    return _Raster_Specification(dtype, shape, offsets[0], 'C', False,
+                                 (2 ** bits - 1) if kind == 'u' else 1, strips,
+                                 rows_per_strip)
+
+
+def _raster_specification(path):
+    """
+    Returns the raster specification of given image.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+
+    Returns
+    -------
+    _Raster_Specification
+        Raster specification.
+    """
+
+    extension = _image_format(path)
+
+    if extension == '.npy':
+        return _npy_specification(path)
+    elif extension in ('.tif', '.tiff'):
+        return _tiff_specification(path)
+    else:
+        return _netpbm_specification(path)
+
+
+def _map_raster(path, specification, mode='r'):
+    """
+    Memory-maps given image pixel data.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+    specification : _Raster_Specification
+        Raster specification, its pixel data must be stored contiguously.
+    mode : unicode, optional
+        **{'r', 'r+'}**,
+        Memory-map mode.
+
+    Returns
+    -------
+    memmap
+        Memory-mapped pixel data with rows ordered from top to bottom.
+    """
+
+    raster = np.memmap(
+        path,
+        specification.dtype,
+        mode,
+        specification.offset,
+        specification.shape,
+        order=specification.order)
+
+    return raster[::-1] if specification.bottom_up else raster
+
+
+def _read_raster_strips(path, specification, region=None):
+    """
+    Reads the strips of given image overlapping the rows of given region.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+    specification : _Raster_Specification
+        Raster specification.
+    region : tuple, optional
+        Region of interest.
+
+    Returns
+    -------
+    ndarray
+        Region pixel data.
+    """
+
+    if region is None:
+        region = (slice(None), )
+    elif not isinstance(region, tuple):
+        region = (region, )
+
+    height = specification.shape[0]
+    rows = np.arange(height)[region[0]]
+    rows_per_strip = specification.rows_per_strip
+    row_shape = specification.shape[1:]
+    row_size = int(np.prod(row_shape)) * specification.dtype.itemsize
+
+    if rows.size == 0:
+        return np.empty((0, ) + row_shape, specification.dtype)[(
+            slice(None), ) + region[1:]]
+
+    start, stop = np.min(rows), np.max(rows) + 1
+    first, last = start // rows_per_strip, (stop - 1) // rows_per_strip
+    pixels = np.empty(
+        ((last - first + 1) * rows_per_strip, ) + row_shape,
+        specification.dtype)
+
+    with open(path, 'rb') as file_:
+        for i in range(first, last + 1):
+            count = min(rows_per_strip, height - i * rows_per_strip)
+            file_.seek(specification.strips[i])
+            offset = (i - first) * rows_per_strip
+            pixels[offset:offset + count] = np.frombuffer(
+                file_.read(count * row_size),
+                specification.dtype).reshape((count, ) + row_shape)
+
+    return pixels[(rows - first * rows_per_strip, ) + region[1:]]
+
+
+def _convert_bit_depth(a, dtype, domain=None, source_domain=None):
+    """
+    Converts given array from given source domain to given dtype and
+    domain.
+
+    Parameters
+    ----------
+    a : ndarray
+        Array to convert.
+    dtype : object
+        Type to convert the array to.
+    domain : integer, optional
+        Domain of the converted array, default to the domain of the dtype.
+    source_domain : integer, optional
+        Domain of the array, default to the domain of its dtype.
+
+    Returns
+    -------
+    ndarray
+        Converted array, given array is returned as is if it does not
+        require any conversion.
+    """
+
+    dtype = np.dtype(dtype)
+    domain = _dtype_domain(dtype) if domain is None else domain
+    source_domain = (_dtype_domain(a.dtype)
+                     if source_domain is None else source_domain)
+
+    if (a.dtype.kind == dtype.kind and a.dtype.itemsize == dtype.itemsize and
+            domain == source_domain):
+        return a
+
+    if domain != source_domain:
+        a = np.multiply(
+            a,
+            domain / source_domain,
+            dtype=np.result_type(a.dtype, np.float32))
+
+    if dtype.kind in 'ui':
+        a = np.clip(np.around(a), 0, domain)
+
+    return a.astype(dtype)
+
+
+def _create_raster(path, shape, dtype):
+    """
+    Creates given image with uninitialised pixel data and memory-maps it.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+    shape : tuple
+        Image shape, i.e. (height, width) or (height, width, channels).
+    dtype : object
+        Type of the pixel data.
+
+    Returns
+    -------
+    memmap
+        Memory-mapped pixel data with rows ordered from top to bottom.
+
+    Raises
+    ------
+    ValueError
+        If the image shape is not supported by the image format.
+    """
+
+    extension = _image_format(path)
+    dtype = np.dtype(dtype)
+
+    if extension == '.npy':
+        return np.lib.format.open_memmap(path, 'w+', dtype, shape)
+
+    height, width = shape[:2]
+    channels = shape[2] if len(shape) == 3 else 1
+
+    if extension in ('.tif', '.tiff'):
+        header = _tiff_header(width, height, channels, dtype)
+        bottom_up = False
+    else:
+        if channels not in (1, 3) or (extension == '.pgm' and channels != 1):
+            raise ValueError(
+                '"{0}" image format does not support {1} channels '
+                'images!'.format(extension, channels))
+
+        if extension == '.pfm':
+            dtype = np.dtype('<f4')
+            header = 'P{0}\n{1} {2}\n-1.0\n'.format(
+                'F' if channels == 3 else 'f', width, height)
+            bottom_up = True
+        else:
+            dtype = np.dtype('u1' if dtype.itemsize == 1 else '>u2')
+            header = 'P{0}\n{1} {2}\n{3}\n'.format(
+                '6' if channels == 3 else '5', width, height,
+                _dtype_domain(dtype))
+            bottom_up = False
+        header = header.encode('ascii')
+
+    size = len(header) + int(np.prod(shape)) * dtype.itemsize
+    with open(path, 'wb') as file_:
+        file_.write(header)
+        file_.truncate(size)
+
+    return _map_raster(
+        path,
+        _Raster_Specification(dtype, shape, len(header), 'C', bottom_up, None,
+                              None, None), 'r+')
+
+
+def _tiff_header(width, height, channels, dtype):
+    """
+    Returns the header of an uncompressed little-endian *TIFF* file with
+    contiguous strips, i.e. the file header, the image file directory and its
+    values, padded so that the pixel data is aligned.
+
+    Parameters
+    ----------
+    width : integer
+        Image width.
+    height : integer
+        Image height.
+    channels : integer
+        Image channels count.
+    dtype : object
+        Type of the pixel data.
+
+    Returns
+    -------
+    bytes
+        *TIFF* file header.
+
+    Raises
+    ------
+    ValueError
+        If the image is too large for a classic *TIFF* file.
+    """
+
+    row_size = width * channels * dtype.itemsize
+    rows_per_strip = max(min(TIFF_STRIP_SIZE // max(row_size, 1), height), 1)
+    strips = tiles(height, rows_per_strip)
+
+    photometric = 2 if channels >= 3 else 1
+    extra_samples = channels - (3 if channels >= 3 else 1)
+
+    entries = [
+        (256, 4, [width]),
+        (257, 4, [height]),
+        (258, 3, [dtype.itemsize * 8] * channels),
+        (259, 3, [1]),
+        (262, 3, [photometric]),
+        (273, 4, [0] * len(strips)),
+        (277, 3, [channels]),
+        (278, 4, [rows_per_strip]),
+        (279, 4, [(strip.stop - strip.start) * row_size for strip in strips]),
+        (284, 3, [1]),
+    ]
+    if extra_samples:
+        entries.append((338, 3, [0] * extra_samples))
+    entries.append((339, 3, [3 if dtype.kind == 'f' else 1] * channels))
+
+    values_offset = 8 + 2 + 12 * len(entries) + 4
+    values_size = sum(
+        struct.calcsize(_TIFF_TYPES[type_]) * len(values)
+        for _tag, type_, values in entries
+        if struct.calcsize(_TIFF_TYPES[type_]) * len(values) > 4)
+    offset = -(-(values_offset + values_size) // 64) * 64
+
+    if offset + height * row_size >= 2 ** 32:
+        raise ValueError('"TIFF" files larger than 4 GiB are not supported, '
+                         'please use the ".npy" image format!')
+
+    entries[5] = (273, 4,
+                  [offset + strip.start * row_size for strip in strips])
+
+    directory = [struct.pack('<2sHIH', b'II', 42, 8, len(entries))]
+    values = []
+    for tag, type_, tag_values in entries:
+        code = _TIFF_TYPES[type_]
+        data = struct.pack('<{0}{1}'.format(len(tag_values), code),
+                           *tag_values)
+        if len(data) > 4:
+            directory.append(
+                struct.pack('<HHII', tag, type_, len(tag_values),
+                            values_offset + sum(len(value)
+                                                for value in values)))
+            values.append(data)
+        else:
+            directory.append(
+                struct.pack('<HHI4s', tag, type_, len(tag_values), data))
+    directory.append(struct.pack('<I', 0))
+
+    header = b''.join(directory + values)
+
+    return header + b'\x00' * (offset - len(header))
+
+
+def _default_method(path, region=None):
+    """
+    Returns the default image input / output method for given image path.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+    region : tuple, optional
+        Region of interest.
+
+    Returns
+    -------
+    unicode
+        *OpenImageIO* if it is installed or if the image format is not
+        supported by the *Numpy* backend, *Numpy* otherwise or if a region of
+        interest is given.
+    """
+
+    supported = os.path.splitext(str(path))[-1].lower() in NUMPY_IMAGE_FORMATS
+
+    if region is not None or (supported and not is_openimageio_installed()):
+        return 'Numpy'
+
+    return 'OpenImageIO'
+
+
+def read_image_OpenImageIO(path, bit_depth='float32'):
     """
     Reads given image using *OpenImageIO*.
 
@@ -108,7 +786,7 @@ def read_image(path, bit_depth='float32'):
     --------
     >>> import os
     >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
-    >>> image = read_image(path)  # doctest: +SKIP
+    >>> image = read_image_OpenImageIO(path)  # doctest: +SKIP
     """
 
     if is_openimageio_installed(raise_exception=True):
@@ -124,10 +802,142 @@ def read_image(path, bit_depth='float32'):
         shape = (specification.height, specification.width,
                  specification.nchannels)
 
-        return np.squeeze(np.array(image.read_image(bit_depth)).reshape(shape))
+        pixels = np.asarray(image.read_image(bit_depth))
+        image.close()
 
+        return np.squeeze(pixels.reshape(shape))
 
-def write_image(image, path, bit_depth='float32', attributes=None):
+
+def read_image_Numpy(path, bit_depth='float32', region=None):
+    """
+    Reads given image or given region of interest of the image using the
+    *Numpy* backend.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path, the image format must be one of the
+        :attr:`colour.io.NUMPY_IMAGE_FORMATS` attribute formats.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Image bit_depth.
+    region : tuple, optional
+        Region of interest to read as a tuple of rows and columns indexes,
+        e.g. ``np.s_[512:1024, 256:768]``, only the pixel data of the region
+        is read.
+
+    Returns
+    -------
+    ndarray
+        Image as a ndarray.
+
+    Raises
+    ------
+    ValueError
+        If the image format is not supported.
+    RuntimeError
+        If the image file layout is not supported.
+
+    Notes
+    -----
+    -   The pixel data is memory-mapped: when the image is stored with the
+        requested bit depth, a read-only :class:`numpy.memmap` class instance
+        view is returned without copying, possibly with a non-native byte
+        order, e.g. for 16-bit *PPM* / *PGM* files. Otherwise only the region
+        of interest is converted to the requested bit depth.
+    -   *PFM* files rows are stored from bottom to top, they are returned
+        from top to bottom as a view.
+    -   *TIFF* files with non-contiguous strips are read strip by strip, only
+        the strips overlapping the region of interest are read.
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join('tests', 'resources', 'Image.pfm')
+    >>> image = read_image_Numpy(path)  # doctest: +SKIP
+    >>> region = read_image_Numpy(path, region=np.s_[0:64, 0:64])
+    ... # doctest: +SKIP
+    """
+
+    path = str(path)
+
+    specification = _raster_specification(path)
+
+    if specification.strips is None:
+        image = _map_raster(path, specification)
+        if region is not None:
+            image = image[region]
+    else:
+        image = _read_raster_strips(path, specification, region)
+
+    bit_depth_specification = BIT_DEPTH_MAPPING[bit_depth]
+
+    return _convert_bit_depth(image, bit_depth_specification.numpy,
+                              bit_depth_specification.domain,
+                              specification.domain)
+
+
+READ_IMAGE_METHODS = CaseInsensitiveMapping({
+    'OpenImageIO': read_image_OpenImageIO,
+    'Numpy': read_image_Numpy,
+})
+READ_IMAGE_METHODS.__doc__ = """
+Supported image read methods.
+
+READ_IMAGE_METHODS : CaseInsensitiveMapping
+    **{'OpenImageIO', 'Numpy'}**
+"""
+
+
+def read_image(path, bit_depth='float32', method=None, **kwargs):
+    """
+    Reads given image using given method.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Image bit_depth.
+    method : unicode, optional
+        **{'OpenImageIO', 'Numpy'}**,
+        Read method, default to *OpenImageIO* if it is installed or if the
+        image format is not supported by the *Numpy* backend, *Numpy*
+        otherwise or if a region of interest is given.
+
+    Other Parameters
+    ----------------
+    region : tuple, optional
+        {:func:`colour.io.read_image_Numpy`},
+        Region of interest to read as a tuple of rows and columns indexes.
+
+    Returns
+    -------
+    ndarray
+        Image as a ndarray.
+
+    Notes
+    -----
+    -   For convenience, single channel images are squeezed to 2d arrays.
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
+    >>> image = read_image(path)  # doctest: +SKIP
+    """
+
+    if method is None:
+        method = _default_method(path, kwargs.get('region'))
+
+    function = READ_IMAGE_METHODS[method]
+
+    return function(path, bit_depth, **filter_kwargs(function, **kwargs))
+
+
+def write_image_OpenImageIO(image, path, bit_depth='float32',
+                            attributes=None):
     """
     Writes given image using *OpenImageIO*.
 
@@ -157,13 +967,14 @@ def write_image(image, path, bit_depth='float32', attributes=None):
     >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
     >>> image = read_image(path)  # doctest: +SKIP
     >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.tif')
-    >>> write_image(image, path)  # doctest: +SKIP
+    >>> write_image_OpenImageIO(image, path)  # doctest: +SKIP
     True
 
     Advanced image writing while setting attributes:
 
     >>> compression = ImageAttribute_Specification('Compression', 'none')
-    >>> write_image(image, path, 'uint8', [compression])  # doctest: +SKIP
+    >>> write_image_OpenImageIO(image, path, 'uint8', [compression])
+    ... # doctest: +SKIP
     True
     """
 
@@ -207,3 +1018,176 @@ def write_image(image, path, bit_depth='float32', attributes=None):
         image_output.close()
 
         return True
+
+
+def write_image_Numpy(image, path, bit_depth='float32', region=None):
+    """
+    Writes given image, or given region of interest of an existing image,
+    using the *Numpy* backend.
+
+    Parameters
+    ----------
+    image : array_like
+        Image data.
+    path : unicode
+        Image path, the image format must be one of the
+        :attr:`colour.io.NUMPY_IMAGE_FORMATS` attribute formats.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Image bit_depth, it must be supported by the image format. It is
+        ignored when writing a region of interest, the existing image bit
+        depth is used.
+    region : tuple, optional
+        Region of interest of the existing image to write given image data
+        to as a tuple of rows and columns indexes, e.g.
+        ``np.s_[512:1024, 256:768]``, only the pixel data of the region is
+        written.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the image format, the bit depth or the image shape are not
+        supported.
+    RuntimeError
+        If the existing image file layout does not allow writing a region of
+        interest.
+
+    Notes
+    -----
+    -   Floating point image data is expected in domain [0, 1] while integer
+        image data is expected in the domain of its dtype, e.g. [0, 255] for
+        *uint8* image data.
+    -   The image is written in tiles of rows into the memory-mapped pixel
+        data so that only a tile is converted to the requested bit depth at
+        any time.
+    -   Attributes are not supported, *TIFF* files are written with
+        contiguous strips so that they can be memory-mapped.
+
+    Examples
+    --------
+    >>> import os
+    >>> image = np.full((512, 512, 3), 0.18)
+    >>> path = os.path.join('tests', 'resources', 'Image.tif')
+    >>> write_image_Numpy(image, path, 'uint16')  # doctest: +SKIP
+    True
+    >>> write_image_Numpy(np.ones((64, 64, 3)), path, region=np.s_[0:64, 0:64])
+    ... # doctest: +SKIP
+    True
+    """
+
+    path = str(path)
+
+    image = np.asarray(image)
+
+    if region is not None:
+        specification = _raster_specification(path)
+        if specification.strips is not None:
+            raise RuntimeError(
+                '"{0}" file strips are not stored contiguously, writing a '
+                'region of interest is not supported!'.format(path))
+
+        raster = _map_raster(path, specification, 'r+')
+        raster[region] = _convert_bit_depth(image, specification.dtype,
+                                            specification.domain)
+        raster.flush()
+
+        return True
+
+    extension = _image_format(path)
+    bit_depth_specification = BIT_DEPTH_MAPPING[bit_depth]
+    if bit_depth_specification.name not in NUMPY_IMAGE_FORMATS[extension]:
+        raise ValueError(
+            '"{0}" bit depth is not supported by "{1}" image format, it must '
+            'be one of {2}!'.format(bit_depth, extension,
+                                    NUMPY_IMAGE_FORMATS[extension]))
+
+    raster = _create_raster(path, image.shape, bit_depth_specification.numpy)
+
+    rows = max(TILE_SIZE // max(int(np.prod(image.shape[1:2])), 1), 1)
+    for tile in tiles(image.shape[0], rows):
+        raster[tile] = _convert_bit_depth(image[tile], raster.dtype,
+                                          bit_depth_specification.domain)
+
+    raster.flush()
+
+    return True
+
+
+WRITE_IMAGE_METHODS = CaseInsensitiveMapping({
+    'OpenImageIO': write_image_OpenImageIO,
+    'Numpy': write_image_Numpy,
+})
+WRITE_IMAGE_METHODS.__doc__ = """
+Supported image write methods.
+
+WRITE_IMAGE_METHODS : CaseInsensitiveMapping
+    **{'OpenImageIO', 'Numpy'}**
+"""
+
+
+def write_image(image, path, bit_depth='float32', method=None, **kwargs):
+    """
+    Writes given image using given method.
+
+    Parameters
+    ----------
+    image : array_like
+        Image data.
+    path : unicode
+        Image path.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Image bit_depth.
+    method : unicode, optional
+        **{'OpenImageIO', 'Numpy'}**,
+        Write method, default to *OpenImageIO* if it is installed or if the
+        image format is not supported by the *Numpy* backend, *Numpy*
+        otherwise or if a region of interest is given.
+
+    Other Parameters
+    ----------------
+    attributes : array_like, optional
+        {:func:`colour.io.write_image_OpenImageIO`},
+        An array of :class:`colour.io.ImageAttribute_Specification` class
+        instances used to set attributes of the image.
+    region : tuple, optional
+        {:func:`colour.io.write_image_Numpy`},
+        Region of interest of the existing image to write given image data
+        to as a tuple of rows and columns indexes.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    Basic image writing:
+
+    >>> import os
+    >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
+    >>> image = read_image(path)  # doctest: +SKIP
+    >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.tif')
+    >>> write_image(image, path)  # doctest: +SKIP
+    True
+
+    Advanced image writing while setting attributes:
+
+    >>> compression = ImageAttribute_Specification('Compression', 'none')
+    >>> write_image(image, path, 'uint8', attributes=[compression])
+    ... # doctest: +SKIP
+    True
+    """
+
+    if method is None:
+        method = _default_method(path, kwargs.get('region'))
+
+    function = WRITE_IMAGE_METHODS[method]
+
+    return function(image, path, bit_depth,
+                    **filter_kwargs(function, **kwargs))
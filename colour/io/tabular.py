@@ -5,18 +5,25 @@ CSV Tabular Data Input / Output
 
 Defines various input / output objects for *CSV* tabular data files:
 
+-   :func:`colour.read_spectral_array_from_csv_file`
 -   :func:`colour.read_spectral_data_from_csv_file`
 -   :func:`colour.read_spds_from_csv_file`
+-   :func:`colour.read_multi_spd_from_csv_file`
 -   :func:`colour.write_spds_to_csv_file`
+-   :func:`colour.write_multi_spd_to_csv_file`
 """
 
 from __future__ import division, unicode_literals
 
-from collections import OrderedDict
 import csv
+import numpy as np
+import warnings
+from collections import OrderedDict
 
-from colour.colorimetry import SpectralPowerDistribution
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
 from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -26,10 +33,175 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
+    'CSV_WRITING_CHUNK_SIZE', 'read_spectral_array_from_csv_file',
     'read_spectral_data_from_csv_file', 'read_spds_from_csv_file',
-    'write_spds_to_csv_file'
+    'read_multi_spd_from_csv_file', 'write_spectral_array_to_csv_file',
+    'write_spds_to_csv_file', 'write_multi_spd_to_csv_file'
 ]
 
+CSV_WRITING_CHUNK_SIZE = 1024
+"""
+Rows count formatted and written at once by the *CSV* writing definitions.
+
+CSV_WRITING_CHUNK_SIZE : integer
+"""
+
+
+def _parse_csv_rows(lines, delimiter, count):
+    """
+    Parses given *CSV* lines with the :mod:`csv` module into a float array
+    with given columns count.
+
+    Parameters
+    ----------
+    lines : array_like
+        *CSV* lines.
+    delimiter : unicode
+        *CSV* content delimiter.
+    count : int
+        Columns count, shorter rows are padded and longer rows are truncated.
+
+    Returns
+    -------
+    tuple
+        Float array of shape (rows, count) and *bool* array of the same shape
+        indicating the missing or non-numeric values.
+    """
+
+    data = np.full((len(lines), count), np.nan, dtype=DEFAULT_FLOAT_DTYPE)
+    missing = np.ones(data.shape, dtype=np.bool_)
+    for i, row in enumerate(csv.reader(lines, delimiter=str(delimiter))):
+        for j, cell in enumerate(row[:count]):
+            try:
+                data[i, j] = DEFAULT_FLOAT_DTYPE(cell)
+                missing[i, j] = False
+            except ValueError:
+                pass
+
+    return data, missing
+
+
+def read_spectral_array_from_csv_file(path,
+                                      delimiter=',',
+                                      fields=None,
+                                      columns=None,
+                                      default=0):
+    """
+    Reads the spectral data from given *CSV* file and returns it as
+    *ndarrays*, the numeric body of the file being parsed in bulk.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names. If no value is provided the
+        first line of the file will be used as spectral data fields names.
+    columns : array_like, optional
+        Names of the spectral data fields to read, the wavelength field is
+        always read. If no value is provided, all the fields are read.
+    default : numeric, optional
+        Default value for fields row with missing or non-numeric value, use
+        *np.nan* to retain them.
+
+    Returns
+    -------
+    tuple
+        Tuple of wavelengths *ndarray* of shape (rows, ), values *ndarray* of
+        shape (rows, columns) and spectral data fields names *list*.
+
+    Raises
+    ------
+    RuntimeError
+        If the *CSV* spectral data file doesn't define the appropriate fields.
+    KeyError
+        If a requested column is not defined by the *CSV* spectral data file.
+
+    Notes
+    -----
+    -   Well formed files are parsed with a single call to
+        :func:`numpy.fromstring`, files with quoted, missing or non-numeric
+        values, or rows with a different fields count fall back to the
+        :mod:`csv` module.
+    -   Literal *nan* values are retained, the default value only replaces
+        missing or non-numeric values.
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> wavelengths, values, labels = read_spectral_array_from_csv_file(
+    ...     csv_file, columns=['1', '2', '3'])
+    >>> wavelengths[:3]
+    array([ 380.,  385.,  390.])
+    >>> values[:3]
+    array([[ 0.048,  0.103,  0.113],
+           [ 0.051,  0.12 ,  0.138],
+           [ 0.055,  0.141,  0.174]])
+    >>> labels
+    ['1', '2', '3']
+    """
+
+    with open(path, 'r') as csv_file:
+        lines = [line.strip() for line in csv_file.read().splitlines()]
+    lines = [line for line in lines if line]
+
+    if fields is None:
+        fields = [
+            field.strip()
+            for field in next(csv.reader(lines[:1], delimiter=str(delimiter)))
+        ]
+        lines = lines[1:]
+
+    fields = list(fields)
+    if len(fields) < 2:
+        raise RuntimeError(('A "CSV" spectral data file should define '
+                            'the following fields: '
+                            '("wavelength", "field 1", ..., "field n")!'))
+
+    shape = (len(lines), len(fields))
+    data = missing = None
+    # The bulk parsing is only used when the body is unquoted and all the
+    # rows have the expected fields count.
+    if all('"' not in line and line.count(delimiter) == shape[1] - 1
+           for line in lines):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            data = np.fromstring(
+                delimiter.join(lines), dtype=DEFAULT_FLOAT_DTYPE,
+                sep=delimiter)
+
+    if data is not None and data.size == shape[0] * shape[1]:
+        data = np.reshape(data, shape)
+    else:
+        data, missing = _parse_csv_rows(lines, delimiter, shape[1])
+    wavelengths, values = data[:, 0], data[:, 1:]
+    labels = fields[1:]
+
+    if columns is not None:
+        indexes = []
+        for column in columns:
+            if column not in labels:
+                raise KeyError(
+                    '"{0}" field is not defined in "{1}" file!'.format(
+                        column, path))
+            indexes.append(labels.index(column))
+
+        values = values[:, indexes]
+        labels = [labels[index] for index in indexes]
+
+    if missing is not None:
+        missing = missing[:, 1:]
+        if columns is not None:
+            missing = missing[:, indexes]
+
+        values = np.where(missing, default, values)
+
+    return wavelengths, values, labels
+
 
 def read_spectral_data_from_csv_file(path,
                                      delimiter=',',
@@ -115,27 +287,14 @@ def read_spectral_data_from_csv_file(path,
      '24']
     """
 
-    with open(path, 'rU') as csv_file:
-        reader = csv.DictReader(
-            csv_file, delimiter=str(delimiter), fieldnames=fields)
-        if len(reader.fieldnames) == 1:
-            raise RuntimeError(('A "CSV" spectral data file should define '
-                                'the following fields: '
-                                '("wavelength", "field 1", ..., "field n")!'))
-
-        wavelength = reader.fieldnames[0]
-        fields = reader.fieldnames[1:]
+    wavelengths, values, fields = read_spectral_array_from_csv_file(
+        path, delimiter, fields, default=default)
 
-        data = OrderedDict(zip(fields, ({} for _ in range(len(fields)))))
-        for line in reader:
-            for field in fields:
-                try:
-                    value = DEFAULT_FLOAT_DTYPE(line[field])
-                except ValueError:
-                    value = default
+    data = OrderedDict()
+    for i, field in enumerate(fields):
+        data[field] = dict(zip(wavelengths, values[:, i]))
 
-                data[field][DEFAULT_FLOAT_DTYPE(line[wavelength])] = value
-        return data
+    return data
 
 
 def read_spds_from_csv_file(path, delimiter=',', fields=None, default=0):
@@ -266,6 +425,122 @@ def read_spds_from_csv_file(path, delimiter=',', fields=None, default=0):
     return spds
 
 
+def read_multi_spd_from_csv_file(path,
+                                 delimiter=',',
+                                 fields=None,
+                                 columns=None,
+                                 default=0):
+    """
+    Reads the spectral data from given *CSV* file and return its content as a
+    :class:`colour.MultiSpectralPowerDistribution` class.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names. If no value is provided the
+        first line of the file will be used for as spectral data fields names.
+    columns : array_like, optional
+        Names of the spectral data fields to read, the wavelength field is
+        always read. If no value is provided, all the fields are read.
+    default : numeric
+        Default value for fields row with missing value.
+
+    Returns
+    -------
+    MultiSpectralPowerDistribution
+        Multi-spectral power distribution of given *CSV* file.
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> multi_spd = read_multi_spd_from_csv_file(csv_file)
+    >>> multi_spd.labels  # doctest: +ELLIPSIS
+    [...'1', ...'2', ...'3', ...'4', ...'5', ...'6', ...'7', ...'8', ...'9', \
+...'10', ...'11', ...'12', ...'13', ...'14', ...'15', ...'16', ...'17', \
+...'18', ...'19', ...'20', ...'21', ...'22', ...'23', ...'24']
+    >>> multi_spd.values.shape
+    (81, 24)
+    >>> multi_spd[555][:4]
+    array([ 0.082,  0.298,  0.188,  0.147])
+    """
+
+    wavelengths, values, labels = read_spectral_array_from_csv_file(
+        path, delimiter, fields, columns, default)
+
+    return MultiSpectralPowerDistribution(
+        values, wavelengths, labels, name=path)
+
+
+def write_spectral_array_to_csv_file(wavelengths,
+                                     values,
+                                     labels,
+                                     path,
+                                     delimiter=','):
+    """
+    Writes the given spectral data *ndarrays* to given *CSV* file.
+
+    The rows are formatted and written by chunks of
+    :attr:`colour.io.tabular.CSV_WRITING_CHUNK_SIZE` rows using a single
+    format string per row, the values being written with their shortest
+    round-tripping representation.
+
+    Parameters
+    ----------
+    wavelengths : array_like
+        Wavelengths of shape (rows, ).
+    values : array_like
+        Values of shape (rows, columns).
+    labels : array_like
+        *CSV* file spectral data fields names for the values columns.
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    RuntimeError
+        If the given wavelengths, values and labels have incompatible shapes.
+    """
+
+    wavelengths = np.ravel(np.asarray(wavelengths, dtype=DEFAULT_FLOAT_DTYPE))
+    values = np.asarray(values, dtype=DEFAULT_FLOAT_DTYPE)
+    values = np.reshape(values, (wavelengths.shape[0], -1))
+    labels = list(labels)
+
+    if values.shape[-1] != len(labels):
+        raise RuntimeError(('Cannot write spectral data with "{0}" columns '
+                            'and "{1}" labels to "CSV" file!').format(
+                                values.shape[-1], len(labels)))
+
+    row_format = delimiter.join(['%r'] * (len(labels) + 1))
+    with open(path, 'w') as csv_file:
+        writer = csv.writer(
+            csv_file, delimiter=str(delimiter), lineterminator='\n')
+        writer.writerow(['wavelength'] + labels)
+
+        for i in range(0, wavelengths.shape[0], CSV_WRITING_CHUNK_SIZE):
+            chunk = np.hstack([
+                wavelengths[i:i + CSV_WRITING_CHUNK_SIZE, np.newaxis],
+                values[i:i + CSV_WRITING_CHUNK_SIZE]
+            ])
+            csv_file.write(''.join(
+                row_format % tuple(row) + '\n' for row in chunk.tolist()))
+
+    return True
+
+
 def write_spds_to_csv_file(spds, path, delimiter=',', fields=None):
     """
     Writes the given spectral power distributions to given *CSV* file.
@@ -300,21 +575,43 @@ def write_spds_to_csv_file(spds, path, delimiter=',', fields=None):
             raise RuntimeError(('Cannot write spectral power distributions '
                                 'with different shapes to "CSV" file!'))
 
+    fields = list(fields) if fields is not None else sorted(spds.keys())
     wavelengths = tuple(spds.values())[0].wavelengths
-    with open(path, 'w') as csv_file:
-        fields = list(fields) if fields is not None else sorted(spds.keys())
-        writer = csv.DictWriter(
-            csv_file,
-            delimiter=str(delimiter),
-            fieldnames=['wavelength'] + fields,
-            lineterminator='\n')
-        # Python 2.7.x / 3.4.x only.
-        # writer.writeheader()
-        writer.writerow(dict((name, name) for name in writer.fieldnames))
-        for wavelength in wavelengths:
-            row = {'wavelength': wavelength}
-            row.update(
-                dict((field, spds[field][wavelength]) for field in fields))
-            writer.writerow(row)
+    values = tstack([spds[field].values for field in fields])
 
-    return True
+    return write_spectral_array_to_csv_file(wavelengths, values, fields, path,
+                                            delimiter)
+
+
+def write_multi_spd_to_csv_file(multi_spd, path, delimiter=',', fields=None):
+    """
+    Writes the given multi-spectral power distribution to given *CSV* file.
+
+    Parameters
+    ----------
+    multi_spd : MultiSpectralPowerDistribution
+        Multi-spectral power distribution to write.
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names, i.e. multi-spectral power
+        distribution labels, to write. If no value is provided, all the
+        labels are written in their existing order.
+
+    Returns
+    -------
+    bool
+        Definition success.
+    """
+
+    labels = list(multi_spd.labels)
+    values = multi_spd.values
+    if fields is not None:
+        fields = list(fields)
+        values = values[:, [labels.index(field) for field in fields]]
+        labels = fields
+
+    return write_spectral_array_to_csv_file(multi_spd.wavelengths, values,
+                                            labels, path, delimiter)
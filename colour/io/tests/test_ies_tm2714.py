@@ -11,8 +11,12 @@ import shutil
 import unittest
 import tempfile
 
-from colour.colorimetry import SpectralPowerDistribution
-from colour.io.ies_tm2714 import IES_TM2714_Header, IES_TM2714_Spd
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution, SpectralShape)
+from colour.io.ies_tm2714 import (
+    IES_TM2714_Header, IES_TM2714_Spd,
+    read_multi_spd_from_IES_TM2714_directory,
+    write_multi_spd_to_IES_TM2714_directory)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -24,7 +28,9 @@ __status__ = 'Production'
 __all__ = [
     'RESOURCES_DIRECTORY', 'FLUORESCENT_FILE_HEADER',
     'FLUORESCENT_FILE_SPECTRAL_DESCRIPTION', 'FLUORESCENT_FILE_SPECTRAL_DATA',
-    'TestIES_TM2714_Header', 'TestIES_TM2714_Spd'
+    'TestIES_TM2714_Header', 'TestIES_TM2714_Spd',
+    'TestReadMultiSpdFromIES_TM2714Directory',
+    'TestWriteMultiSpdToIES_TM2714Directory'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -249,5 +255,146 @@ class TestIES_TM2714_Spd(unittest.TestCase):
         self.assertEquals(spd_r, spd_t)
 
 
+class TestReadMultiSpdFromIES_TM2714Directory(unittest.TestCase):
+    """
+    Defines :func:`colour.io.ies_tm2714.\
+read_multi_spd_from_IES_TM2714_directory` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_multi_spd_from_IES_TM2714_directory(self):
+        """
+        Tests :func:`colour.io.ies_tm2714.\
+read_multi_spd_from_IES_TM2714_directory` definition.
+        """
+
+        multi_spd = read_multi_spd_from_IES_TM2714_directory(
+            RESOURCES_DIRECTORY, processes=2)
+        self.assertIsInstance(multi_spd, MultiSpectralPowerDistribution)
+        self.assertListEqual(list(multi_spd.labels), ['Fluorescent'])
+
+        spd_r = SpectralPowerDistribution(FLUORESCENT_FILE_SPECTRAL_DATA)
+        np.testing.assert_array_equal(multi_spd.wavelengths, spd_r.domain)
+        np.testing.assert_almost_equal(
+            multi_spd.values[..., 0], spd_r.values, decimal=7)
+
+        spd = IES_TM2714_Spd(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'))
+        spd.read()
+        spd.path = os.path.join(self._temporary_directory, 'A.spdx')
+        spd.write()
+        spd.values = spd.values * 2
+        spd.path = os.path.join(self._temporary_directory, 'B.spdx')
+        spd.write()
+
+        multi_spd = read_multi_spd_from_IES_TM2714_directory(
+            self._temporary_directory)
+        self.assertListEqual(list(multi_spd.labels), ['A', 'B'])
+        np.testing.assert_almost_equal(
+            multi_spd.values[..., 1],
+            multi_spd.values[..., 0] * 2,
+            decimal=7)
+
+        spd.wavelengths = spd.wavelengths + 0.5
+        spd.write()
+        shape = SpectralShape(400, 700, 10)
+        multi_spd = read_multi_spd_from_IES_TM2714_directory(
+            self._temporary_directory, shape)
+        self.assertTupleEqual(multi_spd.values.shape, (31, 2))
+        np.testing.assert_array_equal(multi_spd.wavelengths, shape.range())
+
+    def test_raise_exception_read_multi_spd_from_IES_TM2714_directory(self):
+        """
+        Tests :func:`colour.io.ies_tm2714.\
+read_multi_spd_from_IES_TM2714_directory` definition raised exception.
+        """
+
+        self.assertRaises(RuntimeError,
+                          read_multi_spd_from_IES_TM2714_directory,
+                          self._temporary_directory)
+
+        spd = IES_TM2714_Spd(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'))
+        spd.read()
+        spd.path = os.path.join(self._temporary_directory, 'A.spdx')
+        spd.write()
+        spd.wavelengths = spd.wavelengths + 0.5
+        spd.path = os.path.join(self._temporary_directory, 'B.spdx')
+        spd.write()
+
+        self.assertRaises(RuntimeError,
+                          read_multi_spd_from_IES_TM2714_directory,
+                          self._temporary_directory)
+
+
+class TestWriteMultiSpdToIES_TM2714Directory(unittest.TestCase):
+    """
+    Defines :func:`colour.io.ies_tm2714.\
+write_multi_spd_to_IES_TM2714_directory` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_multi_spd_to_IES_TM2714_directory(self):
+        """
+        Tests :func:`colour.io.ies_tm2714.\
+write_multi_spd_to_IES_TM2714_directory` definition.
+        """
+
+        wavelengths = np.arange(380, 790, 10)
+        values = np.random.RandomState(4).random_sample(
+            (wavelengths.size, 8))
+        labels = ['Sample {0}'.format(i) for i in range(values.shape[-1])]
+        multi_spd = MultiSpectralPowerDistribution(values, wavelengths,
+                                                   labels)
+
+        spd = IES_TM2714_Spd(
+            header=IES_TM2714_Header(
+                'colour-science', description='Random <Samples> & Co.'),
+            spectral_quantity='reflectance',
+            bandwidth_FWHM=5.0)
+        paths = write_multi_spd_to_IES_TM2714_directory(
+            multi_spd, self._temporary_directory, spd)
+        self.assertEqual(len(paths), 8)
+
+        spd_t = IES_TM2714_Spd(paths[3])
+        spd_t.read()
+        self.assertEqual(spd_t.header.manufacturer, 'colour-science')
+        self.assertEqual(spd_t.header.description, 'Random <Samples> & Co.')
+        self.assertEqual(spd_t.spectral_quantity, 'reflectance')
+        np.testing.assert_array_equal(spd_t.wavelengths, wavelengths)
+        np.testing.assert_array_equal(spd_t.values, values[..., 3])
+
+        multi_spd_t = read_multi_spd_from_IES_TM2714_directory(
+            self._temporary_directory)
+        self.assertListEqual(list(multi_spd_t.labels), labels)
+        np.testing.assert_array_equal(multi_spd_t.values, values)
+
+
 if __name__ == '__main__':
     unittest.main()
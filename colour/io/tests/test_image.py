@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.image` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+from colour.io import (read_image, read_image_Numpy, write_image,
+                       write_image_Numpy)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'IMAGE_FORMATS', 'BIT_DEPTH_TOLERANCES', 'TestReadImageNumpy',
+    'TestWriteImageNumpy', 'TestReadImage'
+]
+
+IMAGE_FORMATS = (('.pfm', 'float32'), ('.ppm', 'uint8'), ('.ppm', 'uint16'),
+                 ('.npy', 'uint8'), ('.npy', 'float16'), ('.npy', 'float32'),
+                 ('.tif', 'uint8'), ('.tif', 'uint16'), ('.tif', 'float16'),
+                 ('.tif', 'float32'))
+
+BIT_DEPTH_TOLERANCES = {
+    'uint8': 0.5 / 255,
+    'uint16': 0.5 / 65535,
+    'float16': 0.001,
+    'float32': 0.0000001
+}
+
+
+def _write_strips_tiff(image, path, rows_per_strip):
+    """
+    Writes given *uint8* image as a big-endian *TIFF* file with its strips
+    stored in reverse order.
+    """
+
+    height, width, channels = image.shape
+    strips = [
+        image[i:i + rows_per_strip].tostring()
+        for i in range(0, height, rows_per_strip)
+    ]
+
+    entries = 10
+    values_offset = 8 + 2 + 12 * entries + 4
+    data_offset = values_offset + 8 * len(strips)
+    offsets, counts, offset = [], [], data_offset
+    for strip in reversed(strips):
+        offsets.insert(0, offset)
+        counts.insert(0, len(strip))
+        offset += len(strip)
+
+    with open(path, 'wb') as file_:
+        file_.write(struct.pack('>2sHIH', b'MM', 42, 8, entries))
+        for tag, type_, count, value in (
+            (256, 4, 1, struct.pack('>I', width)),
+            (257, 4, 1, struct.pack('>I', height)),
+            (258, 3, 1, struct.pack('>HH', 8, 0)),
+            (259, 3, 1, struct.pack('>HH', 1, 0)),
+            (262, 3, 1, struct.pack('>HH', 2, 0)),
+            (273, 4, len(strips), struct.pack('>I', values_offset)),
+            (277, 3, 1, struct.pack('>HH', channels, 0)),
+            (278, 4, 1, struct.pack('>I', rows_per_strip)),
+            (279, 4, len(strips),
+             struct.pack('>I', values_offset + 4 * len(strips))),
+            (284, 3, 1, struct.pack('>HH', 1, 0)),
+        ):
+            file_.write(struct.pack('>HHI4s', tag, type_, count, value))
+        file_.write(struct.pack('>I', 0))
+        file_.write(struct.pack('>{0}I'.format(len(strips)), *offsets))
+        file_.write(struct.pack('>{0}I'.format(len(strips)), *counts))
+        for strip in reversed(strips):
+            file_.write(strip)
+
+
+class TestReadImageNumpy(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.read_image_Numpy` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._image = np.random.RandomState(4).uniform(0, 1, (37, 23, 3))
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_image_Numpy(self):
+        """
+        Tests :func:`colour.io.image.read_image_Numpy` definition.
+        """
+
+        for extension, bit_depth in IMAGE_FORMATS:
+            path = os.path.join(self._temporary_directory,
+                                '{0}{1}'.format(bit_depth, extension))
+            write_image_Numpy(self._image, path, bit_depth)
+
+            image = read_image_Numpy(path)
+            self.assertEqual(image.shape, self._image.shape)
+            self.assertEqual(image.dtype, np.float32)
+            np.testing.assert_allclose(
+                image,
+                self._image,
+                atol=BIT_DEPTH_TOLERANCES[bit_depth] + 1e-7)
+
+            image = read_image_Numpy(path, bit_depth)
+            self.assertIsInstance(image, np.memmap)
+            self.assertEqual(image.dtype.kind + str(image.dtype.itemsize),
+                             np.dtype(bit_depth).kind +
+                             str(np.dtype(bit_depth).itemsize))
+
+            region = np.s_[5:9, 3:20:2]
+            np.testing.assert_allclose(
+                read_image_Numpy(path, region=region),
+                self._image[region],
+                atol=BIT_DEPTH_TOLERANCES[bit_depth] + 1e-7)
+
+    def test_read_image_Numpy_single_channel(self):
+        """
+        Tests :func:`colour.io.image.read_image_Numpy` definition with single
+        channel images.
+        """
+
+        for extension, bit_depth in (('.pfm', 'float32'), ('.pgm', 'uint16'),
+                                     ('.tif', 'uint8')):
+            path = os.path.join(self._temporary_directory,
+                                'Image{0}'.format(extension))
+            write_image_Numpy(self._image[..., 0], path, bit_depth)
+
+            image = read_image_Numpy(path)
+            self.assertEqual(image.shape, self._image.shape[:2])
+            np.testing.assert_allclose(
+                image,
+                self._image[..., 0],
+                atol=BIT_DEPTH_TOLERANCES[bit_depth] + 1e-7)
+
+    def test_read_image_Numpy_strips(self):
+        """
+        Tests :func:`colour.io.image.read_image_Numpy` definition with
+        non-contiguous strips *TIFF* files.
+        """
+
+        image = (self._image * 255).astype(np.uint8)
+        path = os.path.join(self._temporary_directory, 'Strips.tif')
+        _write_strips_tiff(image, path, 5)
+
+        np.testing.assert_equal(read_image_Numpy(path, 'uint8'), image)
+
+        for region in (np.s_[6:17, 2:9], np.s_[36:0:-3], np.s_[12],
+                       np.s_[4:4]):
+            np.testing.assert_equal(
+                read_image_Numpy(path, 'uint8', region), image[region])
+
+    def test_read_image_Numpy_bit_depth_conversion(self):
+        """
+        Tests :func:`colour.io.image.read_image_Numpy` definition bit depth
+        conversion.
+        """
+
+        path = os.path.join(self._temporary_directory, 'Image.ppm')
+        write_image_Numpy(self._image, path, 'uint8')
+
+        image = read_image_Numpy(path, 'uint8')
+        np.testing.assert_equal(
+            read_image_Numpy(path, 'uint16'),
+            image.astype(np.uint16) * 257)
+
+        path = os.path.join(self._temporary_directory, 'Image.pgm')
+        with open(path, 'wb') as file_:
+            file_.write(b'P5\n# Comment\n2 1\n1023\n\x03\xff\x00\x00')
+
+        np.testing.assert_allclose(
+            read_image_Numpy(path), np.array([[1, 0]]), atol=1e-7)
+
+    def test_raise_exception_read_image_Numpy(self):
+        """
+        Tests :func:`colour.io.image.read_image_Numpy` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, read_image_Numpy,
+                          os.path.join(self._temporary_directory,
+                                       'Image.exr'))
+
+        path = os.path.join(self._temporary_directory, 'Image.ppm')
+        with open(path, 'wb') as file_:
+            file_.write(b'P3\n1 1\n255\n0 0 0\n')
+
+        self.assertRaises(RuntimeError, read_image_Numpy, path)
+
+        path = os.path.join(self._temporary_directory, 'Image.tif')
+        with open(path, 'wb') as file_:
+            file_.write(b'\x89PNG\r\n\x1a\n')
+
+        self.assertRaises(RuntimeError, read_image_Numpy, path)
+
+
+class TestWriteImageNumpy(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.write_image_Numpy` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._image = np.random.RandomState(4).uniform(0, 1, (37, 23, 3))
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_image_Numpy(self):
+        """
+        Tests :func:`colour.io.image.write_image_Numpy` definition.
+        """
+
+        image = np.copy(self._image)
+        path = os.path.join(self._temporary_directory, 'Image.ppm')
+        self.assertTrue(write_image_Numpy(image, path, 'uint8'))
+        np.testing.assert_equal(image, self._image)
+
+        with open(path, 'rb') as file_:
+            self.assertEqual(file_.read(13), b'P6\n23 37\n255\n')
+
+        np.testing.assert_equal(
+            read_image_Numpy(path, 'uint8'),
+            np.around(self._image * 255).astype(np.uint8))
+
+        path = os.path.join(self._temporary_directory, 'Image.tif')
+        write_image_Numpy(
+            (self._image * 65535).astype(np.uint16), path, 'uint16')
+        np.testing.assert_allclose(
+            read_image_Numpy(path), self._image, atol=1 / 65535)
+
+    def test_write_image_Numpy_region(self):
+        """
+        Tests :func:`colour.io.image.write_image_Numpy` definition with a
+        region of interest.
+        """
+
+        for extension, bit_depth in IMAGE_FORMATS:
+            path = os.path.join(self._temporary_directory,
+                                '{0}{1}'.format(bit_depth, extension))
+            write_image_Numpy(self._image, path, bit_depth)
+
+            region = np.s_[30:35, 2:22:3]
+            self.assertTrue(
+                write_image_Numpy(
+                    np.ones((5, 7, 3)), path, bit_depth, region=region))
+
+            image = np.copy(self._image)
+            image[region] = 1
+            np.testing.assert_allclose(
+                read_image_Numpy(path),
+                image,
+                atol=BIT_DEPTH_TOLERANCES[bit_depth] + 1e-7)
+
+    def test_raise_exception_write_image_Numpy(self):
+        """
+        Tests :func:`colour.io.image.write_image_Numpy` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, write_image_Numpy, self._image,
+                          os.path.join(self._temporary_directory,
+                                       'Image.pfm'), 'uint8')
+
+        self.assertRaises(ValueError, write_image_Numpy, self._image,
+                          os.path.join(self._temporary_directory,
+                                       'Image.pgm'), 'uint8')
+
+        path = os.path.join(self._temporary_directory, 'Strips.tif')
+        _write_strips_tiff((self._image * 255).astype(np.uint8), path, 5)
+
+        self.assertRaises(
+            RuntimeError,
+            write_image_Numpy,
+            np.zeros((2, 2, 3)),
+            path,
+            region=np.s_[0:2, 0:2])
+
+
+class TestReadImage(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.read_image` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_image(self):
+        """
+        Tests :func:`colour.io.image.read_image` definition.
+        """
+
+        image = np.random.RandomState(4).uniform(0, 1, (8, 8, 3))
+        path = os.path.join(self._temporary_directory, 'Image.npy')
+        self.assertTrue(write_image(image, path, method='Numpy'))
+
+        np.testing.assert_allclose(
+            read_image(path, method='Numpy'), image, atol=1e-7)
+
+        np.testing.assert_allclose(
+            read_image(path, region=np.s_[2:4]), image[2:4], atol=1e-7)
+
+        self.assertRaises(KeyError, read_image, path, method='PIL')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,9 +12,13 @@ import unittest
 import tempfile
 from six import PY2, text_type
 
-from colour.colorimetry import SpectralPowerDistribution
-from colour.io import (read_spectral_data_from_csv_file,
-                       read_spds_from_csv_file, write_spds_to_csv_file)
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
+from colour.io import (
+    read_spectral_array_from_csv_file, read_spectral_data_from_csv_file,
+    read_spds_from_csv_file, read_multi_spd_from_csv_file,
+    write_spectral_array_to_csv_file, write_spds_to_csv_file,
+    write_multi_spd_to_csv_file)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -25,8 +29,10 @@ __status__ = 'Production'
 
 __all__ = [
     'RESOURCES_DIRECTORY', 'COLOURCHECKER_N_OHTA_1',
-    'TestReadSpectralDataFromCsvFile', 'TestReadSpdsFromCsvFile',
-    'TestWriteSpdsToCsvFile'
+    'TestReadSpectralArrayFromCsvFile', 'TestReadSpectralDataFromCsvFile',
+    'TestReadSpdsFromCsvFile', 'TestReadMultiSpdFromCsvFile',
+    'TestWriteSpectralArrayToCsvFile', 'TestWriteSpdsToCsvFile',
+    'TestWriteMultiSpdToCsvFile'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -116,6 +122,146 @@ COLOURCHECKER_N_OHTA_1 = {
 }
 
 
+class TestReadSpectralArrayFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+    definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        wavelengths, values, labels = read_spectral_array_from_csv_file(
+            colour_checker_n_ohta)
+        self.assertTupleEqual(values.shape, (81, 24))
+        self.assertListEqual(labels, [text_type(i) for i in range(1, 25)])
+        np.testing.assert_equal(wavelengths, np.arange(380, 785, 5))
+        np.testing.assert_almost_equal(
+            values[:, 0],
+            np.array([
+                COLOURCHECKER_N_OHTA_1[wavelength]
+                for wavelength in sorted(COLOURCHECKER_N_OHTA_1)
+            ]),
+            decimal=7)
+
+        wavelengths, values, labels = read_spectral_array_from_csv_file(
+            colour_checker_n_ohta, columns=['24', '1'])
+        self.assertListEqual(labels, ['24', '1'])
+        np.testing.assert_almost_equal(
+            values[:2], np.array([[0.032, 0.048], [0.033, 0.051]]), decimal=7)
+
+        linss2_10e_5 = os.path.join(RESOURCES_DIRECTORY, 'linss2_10e_5.csv')
+        wavelengths, values, labels = read_spectral_array_from_csv_file(
+            linss2_10e_5, fields=['wavelength', 'l_bar', 'm_bar', 's_bar'])
+        self.assertListEqual(labels, ['l_bar', 'm_bar', 's_bar'])
+        np.testing.assert_almost_equal(
+            values[0],
+            np.array([4.15003e-04, 3.68349e-04, 9.54729e-03]),
+            decimal=10)
+
+    def test_raise_exception_read_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+        definition raised exception.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        self.assertRaises(
+            KeyError,
+            read_spectral_array_from_csv_file,
+            colour_checker_n_ohta,
+            columns=['25'])
+
+        self.assertRaises(
+            RuntimeError,
+            read_spectral_array_from_csv_file,
+            colour_checker_n_ohta,
+            fields=['wavelength'])
+
+    def test_nan_read_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+        definition handling of missing and non-numeric values.
+        """
+
+        path = os.path.join(self._temporary_directory, 'missing.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a,b\n'
+                           '400,1.0,\n'
+                           '410,N/A,2.0\n'
+                           '420,3.0,4.0\n')
+
+        wavelengths, values, labels = read_spectral_array_from_csv_file(path)
+        np.testing.assert_equal(wavelengths, np.array([400, 410, 420]))
+        np.testing.assert_equal(
+            values, np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 4.0]]))
+
+        wavelengths, values, labels = read_spectral_array_from_csv_file(
+            path, default=np.nan)
+        np.testing.assert_equal(
+            values, np.array([[1.0, np.nan], [np.nan, 2.0], [3.0, 4.0]]))
+
+        path = os.path.join(self._temporary_directory, 'short.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a,b\n'
+                           '400,1.0,nan\n'
+                           '410,0.3\n'
+                           '420,3.0,4.0\n')
+
+        wavelengths, values, labels = read_spectral_array_from_csv_file(path)
+        np.testing.assert_equal(wavelengths, np.array([400, 410, 420]))
+        np.testing.assert_equal(
+            values, np.array([[1.0, np.nan], [0.3, 0.0], [3.0, 4.0]]))
+
+        wavelengths, values, labels = read_spectral_array_from_csv_file(
+            path, columns=['b'], default=-1)
+        np.testing.assert_equal(values, np.array([[np.nan], [-1], [4.0]]))
+
+    def test_quoted_read_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+        definition handling of quoted values.
+        """
+
+        path = os.path.join(self._temporary_directory, 'quoted.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('"wavelength","a","b"\n'
+                           '"400","0.1","0.2"\n'
+                           '"410",0.3,"0.4"\n')
+
+        wavelengths, values, labels = read_spectral_array_from_csv_file(path)
+        self.assertListEqual(labels, ['a', 'b'])
+        np.testing.assert_equal(wavelengths, np.array([400, 410]))
+        np.testing.assert_equal(values, np.array([[0.1, 0.2], [0.3, 0.4]]))
+
+        path = os.path.join(self._temporary_directory, 'nan.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a\n' '400,nan\n' '410,0.5\n')
+
+        wavelengths, values, labels = read_spectral_array_from_csv_file(path)
+        np.testing.assert_equal(values, np.array([[np.nan], [0.5]]))
+
+
 class TestReadSpectralDataFromCsvFile(unittest.TestCase):
     """
     Defines :func:`colour.io.tabular.read_spectral_data_from_csv_file`
@@ -170,6 +316,84 @@ class TestReadSpdsFromCsvFile(unittest.TestCase):
                              COLOURCHECKER_N_OHTA_1, name='1'))
 
 
+class TestReadMultiSpdFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.read_multi_spd_from_csv_file` definition
+    units tests methods.
+    """
+
+    def test_read_multi_spd_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_multi_spd_from_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        multi_spd = read_multi_spd_from_csv_file(colour_checker_n_ohta)
+        self.assertIsInstance(multi_spd, MultiSpectralPowerDistribution)
+
+        spds = read_spds_from_csv_file(colour_checker_n_ohta)
+        self.assertListEqual(list(multi_spd.labels), list(spds.keys()))
+        for i, spd in enumerate(spds.values()):
+            np.testing.assert_equal(multi_spd.values[:, i], spd.values)
+
+        multi_spd = read_multi_spd_from_csv_file(
+            colour_checker_n_ohta, columns=['3', '1'])
+        self.assertListEqual(list(multi_spd.labels), ['3', '1'])
+        np.testing.assert_equal(multi_spd.values[:, 1], spds['1'].values)
+
+
+class TestWriteSpectralArrayToCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.write_spectral_array_to_csv_file`
+    definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_spectral_array_to_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.write_spectral_array_to_csv_file`
+        definition.
+        """
+
+        wavelengths = np.arange(380, 790, 10)
+        values = np.random.RandomState(4).random_sample(
+            (wavelengths.size, 2500))
+        labels = ['Sample {0}'.format(i) for i in range(values.shape[-1])]
+        path = os.path.join(self._temporary_directory, 'array.csv')
+        write_spectral_array_to_csv_file(wavelengths, values, labels, path)
+
+        wavelengths_t, values_t, labels_t = (
+            read_spectral_array_from_csv_file(path))
+        np.testing.assert_equal(wavelengths_t, wavelengths)
+        np.testing.assert_equal(values_t, values)
+        self.assertListEqual(labels_t, labels)
+
+    def test_raise_exception_write_spectral_array_to_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.write_spectral_array_to_csv_file`
+        definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'array.csv')
+        self.assertRaises(RuntimeError, write_spectral_array_to_csv_file,
+                          np.arange(3), np.ones((3, 2)), ['a'], path)
+
+
 class TestWriteSpdsToCsvFile(unittest.TestCase):
     """
     Defines :func:`colour.io.tabular.write_spds_to_csv_file` definition units
@@ -220,5 +444,50 @@ class TestWriteSpdsToCsvFile(unittest.TestCase):
         self.assertEqual(len(spds_test), 1)
 
 
+class TestWriteMultiSpdToCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.write_multi_spd_to_csv_file` definition
+    units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_multi_spd_to_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.write_multi_spd_to_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        multi_spd = read_multi_spd_from_csv_file(colour_checker_n_ohta)
+        colour_checker_n_ohta_test = os.path.join(self._temporary_directory,
+                                                  'colorchecker_n_ohta.csv')
+        write_multi_spd_to_csv_file(multi_spd, colour_checker_n_ohta_test)
+        multi_spd_test = read_multi_spd_from_csv_file(
+            colour_checker_n_ohta_test)
+        self.assertListEqual(
+            list(multi_spd_test.labels), list(multi_spd.labels))
+        np.testing.assert_equal(multi_spd_test.values, multi_spd.values)
+
+        write_multi_spd_to_csv_file(
+            multi_spd, colour_checker_n_ohta_test, fields=['2', '1'])
+        multi_spd_test = read_multi_spd_from_csv_file(
+            colour_checker_n_ohta_test)
+        self.assertListEqual(list(multi_spd_test.labels), ['2', '1'])
+
+
 if __name__ == '__main__':
     unittest.main()
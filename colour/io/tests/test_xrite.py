@@ -5,11 +5,15 @@ Defines unit tests for :mod:`colour.io.xrite` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import os
+import shutil
+import tempfile
 import unittest
 
 from colour.colorimetry import SpectralPowerDistribution
-from colour.io import read_spds_from_xrite_file
+from colour.io import (read_spectral_batches_from_xrite_file,
+                       read_spds_from_xrite_file)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -19,7 +23,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'RESOURCES_DIRECTORY', 'COLOURCHECKER_XRITE_1', 'TestReadSpdsFromXRiteFile'
+    'RESOURCES_DIRECTORY', 'COLOURCHECKER_XRITE_1', 'CGATS_FILE_CONTENT',
+    'TestReadSpectralBatchesFromXRiteFile', 'TestReadSpdsFromXRiteFile'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -63,6 +68,100 @@ COLOURCHECKER_XRITE_1 = {
     730.0: 0.0065
 }
 
+CGATS_FILE_CONTENT = """CGATS.17
+ORIGINATOR	"Colour"
+NUMBER_OF_FIELDS	9
+BEGIN_DATA_FORMAT
+SAMPLE_ID	SAMPLE_NAME	XYZ_X	XYZ_Y	XYZ_Z	LAB_L
+LAB_A	LAB_B	SPECTRAL_NM400	SPECTRAL_NM500	SPECTRAL_NM600
+END_DATA_FORMAT
+NUMBER_OF_SETS	3
+BEGIN_DATA
+1	"Dark Skin"	11.52	10.00	6.80	37.99	13.56	14.06	0.05	0.06	0.12
+2	"Light Skin"	38.54	35.00	26.66	65.71	18.13	17.81	0.20	0.25	0.45
+3	"Blue Sky"	17.38	19.00	33.59	49.93	-4.88	-21.93	0.32	0.24	0.11
+END_DATA
+"""
+
+
+class TestReadSpectralBatchesFromXRiteFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.xrite.read_spectral_batches_from_xrite_file`
+    definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_spectral_batches_from_xrite_file(self):
+        """
+        Tests :func:`colour.io.xrite.read_spectral_batches_from_xrite_file`
+        definition.
+        """
+
+        colour_checker_xrite = os.path.join(RESOURCES_DIRECTORY,
+                                            'xrite_digital_colour_checker.txt')
+        batches = list(
+            read_spectral_batches_from_xrite_file(colour_checker_xrite, 3))
+        self.assertListEqual([len(batch.names) for batch in batches],
+                             [3, 3, 3, 1])
+        self.assertListEqual(batches[0].names, ['X1', 'X2', 'X3'])
+        self.assertTupleEqual(batches[0].values.shape, (3, 36))
+        np.testing.assert_equal(batches[0].wavelengths,
+                                np.arange(380, 740, 10))
+        np.testing.assert_equal(batches[0].values[0], [
+            COLOURCHECKER_XRITE_1[wavelength]
+            for wavelength in sorted(COLOURCHECKER_XRITE_1)
+        ])
+        self.assertIsNone(batches[0].XYZ)
+        self.assertIsNone(batches[0].Lab)
+
+        path = os.path.join(self._temporary_directory, 'cgats.txt')
+        with open(path, 'w') as cgats_file:
+            cgats_file.write(CGATS_FILE_CONTENT)
+
+        batch, = list(read_spectral_batches_from_xrite_file(path))
+        self.assertListEqual(batch.names,
+                             ['Dark Skin', 'Light Skin', 'Blue Sky'])
+        np.testing.assert_equal(batch.wavelengths, np.array([400, 500, 600]))
+        np.testing.assert_equal(
+            batch.values,
+            np.array([[0.05, 0.06, 0.12], [0.20, 0.25, 0.45],
+                      [0.32, 0.24, 0.11]]))
+        np.testing.assert_equal(
+            batch.XYZ,
+            np.array([[11.52, 10.00, 6.80], [38.54, 35.00, 26.66],
+                      [17.38, 19.00, 33.59]]))
+        np.testing.assert_equal(
+            batch.Lab,
+            np.array([[37.99, 13.56, 14.06], [65.71, 18.13, 17.81],
+                      [49.93, -4.88, -21.93]]))
+
+    def test_raise_exception_read_spectral_batches_from_xrite_file(self):
+        """
+        Tests :func:`colour.io.xrite.read_spectral_batches_from_xrite_file`
+        definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'cgats.txt')
+        with open(path, 'w') as cgats_file:
+            cgats_file.write(
+                CGATS_FILE_CONTENT.replace('\t0.45\n', '\n'))
+
+        self.assertRaises(RuntimeError, list,
+                          read_spectral_batches_from_xrite_file(path))
+
 
 class TestReadSpdsFromXRiteFile(unittest.TestCase):
     """
@@ -6,13 +6,15 @@ X-Rite Data Input
 Defines input object for *X-Rite* spectral data files:
 
 -   :func:`colour.read_spds_from_xrite_file`
+-   :func:`colour.io.read_spectral_batches_from_xrite_file`
 """
 
 from __future__ import division, unicode_literals
 
 import codecs
+import numpy as np
 import re
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 
 from colour.colorimetry import SpectralPowerDistribution
 from colour.constants import DEFAULT_FLOAT_DTYPE
@@ -24,10 +26,234 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['XRITE_FILE_ENCODING', 'read_spds_from_xrite_file']
+__all__ = [
+    'XRITE_FILE_ENCODING', 'XRITE_BATCH_SIZE', 'XRite_SpectralDataBatch',
+    'read_spectral_batches_from_xrite_file', 'read_spds_from_xrite_file'
+]
 
 XRITE_FILE_ENCODING = 'utf-8'
 
+XRITE_BATCH_SIZE = 1024
+"""
+Default patches count of the batches yielded by
+:func:`colour.io.read_spectral_batches_from_xrite_file` definition.
+
+XRITE_BATCH_SIZE : integer
+"""
+
+_XRITE_SPECTRAL_FIELD_PATTERN = re.compile(
+    '^(?:SPECTRAL_)?(?:NM_?)?(\\d+(?:\\.\\d+)?)$', re.IGNORECASE)
+"""
+Pattern matching the spectral data fields names, e.g. *nm380*,
+*SPECTRAL_NM380* or *SPECTRAL_NM_380*.
+
+_XRITE_SPECTRAL_FIELD_PATTERN : object
+"""
+
+_XRITE_NAME_FIELDS = ('SAMPLE_NAME', 'SAMPLE_ID', 'SAMPLEID')
+"""
+Fields names used for the patches names, by order of preference.
+
+_XRITE_NAME_FIELDS : tuple
+"""
+
+_XRITE_COLORIMETRIC_FIELDS = {
+    'XYZ': ('XYZ_X', 'XYZ_Y', 'XYZ_Z'),
+    'Lab': ('LAB_L', 'LAB_A', 'LAB_B')
+}
+"""
+Colorimetric fields names triplets read along the spectral data.
+
+_XRITE_COLORIMETRIC_FIELDS : dict
+"""
+
+
+class XRite_SpectralDataBatch(
+        namedtuple('XRite_SpectralDataBatch',
+                   ('names', 'wavelengths', 'values', 'XYZ', 'Lab'))):
+    """
+    Defines a batch of patches read from an *X-Rite* / *CGATS.17* file.
+
+    Parameters
+    ----------
+    names : list
+        Patches names.
+    wavelengths : ndarray
+        Wavelengths of the spectral data of shape (bins, ).
+    values : ndarray
+        Spectral data of shape (N, bins).
+    XYZ : ndarray
+        *CIE XYZ* tristimulus values of shape (N, 3) or *None* if the file
+        doesn't define the *XYZ_X*, *XYZ_Y* and *XYZ_Z* fields.
+    Lab : ndarray
+        *CIE L\*a\*b\** colourspace array of shape (N, 3) or *None* if the
+        file doesn't define the *LAB_L*, *LAB_A* and *LAB_B* fields.
+    """
+
+
+def _tokenise_xrite_line(line):
+    """
+    Splits given *X-Rite* / *CGATS.17* file line into tokens, quoted tokens
+    being allowed to contain whitespaces.
+
+    Parameters
+    ----------
+    line : unicode
+        Line to split.
+
+    Returns
+    -------
+    list
+        Line tokens.
+    """
+
+    if '"' not in line:
+        return line.split()
+
+    return [
+        token.strip('"') for token in re.findall('"[^"]*"|\\S+', line)
+    ]
+
+
+def _xrite_spectral_data_batch(rows, fields):
+    """
+    Converts given *X-Rite* / *CGATS.17* data rows to a
+    :class:`colour.io.XRite_SpectralDataBatch` class instance.
+
+    Parameters
+    ----------
+    rows : list
+        Data rows tokens.
+    fields : list
+        Data format fields names.
+
+    Returns
+    -------
+    XRite_SpectralDataBatch
+        Spectral data batch.
+    """
+
+    tokens = np.array(rows)
+    upper_fields = [field.upper() for field in fields]
+
+    spectral_indexes, wavelengths = [], []
+    for i, field in enumerate(fields):
+        match = _XRITE_SPECTRAL_FIELD_PATTERN.match(field)
+        if match:
+            spectral_indexes.append(i)
+            wavelengths.append(DEFAULT_FLOAT_DTYPE(match.group(1)))
+
+    names = None
+    for name_field in _XRITE_NAME_FIELDS:
+        if name_field in upper_fields:
+            names = tokens[:, upper_fields.index(name_field)].tolist()
+            break
+
+    if names is None:
+        names = tokens[:, 0].tolist()
+
+    colorimetry = {}
+    for key, triplet in _XRITE_COLORIMETRIC_FIELDS.items():
+        if all(field in upper_fields for field in triplet):
+            colorimetry[key] = tokens[:, [
+                upper_fields.index(field) for field in triplet
+            ]].astype(DEFAULT_FLOAT_DTYPE)
+        else:
+            colorimetry[key] = None
+
+    return XRite_SpectralDataBatch(
+        names,
+        np.array(wavelengths, dtype=DEFAULT_FLOAT_DTYPE),
+        tokens[:, spectral_indexes].astype(DEFAULT_FLOAT_DTYPE),
+        colorimetry['XYZ'], colorimetry['Lab'])
+
+
+def read_spectral_batches_from_xrite_file(path, batch_size=XRITE_BATCH_SIZE):
+    """
+    Reads the spectral data from given *X-Rite* / *CGATS.17* file and yields
+    it as fixed-size batches of patches.
+
+    The file is read line by line and only the data rows of the current batch
+    are retained, thus arbitrarily large files are processed in constant
+    memory.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *X-Rite* / *CGATS.17* file path.
+    batch_size : integer, optional
+        Patches count of the yielded batches, the last batch of a data table
+        might be smaller.
+
+    Yields
+    ------
+    XRite_SpectralDataBatch
+        Patches names, wavelengths, spectral data of shape (N, bins) and *CIE
+        XYZ* tristimulus values and *CIE L\*a\*b\** colourspace arrays if
+        defined.
+
+    Raises
+    ------
+    RuntimeError
+        If a data row fields count doesn't match the data format fields count.
+
+    Notes
+    -----
+    -   Every data table, i.e. *BEGIN_DATA_FORMAT* / *END_DATA* block pair, of
+        the file is read, batches never span multiple tables.
+
+    Examples
+    --------
+    >>> import os
+    >>> xrite_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                           'resources',
+    ...                           'xrite_digital_colour_checker.txt')
+    >>> batches = read_spectral_batches_from_xrite_file(xrite_file, 4)
+    >>> batch = next(batches)
+    >>> print(batch.names)  # doctest: +SKIP
+    ['X1', 'X2', 'X3', 'X4']
+    >>> batch.values.shape
+    (4, 36)
+    >>> [len(batch.names) for batch in batches]
+    [4, 2]
+    """
+
+    with codecs.open(path, encoding=XRITE_FILE_ENCODING) as xrite_file:
+        fields, rows = [], []
+        is_spectral_data_format, is_spectral_data = False, False
+        for line in xrite_file:
+            line = line.strip()
+
+            if line == 'BEGIN_DATA_FORMAT':
+                fields = []
+                is_spectral_data_format = True
+            elif line == 'END_DATA_FORMAT':
+                is_spectral_data_format = False
+            elif line == 'BEGIN_DATA':
+                is_spectral_data = True
+            elif line == 'END_DATA':
+                is_spectral_data = False
+                if rows:
+                    yield _xrite_spectral_data_batch(rows, fields)
+                    rows = []
+            elif is_spectral_data_format:
+                fields.extend(_tokenise_xrite_line(line))
+            elif is_spectral_data and line:
+                tokens = _tokenise_xrite_line(line)
+                if len(tokens) != len(fields):
+                    raise RuntimeError(
+                        ('"{0}" data row defines {1} fields but the data '
+                         'format defines {2} fields!').format(
+                             line, len(tokens), len(fields)))
+
+                rows.append(tokens)
+                if len(rows) == batch_size:
+                    yield _xrite_spectral_data_batch(rows, fields)
+                    rows = []
+
+        if rows:
+            yield _xrite_spectral_data_batch(rows, fields)
+
 
 def read_spds_from_xrite_file(path):
     """
@@ -61,37 +287,10 @@ def read_spds_from_xrite_file(path):
     ['X1', 'X2', 'X3', 'X4', 'X5', 'X6', 'X7', 'X8', 'X9', 'X10']
     """
 
-    with codecs.open(path, encoding=XRITE_FILE_ENCODING) as xrite_file:
-        lines = xrite_file.read().strip().split('\n')
-
-        xrite_spds = OrderedDict()
-        is_spectral_data_format, is_spectral_data = False, False
-        for line in lines:
-            line = line.strip()
-
-            if line == 'END_DATA_FORMAT':
-                is_spectral_data_format = False
-
-            if line == 'END_DATA':
-                is_spectral_data = False
-
-            if is_spectral_data_format:
-                wavelengths = [
-                    DEFAULT_FLOAT_DTYPE(x)
-                    for x in re.findall('nm(\d+)', line)
-                ]
-                index = len(wavelengths)
-
-            if is_spectral_data:
-                tokens = line.split()
-                values = [DEFAULT_FLOAT_DTYPE(x) for x in tokens[-index:]]
-                xrite_spds[tokens[1]] = (SpectralPowerDistribution(
-                    dict(zip(wavelengths, values)), name=tokens[1]))
-
-            if line == 'BEGIN_DATA_FORMAT':
-                is_spectral_data_format = True
-
-            if line == 'BEGIN_DATA':
-                is_spectral_data = True
+    xrite_spds = OrderedDict()
+    for batch in read_spectral_batches_from_xrite_file(path):
+        for name, values in zip(batch.names, batch.values):
+            xrite_spds[name] = SpectralPowerDistribution(
+                values, batch.wavelengths, name=name)
 
-        return xrite_spds
+    return xrite_spds
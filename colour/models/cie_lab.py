@@ -31,7 +31,7 @@ from colour.algebra import cartesian_to_polar, polar_to_cartesian
 from colour.colorimetry import ILLUMINANTS
 from colour.constants import CIE_E, CIE_K
 from colour.models import xy_to_xyY, xyY_to_XYZ
-from colour.utilities import tsplit, tstack
+from colour.utilities import as_float_array, float_dtype, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -81,7 +81,8 @@ def XYZ_to_Lab(
     """
 
     XYZ = np.asarray(XYZ)
-    XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
+    XYZ_r = as_float_array(
+        xyY_to_XYZ(xy_to_xyY(illuminant)), float_dtype(XYZ))
 
     XYZ_f = XYZ / XYZ_r
 
@@ -136,8 +137,10 @@ def Lab_to_XYZ(
     array([ 0.0704953...,  0.1008    ,  0.0955831...])
     """
 
+    Lab = np.asarray(Lab)
     L, a, b = tsplit(Lab)
-    XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
+    XYZ_r = as_float_array(
+        xyY_to_XYZ(xy_to_xyY(illuminant)), float_dtype(Lab))
 
     f_y = (L + 16) / 116
     f_x = a / 500 + f_y
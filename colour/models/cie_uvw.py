@@ -25,7 +25,7 @@ from __future__ import division, unicode_literals
 from colour.colorimetry import ILLUMINANTS
 from colour.models import (UCS_to_uv, UCS_uv_to_xy, XYZ_to_UCS, XYZ_to_xyY,
                            xy_to_UCS_uv, xyY_to_XYZ, xyY_to_xy)
-from colour.utilities import tsplit, tstack
+from colour.utilities import as_float_array, float_dtype, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -81,6 +81,8 @@ def XYZ_to_UVW(
     array([-28.0579733...,  -0.8819449...,  37.0041149...])
     """
 
+    illuminant = as_float_array(illuminant, float_dtype(XYZ))
+
     xyY = XYZ_to_xyY(XYZ, xyY_to_xy(illuminant))
     _x, _y, Y = tsplit(xyY)
 
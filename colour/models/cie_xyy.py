@@ -33,8 +33,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.colorimetry import ILLUMINANTS
-from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import tsplit, tstack
+from colour.utilities import as_float_array, float_dtype, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -87,9 +86,9 @@ def XYZ_to_xyY(
 
     XYZ = np.asarray(XYZ)
     X, Y, Z = tsplit(XYZ)
-    xy_w = np.asarray(illuminant)
+    xy_w = as_float_array(illuminant, float_dtype(XYZ))
 
-    XYZ_n = np.zeros(XYZ.shape)
+    XYZ_n = np.zeros(XYZ.shape, float_dtype(XYZ))
     XYZ_n[..., 0:2] = xy_w
 
     xyY = np.where(
@@ -197,7 +196,7 @@ def xy_to_xyY(xy, Y=1):
 
     x, y = tsplit(xy)
 
-    xyY = tstack((x, y, np.full(x.shape, Y, DEFAULT_FLOAT_DTYPE)))
+    xyY = tstack((x, y, np.full(x.shape, Y, float_dtype(xy))))
 
     return xyY
 
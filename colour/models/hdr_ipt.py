@@ -35,7 +35,7 @@ from colour.colorimetry import (
     luminance_Fairchild2011)
 from colour.models.ipt import (IPT_XYZ_TO_LMS_MATRIX, IPT_LMS_TO_XYZ_MATRIX,
                                IPT_LMS_TO_IPT_MATRIX, IPT_IPT_TO_LMS_MATRIX)
-from colour.utilities import dot_vector
+from colour.utilities import as_float_array, dot_vector, float_dtype
 from colour.utilities.documentation import DocstringTuple
 
 __author__ = 'Colour Developers'
@@ -171,7 +171,9 @@ def XYZ_to_hdr_IPT(XYZ, Y_s=0.2, Y_abs=100, method='Fairchild 2011'):
     else:
         lightness_callable = lightness_Fairchild2011
 
-    e = exponent_hdr_IPT(Y_s, Y_abs, method)[..., np.newaxis]
+    XYZ = np.asarray(XYZ)
+    e = exponent_hdr_IPT(Y_s, Y_abs, method)
+    e = as_float_array(e, float_dtype(XYZ))[..., np.newaxis]
 
     LMS = dot_vector(IPT_XYZ_TO_LMS_MATRIX, XYZ)
     LMS_prime = np.sign(LMS) * np.abs(lightness_callable(LMS, e))
@@ -230,7 +232,9 @@ def hdr_IPT_to_XYZ(IPT_hdr, Y_s=0.2, Y_abs=100, method='Fairchild 2011'):
     else:
         luminance_callable = luminance_Fairchild2011
 
-    e = exponent_hdr_IPT(Y_s, Y_abs, method)[..., np.newaxis]
+    IPT_hdr = np.asarray(IPT_hdr)
+    e = exponent_hdr_IPT(Y_s, Y_abs, method)
+    e = as_float_array(e, float_dtype(IPT_hdr))[..., np.newaxis]
 
     LMS = dot_vector(IPT_IPT_TO_LMS_MATRIX, IPT_hdr)
     LMS_prime = np.sign(LMS) * np.abs(luminance_callable(LMS, e))
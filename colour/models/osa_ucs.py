@@ -29,10 +29,10 @@ ist/cic/2003/00002003/00000001/art00031
 from __future__ import division, unicode_literals
 
 import numpy as np
-from scipy.optimize import fmin
 
 from colour.models import XYZ_to_xyY
-from colour.utilities import dot_vector, tsplit, tstack
+from colour.utilities import (as_float_array, dot_vector, float_dtype, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -94,6 +94,7 @@ def XYZ_to_OSA_UCS(XYZ):
     array([-4.490068...,  0.7030593...,  3.0346366...])
     """
 
+    XYZ = np.asarray(XYZ)
     x, y, Y = tsplit(XYZ_to_xyY(XYZ))
 
     Y_0 = Y * (4.4934 * x ** 2 + 4.3034 * y ** 2 - 4.276 * x * y - 1.3744 * x -
@@ -110,8 +111,8 @@ def XYZ_to_OSA_UCS(XYZ):
 
     C = Lambda / (5.9 * Y_0_es)
     L = (Lambda - 14.4) / 2 ** (1 / 2)
-    j = C * np.dot(RGB_3, np.array([1.7, 8, -9.7]))
-    g = C * np.dot(RGB_3, np.array([-13.7, 17.7, -4]))
+    j = C * np.dot(RGB_3, np.array([1.7, 8, -9.7], float_dtype(XYZ)))
+    g = C * np.dot(RGB_3, np.array([-13.7, 17.7, -4], float_dtype(XYZ)))
 
     return tstack((L, j, g))
 
@@ -175,10 +176,12 @@ def OSA_UCS_to_XYZ(Ljg, optimisation_parameters=None):
 
         return np.linalg.norm(XYZ_to_OSA_UCS(XYZ) - Ljg)
 
+    from scipy.optimize import fmin
+
     x_0 = np.array([30, 30, 30])
     XYZ = np.array([
         fmin(function_error, x_0, (Ljg_i, ), **optimisation_settings)
         for Ljg_i in Ljg
     ])
 
-    return XYZ.reshape(shape)
+    return as_float_array(XYZ.reshape(shape), float_dtype(Ljg))
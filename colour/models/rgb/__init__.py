@@ -12,13 +12,15 @@ from .transfer_functions import *  # noqa
 from . import transfer_functions
 from .dataset import *  # noqa
 from . import dataset
+from .registry import RGB_ColourspacesRegistry, RGB_COLOURSPACES_REGISTRY
 from .common import XYZ_to_sRGB, sRGB_to_XYZ
 from .aces_it import spectral_to_aces_relative_exposure_values
 from .deprecated import (RGB_to_HSV, HSV_to_RGB, RGB_to_HSL, HSL_to_RGB,
                          RGB_to_CMY, CMY_to_RGB, CMY_to_CMYK, CMYK_to_CMY)
 from .prismatic import RGB_to_Prismatic, Prismatic_to_RGB
-from .ycbcr import (YCBCR_WEIGHTS, RGB_to_YCbCr, YCbCr_to_RGB, RGB_to_YcCbcCrc,
-                    YcCbcCrc_to_RGB)
+from .ycbcr import (YCBCR_WEIGHTS, YCBCR_SUBSAMPLINGS, RGB_to_YCbCr,
+                    YCbCr_to_RGB, RGB_to_YcCbcCrc, YcCbcCrc_to_RGB,
+                    YCbCr_to_planar, planar_to_YCbCr)
 from .ycocg import RGB_to_YCoCg, YCoCg_to_RGB
 from .ictcp import RGB_to_ICTCP, ICTCP_to_RGB
 
@@ -31,6 +33,7 @@ __all__ += ['XYZ_to_RGB', 'RGB_to_XYZ']
 __all__ += ['RGB_to_RGB_matrix', 'RGB_to_RGB']
 __all__ += transfer_functions.__all__
 __all__ += dataset.__all__
+__all__ += ['RGB_ColourspacesRegistry', 'RGB_COLOURSPACES_REGISTRY']
 __all__ += ['XYZ_to_sRGB', 'sRGB_to_XYZ']
 __all__ += ['spectral_to_aces_relative_exposure_values']
 __all__ += [
@@ -39,8 +42,8 @@ __all__ += [
 ]
 __all__ += ['RGB_to_Prismatic', 'Prismatic_to_RGB']
 __all__ += [
-    'YCBCR_WEIGHTS', 'RGB_to_YCbCr', 'YCbCr_to_RGB', 'RGB_to_YcCbcCrc',
-    'YcCbcCrc_to_RGB'
+    'YCBCR_WEIGHTS', 'YCBCR_SUBSAMPLINGS', 'RGB_to_YCbCr', 'YCbCr_to_RGB',
+    'RGB_to_YcCbcCrc', 'YcCbcCrc_to_RGB', 'YCbCr_to_planar', 'planar_to_YCbCr'
 ]
 __all__ += ['RGB_to_YCoCg', 'YCoCg_to_RGB']
 __all__ += ['RGB_to_ICTCP', 'ICTCP_to_RGB']
@@ -55,7 +55,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import tsplit, tstack
+from colour.utilities import float_dtype, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -290,7 +290,7 @@ def HSL_to_RGB(HSL):
         vH[np.asarray(vH < 0)] += 1
         vH[np.asarray(vH > 1)] -= 1
 
-        v = np.full(vi.shape, np.nan)
+        v = np.full(vi.shape, np.nan, float_dtype(vi))
 
         v = np.where(
             np.logical_and(6 * vH < 1, np.isnan(v)),
@@ -421,7 +421,7 @@ def CMY_to_CMYK(CMY):
 
     C, M, Y = tsplit(CMY)
 
-    K = np.ones(C.shape)
+    K = np.ones(C.shape, float_dtype(C))
     K = np.where(C < K, C, K)
     K = np.where(M < K, M, K)
     K = np.where(Y < K, Y, K)
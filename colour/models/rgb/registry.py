@@ -0,0 +1,485 @@
+# -*- coding: utf-8 -*-
+"""
+RGB Colourspaces Registry
+=========================
+
+Defines the :class:`colour.models.RGB_ColourspacesRegistry` class memoising
+the conversion matrices and the colour component transfer functions between
+named *RGB* colourspaces and the default
+:attr:`colour.models.RGB_COLOURSPACES_REGISTRY` registry.
+
+The conversion matrices are computed on first use for every ordered pair of
+*RGB* colourspaces and *chromatic adaptation* transform, subsequent
+conversions only involve a dictionary lookup. The computed matrices table can
+be exported and imported, e.g. by worker processes, to avoid computing them
+again.
+"""
+
+from __future__ import division, unicode_literals
+
+import json
+import numpy as np
+
+from colour.models.rgb import RGB_COLOURSPACES, RGB_to_RGB_matrix
+from colour.utilities import dot_vector, is_string, warning
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['RGB_ColourspacesRegistry', 'RGB_COLOURSPACES_REGISTRY']
+
+
+class RGB_ColourspacesRegistry(object):
+    """
+    Implements a registry of named *RGB* colourspaces memoising their
+    conversion matrices and colour component transfer functions.
+
+    Parameters
+    ----------
+    colourspaces : dict_like, optional
+        *RGB* colourspaces, defaults to
+        :attr:`colour.models.RGB_COLOURSPACES` attribute.
+
+    Attributes
+    ----------
+    colourspaces
+
+    Methods
+    -------
+    matrix
+    cctfs
+    convert
+    precompute
+    clear
+    export_table
+    import_table
+
+    Notes
+    -----
+    -   The *RGB* colourspaces are assumed to be immutable once registered,
+        :meth:`colour.models.RGB_ColourspacesRegistry.clear` method must be
+        called if any of them is modified.
+
+    Examples
+    --------
+    >>> registry = RGB_ColourspacesRegistry()
+    >>> RGB = np.array([0.45620519, 0.03081071, 0.04091952])
+    >>> registry.convert(RGB, 'sRGB', 'ACEScg')  # doctest: +ELLIPSIS
+    array([ 0.2920931...,  0.0606799...,  0.0483360...])
+    >>> registry.convert(RGB, 'sRGB', 'ACEScg', 'Bradford', True, True)
+    ... # doctest: +ELLIPSIS
+    array([ 0.1086999...,  0.0145502...,  0.0066343...])
+    """
+
+    def __init__(self, colourspaces=None):
+        self._colourspaces = None
+        self.colourspaces = (RGB_COLOURSPACES
+                             if colourspaces is None else colourspaces)
+
+        self._matrices = {}
+        self._cctfs = {}
+
+    @property
+    def colourspaces(self):
+        """
+        Getter and setter property for the *RGB* colourspaces.
+
+        Parameters
+        ----------
+        value : dict_like
+            Value to set the *RGB* colourspaces with.
+
+        Returns
+        -------
+        dict_like
+            *RGB* colourspaces.
+        """
+
+        return self._colourspaces
+
+    @colourspaces.setter
+    def colourspaces(self, value):
+        """
+        Setter for the **self.colourspaces** property.
+        """
+
+        if value is not None:
+            self._colourspaces = value
+
+            self.clear()
+
+    def _colourspace(self, colourspace):
+        """
+        Returns the *RGB* colourspace with given name.
+        """
+
+        if not is_string(colourspace):
+            return colourspace
+
+        try:
+            return self._colourspaces[colourspace]
+        except KeyError:
+            raise KeyError(
+                '"{0}" colourspace is invalid, it must be one of {1}!'.format(
+                    colourspace, sorted(self._colourspaces.keys())))
+
+    def _canonical_key(self, colourspace):
+        """
+        Returns the memoisation key of given *RGB* colourspace, i.e. its name
+        if it is the registered *RGB* colourspace with that name, the *RGB*
+        colourspace itself otherwise, e.g. for a custom *RGB* colourspace
+        reusing the name of a registered one.
+        """
+
+        try:
+            if self._colourspaces[colourspace.name] is colourspace:
+                return colourspace.name
+        except KeyError:
+            pass
+
+        return colourspace
+
+    def matrix(self,
+               input_colourspace,
+               output_colourspace,
+               chromatic_adaptation_transform='CAT02'):
+        """
+        Returns the matrix :math:`M` converting from given input *RGB*
+        colourspace to output *RGB* colourspace using given *chromatic
+        adaptation* method, computing and memoising it if not existing.
+
+        Parameters
+        ----------
+        input_colourspace : unicode or RGB_Colourspace
+            *RGB* input colourspace name or *RGB* colourspace.
+        output_colourspace : unicode or RGB_Colourspace
+            *RGB* output colourspace name or *RGB* colourspace.
+        chromatic_adaptation_transform : unicode, optional
+            **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+            'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT',
+            'Bianco', 'Bianco PC'}**,
+            *Chromatic adaptation* transform.
+
+        Returns
+        -------
+        ndarray
+            Conversion matrix :math:`M`, read-only.
+
+        Raises
+        ------
+        KeyError
+            If the input or the output *RGB* colourspace is not registered.
+
+        Examples
+        --------
+        >>> registry = RGB_ColourspacesRegistry()
+        >>> registry.matrix('sRGB', 'ProPhoto RGB')  # doctest: +ELLIPSIS
+        array([[ 0.5288241...,  0.3340609...,  0.1373616...],
+               [ 0.0975294...,  0.8790074...,  0.0233981...],
+               [ 0.0163599...,  0.1066124...,  0.8772485...]])
+        """
+
+        key = (input_colourspace, output_colourspace,
+               chromatic_adaptation_transform)
+        M = self._matrices.get(key)
+        if M is not None:
+            return M
+
+        input_colourspace = self._colourspace(input_colourspace)
+        output_colourspace = self._colourspace(output_colourspace)
+
+        # Aliases, e.g. "aces" and "ACES2065-1", share the same matrices.
+        canonical_key = (self._canonical_key(input_colourspace),
+                         self._canonical_key(output_colourspace),
+                         chromatic_adaptation_transform)
+        M = self._matrices.get(canonical_key)
+        if M is None:
+            M = RGB_to_RGB_matrix(input_colourspace, output_colourspace,
+                                  chromatic_adaptation_transform)
+            M.setflags(write=False)
+            self._matrices[canonical_key] = M
+
+        self._matrices[key] = M
+
+        return M
+
+    def cctfs(self, input_colourspace, output_colourspace):
+        """
+        Returns the input *RGB* colourspace decoding colour component transfer
+        function and the output *RGB* colourspace encoding colour component
+        transfer function, memoising them if not existing.
+
+        Parameters
+        ----------
+        input_colourspace : unicode or RGB_Colourspace
+            *RGB* input colourspace name or *RGB* colourspace.
+        output_colourspace : unicode or RGB_Colourspace
+            *RGB* output colourspace name or *RGB* colourspace.
+
+        Returns
+        -------
+        tuple
+            Input *RGB* colourspace decoding colour component transfer
+            function and output *RGB* colourspace encoding colour component
+            transfer function.
+
+        Examples
+        --------
+        >>> registry = RGB_ColourspacesRegistry()
+        >>> registry.cctfs('sRGB', 'ACEScg')  # doctest: +ELLIPSIS
+        (<function oetf_reverse_sRGB at 0x...>, <function function_linear \
+at 0x...>)
+        """
+
+        key = (input_colourspace, output_colourspace)
+        cctfs = self._cctfs.get(key)
+        if cctfs is None:
+            cctfs = self._cctfs[key] = (
+                self._colourspace(input_colourspace).decoding_cctf,
+                self._colourspace(output_colourspace).encoding_cctf)
+
+        return cctfs
+
+    def convert(self,
+                RGB,
+                input_colourspace,
+                output_colourspace,
+                chromatic_adaptation_transform='CAT02',
+                apply_decoding_cctf=False,
+                apply_encoding_cctf=False):
+        """
+        Converts from given input *RGB* colourspace to output *RGB*
+        colourspace using given *chromatic adaptation* method and the
+        memoised conversion matrix.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array.
+        input_colourspace : unicode or RGB_Colourspace
+            *RGB* input colourspace name or *RGB* colourspace.
+        output_colourspace : unicode or RGB_Colourspace
+            *RGB* output colourspace name or *RGB* colourspace.
+        chromatic_adaptation_transform : unicode, optional
+            **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+            'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT',
+            'Bianco', 'Bianco PC'}**,
+            *Chromatic adaptation* transform.
+        apply_decoding_cctf : bool, optional
+            Apply input colourspace decoding colour component transfer
+            function / electro-optical transfer function.
+        apply_encoding_cctf : bool, optional
+            Apply output colourspace encoding colour component transfer
+            function / opto-electronic transfer function.
+
+        Returns
+        -------
+        ndarray
+            *RGB* colourspace array.
+
+        Notes
+        -----
+        -   The output is equal to the output of :func:`colour.RGB_to_RGB`
+            definition with the same arguments.
+
+        Examples
+        --------
+        >>> registry = RGB_ColourspacesRegistry()
+        >>> RGB = np.array([0.01103742, 0.12734226, 0.11632971])
+        >>> registry.convert(RGB, 'sRGB', 'ProPhoto RGB')
+        ... # doctest: +ELLIPSIS
+        array([ 0.0643561...,  0.1157331...,  0.1158069...])
+        """
+
+        if apply_decoding_cctf or apply_encoding_cctf:
+            decoding_cctf, encoding_cctf = self.cctfs(input_colourspace,
+                                                      output_colourspace)
+
+        if apply_decoding_cctf:
+            RGB = decoding_cctf(RGB)
+
+        RGB = dot_vector(
+            self.matrix(input_colourspace, output_colourspace,
+                        chromatic_adaptation_transform), RGB)
+
+        if apply_encoding_cctf:
+            RGB = encoding_cctf(RGB)
+
+        return RGB
+
+    def precompute(self, chromatic_adaptation_transforms=('CAT02', )):
+        """
+        Computes the conversion matrices of every ordered pair of registered
+        *RGB* colourspaces for given *chromatic adaptation* transforms.
+
+        Parameters
+        ----------
+        chromatic_adaptation_transforms : array_like, optional
+            *Chromatic adaptation* transforms.
+
+        Returns
+        -------
+        integer
+            Memoised conversion matrices count.
+
+        Examples
+        --------
+        >>> registry = RGB_ColourspacesRegistry()
+        >>> registry.precompute()
+        2209
+        """
+
+        names = sorted(
+            set(colourspace.name
+                for colourspace in self._colourspaces.values()))
+
+        for chromatic_adaptation_transform in chromatic_adaptation_transforms:
+            for input_colourspace in names:
+                for output_colourspace in names:
+                    self.matrix(input_colourspace, output_colourspace,
+                                chromatic_adaptation_transform)
+
+        return len(self._matrices)
+
+    def clear(self):
+        """
+        Clears the memoised conversion matrices and colour component transfer
+        functions.
+
+        Returns
+        -------
+        bool
+            Definition success.
+
+        Examples
+        --------
+        >>> registry = RGB_ColourspacesRegistry()
+        >>> registry.clear()
+        True
+        """
+
+        self._matrices = {}
+        self._cctfs = {}
+
+        return True
+
+    def export_table(self, path=None):
+        """
+        Exports the memoised conversion matrices table of the registered *RGB*
+        colourspaces and writes it to given *JSON* file if any.
+
+        Parameters
+        ----------
+        path : unicode, optional
+            *JSON* file path.
+
+        Returns
+        -------
+        dict
+            *JSON* serialisable conversion matrices table.
+
+        Examples
+        --------
+        >>> registry = RGB_ColourspacesRegistry()
+        >>> M = registry.matrix('sRGB', 'ACEScg')
+        >>> len(registry.export_table()['matrices'])
+        1
+        """
+
+        from colour import __version__
+
+        # Only the matrices keyed by names are serialisable, the matrices of
+        # unregistered *RGB* colourspaces are keyed by the colourspaces.
+        items = [(key, M) for key, M in self._matrices.items()
+                 if is_string(key[0]) and is_string(key[1])]
+
+        matrices = []
+        for (input_colourspace, output_colourspace,
+             chromatic_adaptation_transform), M in sorted(
+                 items, key=lambda x: x[0]):
+            if (self._colourspace(input_colourspace).name !=
+                    input_colourspace or
+                    self._colourspace(output_colourspace).name !=
+                    output_colourspace):
+                continue
+
+            matrices.append({
+                'input_colourspace': input_colourspace,
+                'output_colourspace': output_colourspace,
+                'chromatic_adaptation_transform':
+                chromatic_adaptation_transform,
+                'matrix': M.tolist(),
+            })
+
+        table = {'version': __version__, 'matrices': matrices}
+
+        if path is not None:
+            with open(path, 'w') as file_:
+                json.dump(table, file_)
+
+        return table
+
+    def import_table(self, table):
+        """
+        Imports given conversion matrices table, e.g. exported by a parent
+        process with :meth:`colour.models.RGB_ColourspacesRegistry.\
+export_table` method.
+
+        Parameters
+        ----------
+        table : dict or unicode
+            Conversion matrices table or *JSON* file path.
+
+        Returns
+        -------
+        bool
+            Whether the table has been imported, a table exported by another
+            *Colour* version is not imported.
+
+        Examples
+        --------
+        >>> registry = RGB_ColourspacesRegistry()
+        >>> M = registry.matrix('sRGB', 'ACEScg')
+        >>> table = registry.export_table()
+        >>> registry = RGB_ColourspacesRegistry()
+        >>> registry.import_table(table)
+        True
+        >>> registry.matrix('sRGB', 'ACEScg')  # doctest: +ELLIPSIS
+        array([[ 0.6131178...,  0.341182 ...,  0.0457873...],
+               [ 0.0699340...,  0.9181030...,  0.0119327...],
+               [ 0.0204629...,  0.1067686...,  0.8727159...]])
+        """
+
+        from colour import __version__
+
+        if is_string(table):
+            with open(table) as file_:
+                table = json.load(file_)
+
+        if table['version'] != __version__:
+            warning('Conversion matrices table was exported by "Colour" '
+                    '"{0}" and is ignored!'.format(table['version']))
+
+            return False
+
+        for record in table['matrices']:
+            M = np.array(record['matrix'])
+            M.setflags(write=False)
+            self._matrices[(record['input_colourspace'],
+                            record['output_colourspace'],
+                            record['chromatic_adaptation_transform'])] = M
+
+        return True
+
+
+RGB_COLOURSPACES_REGISTRY = RGB_ColourspacesRegistry()
+"""
+Default *RGB* colourspaces registry of :attr:`colour.models.RGB_COLOURSPACES`
+attribute.
+
+RGB_COLOURSPACES_REGISTRY : RGB_ColourspacesRegistry
+"""
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.models.rgb.registry` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.models import (RGB_COLOURSPACES, RGB_Colourspace,
+                           RGB_ColourspacesRegistry, RGB_to_RGB,
+                           RGB_to_RGB_matrix)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestRGB_ColourspacesRegistry']
+
+
+class TestRGB_ColourspacesRegistry(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.registry.RGB_ColourspacesRegistry` class
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._registry = RGB_ColourspacesRegistry()
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('colourspaces', )
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(RGB_ColourspacesRegistry))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('matrix', 'cctfs', 'convert', 'precompute',
+                            'clear', 'export_table', 'import_table')
+
+        for method in required_methods:
+            self.assertIn(method, dir(RGB_ColourspacesRegistry))
+
+    def test_matrix(self):
+        """
+        Tests :meth:`colour.models.rgb.registry.RGB_ColourspacesRegistry.\
+matrix` method.
+        """
+
+        arguments = (('sRGB', 'ACEScg', 'CAT02'),
+                     ('ACES2065-1', 'ProPhoto RGB', 'Bradford'),
+                     ('ITU-R BT.2020', 'sRGB', 'Von Kries'))
+        for input_colourspace, output_colourspace, cat in arguments:
+            np.testing.assert_almost_equal(
+                self._registry.matrix(input_colourspace, output_colourspace,
+                                      cat),
+                RGB_to_RGB_matrix(RGB_COLOURSPACES[input_colourspace],
+                                  RGB_COLOURSPACES[output_colourspace], cat),
+                decimal=15)
+
+        M = self._registry.matrix('sRGB', 'ACEScg')
+        self.assertIs(self._registry.matrix('sRGB', 'ACEScg'), M)
+        self.assertIs(self._registry.matrix('srgb', 'acescg'), M)
+        self.assertFalse(M.flags.writeable)
+
+        self.assertIs(
+            self._registry.matrix('aces', 'sRGB'),
+            self._registry.matrix('ACES2065-1', 'sRGB'))
+
+        self.assertIsNot(
+            self._registry.matrix('sRGB', 'ACEScg', 'Bradford'), M)
+
+        np.testing.assert_almost_equal(
+            self._registry.matrix(RGB_COLOURSPACES['sRGB'], 'ACEScg'),
+            M,
+            decimal=15)
+
+        sRGB = RGB_COLOURSPACES['sRGB']
+        colourspace = RGB_Colourspace(
+            'sRGB',
+            sRGB.primaries,
+            np.array([0.32168, 0.33767]),
+            'D60',
+            use_derived_RGB_to_XYZ_matrix=True,
+            use_derived_XYZ_to_RGB_matrix=True)
+        np.testing.assert_almost_equal(
+            self._registry.matrix(colourspace, 'ACEScg'),
+            RGB_to_RGB_matrix(colourspace, RGB_COLOURSPACES['ACEScg']),
+            decimal=15)
+        self.assertIsNot(self._registry.matrix(colourspace, 'ACEScg'), M)
+
+        self.assertRaises(KeyError, self._registry.matrix, 'sRGB', 'None')
+
+    def test_cctfs(self):
+        """
+        Tests :meth:`colour.models.rgb.registry.RGB_ColourspacesRegistry.\
+cctfs` method.
+        """
+
+        self.assertTupleEqual(
+            self._registry.cctfs('sRGB', 'ACEScc'),
+            (RGB_COLOURSPACES['sRGB'].decoding_cctf,
+             RGB_COLOURSPACES['ACEScc'].encoding_cctf))
+
+    def test_convert(self):
+        """
+        Tests :meth:`colour.models.rgb.registry.RGB_ColourspacesRegistry.\
+convert` method.
+        """
+
+        RGB = np.random.RandomState(4).uniform(0, 1, (4, 3, 3))
+
+        for input_colourspace, output_colourspace in (('sRGB', 'ACEScg'),
+                                                      ('ACEScc', 'sRGB'),
+                                                      ('sRGB', 'ACEScct')):
+            for apply_cctfs in (False, True):
+                np.testing.assert_almost_equal(
+                    self._registry.convert(
+                        RGB, input_colourspace, output_colourspace, 'CAT02',
+                        apply_cctfs, apply_cctfs),
+                    RGB_to_RGB(RGB, RGB_COLOURSPACES[input_colourspace],
+                               RGB_COLOURSPACES[output_colourspace], 'CAT02',
+                               apply_cctfs, apply_cctfs),
+                    decimal=15)
+
+    def test_precompute(self):
+        """
+        Tests :meth:`colour.models.rgb.registry.RGB_ColourspacesRegistry.\
+precompute` method.
+        """
+
+        count = len(
+            set(colourspace.name
+                for colourspace in RGB_COLOURSPACES.values())) ** 2
+
+        self.assertEqual(self._registry.precompute(), count)
+        self.assertEqual(
+            self._registry.precompute(('CAT02', 'Bradford')), count * 2)
+
+    def test_clear(self):
+        """
+        Tests :meth:`colour.models.rgb.registry.RGB_ColourspacesRegistry.\
+clear` method.
+        """
+
+        M = self._registry.matrix('sRGB', 'ACEScg')
+        self.assertTrue(self._registry.clear())
+        self.assertIsNot(self._registry.matrix('sRGB', 'ACEScg'), M)
+
+    def test_export_table(self):
+        """
+        Tests :meth:`colour.models.rgb.registry.RGB_ColourspacesRegistry.\
+export_table` and :meth:`colour.models.rgb.registry.\
+RGB_ColourspacesRegistry.import_table` methods.
+        """
+
+        self._registry.matrix('sRGB', 'ACEScg')
+        self._registry.matrix('srgb', 'ACEScc', 'Bradford')
+
+        sRGB = RGB_COLOURSPACES['sRGB']
+        colourspace = RGB_Colourspace(
+            'sRGB',
+            sRGB.primaries,
+            np.array([0.32168, 0.33767]),
+            'D60',
+            use_derived_RGB_to_XYZ_matrix=True,
+            use_derived_XYZ_to_RGB_matrix=True)
+        self._registry.matrix(colourspace, 'ACEScg')
+
+        path = os.path.join(self._temporary_directory, 'Table.json')
+        table = self._registry.export_table(path)
+        self.assertEqual(len(table['matrices']), 2)
+
+        for table in (table, path):
+            registry = RGB_ColourspacesRegistry()
+            self.assertTrue(registry.import_table(table))
+            for arguments in (('sRGB', 'ACEScg', 'CAT02'),
+                              ('sRGB', 'ACEScc', 'Bradford')):
+                np.testing.assert_almost_equal(
+                    registry._matrices[arguments],
+                    self._registry.matrix(*arguments),
+                    decimal=15)
+
+        table = self._registry.export_table()
+        table['version'] = '0.0.0'
+        self.assertFalse(RGB_ColourspacesRegistry().import_table(table))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,9 +9,9 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.models.rgb.ycbcr import (RGB_to_YCbCr, YCbCr_to_RGB,
-                                     RGB_to_YcCbcCrc, YcCbcCrc_to_RGB,
-                                     YCBCR_WEIGHTS)
+from colour.models.rgb.ycbcr import (
+    RGB_to_YCbCr, YCbCr_to_RGB, RGB_to_YcCbcCrc, YcCbcCrc_to_RGB,
+    YCbCr_to_planar, planar_to_YCbCr, YCBCR_WEIGHTS)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -23,7 +23,7 @@ __status__ = 'Development'
 
 __all__ = [
     'TestRGB_to_YCbCr', 'TestYCbCr_to_RGB', 'TestRGB_to_YcCbcCrc',
-    'TestYcCbcCrc_to_RGB'
+    'TestYcCbcCrc_to_RGB', 'TestYCbCr_to_planar', 'TestPlanar_to_YCbCr'
 ]
 
 
@@ -111,6 +111,49 @@ class TestRGB_to_YCbCr(unittest.TestCase):
             RGB = np.array(case)
             RGB_to_YCbCr(RGB)
 
+    def test_integer_RGB_to_YCbCr(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr` definition integer
+        code values conversion.
+        """
+
+        for bits in (8, 10, 12, 16):
+            RGB = np.random.RandomState(4).randint(0, 2 ** bits, (4096, 3))
+            RGB[:256] = np.arange(256)[:, np.newaxis] * 2 ** (bits - 8)
+            for K in YCBCR_WEIGHTS.values():
+                for out_legal in (True, False):
+                    np.testing.assert_equal(
+                        RGB_to_YCbCr(
+                            RGB,
+                            K=K,
+                            in_bits=bits,
+                            in_int=True,
+                            out_bits=bits,
+                            out_legal=out_legal,
+                            out_int=True),
+                        RGB_to_YCbCr(
+                            RGB.astype(np.float_),
+                            K=K,
+                            in_bits=bits,
+                            in_int=True,
+                            out_bits=bits,
+                            out_legal=out_legal,
+                            out_int=True))
+
+        RGB = np.array([[[102, 0, 51], [255, 255, 255]]], np.uint8)
+        YCbCr = np.zeros(RGB.shape, np.uint8)
+        self.assertIs(
+            RGB_to_YCbCr(
+                RGB,
+                K=YCBCR_WEIGHTS['ITU-R BT.601'],
+                in_bits=8,
+                in_int=True,
+                out_legal=False,
+                out_int=True,
+                out=YCbCr), YCbCr)
+        np.testing.assert_equal(YCbCr,
+                                np.array([[[36, 136, 175], [255, 128, 128]]]))
+
 
 class TestYCbCr_to_RGB(unittest.TestCase):
     """
@@ -190,6 +233,49 @@ class TestYCbCr_to_RGB(unittest.TestCase):
             YCbCr = np.array(case)
             YCbCr_to_RGB(YCbCr)
 
+    def test_integer_YCbCr_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YCbCr_to_RGB` definition integer
+        code values conversion.
+        """
+
+        for bits in (8, 10, 12, 16):
+            YCbCr = np.random.RandomState(4).randint(0, 2 ** bits, (4096, 3))
+            YCbCr[:256, 0] = np.arange(256) * 2 ** (bits - 8)
+            YCbCr[:256, 1:] = 2 ** (bits - 1)
+            for K in YCBCR_WEIGHTS.values():
+                for in_legal in (True, False):
+                    np.testing.assert_equal(
+                        YCbCr_to_RGB(
+                            YCbCr,
+                            K=K,
+                            in_bits=bits,
+                            in_legal=in_legal,
+                            in_int=True,
+                            out_bits=bits,
+                            out_int=True),
+                        YCbCr_to_RGB(
+                            YCbCr.astype(np.float_),
+                            K=K,
+                            in_bits=bits,
+                            in_legal=in_legal,
+                            in_int=True,
+                            out_bits=bits,
+                            out_int=True))
+
+        YCbCr = np.array([[[940, 512, 512], [502, 512, 512]]], np.uint16)
+        RGB = np.zeros(YCbCr.shape, np.uint16)
+        YCbCr_to_RGB(
+            YCbCr,
+            in_bits=10,
+            in_legal=True,
+            in_int=True,
+            out_int=True,
+            out=RGB)
+        np.testing.assert_equal(RGB,
+                                np.array([[[1023, 1023, 1023],
+                                           [512, 512, 512]]]))
+
 
 class TestRGB_to_YcCbcCrc(unittest.TestCase):
     """
@@ -334,6 +420,128 @@ class TestYcCbcCrc_to_RGB(unittest.TestCase):
             YcCbcCrc = np.array(case)
             YcCbcCrc_to_RGB(YcCbcCrc)
 
+    def test_integer_YcCbcCrc_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YcCbcCrc_to_RGB` definition
+        integer code values conversion.
+        """
+
+        for bits, is_12_bits_system in ((10, False), (12, True)):
+            YcCbcCrc = np.random.RandomState(4).randint(
+                0, 2 ** bits, (4096, 3))
+            for in_legal in (True, False):
+                np.testing.assert_equal(
+                    YcCbcCrc_to_RGB(
+                        YcCbcCrc,
+                        in_bits=bits,
+                        in_legal=in_legal,
+                        in_int=True,
+                        is_12_bits_system=is_12_bits_system),
+                    YcCbcCrc_to_RGB(
+                        YcCbcCrc.astype(np.float_),
+                        in_bits=bits,
+                        in_legal=in_legal,
+                        in_int=True,
+                        is_12_bits_system=is_12_bits_system))
+
+        RGB = np.zeros((4096, 3))
+        YcCbcCrc_to_RGB(YcCbcCrc, in_bits=12, in_int=True, out=RGB)
+        np.testing.assert_equal(
+            RGB, YcCbcCrc_to_RGB(YcCbcCrc, in_bits=12, in_int=True))
+
+
+class TestYCbCr_to_planar(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.ycbcr.YCbCr_to_planar` definition unit
+    tests methods.
+    """
+
+    def test_YCbCr_to_planar(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YCbCr_to_planar` definition.
+        """
+
+        YCbCr = np.reshape(np.arange(5 * 3 * 3), (5, 3, 3))
+
+        Y, Cb, Cr = YCbCr_to_planar(YCbCr)
+        np.testing.assert_equal(Y, YCbCr[..., 0])
+        np.testing.assert_equal(Cb, YCbCr[..., 1])
+        np.testing.assert_equal(Cr, YCbCr[..., 2])
+
+        Y, Cb, Cr = YCbCr_to_planar(YCbCr, '4:2:2')
+        np.testing.assert_equal(Y, YCbCr[..., 0])
+        np.testing.assert_equal(Cb[:, 0], YCbCr[:, 0, 1] + 2)
+        np.testing.assert_equal(Cb[:, 1], YCbCr[:, 2, 1])
+
+        Y, Cb, Cr = YCbCr_to_planar(YCbCr, '4:2:0')
+        self.assertTupleEqual(Cb.shape, (3, 2))
+        np.testing.assert_equal(Cr[0], np.array([8, 13]))
+        np.testing.assert_equal(Cr[2], np.array([40, 44]))
+
+        Y, Cb, Cr = YCbCr_to_planar(YCbCr / 10, '4:2:0')
+        np.testing.assert_almost_equal(
+            Cr[0], np.array([0.8, 1.25]), decimal=7)
+
+    def test_n_dimensional_YCbCr_to_planar(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YCbCr_to_planar` definition
+        n-dimensional arrays support.
+        """
+
+        YCbCr = np.reshape(np.arange(4 * 4 * 3), (4, 4, 3))
+        Y, Cb, Cr = YCbCr_to_planar(YCbCr, '4:2:0')
+
+        Y_t, Cb_t, Cr_t = YCbCr_to_planar(np.tile(YCbCr, (2, 1, 1, 1)),
+                                          '4:2:0')
+        np.testing.assert_equal(Y_t, np.tile(Y, (2, 1, 1)))
+        np.testing.assert_equal(Cb_t, np.tile(Cb, (2, 1, 1)))
+        np.testing.assert_equal(Cr_t, np.tile(Cr, (2, 1, 1)))
+
+
+class TestPlanar_to_YCbCr(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.ycbcr.planar_to_YCbCr` definition unit
+    tests methods.
+    """
+
+    def test_planar_to_YCbCr(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.planar_to_YCbCr` definition.
+        """
+
+        YCbCr = np.reshape(np.arange(5 * 3 * 3), (5, 3, 3))
+
+        np.testing.assert_equal(
+            planar_to_YCbCr(*YCbCr_to_planar(YCbCr)), YCbCr)
+
+        YCbCr = planar_to_YCbCr(*YCbCr_to_planar(YCbCr, '4:2:0'))
+        self.assertTupleEqual(YCbCr.shape, (5, 3, 3))
+        np.testing.assert_equal(YCbCr[0, :, 2], np.array([8, 8, 13]))
+        np.testing.assert_equal(YCbCr[4, :, 2], np.array([40, 40, 44]))
+
+        YCbCr = np.random.RandomState(4).randint(0, 1024, (4, 6, 3))
+        YCbCr[..., 1:] = 512
+        out = np.zeros(YCbCr.shape, np.uint16)
+        for subsampling in ('4:4:4', '4:2:2', '4:2:0'):
+            self.assertIs(
+                planar_to_YCbCr(
+                    *YCbCr_to_planar(YCbCr, subsampling), out=out), out)
+            np.testing.assert_equal(out, YCbCr)
+
+    def test_n_dimensional_planar_to_YCbCr(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.planar_to_YCbCr` definition
+        n-dimensional arrays support.
+        """
+
+        YCbCr = np.reshape(np.arange(4 * 4 * 3), (4, 4, 3))
+        YCbCr_u = planar_to_YCbCr(*YCbCr_to_planar(YCbCr, '4:2:2'))
+
+        np.testing.assert_equal(
+            planar_to_YCbCr(*YCbCr_to_planar(
+                np.tile(YCbCr, (2, 1, 1, 1)), '4:2:2')),
+            np.tile(YCbCr_u, (2, 1, 1, 1)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,7 +4,8 @@ from __future__ import absolute_import
 
 from colour.utilities import CaseInsensitiveMapping, filter_kwargs
 
-from .common import CV_range, legal_to_full, full_to_legal
+from .common import (CV_range, legal_to_full, full_to_legal, CV_table,
+                     CV_lookup)
 from .aces import (log_encoding_ACESproxy, log_decoding_ACESproxy,
                    log_encoding_ACEScc, log_decoding_ACEScc,
                    log_encoding_ACEScct, log_decoding_ACEScct)
@@ -46,7 +47,9 @@ from .sony_slog import (log_encoding_SLog, log_decoding_SLog,
 from .srgb import oetf_sRGB, oetf_reverse_sRGB
 from .viper_log import log_encoding_ViperLog, log_decoding_ViperLog
 
-__all__ = ['CV_range', 'legal_to_full', 'full_to_legal']
+__all__ = [
+    'CV_range', 'legal_to_full', 'full_to_legal', 'CV_table', 'CV_lookup'
+]
 __all__ += [
     'log_encoding_ACESproxy', 'log_decoding_ACESproxy', 'log_encoding_ACEScc',
     'log_decoding_ACEScc', 'log_encoding_ACEScct', 'log_decoding_ACEScct'
@@ -60,8 +60,8 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import Structure, as_numeric
+from colour.utilities import (Structure, as_float_array, as_numeric,
+                              float_dtype)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -169,8 +169,9 @@ def log_encoding_ACESproxy(lin_AP1,
 
     constants = constants[bit_depth]
 
-    CV_min = np.resize(constants.CV_min, lin_AP1.shape)
-    CV_max = np.resize(constants.CV_max, lin_AP1.shape)
+    dtype = float_dtype(lin_AP1)
+    CV_min = np.resize(constants.CV_min, lin_AP1.shape).astype(dtype)
+    CV_max = np.resize(constants.CV_max, lin_AP1.shape).astype(dtype)
 
     def float_2_cv(x):
         """
@@ -232,7 +233,7 @@ def log_decoding_ACESproxy(ACESproxy,
     0.1...
     """
 
-    ACESproxy = np.asarray(ACESproxy, dtype=DEFAULT_FLOAT_DTYPE)
+    ACESproxy = as_float_array(ACESproxy)
 
     constants = constants[bit_depth]
 
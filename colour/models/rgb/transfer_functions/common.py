@@ -3,7 +3,13 @@
 Common Transfer Functions Utilities
 ===================================
 
-Defines various transfer functions common utilities.
+Defines various transfer functions common utilities:
+
+-   :func:`colour.CV_range`
+-   :func:`colour.legal_to_full`
+-   :func:`colour.full_to_legal`
+-   :func:`colour.CV_table`
+-   :func:`colour.CV_lookup`
 
 See Also
 --------
@@ -25,7 +31,16 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['CV_range', 'legal_to_full', 'full_to_legal']
+__all__ = [
+    'CV_range', 'legal_to_full', 'full_to_legal', 'CV_table', 'CV_lookup'
+]
+
+_CV_TABLES_CACHE = {}
+"""
+Code value :math:`CV` tables cache.
+
+_CV_TABLES_CACHE : dict
+"""
 
 
 def CV_range(bit_depth=10, is_legal=False, is_int=False):
@@ -185,3 +200,126 @@ def full_to_legal(CV, bit_depth=10, in_int=False, out_int=False):
     CV = (W - B) * CV + B
 
     return np.round(CV).astype(np.int_) if out_int else CV / MV
+
+
+def CV_table(function, bit_depth=10, is_legal=False, **kwargs):
+    """
+    Returns the table of given function, e.g. a transfer function, evaluated
+    at the float equivalents of all the integer code values :math:`CV` at
+    given bit depth.
+
+    Parameters
+    ----------
+    function : callable
+        Function to evaluate.
+    bit_depth : int, optional
+        Bit depth of the integer code values :math:`CV`.
+    is_legal : bool, optional
+        Whether the integer code values :math:`CV` are legal range, i.e.
+        whether their float equivalents are computed with
+        :func:`colour.legal_to_full` definition.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments for the function.
+
+    Returns
+    -------
+    ndarray
+        Code value :math:`CV` table.
+
+    Warning
+    -------
+    The tables are cached in :attr:`colour.models.rgb.transfer_functions.\
+common._CV_TABLES_CACHE` attribute. Their identifier key is defined by the
+    function, the bit depth, the range legality and the keywords arguments,
+    thus one should be mindful that modifying the function in place will lead
+    to unexpected behaviour.
+
+    Examples
+    --------
+    >>> from colour.models import eotf_ST2084
+    >>> CV_table(eotf_ST2084, 10)[[0, 512, 1023]]  # doctest: +ELLIPSIS
+    array([     0.        ,     92.6984702...,  10000.        ])
+    """
+
+    key = (function, bit_depth, is_legal, repr(sorted(kwargs.items())))
+    table = _CV_TABLES_CACHE.get(key)
+    if table is not None:
+        return table
+
+    CV = np.arange(2 ** bit_depth)
+    CV = (legal_to_full(CV, bit_depth, True)
+          if is_legal else CV / (2 ** bit_depth - 1))
+
+    table = np.asarray(function(CV, **kwargs))
+    table.setflags(write=False)
+
+    _CV_TABLES_CACHE[key] = table
+
+    return table
+
+
+def CV_lookup(CV, function, bit_depth=10, is_legal=False, out=None, **kwargs):
+    """
+    Evaluates given function, e.g. a transfer function, at the float
+    equivalents of given integer code values :math:`CV` by table lookup.
+
+    The output is bit-exact with the function output for the float
+    equivalents of the integer code values :math:`CV`, i.e.
+    ``function(legal_to_full(CV, bit_depth, True))`` for legal range and
+    ``function(CV / (2 ** bit_depth - 1))`` for full range code values.
+
+    Parameters
+    ----------
+    CV : array_like
+        Integer code values :math:`CV`.
+    function : callable
+        Function to evaluate.
+    bit_depth : int, optional
+        Bit depth of the integer code values :math:`CV`.
+    is_legal : bool, optional
+        Whether the integer code values :math:`CV` are legal range.
+    out : ndarray, optional
+        Array the function output is written to.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments for the function.
+
+    Returns
+    -------
+    ndarray
+        Function output.
+
+    Notes
+    -----
+    -   Non integer code values :math:`CV` or code values outside the bit
+        depth range are evaluated with the function.
+
+    Examples
+    --------
+    >>> from colour.models import eotf_ST2084
+    >>> CV_lookup(np.array([64, 512, 940]), eotf_ST2084, 10, True)
+    ... # doctest: +ELLIPSIS
+    array([     0.        ,    103.3770767...,  10000.        ])
+    """
+
+    CV = np.asarray(CV)
+
+    if (np.issubdtype(CV.dtype, np.integer) and CV.size and CV.min() >= 0 and
+            CV.max() < 2 ** bit_depth):
+        return np.take(
+            CV_table(function, bit_depth, is_legal, **kwargs), CV, out=out)
+
+    CV = (legal_to_full(CV, bit_depth, True)
+          if is_legal else CV / (2 ** bit_depth - 1))
+    output = np.asarray(function(CV, **kwargs))
+    if out is None:
+        return output
+
+    out[...] = output
+
+    return out
@@ -27,7 +27,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import as_float_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -107,7 +107,7 @@ def eotf_DCDM(XYZ_p, in_int=False):
     0.18...
     """
 
-    XYZ_p = np.asarray(XYZ_p, dtype=DEFAULT_FLOAT_DTYPE)
+    XYZ_p = as_float_array(XYZ_p)
 
     if in_int:
         XYZ_p = XYZ_p / 4095
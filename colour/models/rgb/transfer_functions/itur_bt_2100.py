@@ -45,7 +45,8 @@ import numpy as np
 from colour.models.rgb.transfer_functions import (
     eotf_BT1886, eotf_ST2084, eotf_reverse_BT1886, oetf_ARIBSTDB67, oetf_BT709,
     oetf_ST2084, oetf_reverse_ARIBSTDB67, oetf_reverse_BT709)
-from colour.utilities import as_numeric, tsplit, tstack, warning
+from colour.utilities import (as_float_array, as_numeric, float_dtype, tsplit,
+                              tstack, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -511,7 +512,8 @@ def ootf_BT2100_HLG(E, L_B=0, L_W=1000, gamma=None):
     alpha = L_W - L_B
     beta = L_B
 
-    Y_S = np.sum(BT2100_HLG_WEIGHTS * tstack((R_S, G_S, B_S)), axis=-1)
+    weights = as_float_array(BT2100_HLG_WEIGHTS, float_dtype(E))
+    Y_S = np.sum(weights * tstack((R_S, G_S, B_S)), axis=-1)
 
     if gamma is None:
         gamma = function_gamma_BT2100_HLG(L_W)
@@ -575,7 +577,8 @@ def ootf_reverse_BT2100_HLG(F_D, L_B=0, L_W=1000, gamma=None):
     else:
         R_D, G_D, B_D = tsplit(F_D)
 
-    Y_D = np.sum(BT2100_HLG_WEIGHTS * tstack((R_D, G_D, B_D)), axis=-1)
+    weights = as_float_array(BT2100_HLG_WEIGHTS, float_dtype(F_D))
+    Y_D = np.sum(weights * tstack((R_D, G_D, B_D)), axis=-1)
 
     alpha = L_W - L_B
     beta = L_B
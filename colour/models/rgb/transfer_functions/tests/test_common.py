@@ -10,7 +10,7 @@ import numpy as np
 import unittest
 
 from colour.models.rgb.transfer_functions import CV_range, legal_to_full, \
-    full_to_legal
+    full_to_legal, CV_table, CV_lookup, eotf_ST2084, oetf_BT2100_HLG
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -20,7 +20,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Development'
 
-__all__ = ['TestCV_range', 'TestLegalToFull', 'TestFullToLegal']
+__all__ = [
+    'TestCV_range', 'TestLegalToFull', 'TestFullToLegal', 'TestCV_table',
+    'TestCV_lookup'
+]
 
 
 class TestCV_range(unittest.TestCase):
@@ -196,5 +199,75 @@ class TestFullToLegal(unittest.TestCase):
         full_to_legal(np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]), 10)
 
 
+class TestCV_table(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.transfer_functions.common.CV_table`
+    definition unit tests methods.
+    """
+
+    def test_CV_table(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.common.CV_table`
+        definition.
+        """
+
+        CV = np.arange(1024)
+
+        np.testing.assert_equal(
+            CV_table(eotf_ST2084, 10), eotf_ST2084(CV / 1023))
+
+        np.testing.assert_equal(
+            CV_table(eotf_ST2084, 10, True, L_p=1000),
+            eotf_ST2084(legal_to_full(CV, 10, True), L_p=1000))
+
+        table = CV_table(eotf_ST2084, 10)
+        self.assertIs(CV_table(eotf_ST2084, 10), table)
+        self.assertFalse(table.flags.writeable)
+
+
+class TestCV_lookup(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.transfer_functions.common.CV_lookup`
+    definition unit tests methods.
+    """
+
+    def test_CV_lookup(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.common.CV_lookup`
+        definition.
+        """
+
+        CV = np.random.RandomState(4).randint(0, 4096, (16, 16))
+
+        np.testing.assert_equal(
+            CV_lookup(CV, eotf_ST2084, 12, True),
+            eotf_ST2084(legal_to_full(CV, 12, True)))
+
+        np.testing.assert_equal(
+            CV_lookup(CV.astype(np.uint16), oetf_BT2100_HLG, 12),
+            oetf_BT2100_HLG(CV / 4095))
+
+        out = np.zeros(CV.shape)
+        self.assertIs(CV_lookup(CV, eotf_ST2084, 12, out=out), out)
+        np.testing.assert_equal(out, eotf_ST2084(CV / 4095))
+
+        np.testing.assert_equal(
+            CV_lookup(CV, eotf_ST2084, 10), eotf_ST2084(CV / 1023))
+
+        np.testing.assert_equal(
+            CV_lookup(CV.astype(np.float_), eotf_ST2084, 12),
+            eotf_ST2084(CV / 4095))
+
+    @ignore_numpy_errors
+    def test_nan_CV_lookup(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.common.CV_lookup`
+        definition nan support.
+        """
+
+        CV_lookup(
+            np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]), eotf_ST2084)
+
+
 if __name__ == '__main__':
     unittest.main()
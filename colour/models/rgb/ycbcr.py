@@ -9,10 +9,20 @@ Defines the *Y'CbCr* colour encoding related transformations:
 -   :func:`colour.YCbCr_to_RGB`
 -   :func:`colour.RGB_to_YcCbcCrc`
 -   :func:`colour.YcCbcCrc_to_RGB`
+-   :func:`colour.YCbCr_to_planar`
+-   :func:`colour.planar_to_YCbCr`
 
 Notes
 -----
 -   *Y'CbCr* is not an absolute colourspace.
+-   :func:`colour.RGB_to_YCbCr` and :func:`colour.YCbCr_to_RGB` definitions
+    convert integer code values to integer code values, e.g. when decoding
+    video frames, with fixed-point arithmetic. The conversions being affine,
+    their fixed-point matrix is derived from the float implementation, and
+    the few code values whose rounding cannot be decided by the fixed-point
+    error bound, e.g. exact ties, are computed with the float implementation,
+    thus the integer code values are bit-exact with the float implementation
+    ones.
 
 See Also
 --------
@@ -56,7 +66,8 @@ import numpy as np
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models.rgb.transfer_functions import (CV_range, oetf_BT2020,
                                                   eotf_BT2020)
-from colour.utilities import CaseInsensitiveMapping, tsplit, tstack
+from colour.utilities import (CaseInsensitiveMapping, float_dtype, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -66,8 +77,9 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Development'
 
 __all__ = [
-    'YCBCR_WEIGHTS', 'YCbCr_ranges', 'RGB_to_YCbCr', 'YCbCr_to_RGB',
-    'RGB_to_YcCbcCrc', 'YcCbcCrc_to_RGB'
+    'YCBCR_WEIGHTS', 'YCBCR_SUBSAMPLINGS', 'YCbCr_ranges', 'RGB_to_YCbCr',
+    'YCbCr_to_RGB', 'RGB_to_YcCbcCrc', 'YcCbcCrc_to_RGB', 'YCbCr_to_planar',
+    'planar_to_YCbCr'
 ]
 
 YCBCR_WEIGHTS = CaseInsensitiveMapping({
@@ -91,6 +103,145 @@ YCBCR_WEIGHTS : dict
     **{'ITU-R BT.601', 'ITU-R BT.709', 'ITU-R BT.2020', 'SMPTE-240M}**
 """
 
+YCBCR_SUBSAMPLINGS = CaseInsensitiveMapping({
+    '4:4:4': (1, 1),
+    '4:2:2': (1, 2),
+    '4:2:0': (2, 2)
+})
+"""
+Chroma subsampling schemes vertical and horizontal subsampling factors.
+
+YCBCR_SUBSAMPLINGS : dict
+    **{'4:4:4', '4:2:2', '4:2:0'}**
+"""
+
+_YCCBCCRC_TABLES_CACHE = {}
+"""
+*Yc'Cbc'Crc'* colour encoding integer code values tables cache.
+
+_YCCBCCRC_TABLES_CACHE : dict
+"""
+
+
+def _is_integer(a):
+    """
+    Returns whether given array is an integer array.
+    """
+
+    return np.issubdtype(a.dtype, np.integer)
+
+
+def _fill(a, out):
+    """
+    Fills given output array with given array if any, otherwise returns given
+    array.
+    """
+
+    if out is None:
+        return a
+
+    out[...] = a
+
+    return out
+
+
+def _integer_affine(a, function, out=None):
+    """
+    Applies given affine function to given integer code values array with
+    fixed-point arithmetic and rounds the result to integer code values.
+
+    The affine function matrix and offset are derived from the function
+    itself. The fixed-point rounding of a code value is exact unless the
+    fixed-point value is within the accumulated fixed-point and float error
+    bound of a tie, those code values are computed with the function and
+    rounded as the float implementation does, thus the output is bit-exact
+    with the float implementation output.
+
+    Parameters
+    ----------
+    a : ndarray
+        Integer code values array.
+    function : callable
+        Affine function of the last dimension of the code values array,
+        returning unrounded float values.
+    out : ndarray, optional
+        Output array.
+
+    Returns
+    -------
+    ndarray
+        Integer code values array.
+    """
+
+    shape = a.shape
+    a = np.reshape(a, (-1, shape[-1]))
+
+    step = 2.0 ** 16
+    basis = np.vstack([np.zeros(shape[-1]), np.identity(shape[-1]) * step])
+    values = function(basis)
+    o = values[0]
+    M = np.transpose(values[1:] - o) / step
+
+    bound = max(abs(int(a.min())), abs(int(a.max())), 1) if a.size else 1
+    magnitude = shape[-1] * np.max(np.abs(M)) * bound + np.max(np.abs(o)) + 1
+
+    def margin(F):
+        """
+        Returns the fixed-point and float error bound for given fractional
+        bits count.
+        """
+
+        return int(
+            np.ceil(shape[-1] * bound / 2 + 1 + magnitude * 2.0 ** (F - 36)))
+
+    # Using 32-bit integers, if the code values whose rounding cannot be
+    # decided remain a small fraction of the code values, halves the memory
+    # bandwidth of the fixed-point arithmetic.
+    dtype, F = np.int32, int(np.floor(np.log2(2.0 ** 30 / magnitude)))
+    if F < 8 or margin(F) > 2 ** (F - 5):
+        dtype, F = np.int64, min(
+            int(np.floor(np.log2(2.0 ** 62 / magnitude))), 52)
+
+    if F < 8:
+        values = np.round(function(a)).astype(np.int_)
+        return _fill(np.reshape(values, shape), out)
+
+    M_q = np.round(M * 2 ** F).astype(dtype)
+    o_q = np.round(o * 2 ** F).astype(dtype)
+    half, mask, margin_q = dtype(2 ** (F - 1)), dtype(2 ** F - 1), margin(F)
+
+    if out is None:
+        out = np.empty(shape, np.int_)
+    b = np.reshape(out, (-1, shape[-1]))
+
+    a = [a[..., i].astype(dtype) for i in range(shape[-1])]
+    product = np.empty(len(b), dtype)
+    undecided = np.zeros(len(b), np.bool_)
+    for i in range(shape[-1]):
+        value = np.multiply(a[0], M_q[i, 0])
+        for j in range(1, shape[-1]):
+            value += np.multiply(a[j], M_q[i, j], out=product)
+        value += o_q[i] + half
+
+        # The rounding is undecided when the fractional part of the value
+        # offset by half is within the error bound of zero.
+        np.add(value, margin_q, out=product)
+        product &= mask
+        undecided |= product <= 2 * margin_q
+
+        value >>= F
+        b[..., i] = value
+
+    undecided = np.nonzero(undecided)[0]
+    if undecided.size:
+        b[undecided] = np.round(
+            function(np.transpose([c[undecided] for c in a]))).astype(np.int_)
+
+    if not np.may_share_memory(b, out):
+        out[...] = np.reshape(b, shape)
+
+    return out
+
 
 def YCbCr_ranges(bits, is_legal, is_int):
     """"
@@ -149,6 +300,7 @@ def RGB_to_YCbCr(RGB,
                  out_bits=8,
                  out_legal=True,
                  out_int=False,
+                 out=None,
                  **kwargs):
     """
     Converts an array of *R'G'B'* values to the corresponding *Y'CbCr* colour
@@ -181,6 +333,9 @@ def RGB_to_YCbCr(RGB,
     out_int : bool, optional
         Whether to return values as ``out_bits`` integer code values. Default
         is *False*.
+    out : ndarray, optional
+        Array the *Y'CbCr* colour encoding values are written to, e.g. a
+        *uint16* frame buffer.
 
     Other Parameters
     ----------------
@@ -217,6 +372,9 @@ def RGB_to_YCbCr(RGB,
         normalised to range [16 / 255, 240./255]. The float values are
         calculated based on an [0, 255] integer range, but no 8-bit
         quantisation or clamping are performed.
+    -   Integer *R'G'B'* code values are converted to integer *Y'CbCr* code
+        values, i.e. ``out_int`` is *True*, with fixed-point arithmetic,
+        bit-exact with the float implementation.
 
     References
     ----------
@@ -280,24 +438,35 @@ def RGB_to_YCbCr(RGB,
                                             YCbCr_ranges(
                                                 out_bits, out_legal, out_int))
 
-    RGB_float = RGB.astype(DEFAULT_FLOAT_DTYPE) - RGB_min
-    RGB_float *= 1 / (RGB_max - RGB_min)
-    R, G, B = tsplit(RGB_float)
-
-    Y = Kr * R + (1 - Kr - Kb) * G + Kb * B
-    Cb = 0.5 * (B - Y) / (1 - Kb)
-    Cr = 0.5 * (R - Y) / (1 - Kr)
-    Y *= Y_max - Y_min
-    Y += Y_min
-    Cb *= C_max - C_min
-    Cr *= C_max - C_min
-    Cb += (C_max + C_min) / 2
-    Cr += (C_max + C_min) / 2
-
-    YCbCr = tstack((Y, Cb, Cr))
+    def RGB_to_YCbCr_float(RGB):
+        """
+        Converts given *R'G'B'* values to unrounded *Y'CbCr* colour encoding
+        values.
+        """
+
+        RGB_float = RGB.astype(float_dtype(RGB)) - RGB_min
+        RGB_float *= 1 / (RGB_max - RGB_min)
+        R, G, B = tsplit(RGB_float)
+
+        Y = Kr * R + (1 - Kr - Kb) * G + Kb * B
+        Cb = 0.5 * (B - Y) / (1 - Kb)
+        Cr = 0.5 * (R - Y) / (1 - Kr)
+        Y *= Y_max - Y_min
+        Y += Y_min
+        Cb *= C_max - C_min
+        Cr *= C_max - C_min
+        Cb += (C_max + C_min) / 2
+        Cr += (C_max + C_min) / 2
+
+        return tstack((Y, Cb, Cr))
+
+    if out_int and _is_integer(RGB):
+        return _integer_affine(RGB, RGB_to_YCbCr_float, out)
+
+    YCbCr = RGB_to_YCbCr_float(RGB)
     YCbCr = np.round(YCbCr).astype(np.int_) if out_int else YCbCr
 
-    return YCbCr
+    return _fill(YCbCr, out)
 
 
 def YCbCr_to_RGB(YCbCr,
@@ -308,6 +477,7 @@ def YCbCr_to_RGB(YCbCr,
                  out_bits=10,
                  out_legal=False,
                  out_int=False,
+                 out=None,
                  **kwargs):
     """
     Converts an array of *Y'CbCr* colour encoding values to the corresponding
@@ -340,6 +510,8 @@ def YCbCr_to_RGB(YCbCr,
     out_int : bool, optional
         Whether to return values as ``out_bits`` integer code values. Default
         is *False*.
+    out : ndarray, optional
+        Array the *R'G'B'* values are written to.
 
     Other Parameters
     ----------------
@@ -366,6 +538,12 @@ def YCbCr_to_RGB(YCbCr,
     :func:`colour.YcCbcCrc_to_RGB` definition should be used for the constant
     luminance case as per :cite:`InternationalTelecommunicationUnion2015h`.
 
+    Notes
+    -----
+    -   Integer *Y'CbCr* code values are converted to integer *R'G'B'* code
+        values, i.e. ``out_int`` is *True*, with fixed-point arithmetic,
+        bit-exact with the float implementation.
+
     References
     ----------
     -   :cite:`InternationalTelecommunicationUnion2011e`
@@ -378,10 +556,19 @@ def YCbCr_to_RGB(YCbCr,
     >>> YCbCr = np.array([502, 512, 512])
     >>> YCbCr_to_RGB(YCbCr, in_bits=10, in_legal=True, in_int=True)
     array([ 0.5,  0.5,  0.5])
+
+    Decoding a 10-bit legal range frame to 10-bit full range code values in a
+    *uint16* frame buffer:
+
+    >>> YCbCr = np.array([[[940, 512, 512], [502, 512, 512]]], np.uint16)
+    >>> RGB = np.empty(YCbCr.shape, np.uint16)
+    >>> YCbCr_to_RGB(YCbCr, in_bits=10, in_legal=True, in_int=True,
+    ...              out_int=True, out=RGB)
+    array([[[1023, 1023, 1023],
+            [ 512,  512,  512]]], dtype=uint16)
     """
 
     YCbCr = np.asarray(YCbCr)
-    Y, Cb, Cr = tsplit(YCbCr.astype(DEFAULT_FLOAT_DTYPE))
     Kr, Kb = K
     Y_min, Y_max, C_min, C_max = kwargs.get('in_range',
                                             YCbCr_ranges(
@@ -389,22 +576,37 @@ def YCbCr_to_RGB(YCbCr,
     RGB_min, RGB_max = kwargs.get('out_range',
                                   CV_range(out_bits, out_legal, out_int))
 
-    Y -= Y_min
-    Cb -= (C_max + C_min) / 2
-    Cr -= (C_max + C_min) / 2
-    Y *= 1 / (Y_max - Y_min)
-    Cb *= 1 / (C_max - C_min)
-    Cr *= 1 / (C_max - C_min)
-    R = Y + (2 - 2 * Kr) * Cr
-    B = Y + (2 - 2 * Kb) * Cb
-    G = (Y - Kr * R - Kb * B) / (1 - Kr - Kb)
+    def YCbCr_to_RGB_float(YCbCr):
+        """
+        Converts given *Y'CbCr* colour encoding values to unrounded *R'G'B'*
+        values.
+        """
 
-    RGB = tstack((R, G, B))
-    RGB *= RGB_max - RGB_min
-    RGB += RGB_min
+        Y, Cb, Cr = tsplit(YCbCr.astype(float_dtype(YCbCr)))
+
+        Y -= Y_min
+        Cb -= (C_max + C_min) / 2
+        Cr -= (C_max + C_min) / 2
+        Y *= 1 / (Y_max - Y_min)
+        Cb *= 1 / (C_max - C_min)
+        Cr *= 1 / (C_max - C_min)
+        R = Y + (2 - 2 * Kr) * Cr
+        B = Y + (2 - 2 * Kb) * Cb
+        G = (Y - Kr * R - Kb * B) / (1 - Kr - Kb)
+
+        RGB = tstack((R, G, B))
+        RGB *= RGB_max - RGB_min
+        RGB += RGB_min
+
+        return RGB
+
+    if out_int and _is_integer(YCbCr):
+        return _integer_affine(YCbCr, YCbCr_to_RGB_float, out)
+
+    RGB = YCbCr_to_RGB_float(YCbCr)
     RGB = np.round(RGB).astype(np.int_) if out_int else RGB
 
-    return RGB
+    return _fill(RGB, out)
 
 
 def RGB_to_YcCbcCrc(RGB,
@@ -412,6 +614,7 @@ def RGB_to_YcCbcCrc(RGB,
                     out_legal=True,
                     out_int=False,
                     is_12_bits_system=False,
+                    out=None,
                     **kwargs):
     """
     Converts an array of *RGB* linear values to the corresponding *Yc'Cbc'Crc'*
@@ -434,6 +637,8 @@ def RGB_to_YcCbcCrc(RGB,
     is_12_bits_system : bool, optional
         *Recommendation ITU-R BT.2020* OETF (OECF) adopts different parameters
         for 10 and 12 bit systems. Default is *False*.
+    out : ndarray, optional
+        Array the *Yc'Cbc'Crc'* colour encoding values are written to.
 
     Other Parameters
     ----------------
@@ -489,7 +694,7 @@ def RGB_to_YcCbcCrc(RGB,
     YcCbcCrc = tstack((Yc, Cbc, Crc))
     YcCbcCrc = np.round(YcCbcCrc).astype(np.int_) if out_int else YcCbcCrc
 
-    return YcCbcCrc
+    return _fill(YcCbcCrc, out)
 
 
 def YcCbcCrc_to_RGB(YcCbcCrc,
@@ -497,6 +702,7 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
                     in_legal=True,
                     in_int=False,
                     is_12_bits_system=False,
+                    out=None,
                     **kwargs):
     """
     Converts an array of *Yc'Cbc'Crc'* colour encoding values to the
@@ -518,6 +724,8 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
     is_12_bits_system : bool, optional
         *Recommendation ITU-R BT.2020* EOTF (EOCF) adopts different parameters
         for 10 and 12 bit systems. Default is *False*.
+    out : ndarray, optional
+        Array the *RGB* linear values are written to.
 
     Other Parameters
     ----------------
@@ -538,6 +746,12 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
     *Recommendation ITU-R BT.2020* when adopting the constant luminance
     implementation.
 
+    Notes
+    -----
+    -   Integer *Yc'Cbc'Crc'* code values of at most 16-bit are decoded with
+        tables of the normalised code values, chroma differences and
+        *Yc'* decoded luminance, bit-exact with the float implementation.
+
     References
     ----------
     -   :cite:`InternationalTelecommunicationUnion2015h`
@@ -553,11 +767,24 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
     """
 
     YcCbcCrc = np.asarray(YcCbcCrc)
-    Yc, Cbc, Crc = tsplit(YcCbcCrc.astype(DEFAULT_FLOAT_DTYPE))
     Y_min, Y_max, C_min, C_max = kwargs.get('in_range',
                                             YCbCr_ranges(
                                                 in_bits, in_legal, in_int))
 
+    if (_is_integer(YcCbcCrc) and in_bits <= 16 and YcCbcCrc.size and
+            YcCbcCrc.min() >= 0 and YcCbcCrc.max() < 2 ** in_bits):
+        Yc_p, Yc, B_p, R_p = _YcCbcCrc_tables(in_bits, Y_min, Y_max, C_min,
+                                              C_max, is_12_bits_system)
+        Yc_i, Cbc_i, Crc_i = tsplit(YcCbcCrc)
+        Yc_p = Yc_p[Yc_i]
+        B = eotf_BT2020(B_p[Cbc_i] + Yc_p, is_12_bits_system=is_12_bits_system)
+        R = eotf_BT2020(R_p[Crc_i] + Yc_p, is_12_bits_system=is_12_bits_system)
+        G = (Yc[Yc_i] - 0.0593 * B - 0.2627 * R) / 0.6780
+
+        return _fill(tstack((R, G, B)), out)
+
+    Yc, Cbc, Crc = tsplit(YcCbcCrc.astype(float_dtype(YcCbcCrc)))
+
     Yc -= Y_min
     Cbc -= (C_max + C_min) / 2
     Crc -= (C_max + C_min) / 2
@@ -573,4 +800,199 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
 
     RGB = tstack((R, G, B))
 
-    return RGB
+    return _fill(RGB, out)
+
+
+def _YcCbcCrc_tables(bits, Y_min, Y_max, C_min, C_max, is_12_bits_system):
+    """
+    Returns the tables of the normalised *Yc'* code values, *Yc'* decoded
+    luminance, and *Cbc'* and *Crc'* chroma differences for given bit depth,
+    ranges and system.
+
+    The tables entries are computed with the same operations than the float
+    implementation of :func:`colour.YcCbcCrc_to_RGB` definition.
+
+    Parameters
+    ----------
+    bits : int
+        Bit depth of the integer code values.
+    Y_min : numeric
+        Minimum *Yc'* code value.
+    Y_max : numeric
+        Maximum *Yc'* code value.
+    C_min : numeric
+        Minimum *Cbc'* and *Crc'* code value.
+    C_max : numeric
+        Maximum *Cbc'* and *Crc'* code value.
+    is_12_bits_system : bool
+        *Recommendation ITU-R BT.2020* EOTF (EOCF) adopts different parameters
+        for 10 and 12 bit systems.
+
+    Returns
+    -------
+    tuple
+        Normalised *Yc'*, decoded *Yc*, *Cbc'* and *Crc'* chroma differences
+        tables.
+    """
+
+    key = (bits, float(Y_min), float(Y_max), float(C_min), float(C_max),
+           is_12_bits_system)
+    tables = _YCCBCCRC_TABLES_CACHE.get(key)
+    if tables is not None:
+        return tables
+
+    CV = np.arange(2 ** bits).astype(DEFAULT_FLOAT_DTYPE)
+
+    Yc_p = CV - Y_min
+    Yc_p *= 1 / (Y_max - Y_min)
+    C = CV - (C_max + C_min) / 2
+    C *= 1 / (C_max - C_min)
+
+    tables = (Yc_p, eotf_BT2020(Yc_p, is_12_bits_system=is_12_bits_system),
+              np.where(C <= 0, C * 1.9404, C * 1.5816),
+              np.where(C <= 0, C * 1.7184, C * 0.9936))
+    for table in tables:
+        table.setflags(write=False)
+
+    _YCCBCCRC_TABLES_CACHE[key] = tables
+
+    return tables
+
+
+def _subsample(C, factors):
+    """
+    Subsamples given chroma plane by given vertical and horizontal factors
+    with a box filter, the plane is extended by edge replication to a multiple
+    of the factors.
+    """
+
+    v, h = factors
+    if v == 1 and h == 1:
+        return C
+
+    height, width = C.shape[-2:]
+    padding = [(0, 0)] * (C.ndim - 2) + [(0, -height % v), (0, -width % h)]
+    if height % v or width % h:
+        C = np.pad(C, padding, 'edge')
+
+    shape = C.shape[:-2] + (C.shape[-2] // v, v, C.shape[-1] // h, h)
+    C_b = np.reshape(C, shape)
+    if _is_integer(C):
+        n = v * h
+        C_s = np.sum(C_b, axis=(-3, -1), dtype=np.int64)
+        C_s += n // 2
+        C_s //= n
+        return C_s.astype(C.dtype)
+
+    return np.mean(C_b, axis=(-3, -1))
+
+
+def YCbCr_to_planar(YCbCr, subsampling='4:4:4'):
+    """
+    Converts given packed *Y'CbCr* colour encoding image array to planar
+    *Y'*, *Cb* and *Cr* arrays with given chroma subsampling.
+
+    Parameters
+    ----------
+    YCbCr : array_like
+        Packed *Y'CbCr* colour encoding image array of shape
+        *(..., height, width, 3)*.
+    subsampling : unicode, optional
+        **{'4:4:4', '4:2:2', '4:2:0'}**,
+        Chroma subsampling scheme, see :attr:`colour.YCBCR_SUBSAMPLINGS`
+        attribute.
+
+    Returns
+    -------
+    tuple
+        Planar *Y'*, *Cb* and *Cr* arrays.
+
+    Notes
+    -----
+    -   The chroma planes are subsampled with a box filter, integer code
+        values are averaged with round half up. Image dimensions that are not
+        a multiple of the subsampling factors are extended by edge
+        replication.
+
+    Examples
+    --------
+    >>> YCbCr = np.array([[[64, 512, 512], [940, 448, 576]],
+    ...                   [[64, 512, 512], [940, 448, 578]]])
+    >>> Y, Cb, Cr = YCbCr_to_planar(YCbCr, '4:2:0')
+    >>> Y
+    array([[ 64, 940],
+           [ 64, 940]])
+    >>> Cb
+    array([[480]])
+    >>> Cr
+    array([[545]])
+    """
+
+    YCbCr = np.asarray(YCbCr)
+    factors = YCBCR_SUBSAMPLINGS[subsampling]
+
+    Y, Cb, Cr = tsplit(YCbCr)
+
+    return Y, _subsample(Cb, factors), _subsample(Cr, factors)
+
+
+def planar_to_YCbCr(Y, Cb, Cr, out=None):
+    """
+    Converts given planar *Y'*, *Cb* and *Cr* arrays to a packed *Y'CbCr*
+    colour encoding image array, upsampling the chroma planes to the *Y'*
+    plane dimensions.
+
+    Parameters
+    ----------
+    Y : array_like
+        *Y'* plane of shape *(..., height, width)*.
+    Cb : array_like
+        *Cb* plane, subsampled or not.
+    Cr : array_like
+        *Cr* plane, subsampled or not.
+    out : ndarray, optional
+        Array of shape *(..., height, width, 3)* the packed *Y'CbCr* colour
+        encoding values are written to.
+
+    Returns
+    -------
+    ndarray
+        Packed *Y'CbCr* colour encoding image array.
+
+    Notes
+    -----
+    -   The chroma planes are upsampled by sample replication, the
+        subsampling factors are inferred from the planes dimensions.
+
+    Examples
+    --------
+    >>> Y = np.array([[64, 940], [64, 940]])
+    >>> planar_to_YCbCr(Y, np.array([[480]]), np.array([[545]]))
+    array([[[ 64, 480, 545],
+            [940, 480, 545]],
+    <BLANKLINE>
+           [[ 64, 480, 545],
+            [940, 480, 545]]])
+    """
+
+    Y = np.asarray(Y)
+    Cb = np.asarray(Cb)
+    Cr = np.asarray(Cr)
+
+    height, width = Y.shape[-2:]
+
+    if out is None:
+        out = np.empty(
+            Y.shape + (3, ), np.result_type(Y.dtype, Cb.dtype, Cr.dtype))
+
+    out[..., 0] = Y
+    for i, C in enumerate((Cb, Cr), 1):
+        v = -(-height // C.shape[-2])
+        h = -(-width // C.shape[-1])
+        if v != 1:
+            C = np.repeat(C, v, axis=-2)[..., :height, :]
+        if h != 1:
+            C = np.repeat(C, h, axis=-1)[..., :width]
+        out[..., i] = C
+
+    return out
@@ -125,7 +125,8 @@ from collections import OrderedDict
 from colour.algebra import (Extrapolator, LinearInterpolator,
                             cartesian_to_cylindrical, polar_to_cartesian,
                             euclidean_distance)
-from colour.colorimetry import ILLUMINANTS, luminance_ASTMD153508
+from colour.colorimetry import (ILLUMINANTS, luminance_ASTMD153508,
+                                monotone_inverse)
 from colour.constants import (DEFAULT_FLOAT_DTYPE, INTEGER_THRESHOLD,
                               FLOATING_POINT_NUMBER_PATTERN)
 from colour.models import Lab_to_LCHab, XYZ_to_Lab, XYZ_to_xy, xyY_to_XYZ
@@ -197,7 +198,6 @@ MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES = (ILLUMINANTS[
     'CIE 1931 2 Degree Standard Observer'][MUNSELL_DEFAULT_ILLUMINANT])
 
 _MUNSELL_SPECIFICATIONS_CACHE = None
-_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
 _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
 
 
@@ -236,27 +236,6 @@ def _munsell_specifications():
     return _MUNSELL_SPECIFICATIONS_CACHE
 
 
-def _munsell_value_ASTMD153508_interpolator():
-    """
-    Returns the *Munsell* value interpolator for *ASTM D1535-08e1* method and
-    caches it if not existing.
-
-    Returns
-    -------
-    Extrapolator
-        *Munsell* value interpolator for *ASTM D1535-08e1* method.
-    """
-
-    global _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
-    munsell_values = np.arange(0, 10, 0.001)
-    if _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE is None:
-        _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = Extrapolator(
-            LinearInterpolator(
-                luminance_ASTMD153508(munsell_values), munsell_values))
-
-    return _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
-
-
 def _munsell_maximum_chromas_from_renotation():
     """
     Returns the maximum *Munsell* chromas from *Munsell Renotation System* data
@@ -519,6 +498,10 @@ def munsell_value_ASTMD153508(Y):
     Returns the *Munsell* value :math:`V` of given *luminance* :math:`Y` using
     a reverse lookup table from *ASTM D1535-08e1* method.
 
+    The reverse lookup table is built with
+    :func:`colour.colorimetry.monotone_inverse_table` definition and its
+    absolute error is lower than 1e-10.
+
     Parameters
     ----------
     Y : numeric or array_like
@@ -546,7 +529,7 @@ def munsell_value_ASTMD153508(Y):
 
     Y = np.asarray(Y)
 
-    V = _munsell_value_ASTMD153508_interpolator()(Y)
+    V = monotone_inverse(Y, luminance_ASTMD153508, (0, 10))
 
     return V
 
@@ -611,7 +594,7 @@ def munsell_value(Y, method='ASTM D1535-08'):
     Examples
     --------
     >>> munsell_value(10.08)  # doctest: +ELLIPSIS
-    3.7344764...
+    3.7344765...
     >>> munsell_value(10.08, method='Priest 1920')  # doctest: +ELLIPSIS
     3.1749015...
     >>> munsell_value(10.08, method='Munsell 1933')  # doctest: +ELLIPSIS
@@ -45,6 +45,20 @@ class TestRGB_to_HEX(unittest.TestCase):
             RGB_to_HEX(np.array([1.00000000, 1.00000000, 1.00000000])),
             '#ffffff')
 
+        self.assertEqual(
+            RGB_to_HEX(np.array([0.25000000, 0.60000000, 0.05000000, 0.5])),
+            '#3f990c7f')
+
+        self.assertEqual(
+            RGB_to_HEX(np.array([63, 153, 12], np.uint8)), '#3f990c')
+
+        self.assertListEqual(
+            RGB_to_HEX(np.array([[63, 153, 12, 128], [0, 0, 0, 255]],
+                                np.uint8)).tolist(),
+            ['#3f990c80', '#000000ff'])
+
+        self.assertRaises(ValueError, RGB_to_HEX, np.array([0.25, 0.60]))
+
     def test_n_dimensional_RGB_to_HEX(self):
         """
         Tests :func:`colour.notation.triplet.RGB_to_HEX` definition
@@ -103,6 +117,44 @@ class TestHEX_to_RGB(unittest.TestCase):
             np.array([1.00000000, 1.00000000, 1.00000000]),
             decimal=2)
 
+        np.testing.assert_almost_equal(
+            HEX_to_RGB('3F990C'),
+            np.array([0.25000000, 0.60000000, 0.05000000]),
+            decimal=2)
+
+        np.testing.assert_almost_equal(
+            HEX_to_RGB('#3f990c80'),
+            np.array([0.25000000, 0.60000000, 0.05000000, 0.50000000]),
+            decimal=2)
+
+        np.testing.assert_almost_equal(
+            HEX_to_RGB(['#adf', 'aadd00', b'#abc']),
+            np.array([[170, 221, 255], [170, 221, 0], [170, 187, 204]]) / 255,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            HEX_to_RGB('#adf8'),
+            np.array([170, 221, 255, 136]) / 255,
+            decimal=7)
+
+        self.assertRaises(ValueError, HEX_to_RGB, '#3f990')
+        self.assertRaises(ValueError, HEX_to_RGB, '#3f990c8')
+        self.assertRaises(ValueError, HEX_to_RGB, '#3f990g')
+        self.assertRaises(ValueError, HEX_to_RGB, ['#3f990c', '#3f990c80'])
+
+    def test_RGB_to_HEX_to_RGB(self):
+        """
+        Tests :func:`colour.notation.triplet.RGB_to_HEX` and
+        :func:`colour.notation.triplet.HEX_to_RGB` definitions round trip.
+        """
+
+        RGB = np.random.RandomState(4).randint(0, 256, (64, 64, 4))
+        RGB = RGB.astype(np.uint8)
+
+        np.testing.assert_equal(HEX_to_RGB(RGB_to_HEX(RGB)) * 255, RGB)
+        np.testing.assert_equal(
+            HEX_to_RGB(RGB_to_HEX(RGB[..., :3])) * 255, RGB[..., :3])
+
     def test_n_dimensional_HEX_to_RGB(self):
         """
         Tests :func:`colour.notation.triplet.HEX_to_RGB` definition
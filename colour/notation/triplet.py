@@ -12,6 +12,7 @@ Defines objects for hexadecimal triplet notation:
 from __future__ import division, unicode_literals
 
 import numpy as np
+import string
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -22,6 +23,31 @@ __status__ = 'Production'
 
 __all__ = ['RGB_to_HEX', 'HEX_to_RGB']
 
+_HEX_DIGITS = np.frombuffer(b'0123456789abcdef', np.uint8)
+"""
+Lower case hexadecimal digits *ASCII* codes.
+
+_HEX_DIGITS : ndarray
+"""
+
+_HEX_VALUES = np.array([
+    int(chr(i), 16) if chr(i) in string.hexdigits else 255 for i in range(256)
+], np.uint8)
+"""
+Hexadecimal digits values indexed by *ASCII* code, invalid digits have a value
+of 255.
+
+_HEX_VALUES : ndarray
+"""
+
+_HEX_CHANNELS = {3: 3, 4: 4, 6: 3, 8: 4}
+"""
+Channels count of the hexadecimal representations by digits count, i.e.
+*#RGB*, *#RGBA*, *#RRGGBB* and *#RRGGBBAA*.
+
+_HEX_CHANNELS : dict
+"""
+
 
 def RGB_to_HEX(RGB):
     """
@@ -30,16 +56,20 @@ def RGB_to_HEX(RGB):
     Parameters
     ----------
     RGB : array_like
-        *RGB* colourspace array.
+        *RGB* or *RGBA* colourspace array.
 
     Returns
     -------
-    unicode
-        Hexadecimal triplet representation.
+    unicode or ndarray
+        Hexadecimal triplet representation, or *#RRGGBBAA* representation for
+        *RGBA* colourspace array.
 
     Notes
     -----
-    -   Input *RGB* colourspace array is normalised to domain [0, 1].
+    -   Input *RGB* colourspace array is normalised to domain [0, 1], *uint8*
+        arrays are 8-bit code values.
+    -   The hexadecimal representations are encoded at the byte level with
+        a table of the hexadecimal digits.
 
     Examples
     --------
@@ -47,16 +77,32 @@ def RGB_to_HEX(RGB):
     >>> # Doctests skip for Python 2.x compatibility.
     >>> RGB_to_HEX(RGB)  # doctest: +SKIP
     '#aaddff'
+    >>> RGB = np.array([[170, 221, 255, 128], [0, 0, 0, 255]], np.uint8)
+    >>> RGB_to_HEX(RGB)  # doctest: +SKIP
+    array(['#aaddff80', '#000000ff'],
+          dtype='<U9')
     """
 
     RGB = np.asarray(RGB)
 
-    to_HEX = np.vectorize('{0:02x}'.format)
+    channels = RGB.shape[-1]
+    if channels not in (3, 4):
+        raise ValueError(
+            '"{0}" channels count is not supported, it must be 3 or 4!'.format(
+                channels))
+
+    CV = RGB if RGB.dtype == np.uint8 else (RGB * 255).astype(np.uint8)
 
-    HEX = to_HEX((RGB * 255).astype(np.uint8)).astype(object)
-    HEX = np.asarray('#') + HEX[..., 0] + HEX[..., 1] + HEX[..., 2]
+    width = 1 + 2 * channels
+    HEX = np.empty(CV.shape[:-1] + (width, ), np.uint8)
+    HEX[..., 0] = ord('#')
+    HEX[..., 1::2] = _HEX_DIGITS[CV >> 4]
+    HEX[..., 2::2] = _HEX_DIGITS[CV & 15]
 
-    return HEX
+    HEX = np.reshape(HEX.view('S{0}'.format(width)), CV.shape[:-1])
+    HEX = HEX.astype('U{0}'.format(width))
+
+    return HEX.item() if HEX.ndim == 0 else HEX
 
 
 def HEX_to_RGB(HEX):
@@ -66,36 +112,84 @@ def HEX_to_RGB(HEX):
     Parameters
     ----------
     HEX : unicode or array_like
-        Hexadecimal triplet representation.
+        Hexadecimal triplet representation, the *#RGB*, *#RRGGBB*, *#RGBA*
+        and *#RRGGBBAA* forms are supported, the leading *#* is optional.
 
     Returns
     -------
     ndarray
-        *RGB* colourspace array.
+        *RGB* colourspace array, or *RGBA* colourspace array for the *#RGBA*
+        and *#RRGGBBAA* forms.
+
+    Raises
+    ------
+    ValueError
+        If the hexadecimal representations are invalid or mix *RGB* and
+        *RGBA* forms.
 
     Notes
     -----
     -   Output *RGB* colourspace array is normalised to range [0, 1].
+    -   The hexadecimal representations are decoded at the byte level with a
+        table of the hexadecimal digits values.
 
     Examples
     --------
     >>> HEX = '#aaddff'
     >>> HEX_to_RGB(HEX)  # doctest: +ELLIPSIS
     array([ 0.6666666...,  0.8666666...,  1.        ])
+    >>> HEX_to_RGB(['#adf', '#000'])  # doctest: +ELLIPSIS
+    array([[ 0.6666666...,  0.8666666...,  1.        ],
+           [ 0.        ,  0.        ,  0.        ]])
+    >>> HEX_to_RGB('#aaddff80')  # doctest: +ELLIPSIS
+    array([ 0.6666666...,  0.8666666...,  1.        ,  0.5019607...])
     """
 
-    HEX = np.core.defchararray.lstrip(HEX, '#')
-
-    def to_RGB(x):
-        """
-        Converts given hexadecimal representation to *RGB*.
-        """
-
-        l_x = len(x)
-        return [int(x[i:i + l_x // 3], 16) for i in range(0, l_x, l_x // 3)]
-
-    to_RGB_v = np.vectorize(to_RGB, otypes=[np.ndarray])
-
-    RGB = np.asarray(to_RGB_v(HEX).tolist()) / 255
-
-    return RGB
+    HEX = np.asarray(HEX)
+    shape = HEX.shape
+
+    if HEX.size == 0:
+        return np.zeros(shape + (3, ))
+
+    HEX = np.ascontiguousarray(np.reshape(HEX, -1))
+    if HEX.dtype.kind == 'S':
+        characters = HEX.view(np.uint8)
+    else:
+        # Unicode strings are viewed as *UCS-4* code points, the non *ASCII*
+        # characters being mapped to an invalid digit.
+        HEX = HEX.astype(np.unicode_, copy=False)
+        characters = np.minimum(HEX.view(np.uint32), 255).astype(np.uint8)
+
+    characters = np.reshape(characters, (len(HEX), -1))
+
+    has_hash = (characters[:, 0] == ord('#')).astype(np.int_)
+    digits = np.count_nonzero(characters, axis=-1) - has_hash
+
+    # The representations are grouped by digits count and leading "#".
+    forms = digits * 2 + has_hash
+    unique_forms = np.unique(forms)
+    channels = set(_HEX_CHANNELS.get(form // 2) for form in unique_forms)
+    if None in channels or len(channels) > 1:
+        raise ValueError(
+            '"{0}" hexadecimal representations are not supported, they must '
+            'be in a single form of "#RGB", "#RRGGBB", "#RGBA" or '
+            '"#RRGGBBAA"!'.format(np.unique(digits).tolist()))
+
+    channels = channels.pop()
+    CV = np.empty((len(characters), channels), np.uint8)
+    for form in unique_forms:
+        count, offset = form // 2, form % 2
+        indexes = (slice(None) if len(unique_forms) == 1 else
+                   np.nonzero(forms == form)[0])
+
+        values = _HEX_VALUES[characters[indexes, offset:offset + count]]
+        if np.any(values == 255):
+            raise ValueError(
+                'Hexadecimal representations contain invalid digits!')
+
+        if count == channels:
+            CV[indexes] = values * 17
+        else:
+            CV[indexes] = values[:, 0::2] * 16 + values[:, 1::2]
+
+    return np.reshape(CV / 255, shape + (channels, ))
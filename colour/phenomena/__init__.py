@@ -3,9 +3,11 @@
 from __future__ import absolute_import
 
 from .rayleigh import (scattering_cross_section, rayleigh_optical_depth,
-                       rayleigh_scattering, rayleigh_scattering_spd)
+                       rayleigh_optical_depth_msa, rayleigh_scattering,
+                       rayleigh_scattering_spd)
 
 __all__ = [
     'scattering_cross_section', 'rayleigh_optical_depth',
-    'rayleigh_scattering', 'rayleigh_scattering_spd'
+    'rayleigh_optical_depth_msa', 'rayleigh_scattering',
+    'rayleigh_scattering_spd'
 ]
@@ -7,6 +7,7 @@ Implements *Rayleigh* scattering / optical depth in the atmosphere computation:
 
 -   :func:`colour.scattering_cross_section`
 -   :func:`colour.phenomena.rayleigh_optical_depth`
+-   :func:`colour.phenomena.rayleigh_optical_depth_msa`
 -   :func:`colour.rayleigh_scattering`
 
 See Also
@@ -31,7 +32,7 @@ import numpy as np
 
 from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE,
                                 SpectralPowerDistribution)
-from colour.constants import AVOGADRO_CONSTANT
+from colour.constants import AVOGADRO_CONSTANT, DEFAULT_FLOAT_DTYPE
 from colour.utilities import filter_kwargs
 
 __author__ = 'Colour Developers'
@@ -49,7 +50,9 @@ __all__ = [
     'N2_depolarisation', 'O2_depolarisation', 'F_air_Penndorf1957',
     'F_air_Young1981', 'F_air_Bates1984', 'F_air_Bodhaine1999',
     'molecular_density', 'mean_molecular_weights', 'gravity_List1968',
-    'scattering_cross_section', 'rayleigh_optical_depth', 'rayleigh_scattering'
+    'scattering_cross_section', 'rayleigh_optical_depth',
+    'rayleigh_optical_depth_msa', 'rayleigh_scattering',
+    'rayleigh_scattering_spd'
 ]
 
 STANDARD_AIR_TEMPERATURE = 288.15
@@ -87,6 +90,21 @@ Default altitude in meters (sea level).
 DEFAULT_ALTITUDE : numeric
 """
 
+_RAYLEIGH_SPECTRAL_TERMS_CACHE = {}
+"""
+*Rayleigh* optical depth spectral terms cache.
+
+_RAYLEIGH_SPECTRAL_TERMS_CACHE : dict
+"""
+
+_RAYLEIGH_SPECTRAL_TERMS_CACHE_CONCENTRATIONS = 16
+"""
+Unique :math:`CO_2` concentrations count above which the *Rayleigh* optical
+depth spectral terms are not cached.
+
+_RAYLEIGH_SPECTRAL_TERMS_CACHE_CONCENTRATIONS : int
+"""
+
 
 def air_refraction_index_Penndorf1957(wavelength):
     """
@@ -650,7 +668,7 @@ def rayleigh_optical_depth(wavelength,
     latitude = np.asarray(latitude)
     altitude = np.asarray(altitude)
     # Conversion from pascal to dyne/cm2.
-    P = np.asarray(pressure * 10)
+    P = np.asarray(pressure) * 10
 
     sigma = scattering_cross_section(wavelength, CO2_c, temperature,
                                      avogadro_constant, n_s, F_air)
@@ -666,6 +684,160 @@ def rayleigh_optical_depth(wavelength,
 rayleigh_scattering = rayleigh_optical_depth
 
 
+def _rayleigh_spectral_terms(shape, CO2_concentration, n_s, F_air):
+    """
+    Returns the spectral terms of the *Rayleigh* optical depth, i.e. the
+    scattering cross section per molecule :math:`\sigma` of dry air multiplied
+    by the squared molecular density :math:`N_s^2`, for given spectral shape
+    and unique :math:`CO_2` concentrations.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape of the spectral terms.
+    CO2_concentration : ndarray
+        Unique :math:`CO_2` concentrations in parts per million (ppm).
+    n_s : object
+        Air refraction index :math:`n_s` computation method.
+    F_air : object
+        :math:`(6+3_p)/(6-7_p)`, the depolarisation term :math:`F(air)` or
+        *King Factor* computation method.
+
+    Returns
+    -------
+    ndarray
+        Spectral terms with shape *(concentrations, bins)*.
+    """
+
+    key = (float(shape.start), float(shape.end), float(shape.interval), n_s,
+           F_air, CO2_concentration.tobytes())
+    terms = _RAYLEIGH_SPECTRAL_TERMS_CACHE.get(key)
+    if terms is not None:
+        return terms
+
+    wl = shape.range() * 10e-8
+    wl_micrometers = wl * 10e3
+
+    n_s = n_s(wl_micrometers)
+    F_air = F_air(**filter_kwargs(
+        F_air,
+        wavelength=wl_micrometers,
+        CO2_concentration=CO2_concentration[..., np.newaxis]))
+
+    terms = (24 * np.pi ** 3 * (n_s ** 2 - 1) ** 2 / (wl ** 4 *
+                                                      (n_s ** 2 + 2) ** 2))
+    terms = terms * np.broadcast_to(F_air,
+                                    (CO2_concentration.size, wl.size))
+
+    if (CO2_concentration.size <=
+            _RAYLEIGH_SPECTRAL_TERMS_CACHE_CONCENTRATIONS):
+        terms.setflags(write=False)
+        _RAYLEIGH_SPECTRAL_TERMS_CACHE[key] = terms
+
+    return terms
+
+
+def rayleigh_optical_depth_msa(shape=DEFAULT_SPECTRAL_SHAPE,
+                               CO2_concentration=STANDARD_CO2_CONCENTRATION,
+                               temperature=STANDARD_AIR_TEMPERATURE,
+                               pressure=AVERAGE_PRESSURE_MEAN_SEA_LEVEL,
+                               latitude=DEFAULT_LATITUDE,
+                               altitude=DEFAULT_ALTITUDE,
+                               avogadro_constant=AVOGADRO_CONSTANT,
+                               n_s=air_refraction_index_Bodhaine1999,
+                               F_air=F_air_Bodhaine1999):
+    """
+    Returns the multi-spectral array of the *Rayleigh* optical depth
+    :math:`T_r(\lambda)` for given spectral shape and atmospheric columns, the
+    atmospheric columns parameters being broadcast against each other.
+
+    The *Rayleigh* optical depth is factorised into spectral terms, only
+    depending on the wavelength :math:`\lambda` and :math:`CO_2`
+    concentration, and column terms depending on the atmospheric column
+    parameters. The spectral terms are computed once per unique :math:`CO_2`
+    concentration and cached, an atmospheric column then costs a single
+    product per wavelength :math:`\lambda`.
+
+    Parameters
+    ----------
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral array.
+    CO2_concentration : numeric or array_like, optional
+        :math:`CO_2` concentration in parts per million (ppm).
+    temperature : numeric or array_like, optional
+        Air temperature :math:`T[K]` in kelvin degrees.
+    pressure : numeric or array_like
+        Surface pressure :math:`P` of the measurement site.
+    latitude : numeric or array_like, optional
+        Latitude of the site in degrees.
+    altitude : numeric or array_like, optional
+        Altitude of the site in meters.
+    avogadro_constant : numeric or array_like, optional
+        *Avogadro*'s number (molecules :math:`mol^{-1}`).
+    n_s : object
+        Air refraction index :math:`n_s` computation method.
+    F_air : object
+        :math:`(6+3_p)/(6-7_p)`, the depolarisation term :math:`F(air)` or
+        *King Factor* computation method.
+
+    Returns
+    -------
+    ndarray
+        *Rayleigh* optical depth :math:`T_r(\lambda)` multi-spectral array with
+        shape *(..., bins)*.
+
+    Warning
+    -------
+    The spectral terms are cached in :attr:`colour.phenomena.rayleigh.\
+_RAYLEIGH_SPECTRAL_TERMS_CACHE` attribute when there are no more than
+    :attr:`colour.phenomena.rayleigh.\
+_RAYLEIGH_SPECTRAL_TERMS_CACHE_CONCENTRATIONS` unique :math:`CO_2`
+    concentrations. Their identifier key is defined by the spectral shape, the
+    computation methods and the :math:`CO_2` concentrations, thus one should
+    be mindful that modifying the computation methods in place will lead to
+    unexpected behaviour.
+
+    References
+    ----------
+    -   :cite:`Bodhaine1999a`
+    -   :cite:`Wikipediabx`
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> rayleigh_optical_depth_msa(
+    ...     SpectralShape(450, 650, 100), altitude=np.array([0, 1500, 3000]))
+    ... # doctest: +ELLIPSIS
+    array([[ 0.2370851...,  0.1041815...,  0.0528176...],
+           [ 0.2371974...,  0.1042308...,  0.0528426...],
+           [ 0.2373097...,  0.1042802...,  0.0528677...]])
+    """
+
+    CO2_c = np.asarray(CO2_concentration, dtype=DEFAULT_FLOAT_DTYPE)
+    temperature = np.asarray(temperature)
+    latitude = np.asarray(latitude)
+    altitude = np.asarray(altitude)
+    # Conversion from pascal to dyne/cm2.
+    P = np.asarray(pressure) * 10
+
+    CO2_u, CO2_i = np.unique(CO2_c, return_inverse=True)
+    terms = _rayleigh_spectral_terms(shape, CO2_u, n_s, F_air)
+
+    N_s = molecular_density(temperature, avogadro_constant)
+    m_a = mean_molecular_weights(CO2_c)
+    g = gravity_List1968(latitude, altitude)
+
+    column = (P * avogadro_constant) / (m_a * g * N_s ** 2)
+
+    if CO2_u.size == 1:
+        return column[..., np.newaxis] * terms[0]
+
+    column, CO2_i = np.broadcast_arrays(column, np.reshape(
+        CO2_i, CO2_c.shape))
+
+    return column[..., np.newaxis] * terms[CO2_i]
+
+
 def rayleigh_scattering_spd(shape=DEFAULT_SPECTRAL_SHAPE,
                             CO2_concentration=STANDARD_CO2_CONCENTRATION,
                             temperature=STANDARD_AIR_TEMPERATURE,
@@ -15,7 +15,9 @@ from colour.phenomena.rayleigh import (
     N2_depolarisation, O2_depolarisation, F_air_Penndorf1957, F_air_Young1981,
     F_air_Bates1984, F_air_Bodhaine1999, molecular_density,
     mean_molecular_weights, gravity_List1968)
+from colour.colorimetry import SpectralShape
 from colour.phenomena import (scattering_cross_section, rayleigh_optical_depth,
+                              rayleigh_optical_depth_msa,
                               rayleigh_scattering_spd)
 from colour.utilities import ignore_numpy_errors
 
@@ -34,7 +36,7 @@ __all__ = [
     'TestF_airBates1984', 'TestF_airBodhaine1999', 'TestMolecularDensity',
     'TestMeanMolecularWeights', 'TestGravityList1968',
     'TestScatteringCrossSection', 'TestRayleighOpticalDepth',
-    'TestRayleighScatteringSpd'
+    'TestRayleighOpticalDepthMsa', 'TestRayleighScatteringSpd'
 ]
 
 RAYLEIGH_SCATTERING_SPD_DATA = (
@@ -1429,6 +1431,105 @@ class TestRayleighOpticalDepth(unittest.TestCase):
                                    latitude, altitude)
 
 
+class TestRayleighOpticalDepthMsa(unittest.TestCase):
+    """
+    Defines :func:`colour.phenomena.rayleigh.rayleigh_optical_depth_msa`
+    definition unit tests methods.
+    """
+
+    def test_rayleigh_optical_depth_msa(self):
+        """
+        Tests :func:`colour.phenomena.rayleigh.rayleigh_optical_depth_msa`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            rayleigh_optical_depth_msa(),
+            RAYLEIGH_SCATTERING_SPD_DATA,
+            decimal=7)
+
+        shape = SpectralShape(360, 830, 10)
+        wl = shape.range() * 10e-8
+        for CO2_concentration, temperature, pressure, latitude, altitude in (
+            (300, 288.15, 101325, 0, 0),
+            (0, 200, 100325, 45, 1500),
+            (620, 400, 99325, 48.8567, 35),
+        ):
+            np.testing.assert_allclose(
+                rayleigh_optical_depth_msa(shape, CO2_concentration,
+                                           temperature, pressure, latitude,
+                                           altitude),
+                rayleigh_optical_depth(wl, CO2_concentration, temperature,
+                                       pressure, latitude, altitude),
+                rtol=1e-12)
+
+        CO2_concentration = np.array([300, 0, 620, 300])
+        altitude = np.array([[0], [1500], [3000]])
+        T_R = rayleigh_optical_depth_msa(
+            shape, CO2_concentration, altitude=altitude)
+        self.assertTupleEqual(T_R.shape, (3, 4, len(wl)))
+        for i in range(3):
+            for j in range(4):
+                np.testing.assert_allclose(
+                    T_R[i, j],
+                    rayleigh_optical_depth(
+                        wl,
+                        CO2_concentration[j],
+                        altitude=altitude[i, 0]),
+                    rtol=1e-12)
+
+        shape = SpectralShape(400, 700, 100)
+        T_R = rayleigh_optical_depth_msa(shape, pressure=[101325, 90000])
+        self.assertTupleEqual(T_R.shape, (2, 4))
+        for i, pressure in enumerate((101325, 90000)):
+            np.testing.assert_allclose(
+                T_R[i],
+                rayleigh_optical_depth(
+                    shape.range() * 10e-8, pressure=pressure),
+                rtol=1e-12)
+
+    def test_n_dimensional_rayleigh_optical_depth_msa(self):
+        """
+        Tests :func:`colour.phenomena.rayleigh.rayleigh_optical_depth_msa`
+        definition n-dimensional arrays support.
+        """
+
+        shape = SpectralShape(360, 830, 10)
+        altitude = 1500
+        T_R = rayleigh_optical_depth_msa(shape, altitude=altitude)
+
+        altitude = np.tile(altitude, 6)
+        T_R = np.tile(T_R, (6, 1))
+        np.testing.assert_almost_equal(
+            rayleigh_optical_depth_msa(shape, altitude=altitude),
+            T_R,
+            decimal=7)
+
+        altitude = np.reshape(altitude, (2, 3))
+        T_R = np.reshape(T_R, (2, 3, -1))
+        np.testing.assert_almost_equal(
+            rayleigh_optical_depth_msa(shape, altitude=altitude),
+            T_R,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            rayleigh_optical_depth_msa(
+                shape, np.full((2, 3), 300), altitude=altitude),
+            T_R,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_rayleigh_optical_depth_msa(self):
+        """
+        Tests :func:`colour.phenomena.rayleigh.rayleigh_optical_depth_msa`
+        definition nan support.
+        """
+
+        cases = np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan])
+        rayleigh_optical_depth_msa(
+            SpectralShape(360, 830, 10), cases, cases, cases, cases, cases)
+
+
 class TestRayleighScatteringSpd(unittest.TestCase):
     """
     Defines :func:`colour.phenomena.rayleigh.rayleigh_scattering_spd`
@@ -33,8 +33,9 @@ from six.moves import reduce
 
 from colour.algebra import LinearInterpolator
 from colour.colorimetry import (
-    ILLUMINANTS, ILLUMINANTS_SPDS, LIGHTNESS_METHODS, SpectralShape,
-    blackbody_spd, ones_spd, spectral_to_XYZ, wavelength_to_XYZ)
+    ASTME30815_PRACTISE_SHAPE, ILLUMINANTS, ILLUMINANTS_SPDS,
+    LIGHTNESS_METHODS, SpectralShape, blackbody_XYZ, blackbody_spd, ones_spd,
+    spectral_to_XYZ, wavelength_to_XYZ)
 from colour.plotting import (ColourSwatch, DEFAULT_PLOTTING_COLOURSPACE,
                              DEFAULT_FIGURE_WIDTH, XYZ_to_plotting_colourspace,
                              canvas, get_cmfs, get_illuminant, render,
@@ -794,18 +795,13 @@ def blackbody_colours_plot(shape=SpectralShape(150, 12500, 50),
 
     cmfs = get_cmfs(cmfs)
 
-    colours = []
-    temperatures = []
+    temperatures = shape.range()
 
     with suppress_warnings():
-        for temperature in shape:
-            spd = blackbody_spd(temperature, cmfs.shape)
-
-            XYZ = spectral_to_XYZ(spd, cmfs)
-            RGB = normalise_maximum(XYZ_to_plotting_colourspace(XYZ / 100))
-
-            colours.append(RGB)
-            temperatures.append(temperature)
+        XYZ = blackbody_XYZ(temperatures,
+                            cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE))
+        colours = normalise_maximum(
+            XYZ_to_plotting_colourspace(XYZ / 100), axis=-1)
 
     x_min, x_max = min(temperatures), max(temperatures)
     y_min, y_max = 0, 1
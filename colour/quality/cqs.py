@@ -7,6 +7,7 @@ Defines *Colour Quality Scale* (CQS) computation objects:
 
 -   :class:`colour.quality.CQS_Specification`
 -   :func:`colour.colour_quality_scale`
+-   :func:`colour.multi_colour_quality_scale`
 
 See Also
 --------
@@ -32,12 +33,14 @@ from colour.algebra import euclidean_distance
 from colour.colorimetry import (
     ASTME30815_PRACTISE_SHAPE, D_illuminant_relative_spd, ILLUMINANTS,
     STANDARD_OBSERVERS_CMFS, blackbody_spd, spectral_to_XYZ)
+from colour.quality.cri import (multi_spds_values,
+                                reference_illuminants_values)
 from colour.quality.dataset.vs import VS_INDEXES_TO_NAMES, VS_SPDS
 from colour.models import (Lab_to_LCHab, UCS_to_uv, XYZ_to_Lab, XYZ_to_UCS,
                            XYZ_to_xy, xy_to_XYZ)
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Ohno2013
 from colour.adaptation import chromatic_adaptation_VonKries
-from colour.utilities import tsplit
+from colour.utilities import tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -50,7 +53,8 @@ __all__ = [
     'D65_GAMUT_AREA', 'VS_ColorimetryData', 'VS_ColourQualityScaleData',
     'CQS_Specification', 'colour_quality_scale', 'gamut_area',
     'vs_colorimetry_data', 'CCT_factor', 'scale_conversion', 'delta_E_RMS',
-    'colour_quality_scales'
+    'colour_quality_scales', 'multi_colour_quality_scale',
+    'multi_vs_colorimetry_data'
 ]
 
 D65_GAMUT_AREA = 8210
@@ -207,11 +211,12 @@ def gamut_area(Lab):
     Parameters
     ----------
     Lab : array_like
-        *CIE L\*a\*b\** colourspace matrices.
+        *CIE L\*a\*b\** colourspace matrices, the gamut polygon vertices are
+        stored along the penultimate axis.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Gamut area :math:`G`.
 
     Examples
@@ -238,18 +243,18 @@ def gamut_area(Lab):
     """
 
     Lab = np.asarray(Lab)
-    Lab_s = np.roll(np.copy(Lab), -3)
+    Lab_s = np.roll(Lab, -1, axis=-2)
 
     _L, a, b = tsplit(Lab)
     _L_s, a_s, b_s = tsplit(Lab_s)
 
     A = np.linalg.norm(Lab[..., 1:3], axis=-1)
     B = np.linalg.norm(Lab_s[..., 1:3], axis=-1)
-    C = np.linalg.norm(np.dstack((a_s - a, b_s - b)), axis=-1)
+    C = np.linalg.norm(tstack((a_s - a, b_s - b)), axis=-1)
     t = (A + B + C) / 2
     S = np.sqrt(t * (t - A) * (t - B) * (t - C))
 
-    return np.sum(S)
+    return np.sum(S, axis=-1)
 
 
 def vs_colorimetry_data(spd_test,
@@ -423,3 +428,181 @@ def colour_quality_scales(test_data, reference_data, CCT_f):
         Q_as[i + 1] = VS_ColourQualityScaleData(test_data[i].name, Q_a, D_C_ab,
                                                 D_E_ab, D_Ep_ab)
     return Q_as
+
+
+def multi_colour_quality_scale(spds_test, additional_data=False):
+    """
+    Returns the *Colour Quality Scale* (CQS) of given spectral power
+    distributions.
+
+    The *VS test colour samples* tristimulus values of all the spectral power
+    distributions are computed with a single matrix product and their
+    reference illuminants are generated in bulk, making this definition
+    suitable for large lamps catalogues or spectral sweeps.
+
+    Parameters
+    ----------
+    spds_test : MultiSpectralPowerDistribution or array_like
+        Test multi-spectral power distribution or array of test spectral power
+        distributions values with shape (N, bins) sampled according to
+        :attr:`colour.ASTME30815_PRACTISE_SHAPE` attribute.
+    additional_data : bool, optional
+        Output additional data.
+
+    Returns
+    -------
+    ndarray or CQS_Specification
+        Color quality scale :math:`Q_a` with shape (N, ). The additional data
+        specification stores the :math:`Q_a`, :math:`Q_f`, :math:`Q_p`,
+        :math:`Q_g` and :math:`Q_d` values with shape (N, ), the individual
+        *VS test colour samples* colour quality scales with shape (N, 15) and
+        the colorimetry data for the test and reference computations.
+
+    References
+    ----------
+    -   :cite:`Davis2010a`
+    -   :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_SPDS
+    >>> spds = np.array([
+    ...     ILLUMINANTS_SPDS[name].copy().align(
+    ...         ASTME30815_PRACTISE_SHAPE).values for name in ('F2', 'A')
+    ... ])
+    >>> multi_colour_quality_scale(spds)  # doctest: +ELLIPSIS
+    array([ 64.6863391...,  98.4956444...])
+    """
+
+    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
+    ).trim(ASTME30815_PRACTISE_SHAPE)
+
+    shape = cmfs.shape
+    names, S_t = multi_spds_values(spds_test, shape)
+    R_vs = np.array([
+        VS_SPDS[value].copy().align(shape).values
+        for _key, value in sorted(VS_INDEXES_TO_NAMES.items())
+    ])
+
+    XYZ = np.dot(S_t, cmfs.values)
+    uv = UCS_to_uv(XYZ_to_UCS(XYZ))
+    CCT, _D_uv = tsplit(uv_to_CCT_Ohno2013(uv))
+
+    S_r = reference_illuminants_values(CCT, shape)
+
+    test_vs_colorimetry_data = multi_vs_colorimetry_data(
+        S_t, S_r, R_vs, cmfs, chromatic_adaptation=True)
+
+    reference_vs_colorimetry_data = multi_vs_colorimetry_data(
+        S_r, S_r, R_vs, cmfs)
+
+    XYZ_r = np.dot(S_r, cmfs.values)
+    XYZ_r /= XYZ_r[..., 1, np.newaxis]
+
+    xy_w = ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
+    XYZ_w = xy_to_XYZ(xy_w)
+
+    XYZ_a = chromatic_adaptation_VonKries(
+        reference_vs_colorimetry_data.XYZ,
+        XYZ_r[..., np.newaxis, :],
+        XYZ_w,
+        transform='CMCCAT2000')
+    G_r = gamut_area(XYZ_to_Lab(XYZ_a, illuminant=xy_w)) / D65_GAMUT_AREA
+    CCT_f = np.where(G_r > 1, 1, G_r)
+
+    D_C_ab = test_vs_colorimetry_data.C - reference_vs_colorimetry_data.C
+    D_E_ab = euclidean_distance(test_vs_colorimetry_data.Lab,
+                                reference_vs_colorimetry_data.Lab)
+    with np.errstate(invalid='ignore'):
+        D_Ep_ab = np.where(D_C_ab > 0, np.sqrt(D_E_ab ** 2 - D_C_ab ** 2),
+                           D_E_ab)
+
+    Q_as = scale_conversion(D_Ep_ab, CCT_f[..., np.newaxis])
+
+    D_E_RMS = np.sqrt(np.average(D_E_ab ** 2, axis=-1))
+    D_Ep_RMS = np.sqrt(np.average(D_Ep_ab ** 2, axis=-1))
+
+    Q_a = scale_conversion(D_Ep_RMS, CCT_f)
+    Q_f = scale_conversion(D_E_RMS, CCT_f, 2.928)
+
+    p_delta_C = np.average(np.where(D_C_ab > 0, D_C_ab, 0), axis=-1)
+    Q_p = 100 - 3.6 * (D_Ep_RMS - p_delta_C)
+
+    G_t = gamut_area(test_vs_colorimetry_data.Lab)
+    G_r = gamut_area(reference_vs_colorimetry_data.Lab)
+
+    Q_g = G_t / D65_GAMUT_AREA * 100
+    Q_d = G_t / G_r * CCT_f * 100
+
+    if additional_data:
+        return CQS_Specification(names, Q_a, Q_f, Q_p, Q_g, Q_d, Q_as,
+                                 (test_vs_colorimetry_data,
+                                  reference_vs_colorimetry_data))
+    else:
+        return Q_a
+
+
+def multi_vs_colorimetry_data(S_t, S_r, R_vs, cmfs,
+                              chromatic_adaptation=False):
+    """
+    Returns the *VS test colour samples* colorimetry data for given test and
+    reference spectral power distributions values.
+
+    Parameters
+    ----------
+    S_t : array_like
+        Test spectral power distributions values with shape (N, bins).
+    S_r : array_like
+        Reference spectral power distributions values with shape (N, bins).
+    R_vs : array_like
+        *VS test colour samples* spectral reflectances values with shape
+        (K, bins).
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    VS_ColorimetryData
+        *VS test colour samples* colorimetry data, with *CIE XYZ* tristimulus
+        values, *CIE L\*a\*b\** colourspace matrices and chroma
+        :math:`C^*_{ab}` of shape (N, K, 3), (N, K, 3) and (N, K) respectively.
+    """
+
+    S_t = np.asarray(S_t)
+    S_r = np.asarray(S_r)
+    R_vs = np.asarray(R_vs)
+
+    y_bar = cmfs.values[..., 1]
+    bins, samples = R_vs.shape[-1], R_vs.shape[0]
+
+    XYZ_t = np.dot(S_t, cmfs.values)
+    XYZ_t /= XYZ_t[..., 1, np.newaxis]
+
+    XYZ_r = np.dot(S_r, cmfs.values)
+    XYZ_r /= XYZ_r[..., 1, np.newaxis]
+    xy_r = XYZ_to_xy(XYZ_r)
+
+    # Weighting of the colour matching functions by each *VS test colour
+    # sample* so that all the tristimulus values are computed with a single
+    # product.
+    W = np.reshape(
+        np.transpose(R_vs[..., np.newaxis] * cmfs.values, (1, 0, 2)),
+        (bins, samples * 3))
+    XYZ_vs = np.reshape(np.dot(S_t, W), S_t.shape[:-1] + (samples, 3))
+    XYZ_vs /= np.dot(S_t, y_bar)[..., np.newaxis, np.newaxis]
+
+    if chromatic_adaptation:
+        XYZ_vs = chromatic_adaptation_VonKries(
+            XYZ_vs,
+            XYZ_t[..., np.newaxis, :],
+            XYZ_r[..., np.newaxis, :],
+            transform='CMCCAT2000')
+
+    Lab_vs = XYZ_to_Lab(XYZ_vs, illuminant=xy_r[..., np.newaxis, :])
+    _L_vs, C_vs, _Hab = tsplit(Lab_to_LCHab(Lab_vs))
+
+    return VS_ColorimetryData(
+        [value for _key, value in sorted(VS_INDEXES_TO_NAMES.items())],
+        XYZ_vs, Lab_vs, C_vs)
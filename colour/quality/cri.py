@@ -7,6 +7,7 @@ Defines *Colour Rendering Index* (CRI) computation objects:
 
 -   :class:`colour.quality.CRI_Specification`
 -   :func:`colour.colour_rendering_index`
+-   :func:`colour.multi_colour_rendering_index`
 
 See Also
 --------
@@ -28,11 +29,13 @@ from collections import namedtuple
 
 from colour.algebra import euclidean_distance
 from colour.colorimetry import (
-    ASTME30815_PRACTISE_SHAPE, D_illuminant_relative_spd,
-    STANDARD_OBSERVERS_CMFS, blackbody_spd, spectral_to_XYZ)
+    ASTME30815_PRACTISE_SHAPE, D_illuminant_relative_msa,
+    D_illuminant_relative_spd, MultiSpectralPowerDistribution,
+    STANDARD_OBSERVERS_CMFS, blackbody_msa, blackbody_spd, spectral_to_XYZ)
 from colour.quality.dataset.tcs import TCS_INDEXES_TO_NAMES, TCS_SPDS
 from colour.models import UCS_to_uv, XYZ_to_UCS, XYZ_to_xyY
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Robertson1968
+from colour.utilities import tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -44,7 +47,9 @@ __status__ = 'Production'
 __all__ = [
     'TCS_ColorimetryData', 'TCS_ColourQualityScaleData', 'CRI_Specification',
     'colour_rendering_index', 'tcs_colorimetry_data',
-    'colour_rendering_indexes'
+    'colour_rendering_indexes', 'multi_spds_values',
+    'reference_illuminants_values', 'multi_colour_rendering_index',
+    'multi_tcs_colorimetry_data'
 ]
 
 
@@ -255,3 +260,259 @@ def colour_rendering_indexes(test_data, reference_data):
             test_data[i].name, 100 -
             4.6 * euclidean_distance(reference_data[i].UVW, test_data[i].UVW))
     return Q_as
+
+
+def multi_spds_values(spds, shape):
+    """
+    Returns the names and values of given spectral power distributions aligned
+    to given spectral shape.
+
+    Parameters
+    ----------
+    spds : MultiSpectralPowerDistribution or array_like
+        Multi-spectral power distribution or array of spectral power
+        distributions values with shape (N, bins), in that latter case the
+        values are expected to be sampled according to given spectral shape.
+    shape : SpectralShape
+        Spectral shape to align the spectral power distributions to.
+
+    Returns
+    -------
+    tuple
+        Spectral power distributions names and values with shape (N, bins).
+
+    Raises
+    ------
+    ValueError
+        If the spectral power distributions values are not sampled according
+        to given spectral shape.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> values = np.ones((2, 5))
+    >>> multi_spds_values(values, SpectralShape(400, 700, 75))
+    ... # doctest: +ELLIPSIS
+    (None, array([[ 1.,  1.,  1.,  1.,  1.],
+           [ 1.,  1.,  1.,  1.,  1.]]))
+    """
+
+    if isinstance(spds, MultiSpectralPowerDistribution):
+        spds = spds.copy().align(shape)
+
+        return spds.labels, np.transpose(spds.values)
+
+    values = np.asarray(spds)
+    if values.shape[-1] != len(shape.range()):
+        raise ValueError(
+            'Spectral power distributions values with "{0}" bins are not '
+            'sampled according to "{1}" shape!'.format(values.shape[-1],
+                                                       shape))
+
+    return None, values
+
+
+def reference_illuminants_values(CCT, shape):
+    """
+    Returns the values of the reference illuminants for given correlated
+    colour temperatures :math:`T_{cp}`, i.e. a planckian radiator below
+    5000K and a *CIE Illuminant D Series* otherwise.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Spectral shape of the reference illuminants.
+
+    Returns
+    -------
+    ndarray
+        Reference illuminants values with shape (..., bins).
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> reference_illuminants_values(
+    ...     np.array([4000, 6500]), SpectralShape(400, 450, 10))
+    ... # doctest: +ELLIPSIS
+    array([[  1.4463994...e+12,   1.5919728...e+12,   1.7391687...e+12,
+              1.8869585...e+12,   2.0343650...e+12,   2.1804739...e+12],
+           [  8.2710400...e+01,   9.1439200...e+01,   9.3387200...e+01,
+              8.6644000...e+01,   1.0482560...e+02,   1.1696880...e+02]])
+    """
+
+    CCT = np.asarray(CCT)
+
+    blackbody = blackbody_msa(CCT, shape)
+
+    # Planckian radiators temperatures are substituted to avoid computing
+    # *CIE Illuminant D Series* outside their domain.
+    daylight = D_illuminant_relative_msa(
+        CCT_to_xy_CIE_D(np.where(CCT < 5000, 5000, CCT)), shape)
+
+    return np.where((CCT < 5000)[..., np.newaxis], blackbody, daylight)
+
+
+def multi_colour_rendering_index(spds_test, additional_data=False):
+    """
+    Returns the *Colour Rendering Index* (CRI) :math:`Q_a` of given spectral
+    power distributions.
+
+    The *test colour samples* tristimulus values of all the spectral power
+    distributions are computed with a single matrix product and their
+    reference illuminants are generated in bulk, making this definition
+    suitable for large lamps catalogues or spectral sweeps.
+
+    Parameters
+    ----------
+    spds_test : MultiSpectralPowerDistribution or array_like
+        Test multi-spectral power distribution or array of test spectral power
+        distributions values with shape (N, bins) sampled according to
+        :attr:`colour.ASTME30815_PRACTISE_SHAPE` attribute.
+    additional_data : bool, optional
+        Output additional data.
+
+    Returns
+    -------
+    ndarray or CRI_Specification
+        *Colour Rendering Index* (CRI) :math:`Q_a` with shape (N, ). The
+        additional data specification stores the :math:`Q_a` values, the
+        individual *colour rendering indexes* :math:`R_1`-:math:`R_{14}` with
+        shape (N, 14) and the colorimetry data for the test and reference
+        computations.
+
+    References
+    ----------
+    -   :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_SPDS
+    >>> spds = np.array([
+    ...     ILLUMINANTS_SPDS[name].copy().align(
+    ...         ASTME30815_PRACTISE_SHAPE).values for name in ('F2', 'A')
+    ... ])
+    >>> multi_colour_rendering_index(spds)  # doctest: +ELLIPSIS
+    array([ 64.1515202...,  99.9967326...])
+    """
+
+    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
+    ).trim(ASTME30815_PRACTISE_SHAPE)
+
+    shape = cmfs.shape
+    names, S_t = multi_spds_values(spds_test, shape)
+    R_tcs = np.array([
+        TCS_SPDS[value].copy().align(shape).values
+        for _key, value in sorted(TCS_INDEXES_TO_NAMES.items())
+    ])
+
+    XYZ = np.dot(S_t, cmfs.values)
+    uv = UCS_to_uv(XYZ_to_UCS(XYZ))
+    CCT, _D_uv = tsplit(uv_to_CCT_Robertson1968(uv))
+
+    S_r = reference_illuminants_values(CCT, shape)
+
+    test_tcs_colorimetry_data = multi_tcs_colorimetry_data(
+        S_t, S_r, R_tcs, cmfs, chromatic_adaptation=True)
+
+    reference_tcs_colorimetry_data = multi_tcs_colorimetry_data(
+        S_r, S_r, R_tcs, cmfs)
+
+    Q_as = 100 - 4.6 * euclidean_distance(reference_tcs_colorimetry_data.UVW,
+                                          test_tcs_colorimetry_data.UVW)
+
+    Q_a = np.average(Q_as[..., 0:8], axis=-1)
+
+    if additional_data:
+        return CRI_Specification(names, Q_a, Q_as,
+                                 (test_tcs_colorimetry_data,
+                                  reference_tcs_colorimetry_data))
+    else:
+        return Q_a
+
+
+def multi_tcs_colorimetry_data(S_t, S_r, R_tcs, cmfs,
+                               chromatic_adaptation=False):
+    """
+    Returns the *test colour samples* colorimetry data for given test and
+    reference spectral power distributions values.
+
+    Parameters
+    ----------
+    S_t : array_like
+        Test spectral power distributions values with shape (N, bins).
+    S_r : array_like
+        Reference spectral power distributions values with shape (N, bins).
+    R_tcs : array_like
+        *Test colour samples* spectral reflectances values with shape
+        (K, bins).
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    TCS_ColorimetryData
+        *Test colour samples* colorimetry data, with *CIE XYZ* tristimulus
+        values, *uv* chromaticity coordinates and *CIE U\*V\*W\**
+        values of shape (N, K, 3), (N, K, 2) and (N, K, 3) respectively.
+    """
+
+    S_t = np.asarray(S_t)
+    S_r = np.asarray(S_r)
+    R_tcs = np.asarray(R_tcs)
+
+    y_bar = cmfs.values[..., 1]
+    bins, samples = R_tcs.shape[-1], R_tcs.shape[0]
+
+    uv_t = UCS_to_uv(XYZ_to_UCS(np.dot(S_t, cmfs.values)))
+    u_t, v_t = [x[..., np.newaxis] for x in tsplit(uv_t)]
+
+    uv_r = UCS_to_uv(XYZ_to_UCS(np.dot(S_r, cmfs.values)))
+    u_r, v_r = [x[..., np.newaxis] for x in tsplit(uv_r)]
+
+    # Weighting of the colour matching functions by each *test colour sample*
+    # so that all the tristimulus values are computed with a single product.
+    W = np.reshape(
+        np.transpose(R_tcs[..., np.newaxis] * cmfs.values, (1, 0, 2)),
+        (bins, samples * 3))
+    XYZ_tcs = np.reshape(np.dot(S_t, W), S_t.shape[:-1] + (samples, 3))
+    XYZ_tcs *= (100 / np.dot(S_t, y_bar))[..., np.newaxis, np.newaxis]
+
+    xyY_tcs = XYZ_to_xyY(XYZ_tcs)
+    uv_tcs = UCS_to_uv(XYZ_to_UCS(XYZ_tcs))
+    u_tcs, v_tcs = tsplit(uv_tcs)
+
+    if chromatic_adaptation:
+
+        def c(x, y):
+            """
+            Computes the :math:`c` term.
+            """
+
+            return (4 - x - 10 * y) / y
+
+        def d(x, y):
+            """
+            Computes the :math:`d` term.
+            """
+
+            return (1.708 * y + 0.404 - 1.481 * x) / y
+
+        c_t, d_t = c(u_t, v_t), d(u_t, v_t)
+        c_r, d_r = c(u_r, v_r), d(u_r, v_r)
+        tcs_c, tcs_d = c(u_tcs, v_tcs), d(u_tcs, v_tcs)
+        u_tcs = ((10.872 + 0.404 * c_r / c_t * tcs_c - 4 * d_r / d_t * tcs_d) /
+                 (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+        v_tcs = (5.52 /
+                 (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+
+    W_tcs = 25 * xyY_tcs[..., -1] ** (1 / 3) - 17
+    U_tcs = 13 * W_tcs * (u_tcs - u_r)
+    V_tcs = 13 * W_tcs * (v_tcs - v_r)
+
+    return TCS_ColorimetryData(
+        [value for _key, value in sorted(TCS_INDEXES_TO_NAMES.items())],
+        XYZ_tcs, uv_tcs, tstack((U_tcs, V_tcs, W_tcs)))
@@ -5,11 +5,13 @@ Defines unit tests for :mod:`colour.quality.cqs` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
-from colour.quality import colour_quality_scale
-from colour.colorimetry import (ILLUMINANTS_SPDS,
-                                LIGHT_SOURCES_SPDS)
+from colour.quality import colour_quality_scale, multi_colour_quality_scale
+from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE, ILLUMINANTS_SPDS,
+                                LIGHT_SOURCES_SPDS,
+                                MultiSpectralPowerDistribution)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,7 +20,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestColourQualityScale']
+__all__ = ['TestColourQualityScale', 'TestMultiColourQualityScale']
 
 
 class TestColourQualityScale(unittest.TestCase):
@@ -67,5 +69,73 @@ class TestColourQualityScale(unittest.TestCase):
             places=7)
 
 
+class TestMultiColourQualityScale(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cqs.multi_colour_quality_scale` definition
+    unit tests methods.
+    """
+
+    def test_multi_colour_quality_scale(self):
+        """
+        Tests :func:`colour.quality.cqs.multi_colour_quality_scale`
+        definition.
+        """
+
+        spds = MultiSpectralPowerDistribution({
+            'F1':
+                ILLUMINANTS_SPDS['F1'].copy().align(ASTME30815_PRACTISE_SHAPE),
+            'F2':
+                ILLUMINANTS_SPDS['F2'].copy().align(ASTME30815_PRACTISE_SHAPE),
+            'Neodimium Incandescent':
+                LIGHT_SOURCES_SPDS['Neodimium Incandescent'].copy().align(
+                    ASTME30815_PRACTISE_SHAPE),
+            'H38HT-100 (Mercury)':
+                LIGHT_SOURCES_SPDS['H38HT-100 (Mercury)'].copy().align(
+                    ASTME30815_PRACTISE_SHAPE),
+        })
+
+        Q_a = dict(
+            zip(spds.labels, multi_colour_quality_scale(spds)))
+        self.assertAlmostEqual(Q_a['F1'], 75.332008182589348, places=7)
+        self.assertAlmostEqual(Q_a['F2'], 64.686339173112856, places=7)
+        self.assertAlmostEqual(
+            Q_a['Neodimium Incandescent'], 87.655035241231985, places=7)
+        self.assertAlmostEqual(
+            Q_a['H38HT-100 (Mercury)'], 22.860610106043985, places=7)
+
+        specification = multi_colour_quality_scale(
+            np.transpose(spds.values), additional_data=True)
+        np.testing.assert_almost_equal(
+            specification.Q_a, [Q_a[label] for label in spds.labels],
+            decimal=7)
+        self.assertEqual(specification.Q_as.shape, (4, 15))
+
+        specification_f2 = colour_quality_scale(
+            ILLUMINANTS_SPDS['F2'], additional_data=True)
+        i = spds.labels.index('F2')
+        for attribute in ('Q_f', 'Q_p', 'Q_g', 'Q_d'):
+            self.assertAlmostEqual(
+                getattr(specification, attribute)[i],
+                getattr(specification_f2, attribute),
+                places=7)
+
+        np.testing.assert_almost_equal(
+            specification.Q_as[i],
+            [
+                specification_f2.Q_as[j].Q_a
+                for j in sorted(specification_f2.Q_as.keys())
+            ],
+            decimal=7)
+
+    def test_raise_exception_multi_colour_quality_scale(self):
+        """
+        Tests :func:`colour.quality.cqs.multi_colour_quality_scale`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, multi_colour_quality_scale,
+                          np.ones((2, 10)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,10 +5,13 @@ Defines unit tests for :mod:`colour.quality.cri` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
-from colour.quality import colour_rendering_index
-from colour.colorimetry import (ILLUMINANTS_SPDS,
+from colour.quality import (colour_rendering_index,
+                            multi_colour_rendering_index)
+from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE, ILLUMINANTS_SPDS,
+                                MultiSpectralPowerDistribution,
                                 SpectralPowerDistribution)
 
 __author__ = 'Colour Developers'
@@ -18,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestColourRenderingIndex']
+__all__ = ['TestColourRenderingIndex', 'TestMultiColourRenderingIndex']
 
 SAMPLE_SPD_DATA = {
     380: 0.00588346,
@@ -132,5 +135,59 @@ class TestColourRenderingIndex(unittest.TestCase):
             places=7)
 
 
+class TestMultiColourRenderingIndex(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cri.multi_colour_rendering_index`
+    definition unit tests methods.
+    """
+
+    def test_multi_colour_rendering_index(self):
+        """
+        Tests :func:`colour.quality.cri.multi_colour_rendering_index`
+        definition.
+        """
+
+        spds = MultiSpectralPowerDistribution({
+            'F2':
+                ILLUMINANTS_SPDS['F2'].copy().align(ASTME30815_PRACTISE_SHAPE),
+            'A':
+                ILLUMINANTS_SPDS['A'].copy().align(ASTME30815_PRACTISE_SHAPE),
+            'Sample':
+                SpectralPowerDistribution(SAMPLE_SPD_DATA).align(
+                    ASTME30815_PRACTISE_SHAPE),
+        })
+
+        Q_a = dict(zip(spds.labels, multi_colour_rendering_index(spds)))
+        self.assertAlmostEqual(Q_a['F2'], 64.151520202968015, places=7)
+        self.assertAlmostEqual(Q_a['A'], 99.996732643006169, places=7)
+        self.assertAlmostEqual(Q_a['Sample'], 70.813839034481575, places=7)
+
+        specification = multi_colour_rendering_index(
+            np.transpose(spds.values), additional_data=True)
+        np.testing.assert_almost_equal(
+            specification.Q_a, [Q_a[label] for label in spds.labels],
+            decimal=7)
+        self.assertEqual(specification.Q_as.shape, (3, 14))
+
+        specification_f2 = colour_rendering_index(
+            ILLUMINANTS_SPDS['F2'], additional_data=True)
+        np.testing.assert_almost_equal(
+            specification.Q_as[spds.labels.index('F2')],
+            [
+                specification_f2.Q_as[i].Q_a
+                for i in sorted(specification_f2.Q_as.keys())
+            ],
+            decimal=7)
+
+    def test_raise_exception_multi_colour_rendering_index(self):
+        """
+        Tests :func:`colour.quality.cri.multi_colour_rendering_index`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, multi_colour_rendering_index,
+                          np.ones((2, 10)))
+
+
 if __name__ == '__main__':
     unittest.main()
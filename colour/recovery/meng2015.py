@@ -24,7 +24,6 @@ References
 from __future__ import division, unicode_literals
 
 import numpy as np
-from scipy.optimize import minimize
 
 from colour.colorimetry import (STANDARD_OBSERVERS_CMFS,
                                 SpectralPowerDistribution, SpectralShape,
@@ -175,6 +174,8 @@ def XYZ_to_spectral_Meng2015(
 
     bounds = np.tile(np.array([0, 1000]), (bins, 1))
 
+    from scipy.optimize import minimize
+
     result = minimize(
         function_objective,
         spd.values,
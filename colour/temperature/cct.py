@@ -90,8 +90,8 @@ import numpy as np
 from collections import namedtuple
 
 from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE,
-                                STANDARD_OBSERVERS_CMFS, blackbody_spd,
-                                spectral_to_XYZ)
+                                STANDARD_OBSERVERS_CMFS, blackbody_XYZ,
+                                blackbody_spd, spectral_to_XYZ)
 from colour.models import UCS_to_uv, XYZ_to_UCS
 from colour.utilities import (CaseInsensitiveMapping, as_numeric,
                               filter_kwargs, tsplit, tstack, warning)
@@ -241,19 +241,11 @@ ui=0.4456351..., vi=0.3548306..., di=0.2514749...)]
 
     cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
 
-    shape = cmfs.shape
-
-    table = []
-    for Ti in np.linspace(start, end, count):
-        spd = blackbody_spd(Ti, shape)
-        XYZ = spectral_to_XYZ(spd, cmfs)
-        XYZ /= np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        ui, vi = UCS_to_uv(UVW)
-        di = np.hypot(ux - ui, vx - vi)
-        table.append(PLANCKIAN_TABLE_TUVD(Ti, ui, vi, di))
+    Ti = np.linspace(start, end, count)
+    ui, vi = tsplit(_planckian_uv(Ti, cmfs))
+    di = np.hypot(ux - ui, vx - vi)
 
-    return table
+    return [PLANCKIAN_TABLE_TUVD(*row) for row in zip(Ti, ui, vi, di)]
 
 
 def planckian_table_minimal_distance_index(planckian_table_):
@@ -335,33 +327,48 @@ def uv_to_CCT_Ohno2013(
     array([  6.5074738...e+03,   3.2233461...e-03])
     """
 
+    uv = np.asarray(uv)
+
+    shape = uv.shape
+    u, v = tsplit(np.reshape(uv, (-1, 2)))
+
+    cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+
+    start = np.full(u.shape, start, dtype=np.float_)
+    end = np.full(u.shape, end, dtype=np.float_)
+
     # Ensuring we do at least one iteration to initialise variables.
     iterations = max(iterations, 1)
 
-    # Planckian table creation through cascade expansion.
+    # Planckian tables creation through cascade expansion.
+    samples = np.arange(count)
+    rows = np.arange(u.shape[0])
     for _i in range(iterations):
-        table = planckian_table(uv, cmfs, start, end, count)
-        index = planckian_table_minimal_distance_index(table)
-        if index == 0:
+        # Mimicking :func:`np.linspace` definition for each planckian table.
+        Ti = (start[..., np.newaxis] + samples *
+              ((end - start) / (count - 1))[..., np.newaxis])
+        Ti[..., -1] = end
+
+        ui, vi = tsplit(_planckian_uv(Ti, cmfs))
+        di = np.hypot(u[..., np.newaxis] - ui, v[..., np.newaxis] - vi)
+
+        index = np.argmin(di, axis=-1)
+        if np.any(index == 0):
             warning(
                 ('Minimal distance index is on lowest planckian table bound, '
                  'unpredictable results may occur!'))
-            index += 1
-        elif index == len(table) - 1:
+        if np.any(index == count - 1):
             warning(
                 ('Minimal distance index is on highest planckian table bound, '
                  'unpredictable results may occur!'))
-            index -= 1
+        index = np.clip(index, 1, count - 2)
 
-        start = table[index - 1].Ti
-        end = table[index + 1].Ti
+        start = Ti[rows, index - 1]
+        end = Ti[rows, index + 1]
 
-    _ux, vx = uv
-
-    Tuvdip, Tuvdi, Tuvdin = (table[index - 1], table[index], table[index + 1])
-    Tip, uip, vip, dip = Tuvdip.Ti, Tuvdip.ui, Tuvdip.vi, Tuvdip.di
-    Ti, di = Tuvdi.Ti, Tuvdi.di
-    Tin, uin, vin, din = Tuvdin.Ti, Tuvdin.ui, Tuvdin.vi, Tuvdin.di
+    Tip, uip, vip, dip = [a[rows, index - 1] for a in (Ti, ui, vi, di)]
+    Tin, uin, vin, din = [a[rows, index + 1] for a in (Ti, ui, vi, di)]
+    Ti, di = Ti[rows, index], di[rows, index]
 
     # Triangular solution.
     l = np.hypot(uin - uip, vin - vip)  # noqa
@@ -369,24 +376,59 @@ def uv_to_CCT_Ohno2013(
     T = Tip + (Tin - Tip) * (x / l)
 
     vtx = vip + (vin - vip) * (x / l)
-    sign = 1 if vx - vtx >= 0 else -1
+    sign = np.where(v - vtx >= 0, 1, -1)
     D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
 
     # Parabolic solution.
-    if np.abs(D_uv) >= 0.002:
-        X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
-        a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
-        b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
-               (di - dip)) * X ** -1)
-        c = (-(dip * (Tin - Ti) * Ti * Tin + di *
-               (Tip - Tin) * Tip * Tin + din *
-               (Ti - Tip) * Tip * Ti) * X ** -1)
+    X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
+    a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
+    b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
+           (di - dip)) * X ** -1)
+    c = (-(dip * (Tin - Ti) * Ti * Tin + di * (Tip - Tin) * Tip * Tin + din *
+           (Ti - Tip) * Tip * Ti) * X ** -1)
+
+    T_p = -b / (2 * a)
+    D_uv_p = sign * (a * T_p ** 2 + b * T_p + c)
 
-        T = -b / (2 * a)
+    parabolic = np.abs(D_uv) >= 0.002
+    T = np.where(parabolic, T_p, T)
+    D_uv = np.where(parabolic, D_uv_p, D_uv)
 
-        D_uv = sign * (a * T ** 2 + b * T + c)
+    return np.reshape(tstack((T, D_uv)), shape)
 
-    return np.array([T, D_uv])
+
+def _planckian_uv(T, cmfs):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates of the
+    planckian radiators at given temperatures.
+
+    Parameters
+    ----------
+    T : array_like
+        Planckian radiators temperatures in kelvins.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    ndarray
+        Planckian radiators *uv* chromaticity coordinates.
+    """
+
+    T = np.asarray(T)
+
+    shape = cmfs.shape
+    # Tristimulus values are computed with a direct integration for the
+    # measurement intervals where the practise "ASTM E308-15" reduces to it.
+    if shape.interval in (1, 5):
+        XYZ = blackbody_XYZ(T, cmfs)
+    else:
+        XYZ = np.reshape([
+            spectral_to_XYZ(blackbody_spd(Ti, shape), cmfs)
+            for Ti in np.ravel(T)
+        ], T.shape + (3, ))
+
+    return UCS_to_uv(XYZ_to_UCS(XYZ))
 
 
 def CCT_to_uv_Ohno2013(
@@ -428,25 +470,13 @@ def CCT_to_uv_Ohno2013(
 
     cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
 
-    shape = cmfs.shape
-
     delta = 0.01
 
-    spd = blackbody_spd(CCT, shape)
-    XYZ = spectral_to_XYZ(spd, cmfs)
-    XYZ *= 1 / np.max(XYZ)
-    UVW = XYZ_to_UCS(XYZ)
-    u0, v0 = UCS_to_uv(UVW)
+    (u0, v0), (u1, v1) = _planckian_uv(np.array([CCT, CCT + delta]), cmfs)
 
     if D_uv == 0:
         return np.array([u0, v0])
     else:
-        spd = blackbody_spd(CCT + delta, shape)
-        XYZ = spectral_to_XYZ(spd, cmfs)
-        XYZ *= 1 / np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        u1, v1 = UCS_to_uv(UVW)
-
         du = u0 - u1
         dv = v0 - v1
 
@@ -484,57 +514,58 @@ def uv_to_CCT_Robertson1968(uv):
     array([  6.5000162...e+03,   8.3333289...e-03])
     """
 
-    u, v = uv
-
-    last_dt = last_dv = last_du = 0
-
-    for i in range(1, 31):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_previous = ROBERTSON_ISOTEMPERATURE_LINES[i - 1]
-
-        du = 1
-        dv = wr_ruvt.t
+    uv = np.asarray(uv)
 
-        length = np.hypot(1, dv)
+    shape = uv.shape
+    u, v = tsplit(np.reshape(uv, (-1, 2)))
+    u, v = u[..., np.newaxis], v[..., np.newaxis]
 
-        du /= length
-        dv /= length
+    r_l, u_l, v_l, t_l = tsplit(ROBERTSON_ISOTEMPERATURE_LINES_DATA)
 
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
+    length = np.hypot(1, t_l)
+    du_l = 1 / length
+    dv_l = t_l / length
 
-        dt = -uu * dv + vv * du
+    dt_l = -(u - u_l) * dv_l + (v - v_l) * du_l
+    dt_l[..., 0] = 0
 
-        if dt <= 0 or i == 30:
-            if dt > 0:
-                dt = 0
+    # Index of the first iso-temperature line with a non positive distance,
+    # defaulting to the last one.
+    with np.errstate(invalid='ignore'):
+        i = np.argmax(dt_l[..., 1:] <= 0, axis=-1) + 1
+        i = np.where(np.any(dt_l[..., 1:] <= 0, axis=-1), i, 30)
 
-            dt = -dt
+    def line(a, i):
+        """
+        Returns given iso-temperature lines attribute at given index.
+        """
 
-            f = 0 if i == 1 else dt / (last_dt + dt)
+        return np.take(a, i)
 
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
+    rows = np.arange(i.shape[0])
+    dt = dt_l[rows, i]
+    last_dt = dt_l[rows, i - 1]
+    with np.errstate(invalid='ignore'):
+        dt = -np.where(dt > 0, 0, dt)
 
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
+        f = np.where(i == 1, 0, dt / (last_dt + dt))
 
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
+    T = 1.0e6 / (line(r_l, i - 1) * f + line(r_l, i) * (1 - f))
 
-            length = np.hypot(du, dv)
+    uu = u[..., 0] - (line(u_l, i - 1) * f + line(u_l, i) * (1 - f))
+    vv = v[..., 0] - (line(v_l, i - 1) * f + line(v_l, i) * (1 - f))
 
-            du /= length
-            dv /= length
+    du = line(du_l, i) * (1 - f) + np.where(i == 1, 0, line(du_l, i - 1)) * f
+    dv = line(dv_l, i) * (1 - f) + np.where(i == 1, 0, line(dv_l, i - 1)) * f
 
-            D_uv = uu * du + vv * dv
+    length = np.hypot(du, dv)
 
-            break
+    du /= length
+    dv /= length
 
-        last_dt = dt
-        last_du = du
-        last_dv = dv
+    D_uv = uu * du + vv * dv
 
-    return np.array([T, -D_uv])
+    return np.reshape(tstack((T, -D_uv)), shape)
 
 
 def CCT_to_uv_Robertson1968(CCT, D_uv=0):
@@ -2,35 +2,61 @@
 
 from __future__ import absolute_import
 
-from .common import (handle_numpy_errors, ignore_numpy_errors,
+from .common import (numpy_errors_state, handle_numpy_errors,
+                     ignore_numpy_errors,
                      raise_numpy_errors, print_numpy_errors, warn_numpy_errors,
                      ignore_python_warnings, batch, is_openimageio_installed,
                      is_pandas_installed, is_iterable, is_string, is_numeric,
                      is_integer, filter_kwargs, first_item)
-from .array import (as_numeric, as_namedtuple, closest_indexes, closest,
-                    normalise_maximum, interval, is_uniform, in_array, tstack,
-                    tsplit, row_as_diagonal, dot_vector, dot_matrix, orient,
-                    centroid, linear_conversion, fill_nan, ndarray_write)
+from .array import (
+    FLOAT_PRECISION_POLICIES, get_float_precision_policy,
+    set_float_precision_policy, float_precision_policy, float_dtype,
+    as_float_array, as_numeric, as_namedtuple, closest_indexes, closest,
+    normalise_maximum, interval, is_uniform, in_array, tstack, tsplit,
+    row_as_diagonal, dot_vector, dot_matrix, orient, centroid,
+    linear_conversion, fill_nan, ndarray_write)
 from .data_structures import Lookup, Structure, CaseInsensitiveMapping
 from .metrics import metric_mse, metric_psnr
-from .verbose import (ColourWarning, message_box, warning, filter_warnings,
-                      suppress_warnings, numpy_print_options)
+from .verbose import (ColourWarning, message_box, warning,
+                      set_warnings_rate_limit, warnings_rate_limit,
+                      warnings_registry, filter_warnings, suppress_warnings,
+                      numpy_print_options)
+from .tiling import TILE_SIZE, TILING_METHODS, tiles, process_tiles
+from .instrumentation import (
+    INSTRUMENTATION_ENVIRONMENT_VARIABLE, INSTRUMENTATION_EXCLUDED_MODULES,
+    InstrumentationRecord, instrument, enable_instrumentation,
+    disable_instrumentation, is_instrumentation_enabled, reset_instrumentation,
+    instrumentation, instrumentation_records, instrumentation_report,
+    instrumentation_trace, write_instrumentation_trace)
 
 __all__ = [
-    'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
-    'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
+    'numpy_errors_state', 'handle_numpy_errors', 'ignore_numpy_errors',
+    'raise_numpy_errors', 'print_numpy_errors', 'warn_numpy_errors',
+    'ignore_python_warnings',
     'batch', 'is_openimageio_installed', 'is_pandas_installed', 'is_iterable',
     'is_string', 'is_numeric', 'is_integer', 'filter_kwargs', 'first_item'
 ]
 __all__ += [
-    'as_numeric', 'as_namedtuple', 'closest_indexes', 'closest',
-    'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
-    'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
+    'FLOAT_PRECISION_POLICIES', 'get_float_precision_policy',
+    'set_float_precision_policy', 'float_precision_policy', 'float_dtype',
+    'as_float_array', 'as_numeric', 'as_namedtuple', 'closest_indexes',
+    'closest', 'normalise_maximum', 'interval', 'is_uniform', 'in_array',
+    'tstack', 'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix',
+    'orient', 'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
 ]
 __all__ += ['Lookup', 'Structure', 'CaseInsensitiveMapping']
 __all__ += ['metric_mse', 'metric_psnr']
 __all__ += [
-    'ColourWarning', 'message_box', 'warning', 'filter_warnings',
+    'ColourWarning', 'message_box', 'warning', 'set_warnings_rate_limit',
+    'warnings_rate_limit', 'warnings_registry', 'filter_warnings',
     'suppress_warnings', 'numpy_print_options'
 ]
+__all__ += ['TILE_SIZE', 'TILING_METHODS', 'tiles', 'process_tiles']
+__all__ += [
+    'INSTRUMENTATION_ENVIRONMENT_VARIABLE', 'INSTRUMENTATION_EXCLUDED_MODULES',
+    'InstrumentationRecord', 'instrument', 'enable_instrumentation',
+    'disable_instrumentation', 'is_instrumentation_enabled',
+    'reset_instrumentation', 'instrumentation', 'instrumentation_records',
+    'instrumentation_report', 'instrumentation_trace',
+    'write_instrumentation_trace'
+]
@@ -33,14 +33,209 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'as_numeric', 'as_namedtuple', 'closest_indexes', 'closest',
-    'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
-    'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
+    'FLOAT_PRECISION_POLICIES', 'get_float_precision_policy',
+    'set_float_precision_policy', 'float_precision_policy', 'float_dtype',
+    'as_float_array', 'as_numeric', 'as_namedtuple', 'closest_indexes',
+    'closest', 'normalise_maximum', 'interval', 'is_uniform', 'in_array',
+    'tstack', 'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix',
+    'orient', 'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
 ]
 
+FLOAT_PRECISION_POLICIES = ('Promote', 'Preserve')
+"""
+Floating point precision policies:
+
+-   *Promote*: Computations are performed and returned using
+    :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` dtype.
+-   *Preserve*: Computations are performed and returned using the floating
+    point dtype of the main input, e.g. *float32* or *float16*, integer
+    input being promoted to :attr:`colour.constants.DEFAULT_FLOAT_DTYPE`
+    dtype.
+
+Notes
+-----
+-   The *Preserve* policy follows *Numpy* type promotion rules: single
+    samples, e.g. an array of shape (3, ), are split into *Numpy* scalars
+    that are promoted to *float64* when combined with *Python* scalars, and
+    *float16* arrays are promoted to *float32* when combined with integer
+    constants that cannot be represented exactly in *float16*.
+
+FLOAT_PRECISION_POLICIES : tuple
+    **{'Promote', 'Preserve'}**
+"""
+
+_FLOAT_PRECISION_POLICY = 'Promote'
+"""
+Current floating point precision policy.
+
+_FLOAT_PRECISION_POLICY : unicode
+    **{'Promote', 'Preserve'}**
+"""
+
+
+def get_float_precision_policy():
+    """
+    Returns the current floating point precision policy.
+
+    Returns
+    -------
+    unicode
+        **{'Promote', 'Preserve'}**,
+        Current floating point precision policy.
+
+    Examples
+    --------
+    >>> get_float_precision_policy()
+    'Promote'
+    """
+
+    return _FLOAT_PRECISION_POLICY
+
+
+def set_float_precision_policy(policy):
+    """
+    Sets the current floating point precision policy.
+
+    Parameters
+    ----------
+    policy : unicode
+        **{'Promote', 'Preserve'}**,
+        Floating point precision policy to set.
+
+    Returns
+    -------
+    unicode
+        Previous floating point precision policy.
+
+    Raises
+    ------
+    ValueError
+        If the floating point precision policy is not supported.
+
+    Examples
+    --------
+    >>> previous_policy = set_float_precision_policy('Preserve')
+    >>> get_float_precision_policy()
+    'Preserve'
+    >>> set_float_precision_policy(previous_policy)
+    'Preserve'
+    """
+
+    global _FLOAT_PRECISION_POLICY
+
+    if policy not in FLOAT_PRECISION_POLICIES:
+        raise ValueError(
+            '"{0}" floating point precision policy is invalid, it must be one '
+            'of {1}!'.format(policy, FLOAT_PRECISION_POLICIES))
 
-def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
+    previous_policy = _FLOAT_PRECISION_POLICY
+    _FLOAT_PRECISION_POLICY = policy
+
+    return previous_policy
+
+
+@contextmanager
+def float_precision_policy(policy):
+    """
+    A context manager setting the floating point precision policy.
+
+    Parameters
+    ----------
+    policy : unicode
+        **{'Promote', 'Preserve'}**,
+        Floating point precision policy to set.
+
+    Examples
+    --------
+    >>> from colour.models import XYZ_to_Lab
+    >>> XYZ = np.array([[0.20654008, 0.12197225, 0.05136952]], np.float32)
+    >>> XYZ_to_Lab(XYZ).dtype
+    dtype('float64')
+    >>> with float_precision_policy('Preserve'):
+    ...     XYZ_to_Lab(XYZ).dtype
+    dtype('float32')
+    """
+
+    previous_policy = set_float_precision_policy(policy)
+    try:
+        yield
+    finally:
+        set_float_precision_policy(previous_policy)
+
+
+def float_dtype(a):
+    """
+    Returns the floating point dtype computations involving given :math:`a`
+    variable should use according to the current floating point precision
+    policy.
+
+    Parameters
+    ----------
+    a : object
+        Variable to return the floating point dtype of.
+
+    Returns
+    -------
+    type
+        Floating point dtype.
+
+    Examples
+    --------
+    >>> float_dtype(np.array([0.5], np.float32)).__name__
+    'float64'
+    >>> with float_precision_policy('Preserve'):
+    ...     float_dtype(np.array([0.5], np.float32)).__name__
+    'float32'
+    >>> with float_precision_policy('Preserve'):
+    ...     float_dtype(np.array([1])).__name__
+    'float64'
+    """
+
+    if _FLOAT_PRECISION_POLICY == 'Preserve':
+        dtype = getattr(a, 'dtype', None)
+        if dtype is not None and np.issubdtype(dtype, np.floating):
+            return dtype.type
+
+    return DEFAULT_FLOAT_DTYPE
+
+
+def as_float_array(a, dtype=None):
+    """
+    Converts given :math:`a` variable to a floating point *ndarray*.
+
+    Parameters
+    ----------
+    a : array_like
+        Variable to convert.
+    dtype : object, optional
+        Floating point dtype to use for conversion, default to the dtype
+        returned by :func:`colour.utilities.float_dtype` definition, i.e.
+        :math:`a` variable dtype is retained when using the *Preserve*
+        floating point precision policy.
+
+    Returns
+    -------
+    ndarray
+        :math:`a` variable converted to floating point *ndarray*.
+
+    Examples
+    --------
+    >>> as_float_array([1, 2, 3])
+    array([ 1.,  2.,  3.])
+    >>> as_float_array(np.array([1, 2, 3], np.float32)).dtype
+    dtype('float64')
+    >>> with float_precision_policy('Preserve'):
+    ...     as_float_array(np.array([1, 2, 3], np.float32)).dtype
+    dtype('float32')
+    """
+
+    if dtype is None:
+        dtype = float_dtype(a)
+
+    return np.asarray(a, dtype=dtype)
+
+
+def as_numeric(a, type_=None):
     """
     Converts given :math:`a` variable to *numeric*. In the event where
     :math:`a` cannot be converted, it is passed as is.
@@ -49,8 +244,9 @@ def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
     ----------
     a : object
         Variable to convert.
-    type_ : object
-        Type to use for conversion.
+    type_ : object, optional
+        Type to use for conversion, default to the dtype returned by
+        :func:`colour.utilities.float_dtype` definition.
 
     Returns
     -------
@@ -65,6 +261,9 @@ def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
     array([ 0.,  1.,  2.,  3.,  4.,  5.,  6.,  7.,  8.,  9.])
     """
 
+    if type_ is None:
+        type_ = float_dtype(a)
+
     try:
         return type_(a)
     except TypeError:
@@ -532,6 +731,10 @@ def dot_vector(m, v):
            [ 0.0794399...,  0.1220905...,  0.0955788...]])
     """
 
+    v = np.asarray(v)
+    if _FLOAT_PRECISION_POLICY == 'Preserve':
+        m = as_float_array(m, float_dtype(v))
+
     return np.einsum('...ij,...j->...i', m, v)
 
 
@@ -590,6 +793,10 @@ def dot_matrix(a, b):
             [-0.0044203...,  0.0377490...,  0.9666713...]]])
     """
 
+    b = np.asarray(b)
+    if _FLOAT_PRECISION_POLICY == 'Preserve':
+        a = as_float_array(a, float_dtype(b))
+
     return np.einsum('...ij,...jk->...ik', a, b)
 
 
@@ -18,7 +18,9 @@ from __future__ import division, unicode_literals
 import inspect
 import functools
 import numpy as np
+import threading
 import warnings
+from contextlib import contextmanager
 from copy import deepcopy
 from six import string_types
 
@@ -32,17 +34,180 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
-    'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
+    'numpy_errors_state', 'handle_numpy_errors', 'ignore_numpy_errors',
+    'raise_numpy_errors', 'print_numpy_errors', 'warn_numpy_errors',
+    'ignore_python_warnings',
     'batch', 'is_openimageio_installed', 'is_pandas_installed', 'is_iterable',
     'is_string', 'is_numeric', 'is_integer', 'filter_kwargs', 'first_item'
 ]
 
 
+_NUMPY_ERRORS_STATE = threading.local()
+"""
+Per thread *Numpy* floating-point errors settings items set by
+:func:`colour.utilities.numpy_errors_state` definition and the definitions
+decorated with :func:`colour.utilities.handle_numpy_errors` definition.
+
+_NUMPY_ERRORS_STATE : local
+"""
+
+_PYTHON_WARNINGS_STATE = threading.local()
+"""
+Per thread nesting depth of the definitions decorated with
+:func:`colour.utilities.ignore_python_warnings` definition.
+
+_PYTHON_WARNINGS_STATE : local
+"""
+
+
+_NUMPY_ERRORS_OBJECT = (getattr(np.core.umath, 'geterrobj', None),
+                        getattr(np.core.umath, 'seterrobj', None))
+"""
+*Numpy* low-level floating-point errors object getter and setter, much
+cheaper than :func:`np.seterr` definition, *None* if unavailable.
+
+_NUMPY_ERRORS_OBJECT : tuple
+"""
+
+_NUMPY_ERRORS_MODES = ('ignore', 'warn', 'raise', 'call', 'print', 'log')
+"""
+*Numpy* floating-point errors handling modes, their index is the mode value
+in the errors mask.
+
+_NUMPY_ERRORS_MODES : tuple
+"""
+
+_NUMPY_ERRORS_SHIFTS = {'divide': 0, 'over': 3, 'under': 6, 'invalid': 9}
+"""
+*Numpy* floating-point errors shifts in the errors mask.
+
+_NUMPY_ERRORS_SHIFTS : dict
+"""
+
+
+def _numpy_errors_settings(**kwargs):
+    """
+    Returns the *Numpy* floating-point errors settings for given keywords
+    arguments of :func:`np.seterr` definition, expanding the *all* key.
+    """
+
+    settings = {}
+    if 'all' in kwargs:
+        settings = dict.fromkeys(('divide', 'over', 'under', 'invalid'),
+                                 kwargs['all'])
+
+    settings.update((key, value) for key, value in kwargs.items()
+                    if key != 'all')
+
+    return settings
+
+
+def _set_numpy_errors(settings, mask):
+    """
+    Sets given *Numpy* floating-point errors settings and returns the
+    previous state to restore with :func:`_restore_numpy_errors` definition.
+    """
+
+    getter, setter = _NUMPY_ERRORS_OBJECT
+    if setter is None:
+        return np.seterr(**settings)
+
+    errors = getter()
+    setter([errors[0], (errors[1] & ~mask[0]) | mask[1], errors[2]])
+
+    return errors
+
+
+def _restore_numpy_errors(previous):
+    """
+    Restores given *Numpy* floating-point errors state.
+    """
+
+    setter = _NUMPY_ERRORS_OBJECT[1]
+    if setter is None:
+        np.seterr(**previous)
+    else:
+        setter(previous)
+
+
+def _numpy_errors_mask(settings):
+    """
+    Returns the bits to clear and set in the *Numpy* errors mask for given
+    *Numpy* floating-point errors settings.
+    """
+
+    clear = bits = 0
+    for key, value in settings.items():
+        if value not in _NUMPY_ERRORS_MODES:
+            raise ValueError(
+                '"{0}" floating-point errors handling is invalid, it must be '
+                'one of {1}!'.format(value, _NUMPY_ERRORS_MODES))
+
+        clear |= 7 << _NUMPY_ERRORS_SHIFTS[key]
+        bits |= _NUMPY_ERRORS_MODES.index(value) << _NUMPY_ERRORS_SHIFTS[key]
+
+    return clear, bits
+
+
+@contextmanager
+def numpy_errors_state(**kwargs):
+    """
+    A context manager setting the *Numpy* floating-point errors handling.
+
+    The definitions decorated with :func:`colour.utilities.handle_numpy_errors`
+    definition with the same errors handling do not change it when called
+    within the context manager, thus it can be hoisted out of loops to avoid
+    its per-call overhead.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments of :func:`np.seterr` definition.
+
+    Notes
+    -----
+    -   Changes of the errors handling with :class:`np.errstate` class or
+        :func:`np.seterr` definition within the context manager are not
+        tracked.
+
+    Examples
+    --------
+    >>> @ignore_numpy_errors
+    ... def f(a):
+    ...     return 1 / a
+    >>> with numpy_errors_state(all='ignore'):
+    ...     for _ in range(3):
+    ...         f(np.zeros(3))  # doctest: +ELLIPSIS
+    array([ inf,  inf,  inf])
+    array([ inf,  inf,  inf])
+    array([ inf,  inf,  inf])
+    """
+
+    settings = _numpy_errors_settings(**kwargs)
+
+    state = getattr(_NUMPY_ERRORS_STATE, 'settings', None)
+    if state is not None and frozenset(settings.items()) <= state:
+        yield
+        return
+
+    previous = _set_numpy_errors(settings, _numpy_errors_mask(settings))
+    _NUMPY_ERRORS_STATE.settings = frozenset(
+        dict(state or (), **settings).items())
+    try:
+        yield
+    finally:
+        _restore_numpy_errors(previous)
+        _NUMPY_ERRORS_STATE.settings = state
+
+
 def handle_numpy_errors(**kwargs):
     """
     Decorator for handling *Numpy* errors.
 
+    The errors handling is only changed by the outermost decorated definition
+    of nested calls, see :func:`colour.utilities.numpy_errors_state`
+    definition.
+
     Other Parameters
     ----------------
     \**kwargs : dict, optional
@@ -65,7 +230,9 @@ def handle_numpy_errors(**kwargs):
     >>> f()
     """
 
-    context = np.errstate(**kwargs)
+    settings = _numpy_errors_settings(**kwargs)
+    items = frozenset(settings.items())
+    mask = _numpy_errors_mask(settings)
 
     def wrapper(function):
         """
@@ -78,9 +245,19 @@ def handle_numpy_errors(**kwargs):
             Wrapped function.
             """
 
-            with context:
+            state = getattr(_NUMPY_ERRORS_STATE, 'settings', None)
+            if state is not None and items <= state:
                 return function(*args, **kwargs)
 
+            previous = _set_numpy_errors(settings, mask)
+            _NUMPY_ERRORS_STATE.settings = frozenset(
+                dict(state or (), **settings).items())
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _restore_numpy_errors(previous)
+                _NUMPY_ERRORS_STATE.settings = state
+
         return wrapped
 
     return wrapper
@@ -96,6 +273,9 @@ def ignore_python_warnings(function):
     """
     Decorator for ignoring *Python* warnings.
 
+    The warnings filters are only changed by the outermost decorated
+    definition of nested calls.
+
     Parameters
     ----------
     function : object
@@ -119,10 +299,18 @@ def ignore_python_warnings(function):
         Wrapped function.
         """
 
+        depth = getattr(_PYTHON_WARNINGS_STATE, 'depth', 0)
+        if depth:
+            return function(*args, **kwargs)
+
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
 
-            return function(*args, **kwargs)
+            _PYTHON_WARNINGS_STATE.depth = depth + 1
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _PYTHON_WARNINGS_STATE.depth = depth
 
     return wrapped
 
@@ -357,6 +545,12 @@ def filter_kwargs(function, **kwargs):
     """
 
     kwargs = deepcopy(kwargs)
+
+    # Decorated, e.g. instrumented, definitions are unwrapped to retrieve
+    # their actual arguments.
+    while hasattr(function, '__wrapped__'):
+        function = function.__wrapped__
+
     args, _varargs, _keywords, _defaults = inspect.getargspec(function)
 
     args = set(kwargs.keys()) - set(args)
@@ -190,12 +190,25 @@ class FutureAccessRemove(namedtuple('FutureAccessRemove', ('name', 'access'))):
 class ModuleAPI(object):
     """
     Define a class that allows customisation of module attributes access with
-    deprecation management.
+    deprecation management and lazy attributes loading.
+
+    The instances share the namespace of the customised module, thus existing
+    attributes are resolved by the regular attribute lookup and only the
+    missing ones, i.e. the deprecated or the lazy attributes, go through
+    :meth:`colour.utilities.deprecation.ModuleAPI.__getattr__` method.
 
     Parameters
     ----------
     module : module
         Module to customise attributes access.
+    changes : dict, optional
+        Module API changes, i.e. mapping of attribute names to
+        :class:`colour.utilities.deprecation.Renamed`,
+        :class:`colour.utilities.deprecation.Removed`, etc... instances.
+    lazy : dict, optional
+        Mapping of attribute names to the fully qualified name of the object,
+        sub-module or sub-package to import on first access, e.g.
+        ``{'RGB_to_XYZ': 'colour.models.RGB_to_XYZ'}``.
 
     Methods
     -------
@@ -203,6 +216,11 @@ class ModuleAPI(object):
     __getattr__
     __dir__
 
+    Notes
+    -----
+    -   The deprecated attributes must not exist in the module namespace,
+        otherwise they are resolved without warning.
+
     Examples
     --------
     >>> import sys
@@ -210,13 +228,19 @@ class ModuleAPI(object):
     ... # doctest: +SKIP
     """
 
-    def __init__(self, module, changes=None):
+    __slots__ = ('_module', '_changes', '_lazy', '__dict__')
+
+    def __init__(self, module, changes=None, lazy=None):
         self._module = module
         self._changes = changes or {}
+        self._lazy = lazy or {}
+
+        self.__dict__ = vars(module)
 
     def __getattr__(self, attribute):
         """
-        Returns given attribute value while handling deprecation.
+        Returns given attribute value while handling deprecation and lazy
+        loading.
 
         Parameters
         ----------
@@ -242,12 +266,25 @@ class ModuleAPI(object):
             else:
                 raise AttributeError(str(change))
 
+        name = self._lazy.get(attribute)
+        if name is not None:
+            module, object_name = name.rsplit('.', 1)
+            namespace = vars(import_module(module))
+            if object_name in namespace:
+                value = namespace[object_name]
+            else:
+                value = import_module(name)
+
+            self.__dict__[attribute] = value
+
+            return value
+
         return getattr(self._module, attribute)
 
     def __dir__(self):
         """
-        Returns list of names in the module local scope filtered accordingly to
-        the changes.
+        Returns list of names in the module local scope and lazy attributes
+        filtered accordingly to the changes.
 
         Returns
         -------
@@ -256,7 +293,8 @@ class ModuleAPI(object):
         """
 
         attributes = [
-            attribute for attribute in dir(self._module)
+            attribute
+            for attribute in sorted(set(dir(self._module)) | set(self._lazy))
             if attribute not in self._changes
         ]
 
@@ -0,0 +1,688 @@
+# -*- coding: utf-8 -*-
+"""
+Instrumentation
+===============
+
+Defines the opt-in instrumentation objects recording the calls count,
+cumulative time, array sizes and allocated bytes of the public *Colour*
+definitions and methods, including the dispatchers such as
+:func:`colour.delta_E` or :func:`colour.oetf`:
+
+-   :attr:`colour.utilities.INSTRUMENTATION_ENVIRONMENT_VARIABLE`
+-   :attr:`colour.utilities.INSTRUMENTATION_EXCLUDED_MODULES`
+-   :class:`colour.utilities.InstrumentationRecord`
+-   :func:`colour.utilities.instrument`
+-   :func:`colour.utilities.enable_instrumentation`
+-   :func:`colour.utilities.disable_instrumentation`
+-   :func:`colour.utilities.is_instrumentation_enabled`
+-   :func:`colour.utilities.reset_instrumentation`
+-   :func:`colour.utilities.instrumentation`
+-   :func:`colour.utilities.instrumentation_records`
+-   :func:`colour.utilities.instrumentation_report`
+-   :func:`colour.utilities.instrumentation_trace`
+-   :func:`colour.utilities.write_instrumentation_trace`
+
+The instrumentation wraps the definitions in place, i.e. in the modules
+namespaces, the classes and the methods mappings, when it is enabled and
+restores them when it is disabled, thus it has no overhead when it is
+disabled.
+
+It can be enabled for the whole session by setting the
+*COLOUR_SCIENCE_INSTRUMENTATION* environment variable before importing
+*Colour*: a *.json* file path writes a *Chrome* trace at exit, any other
+truthy value prints a flat report at exit.
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import atexit
+import functools
+import inspect
+import json
+import numpy as np
+import os
+import sys
+import threading
+from collections import MutableMapping, OrderedDict, namedtuple
+from contextlib import contextmanager
+from timeit import default_timer
+
+from colour.utilities.deprecation import ModuleAPI
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'INSTRUMENTATION_ENVIRONMENT_VARIABLE', 'INSTRUMENTATION_EXCLUDED_MODULES',
+    'InstrumentationRecord', 'instrument', 'enable_instrumentation',
+    'disable_instrumentation', 'is_instrumentation_enabled',
+    'reset_instrumentation', 'instrumentation', 'instrumentation_records',
+    'instrumentation_report', 'instrumentation_trace',
+    'write_instrumentation_trace'
+]
+
+INSTRUMENTATION_ENVIRONMENT_VARIABLE = 'COLOUR_SCIENCE_INSTRUMENTATION'
+"""
+Environment variable enabling the instrumentation when *Colour* is imported.
+
+INSTRUMENTATION_ENVIRONMENT_VARIABLE : unicode
+"""
+
+INSTRUMENTATION_EXCLUDED_MODULES = (
+    'colour.utilities.array', 'colour.utilities.common',
+    'colour.utilities.data_structures', 'colour.utilities.deprecation',
+    'colour.utilities.documentation', 'colour.utilities.instrumentation')
+"""
+Modules whose definitions are not instrumented by default, i.e. the low-level
+utilities called by most definitions, e.g. :func:`colour.utilities.tsplit`.
+
+INSTRUMENTATION_EXCLUDED_MODULES : tuple
+"""
+
+_INSTRUMENTATION_STATE = {
+    'enabled': False,
+    'trace': True,
+    'max_events': 2 ** 20,
+    'origin': default_timer(),
+}
+"""
+Instrumentation state.
+
+_INSTRUMENTATION_STATE : dict
+"""
+
+_INSTRUMENTATION_RECORDS = {}
+"""
+Instrumentation records, i.e. calls count, cumulative time, own time, array
+sizes and allocated bytes per instrumented definition.
+
+_INSTRUMENTATION_RECORDS : dict
+"""
+
+_INSTRUMENTATION_EVENTS = []
+"""
+Instrumentation trace events.
+
+_INSTRUMENTATION_EVENTS : list
+"""
+
+_INSTRUMENTATION_WRAPPERS = {}
+"""
+Instrumentation wrappers of the instrumented definitions.
+
+_INSTRUMENTATION_WRAPPERS : dict
+"""
+
+_INSTRUMENTATION_PATCHES = []
+"""
+Containers, keys and original definitions patched by the instrumentation.
+
+_INSTRUMENTATION_PATCHES : list
+"""
+
+_INSTRUMENTATION_LOCK = threading.Lock()
+"""
+Instrumentation records lock.
+
+_INSTRUMENTATION_LOCK : Lock
+"""
+
+_INSTRUMENTATION_STACKS = threading.local()
+"""
+Per thread stacks of the instrumented calls children time.
+
+_INSTRUMENTATION_STACKS : local
+"""
+
+
+class InstrumentationRecord(
+        namedtuple('InstrumentationRecord',
+                   ('calls', 'time', 'own_time', 'size', 'bytes'))):
+    """
+    Defines an instrumentation record.
+
+    Parameters
+    ----------
+    calls : integer
+        Calls count.
+    time : numeric
+        Cumulative time in seconds, including the time spent in the
+        instrumented callees.
+    own_time : numeric
+        Cumulative time in seconds, excluding the time spent in the
+        instrumented callees.
+    size : integer
+        Cumulative size of the :class:`ndarray` class instances arguments.
+    bytes : integer
+        Cumulative bytes allocated for the :class:`ndarray` class instances
+        returned.
+    """
+
+
+def _arrays_size(values):
+    """
+    Returns the cumulative size of the :class:`ndarray` class instances in
+    given values.
+    """
+
+    return sum(value.size for value in values
+               if isinstance(value, np.ndarray))
+
+
+def _arrays_bytes(value):
+    """
+    Returns the cumulative bytes of the :class:`ndarray` class instances in
+    given value.
+    """
+
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    elif isinstance(value, tuple):
+        return sum(item.nbytes for item in value
+                   if isinstance(item, np.ndarray))
+
+    return 0
+
+
+def _record(name, start, elapsed, own_time, size, nbytes):
+    """
+    Records given instrumented call.
+    """
+
+    with _INSTRUMENTATION_LOCK:
+        record = _INSTRUMENTATION_RECORDS.get(name)
+        if record is None:
+            record = _INSTRUMENTATION_RECORDS[name] = [0, 0, 0, 0, 0]
+
+        record[0] += 1
+        record[1] += elapsed
+        record[2] += own_time
+        record[3] += size
+        record[4] += nbytes
+
+        if (_INSTRUMENTATION_STATE['trace'] and len(_INSTRUMENTATION_EVENTS) <
+                _INSTRUMENTATION_STATE['max_events']):
+            _INSTRUMENTATION_EVENTS.append(
+                (name, start, elapsed, threading.current_thread().ident, size,
+                 nbytes))
+
+
+def instrument(function, name=None):
+    """
+    Returns given function wrapped to record its calls when the
+    instrumentation is enabled.
+
+    Parameters
+    ----------
+    function : callable
+        Function to instrument.
+    name : unicode, optional
+        Name the calls are recorded with, defaults to the function qualified
+        name.
+
+    Returns
+    -------
+    callable
+        Instrumented function.
+
+    Examples
+    --------
+    >>> def f(a):
+    ...     return a * 2
+    >>> f = instrument(f, 'f')
+    >>> with instrumentation():
+    ...     f(np.ones(3))
+    ...     instrumentation_records()['f']  # doctest: +ELLIPSIS
+    array([ 2.,  2.,  2.])
+    InstrumentationRecord(calls=1, time=..., own_time=..., size=3, bytes=24)
+    """
+
+    wrapped_function = _INSTRUMENTATION_WRAPPERS.get(function)
+    if wrapped_function is not None:
+        return wrapped_function
+
+    if name is None:
+        name = '{0}.{1}'.format(function.__module__, function.__name__)
+
+    @functools.wraps(function)
+    def wrapped(*args, **kwargs):
+        """
+        Wrapped function.
+        """
+
+        if not _INSTRUMENTATION_STATE['enabled']:
+            return function(*args, **kwargs)
+
+        stack = getattr(_INSTRUMENTATION_STACKS, 'stack', None)
+        if stack is None:
+            stack = _INSTRUMENTATION_STACKS.stack = []
+
+        stack.append(0)
+        result = None
+        start = default_timer()
+        try:
+            result = function(*args, **kwargs)
+
+            return result
+        finally:
+            elapsed = default_timer() - start
+            children_time = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+
+            _record(name, start, elapsed, elapsed - children_time,
+                    _arrays_size(args) + _arrays_size(kwargs.values()),
+                    _arrays_bytes(result))
+
+    wrapped.__wrapped__ = function
+
+    _INSTRUMENTATION_WRAPPERS[function] = wrapped
+    _INSTRUMENTATION_WRAPPERS[wrapped] = wrapped
+
+    return wrapped
+
+
+def _is_instrumentable_module(name, excluded_modules):
+    """
+    Returns whether given module is instrumentable.
+    """
+
+    if name != 'colour' and not name.startswith('colour.'):
+        return False
+
+    if '.tests' in name or name == __name__:
+        return False
+
+    return not any(name == module or name.startswith(module + '.')
+                   for module in excluded_modules)
+
+
+def _is_instrumentable_function(function, excluded_modules):
+    """
+    Returns whether given function is instrumentable.
+    """
+
+    return (inspect.isfunction(function) and
+            not function.__name__.startswith('_') and
+            _INSTRUMENTATION_WRAPPERS.get(function) is not function and
+            _is_instrumentable_module(
+                getattr(function, '__module__', None) or '', excluded_modules))
+
+
+def enable_instrumentation(trace=True,
+                           max_events=2 ** 20,
+                           excluded_modules=INSTRUMENTATION_EXCLUDED_MODULES):
+    """
+    Enables the instrumentation of the public *Colour* definitions and
+    methods.
+
+    Parameters
+    ----------
+    trace : bool, optional
+        Whether to record the calls trace events, see
+        :func:`colour.utilities.instrumentation_trace` definition.
+    max_events : integer, optional
+        Maximum trace events count recorded.
+    excluded_modules : array_like, optional
+        Modules whose definitions are not instrumented.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   The definitions referenced by the imported *Colour* modules
+        namespaces, classes and mutable mappings, e.g.
+        :attr:`colour.DELTA_E_METHODS` attribute, are replaced by their
+        instrumented counterpart.
+    -   The lazily imported top-level attributes, e.g.
+        :func:`colour.delta_E` definition, are imported beforehand, which
+        imports most of the *Colour* modules.
+    -   References held elsewhere, e.g. in definitions default arguments, are
+        not instrumented.
+
+    Examples
+    --------
+    >>> enable_instrumentation()
+    True
+    >>> is_instrumentation_enabled()
+    True
+    >>> disable_instrumentation()
+    True
+    """
+
+    _INSTRUMENTATION_STATE['trace'] = trace
+    _INSTRUMENTATION_STATE['max_events'] = max_events
+
+    if _INSTRUMENTATION_STATE['enabled']:
+        return True
+
+    # The lazy top-level attributes are imported so that their modules are
+    # instrumented.
+    for module in list(sys.modules.values()):
+        if isinstance(module, ModuleAPI):
+            for attribute in getattr(module, '__all__', []):
+                getattr(module, attribute)
+
+    classes, mappings = set(), set()
+    for module in list(sys.modules.values()):
+        if isinstance(module, ModuleAPI):
+            module = module._module
+
+        if module is None or not _is_instrumentable_module(
+                getattr(module, '__name__', ''), excluded_modules):
+            continue
+
+        namespace = vars(module)
+        for attribute, value in list(namespace.items()):
+            if attribute.startswith('_'):
+                continue
+
+            if _is_instrumentable_function(value, excluded_modules):
+                _INSTRUMENTATION_PATCHES.append((namespace, attribute, value))
+                namespace[attribute] = instrument(value)
+            elif (inspect.isclass(value) and id(value) not in classes and
+                  _is_instrumentable_module(value.__module__,
+                                            excluded_modules)):
+                classes.add(id(value))
+                for name, method in list(vars(value).items()):
+                    if _is_instrumentable_function(method, excluded_modules):
+                        _INSTRUMENTATION_PATCHES.append((value, name, method))
+                        setattr(value, name,
+                                instrument(method, '{0}.{1}.{2}'.format(
+                                    value.__module__, value.__name__, name)))
+            elif (isinstance(value, MutableMapping) and
+                  id(value) not in mappings):
+                mappings.add(id(value))
+                for key, item in list(value.items()):
+                    if _is_instrumentable_function(item, excluded_modules):
+                        _INSTRUMENTATION_PATCHES.append((value, key, item))
+                        value[key] = instrument(item)
+
+    _INSTRUMENTATION_STATE['enabled'] = True
+
+    return True
+
+
+def disable_instrumentation():
+    """
+    Disables the instrumentation and restores the instrumented definitions.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    >>> disable_instrumentation()
+    True
+    >>> is_instrumentation_enabled()
+    False
+    """
+
+    _INSTRUMENTATION_STATE['enabled'] = False
+
+    while _INSTRUMENTATION_PATCHES:
+        container, key, value = _INSTRUMENTATION_PATCHES.pop()
+        if inspect.isclass(container):
+            setattr(container, key, value)
+        else:
+            container[key] = value
+
+    return True
+
+
+def is_instrumentation_enabled():
+    """
+    Returns whether the instrumentation is enabled.
+
+    Returns
+    -------
+    bool
+        Whether the instrumentation is enabled.
+
+    Examples
+    --------
+    >>> is_instrumentation_enabled()
+    False
+    """
+
+    return _INSTRUMENTATION_STATE['enabled']
+
+
+def reset_instrumentation():
+    """
+    Resets the instrumentation records and trace events.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    >>> reset_instrumentation()
+    True
+    """
+
+    with _INSTRUMENTATION_LOCK:
+        _INSTRUMENTATION_RECORDS.clear()
+        del _INSTRUMENTATION_EVENTS[:]
+
+    _INSTRUMENTATION_STATE['origin'] = default_timer()
+
+    return True
+
+
+@contextmanager
+def instrumentation(trace=True,
+                    reset=True,
+                    excluded_modules=INSTRUMENTATION_EXCLUDED_MODULES):
+    """
+    A context manager enabling the instrumentation.
+
+    Parameters
+    ----------
+    trace : bool, optional
+        Whether to record the calls trace events.
+    reset : bool, optional
+        Whether to reset the instrumentation records and trace events on
+        entry.
+    excluded_modules : array_like, optional
+        Modules whose definitions are not instrumented.
+
+    Examples
+    --------
+    >>> import colour
+    >>> Lab_1 = np.array([100.00000000, 21.57210357, 272.22819350])
+    >>> Lab_2 = np.array([100.00000000, 426.67945353, 72.39590835])
+    >>> with instrumentation():
+    ...     colour.delta_E(Lab_1, Lab_2)  # doctest: +ELLIPSIS
+    ...     instrumentation_records()['colour.difference.delta_E'].calls
+    94.0356490...
+    1
+    """
+
+    enabled = _INSTRUMENTATION_STATE['enabled']
+
+    if reset:
+        reset_instrumentation()
+
+    enable_instrumentation(trace, _INSTRUMENTATION_STATE['max_events'],
+                           excluded_modules)
+    try:
+        yield
+    finally:
+        if not enabled:
+            disable_instrumentation()
+
+
+def instrumentation_records(sort='time'):
+    """
+    Returns the instrumentation records.
+
+    Parameters
+    ----------
+    sort : unicode, optional
+        **{'time', 'calls', 'own_time', 'size', 'bytes'}**,
+        Field the records are sorted by in descending order.
+
+    Returns
+    -------
+    OrderedDict
+        Instrumentation records.
+
+    Examples
+    --------
+    >>> reset_instrumentation()
+    True
+    >>> instrumentation_records()
+    OrderedDict()
+    """
+
+    index = InstrumentationRecord._fields.index(sort)
+
+    with _INSTRUMENTATION_LOCK:
+        records = [(name, InstrumentationRecord(*record))
+                   for name, record in _INSTRUMENTATION_RECORDS.items()]
+
+    return OrderedDict(
+        sorted(records, key=lambda x: (-x[1][index], x[0])))
+
+
+def instrumentation_report(sort='time', limit=None):
+    """
+    Returns a flat report of the instrumentation records.
+
+    Parameters
+    ----------
+    sort : unicode, optional
+        **{'time', 'calls', 'own_time', 'size', 'bytes'}**,
+        Field the records are sorted by in descending order.
+    limit : integer, optional
+        Maximum records count reported.
+
+    Returns
+    -------
+    unicode
+        Instrumentation report.
+
+    Examples
+    --------
+    >>> reset_instrumentation()
+    True
+    >>> print(instrumentation_report())
+    Name  Calls  Time (s)  Own Time (s)  Size  Bytes
+    """
+
+    rows = [('Name', 'Calls', 'Time (s)', 'Own Time (s)', 'Size', 'Bytes')]
+    for name, record in list(instrumentation_records(sort).items())[:limit]:
+        rows.append((name, str(record.calls), '{0:.6f}'.format(record.time),
+                     '{0:.6f}'.format(record.own_time), str(record.size),
+                     str(record.bytes)))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+    return '\n'.join('  '.join(
+        value.ljust(width) if i == 0 else value.rjust(width)
+        for i, (value, width) in enumerate(zip(row, widths))).rstrip()
+                     for row in rows)
+
+
+def instrumentation_trace():
+    """
+    Returns the instrumentation trace events in the *Chrome* trace format,
+    i.e. *Trace Event Format*, viewable with *chrome://tracing* or
+    *Perfetto*.
+
+    Returns
+    -------
+    dict
+        *Chrome* trace.
+
+    Examples
+    --------
+    >>> reset_instrumentation()
+    True
+    >>> instrumentation_trace()['traceEvents']
+    []
+    """
+
+    origin = _INSTRUMENTATION_STATE['origin']
+    pid = os.getpid()
+
+    with _INSTRUMENTATION_LOCK:
+        events = list(_INSTRUMENTATION_EVENTS)
+
+    return {
+        'traceEvents': [{
+            'name': name,
+            'cat': name.rsplit('.', 1)[0],
+            'ph': 'X',
+            'ts': (start - origin) * 1e6,
+            'dur': elapsed * 1e6,
+            'pid': pid,
+            'tid': tid,
+            'args': {
+                'size': size,
+                'bytes': nbytes
+            }
+        } for name, start, elapsed, tid, size, nbytes in events],
+        'displayTimeUnit':
+            'ms'
+    }
+
+
+def write_instrumentation_trace(path):
+    """
+    Writes the instrumentation trace events to given *JSON* file in the
+    *Chrome* trace format.
+
+    Parameters
+    ----------
+    path : unicode
+        *JSON* file path.
+
+    Returns
+    -------
+    bool
+        Definition success.
+    """
+
+    with open(path, 'w') as file_:
+        json.dump(instrumentation_trace(), file_)
+
+    return True
+
+
+def _setup_instrumentation_from_environment():
+    """
+    Enables the instrumentation if the
+    :attr:`colour.utilities.INSTRUMENTATION_ENVIRONMENT_VARIABLE` environment
+    variable is set and registers the report or trace writing at exit.
+
+    Returns
+    -------
+    bool
+        Whether the instrumentation was enabled.
+    """
+
+    value = os.environ.get(INSTRUMENTATION_ENVIRONMENT_VARIABLE, '').strip()
+    if value.lower() in ('', '0', 'false', 'no', 'off'):
+        return False
+
+    if value.lower().endswith('.json'):
+        enable_instrumentation(trace=True)
+        atexit.register(write_instrumentation_trace, value)
+    else:
+        enable_instrumentation(trace=False)
+        atexit.register(lambda: print(instrumentation_report()))
+
+    return True
@@ -9,12 +9,32 @@ import numpy as np
 import unittest
 from collections import namedtuple
 
+from colour.adaptation import (
+    chromatic_adaptation_CIE1994, chromatic_adaptation_CMCCAT2000,
+    chromatic_adaptation_Fairchild1990, chromatic_adaptation_VonKries)
+from colour.appearance import (XYZ_to_ATD95, XYZ_to_CAM16, XYZ_to_CIECAM02,
+                               XYZ_to_Hunt, XYZ_to_LLAB, XYZ_to_Nayatani95,
+                               XYZ_to_RLAB)
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import (as_numeric, as_namedtuple, closest_indexes,
-                              closest, normalise_maximum, interval, is_uniform,
-                              in_array, tstack, tsplit, row_as_diagonal,
-                              dot_vector, dot_matrix, orient, centroid,
-                              linear_conversion, fill_nan, ndarray_write)
+from colour.difference import (delta_E_CIE1976, delta_E_CIE2000,
+                               delta_E_CMC)
+from colour.models import (
+    CMY_to_CMYK, HSL_to_RGB, IPT_to_XYZ, Lab_to_XYZ, Luv_to_XYZ,
+    RGB_to_HSL, RGB_to_ICTCP, RGB_to_YCbCr, XYZ_to_IPT, XYZ_to_JzAzBz,
+    XYZ_to_Lab, XYZ_to_Luv, XYZ_to_OSA_UCS, XYZ_to_UVW, XYZ_to_hdr_CIELab,
+    XYZ_to_hdr_IPT, XYZ_to_xyY, YCbCr_to_RGB, sRGB_to_XYZ, xyY_to_XYZ)
+from colour.models.rgb.transfer_functions import (
+    eotf_BT1886, eotf_BT2100_HLG, eotf_DCDM, eotf_ROMMRGB, eotf_ST2084,
+    log_decoding_ACESproxy, log_decoding_Cineon, log_encoding_ACEScc,
+    log_encoding_ALEXALogC, log_encoding_Cineon, log_encoding_SLog3,
+    oetf_BT709, oetf_ST2084, oetf_sRGB, oetf_reverse_sRGB, ootf_BT2100_HLG)
+from colour.utilities import (
+    FLOAT_PRECISION_POLICIES, get_float_precision_policy,
+    set_float_precision_policy, float_precision_policy, float_dtype,
+    as_float_array, as_numeric, as_namedtuple, closest_indexes, closest,
+    normalise_maximum, interval, is_uniform, in_array, tstack, tsplit,
+    row_as_diagonal, dot_vector, dot_matrix, orient, centroid,
+    linear_conversion, fill_nan, ndarray_write)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -24,14 +44,308 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'TestAsNumeric', 'TestAsNametuple', 'TestClosestIndexes', 'TestClosest',
-    'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform', 'TestInArray',
-    'TestTstack', 'TestTsplit', 'TestRowAsDiagonal', 'TestDotVector',
-    'TestDotMatrix', 'TestOrient', 'TestCentroid', 'TestLinearConversion',
-    'TestFillNan', 'TestNdarrayWrite'
+    'TestFloatPrecisionPolicy', 'TestFloatDtype', 'TestAsFloatArray',
+    'TestFloatPrecisionAccuracy', 'TestAsNumeric', 'TestAsNametuple',
+    'TestClosestIndexes', 'TestClosest', 'TestNormaliseMaximum',
+    'TestInterval', 'TestIsUniform', 'TestInArray', 'TestTstack', 'TestTsplit',
+    'TestRowAsDiagonal', 'TestDotVector', 'TestDotMatrix', 'TestOrient',
+    'TestCentroid', 'TestLinearConversion', 'TestFillNan', 'TestNdarrayWrite'
 ]
 
 
+class TestFloatPrecisionPolicy(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.get_float_precision_policy`,
+    :func:`colour.utilities.array.set_float_precision_policy` and
+    :func:`colour.utilities.array.float_precision_policy` definitions unit
+    tests methods.
+    """
+
+    def test_float_precision_policy(self):
+        """
+        Tests :func:`colour.utilities.array.get_float_precision_policy`,
+        :func:`colour.utilities.array.set_float_precision_policy` and
+        :func:`colour.utilities.array.float_precision_policy` definitions.
+        """
+
+        self.assertIn(get_float_precision_policy(), FLOAT_PRECISION_POLICIES)
+        self.assertEqual(get_float_precision_policy(), 'Promote')
+
+        previous_policy = set_float_precision_policy('Preserve')
+        self.assertEqual(previous_policy, 'Promote')
+        self.assertEqual(get_float_precision_policy(), 'Preserve')
+        self.assertEqual(set_float_precision_policy(previous_policy),
+                         'Preserve')
+        self.assertEqual(get_float_precision_policy(), 'Promote')
+
+        with float_precision_policy('Preserve'):
+            self.assertEqual(get_float_precision_policy(), 'Preserve')
+
+            with float_precision_policy('Promote'):
+                self.assertEqual(get_float_precision_policy(), 'Promote')
+
+            self.assertEqual(get_float_precision_policy(), 'Preserve')
+
+        self.assertEqual(get_float_precision_policy(), 'Promote')
+
+        try:
+            with float_precision_policy('Preserve'):
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+
+        self.assertEqual(get_float_precision_policy(), 'Promote')
+
+    def test_raise_exception_set_float_precision_policy(self):
+        """
+        Tests :func:`colour.utilities.array.set_float_precision_policy`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, set_float_precision_policy, 'Demote')
+
+        self.assertEqual(get_float_precision_policy(), 'Promote')
+
+
+class TestFloatDtype(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.float_dtype` definition unit tests
+    methods.
+    """
+
+    def test_float_dtype(self):
+        """
+        Tests :func:`colour.utilities.array.float_dtype` definition.
+        """
+
+        for dtype in (np.float16, np.float32, np.float64):
+            self.assertIs(
+                float_dtype(np.array([0.5], dtype)), DEFAULT_FLOAT_DTYPE)
+
+        self.assertIs(float_dtype(0.5), DEFAULT_FLOAT_DTYPE)
+
+        with float_precision_policy('Preserve'):
+            for dtype in (np.float16, np.float32, np.float64):
+                self.assertIs(float_dtype(np.array([0.5], dtype)), dtype)
+                self.assertIs(float_dtype(dtype(0.5)), dtype)
+
+            self.assertIs(float_dtype(np.array([1])), DEFAULT_FLOAT_DTYPE)
+            self.assertIs(float_dtype([0.5]), DEFAULT_FLOAT_DTYPE)
+            self.assertIs(float_dtype(0.5), DEFAULT_FLOAT_DTYPE)
+
+
+class TestAsFloatArray(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.as_float_array` definition unit
+    tests methods.
+    """
+
+    def test_as_float_array(self):
+        """
+        Tests :func:`colour.utilities.array.as_float_array` definition.
+        """
+
+        np.testing.assert_equal(
+            as_float_array([1, 2, 3]), np.array([1.0, 2.0, 3.0]))
+
+        self.assertEqual(as_float_array([1, 2, 3]).dtype, DEFAULT_FLOAT_DTYPE)
+
+        self.assertEqual(
+            as_float_array(np.array([1, 2, 3], np.float32)).dtype,
+            DEFAULT_FLOAT_DTYPE)
+
+        self.assertEqual(
+            as_float_array(np.array([1, 2, 3]), np.float32).dtype, np.float32)
+
+        with float_precision_policy('Preserve'):
+            self.assertEqual(
+                as_float_array(np.array([1, 2, 3], np.float32)).dtype,
+                np.float32)
+
+            self.assertEqual(
+                as_float_array(np.array([1, 2, 3])).dtype,
+                DEFAULT_FLOAT_DTYPE)
+
+    def test_preserve_dot_vector(self):
+        """
+        Tests :func:`colour.utilities.array.dot_vector` and
+        :func:`colour.utilities.array.dot_matrix` definitions dtype
+        preservation.
+        """
+
+        m = np.array([
+            [0.7328, 0.4296, -0.1624],
+            [-0.7036, 1.6975, 0.0061],
+            [0.0030, 0.0136, 0.9834],
+        ])
+        v = np.array([[0.07049534, 0.10080000, 0.09558313]], np.float32)
+
+        self.assertEqual(dot_vector(m, v).dtype, DEFAULT_FLOAT_DTYPE)
+        self.assertEqual(
+            dot_matrix(m, m.astype(np.float32)).dtype, DEFAULT_FLOAT_DTYPE)
+
+        with float_precision_policy('Preserve'):
+            self.assertEqual(dot_vector(m, v).dtype, np.float32)
+            self.assertEqual(
+                dot_matrix(m, m.astype(np.float32)).dtype, np.float32)
+
+
+class TestFloatPrecisionAccuracy(unittest.TestCase):
+    """
+    Defines the *Preserve* floating point precision policy accuracy matrix
+    unit tests methods.
+
+    Each definition is evaluated on *float64* input as reference and then on
+    *float32* and *float16* input using the *Preserve* floating point
+    precision policy. The error is the maximum absolute difference with the
+    reference, relative to the reference magnitude when the latter is greater
+    than 1.
+
+    The following table documents the accuracy loss, *None* indicating that
+    the representable range of the dtype is exceeded, i.e. *float16*
+    maximum value is 65504, and that the dtype is not suitable for the
+    definition.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        prng = np.random.RandomState(4)
+        XYZ = prng.uniform(0.05, 0.95, (16, 3))
+        RGB = prng.uniform(0.05, 0.95, (16, 3))
+        V = np.linspace(0.01, 0.99, 16)
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        Lab_1 = XYZ_to_Lab(XYZ)
+        Lab_2 = XYZ_to_Lab(XYZ[::-1])
+
+        def delta_E(definition):
+            """
+            Returns a definition computing given colour difference definition
+            against a fixed *CIE L\*a\*b\** colourspace array.
+            """
+
+            return lambda x: definition(x, Lab_2.astype(x.dtype))
+
+        self._matrix = [
+            # Colour Models
+            (XYZ_to_xyY, XYZ, 1e-7, 1e-3),
+            (xyY_to_XYZ, XYZ_to_xyY(XYZ), 1e-6, 1e-3),
+            (XYZ_to_Lab, XYZ, 1e-5, 5e-2),
+            (Lab_to_XYZ, Lab_1, 1e-6, 5e-3),
+            (XYZ_to_Luv, XYZ, 1e-5, 5e-2),
+            (Luv_to_XYZ, XYZ_to_Luv(XYZ), 1e-6, 5e-2),
+            (XYZ_to_UVW, XYZ, 1e-5, 5e-2),
+            (XYZ_to_hdr_CIELab, XYZ, 5e-5, 1e-1),
+            (XYZ_to_IPT, XYZ, 1e-6, 1e-2),
+            (IPT_to_XYZ, XYZ_to_IPT(XYZ), 1e-6, 5e-3),
+            (XYZ_to_hdr_IPT, XYZ, 5e-5, 5e-1),
+            (XYZ_to_JzAzBz, XYZ, 1e-5, None),
+            (XYZ_to_OSA_UCS, XYZ, 1e-5, 5e-2),
+            (sRGB_to_XYZ, RGB, 1e-6, 5e-3),
+            (RGB_to_HSL, RGB, 1e-6, 5e-3),
+            (HSL_to_RGB, RGB, 1e-6, 5e-3),
+            (CMY_to_CMYK, RGB, 1e-6, 5e-3),
+            (RGB_to_YCbCr, RGB, 1e-6, 5e-3),
+            (YCbCr_to_RGB, RGB, 1e-6, 5e-3),
+            (RGB_to_ICTCP, RGB, 5e-5, None),
+            # Transfer Functions
+            (oetf_sRGB, V, 1e-6, 5e-3),
+            (oetf_reverse_sRGB, V, 1e-6, 5e-3),
+            (oetf_BT709, V, 1e-6, 5e-3),
+            (eotf_BT1886, V, 1e-6, 5e-3),
+            (oetf_ST2084, V, 1e-5, None),
+            (eotf_ST2084, V, 5e-4, None),
+            (eotf_BT2100_HLG, V, 1e-6, 1e-2),
+            (ootf_BT2100_HLG, XYZ, 1e-6, 5e-3),
+            (eotf_DCDM, V, 1e-6, 5e-3),
+            (eotf_ROMMRGB, V, 1e-6, 5e-3),
+            (log_encoding_ACEScc, V, 1e-6, 5e-3),
+            (log_decoding_ACESproxy, V, 1e-5, 1e-2),
+            (log_encoding_ALEXALogC, V, 1e-6, 5e-3),
+            (log_encoding_Cineon, V, 1e-6, 5e-3),
+            (log_decoding_Cineon, V, 1e-5, 1e-2),
+            (log_encoding_SLog3, V, 1e-6, 5e-3),
+            # Chromatic Adaptation
+            (lambda x: chromatic_adaptation_VonKries(
+                x, np.array([0.95, 1.00, 1.09]), np.array([0.96, 1.00, 0.82])),
+             XYZ, 1e-6, 5e-3),
+            (lambda x: chromatic_adaptation_Fairchild1990(
+                x, XYZ_w, np.array([96.42, 100.00, 82.49]), 20),
+             XYZ * 100, 1e-5, 1e-1),
+            (lambda x: chromatic_adaptation_CMCCAT2000(
+                x, np.array([111.15, 100.00, 35.20]),
+                np.array([94.81, 100.00, 107.30]), 200, 200),
+             XYZ * 100, 5e-5, 5e-2),
+            (lambda x: chromatic_adaptation_CIE1994(
+                x, np.array([0.4476, 0.4074]), np.array([0.3127, 0.3290]), 20,
+                1000, 1000),
+             XYZ * 100, 1e-4, 5e-1),
+            # Colour Appearance Models
+            (lambda x: XYZ_to_CIECAM02(x, XYZ_w, 318.31, 20.0),
+             XYZ * 100, 1e-4, 5e-1),
+            (lambda x: XYZ_to_CAM16(x, XYZ_w, 318.31, 20.0),
+             XYZ * 100, 1e-4, 5e-1),
+            (lambda x: XYZ_to_Hunt(x, XYZ_w, XYZ_w, 318.31, CCT_w=6504),
+             XYZ * 100, 1e-4, 5e-1),
+            (lambda x: XYZ_to_ATD95(x, XYZ_w, 318.31, 0, 50),
+             XYZ * 100, 1e-4, None),
+            (lambda x: XYZ_to_LLAB(x, XYZ_w, 20, 318.31),
+             XYZ * 100, 1e-4, 5e-1),
+            (lambda x: XYZ_to_Nayatani95(x, XYZ_w, 20, 5000, 1000),
+             XYZ * 100, 1e-4, None),
+            (lambda x: XYZ_to_RLAB(x, XYZ_w, 318.31),
+             XYZ * 100, 1e-5, 5e-1),
+            # Colour Difference
+            (delta_E(delta_E_CIE1976), Lab_1, 1e-6, None),
+            (delta_E(delta_E_CIE2000), Lab_1, 1e-5, None),
+            (delta_E(delta_E_CMC), Lab_1, 1e-5, None),
+        ]
+
+    def test_float_precision_accuracy(self):
+        """
+        Tests the *Preserve* floating point precision policy accuracy matrix.
+        """
+
+        def outputs(values):
+            """
+            Returns given definition output as a list of floating point
+            *ndarrays*.
+            """
+
+            if not isinstance(values, tuple):
+                values = (values, )
+
+            return [
+                np.asarray(value) for value in values
+                if value is not None and np.asarray(value).dtype.kind == 'f'
+            ]
+
+        for definition, a, tolerance_32, tolerance_16 in self._matrix:
+            reference = outputs(definition(a))
+
+            for dtype, tolerance in ((np.float32, tolerance_32),
+                                     (np.float16, tolerance_16)):
+                if tolerance is None:
+                    continue
+
+                with float_precision_policy('Preserve'):
+                    values = outputs(definition(a.astype(dtype)))
+
+                for value, value_r in zip(values, reference):
+                    if dtype is np.float32:
+                        self.assertEqual(value.dtype, np.float32)
+                    else:
+                        self.assertIn(value.dtype, (np.float16, np.float32))
+
+                    error = np.nanmax(
+                        np.abs(value - value_r) /
+                        np.maximum(np.abs(value_r), 1))
+
+                    self.assertLessEqual(error, tolerance)
+
+
 class TestAsNumeric(unittest.TestCase):
     """
     Defines :func:`colour.utilities.array.as_numeric` definition unit tests
@@ -5,12 +5,17 @@ Defines unit tests for :mod:`colour.utilities.common` module.
 
 from __future__ import division, unicode_literals
 
+import multiprocessing.pool
 import numpy as np
 import unittest
+import warnings
 from collections import OrderedDict
 
-from colour.utilities import (batch, is_iterable, is_string, is_numeric,
-                              is_integer, filter_kwargs, first_item)
+from colour.utilities import (
+    numpy_errors_state, handle_numpy_errors, ignore_numpy_errors,
+    ignore_python_warnings, batch, is_iterable, is_string, is_numeric,
+    is_integer, filter_kwargs, first_item)
+from colour.utilities.common import _PYTHON_WARNINGS_STATE
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -20,11 +25,165 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'TestBatch', 'TestIsIterable', 'TestIsString', 'TestIsNumeric',
-    'TestIsInteger', 'TestFilterKwargs', 'TestFirstItem'
+    'TestNumpyErrorsState', 'TestHandleNumpyErrors',
+    'TestIgnorePythonWarnings', 'TestBatch', 'TestIsIterable', 'TestIsString',
+    'TestIsNumeric', 'TestIsInteger', 'TestFilterKwargs', 'TestFirstItem'
 ]
 
 
+class TestNumpyErrorsState(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.numpy_errors_state` definition unit
+    tests methods.
+    """
+
+    def test_numpy_errors_state(self):
+        """
+        Tests :func:`colour.utilities.common.numpy_errors_state` definition.
+        """
+
+        errors = np.geterr()
+        with numpy_errors_state(all='ignore'):
+            self.assertDictEqual(
+                np.geterr(), {
+                    'divide': 'ignore',
+                    'over': 'ignore',
+                    'under': 'ignore',
+                    'invalid': 'ignore'
+                })
+
+            with numpy_errors_state(divide='raise'):
+                self.assertDictEqual(
+                    np.geterr(), {
+                        'divide': 'raise',
+                        'over': 'ignore',
+                        'under': 'ignore',
+                        'invalid': 'ignore'
+                    })
+
+                self.assertRaises(FloatingPointError,
+                                  lambda: 1 / np.zeros(1))
+
+            self.assertEqual(np.geterr()['divide'], 'ignore')
+
+        self.assertDictEqual(np.geterr(), errors)
+
+    def test_raise_exception_numpy_errors_state(self):
+        """
+        Tests :func:`colour.utilities.common.numpy_errors_state` definition
+        raised exception.
+        """
+
+        def context():
+            """
+            Enters the context manager with an invalid errors handling.
+            """
+
+            with numpy_errors_state(all='Undefined'):
+                pass
+
+        self.assertRaises(ValueError, context)
+
+
+class TestHandleNumpyErrors(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.handle_numpy_errors` definition
+    unit tests methods.
+    """
+
+    def test_handle_numpy_errors(self):
+        """
+        Tests :func:`colour.utilities.common.handle_numpy_errors` definition.
+        """
+
+        @ignore_numpy_errors
+        def fn_a(a):
+            """
+            Divides by given array with *Numpy* errors ignored.
+            """
+
+            return np.geterr(), 1 / a
+
+        @handle_numpy_errors(divide='raise')
+        def fn_b(a):
+            """
+            Divides by given array with *Numpy* divide errors raised.
+            """
+
+            return 1 / a
+
+        errors = np.geterr()
+
+        state, a = fn_a(np.zeros(3))
+        self.assertEqual(state['invalid'], 'ignore')
+        np.testing.assert_equal(a, np.array([np.inf, np.inf, np.inf]))
+        self.assertDictEqual(np.geterr(), errors)
+
+        self.assertRaises(FloatingPointError, fn_b, np.zeros(3))
+        self.assertDictEqual(np.geterr(), errors)
+
+        with numpy_errors_state(all='ignore'):
+            self.assertRaises(FloatingPointError, fn_b, np.zeros(3))
+            self.assertEqual(np.geterr()['divide'], 'ignore')
+
+        self.assertDictEqual(np.geterr(), errors)
+
+
+class TestIgnorePythonWarnings(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.ignore_python_warnings` definition
+    unit tests methods.
+    """
+
+    def test_ignore_python_warnings(self):
+        """
+        Tests :func:`colour.utilities.common.ignore_python_warnings`
+        definition.
+        """
+
+        @ignore_python_warnings
+        def fn_a():
+            """
+            Issues a warning.
+            """
+
+            warnings.warn('This is an ignored warning!')
+
+        @ignore_python_warnings
+        def fn_b():
+            """
+            Issues a warning and calls a decorated definition.
+            """
+
+            fn_a()
+            warnings.warn('This is an ignored warning!')
+
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+
+            fn_a()
+            fn_b()
+            warnings.warn('This is a warning!')
+
+        self.assertEqual(len(records), 1)
+
+        # The nesting depth is per thread.
+        pool = multiprocessing.pool.ThreadPool(processes=8)
+        try:
+            pool.map(lambda x: fn_b(), range(256))
+        finally:
+            pool.close()
+            pool.join()
+
+        self.assertEqual(getattr(_PYTHON_WARNINGS_STATE, 'depth', 0), 0)
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+
+            fn_b()
+
+        self.assertEqual(len(records), 0)
+
+
 class TestBatch(unittest.TestCase):
     """
     Defines :func:`colour.utilities.common.batch` definition unit tests
@@ -5,9 +5,15 @@ Defines unit tests for :mod:`colour.utilities.deprecation` module.
 
 from __future__ import division, unicode_literals
 
+import subprocess
+import sys
+import types
 import unittest
+import warnings
 
-from colour.utilities.deprecation import get_attribute
+from colour.utilities import ColourWarning
+from colour.utilities.deprecation import (ModuleAPI, Removed, Renamed,
+                                          get_attribute)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -16,7 +22,85 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestGetAttribute']
+__all__ = ['TestModuleAPI', 'TestGetAttribute', 'TestColourImport']
+
+
+class TestModuleAPI(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.deprecation.ModuleAPI` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._module = types.ModuleType('module')
+        self._module.a = 1
+        self._module_api = ModuleAPI(
+            self._module, {
+                'b': Renamed('module.b', 'colour.utilities.tsplit'),
+                'c': Removed('module.c')
+            }, {
+                'tstack': 'colour.utilities.tstack',
+                'array': 'colour.utilities.array'
+            })
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__getattr__', '__dir__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ModuleAPI))
+
+    def test__getattr__(self):
+        """
+        Tests :meth:`colour.utilities.deprecation.ModuleAPI.__getattr__`
+        method.
+        """
+
+        from colour.utilities import array, tsplit, tstack
+
+        self.assertEqual(self._module_api.a, 1)
+
+        self._module.a = 2
+        self.assertEqual(self._module_api.a, 2)
+
+        self._module_api.d = 3
+        self.assertEqual(self._module.d, 3)
+
+        self.assertIs(self._module_api.tstack, tstack)
+        self.assertIs(self._module.tstack, tstack)
+        self.assertIs(self._module_api.array, array)
+
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+
+            self.assertIs(self._module_api.b, tsplit)
+            self.assertIs(self._module_api.b, tsplit)
+
+        self.assertEqual(len(records), 2)
+        self.assertIs(records[0].category, ColourWarning)
+        self.assertNotIn('b', vars(self._module))
+
+        self.assertRaises(AttributeError, getattr, self._module_api, 'c')
+        self.assertRaises(AttributeError, getattr, self._module_api, 'e')
+
+    def test__dir__(self):
+        """
+        Tests :meth:`colour.utilities.deprecation.ModuleAPI.__dir__` method.
+        """
+
+        attributes = dir(self._module_api)
+
+        self.assertIn('a', attributes)
+        self.assertIn('tstack', attributes)
+        self.assertNotIn('b', attributes)
+        self.assertNotIn('c', attributes)
 
 
 class TestGetAttribute(unittest.TestCase):
@@ -41,5 +125,56 @@ class TestGetAttribute(unittest.TestCase):
             get_attribute('colour.utilities.array.as_numeric'), as_numeric)
 
 
+class TestColourImport(unittest.TestCase):
+    """
+    Defines *Colour* package import unit tests methods.
+    """
+
+    def test_colour_import(self):
+        """
+        Tests that *Colour* package import is lazy, i.e. that the sub-packages
+        and their heavy dependencies are only imported on first access.
+        """
+
+        modules = subprocess.check_output([
+            sys.executable, '-c', 'import sys; import colour; '
+            'print(" ".join(sorted(sys.modules)))'
+        ]).decode('utf-8').split()
+
+        for module in ('colour.colorimetry', 'colour.difference',
+                       'colour.models', 'colour.notation', 'colour.plotting',
+                       'colour.volume'):
+            self.assertNotIn(module, modules)
+
+        modules = subprocess.check_output([
+            sys.executable, '-c', 'import sys; import colour; colour.delta_E; '
+            'print(" ".join(sorted(sys.modules)))'
+        ]).decode('utf-8').split()
+
+        self.assertIn('colour.difference', modules)
+        for module in ('colour.notation', 'colour.plotting', 'colour.volume'):
+            self.assertNotIn(module, modules)
+
+        import colour
+
+        self.assertNotIn('OrderedDict', dir(colour))
+
+    def test_colour_import_time(self):
+        """
+        Tests that *Colour* package import time is a fraction of the import
+        time of all its sub-packages.
+        """
+
+        durations = subprocess.check_output([
+            sys.executable, '-W', 'ignore', '-c', 'import time; '
+            'start = time.time(); import colour; lazy = time.time() - start; '
+            'from colour import *; eager = time.time() - start; '
+            'print(lazy, eager)'
+        ]).decode('utf-8').split()
+
+        lazy, eager = (float(duration) for duration in durations)
+        self.assertLess(lazy, eager / 2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.utilities.instrumentation` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import json
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+import colour
+from colour.difference import DELTA_E_METHODS, delta_E
+from colour.utilities import (
+    disable_instrumentation, enable_instrumentation, filter_kwargs,
+    instrument, instrumentation, instrumentation_records,
+    instrumentation_report, instrumentation_trace, is_instrumentation_enabled,
+    reset_instrumentation, write_instrumentation_trace)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestInstrument', 'TestEnableInstrumentation', 'TestInstrumentation',
+    'TestInstrumentationReport', 'TestInstrumentationTrace'
+]
+
+
+class TestInstrument(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.instrumentation.instrument` definition
+    unit tests methods.
+    """
+
+    def test_instrument(self):
+        """
+        Tests :func:`colour.utilities.instrumentation.instrument` definition.
+        """
+
+        def fn_a(a, b=1):
+            """
+            Definition to instrument.
+            """
+
+            return a * b
+
+        fn_b = instrument(fn_a, 'fn_b')
+        self.assertIs(instrument(fn_a), fn_b)
+        self.assertIs(instrument(fn_b), fn_b)
+        self.assertDictEqual(filter_kwargs(fn_b, b=2, c=3), {'b': 2})
+
+        reset_instrumentation()
+        fn_b(np.ones(4))
+        self.assertDictEqual(instrumentation_records(), {})
+
+        with instrumentation():
+            fn_b(np.ones(4), b=np.ones(4))
+            fn_b(np.ones(2))
+
+        record = instrumentation_records()['fn_b']
+        self.assertEqual(record.calls, 2)
+        self.assertEqual(record.size, 10)
+        self.assertEqual(record.bytes, 48)
+        self.assertGreaterEqual(record.time, record.own_time)
+
+
+class TestEnableInstrumentation(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.instrumentation.enable_instrumentation`
+    and :func:`colour.utilities.instrumentation.disable_instrumentation`
+    definitions unit tests methods.
+    """
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        disable_instrumentation()
+
+    def test_enable_instrumentation(self):
+        """
+        Tests :func:`colour.utilities.instrumentation.enable_instrumentation`
+        and :func:`colour.utilities.instrumentation.disable_instrumentation`
+        definitions.
+        """
+
+        delta_E_CIE2000 = DELTA_E_METHODS['CIE 2000']
+
+        self.assertFalse(is_instrumentation_enabled())
+        self.assertTrue(enable_instrumentation())
+        self.assertTrue(is_instrumentation_enabled())
+        self.assertIsNot(colour.difference.delta_E, delta_E)
+        self.assertIsNot(DELTA_E_METHODS['CIE 2000'], delta_E_CIE2000)
+        self.assertIs(colour.utilities.tsplit,
+                      colour.utilities.array.tsplit)
+
+        self.assertTrue(disable_instrumentation())
+        self.assertFalse(is_instrumentation_enabled())
+        self.assertIs(colour.difference.delta_E, delta_E)
+        self.assertIs(DELTA_E_METHODS['CIE 2000'], delta_E_CIE2000)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.instrumentation.instrumentation`
+    definition unit tests methods.
+    """
+
+    def test_instrumentation(self):
+        """
+        Tests :func:`colour.utilities.instrumentation.instrumentation`
+        definition.
+        """
+
+        Lab = np.random.RandomState(4).uniform(0, 100, (16, 3))
+        with instrumentation():
+            self.assertTrue(is_instrumentation_enabled())
+            colour.delta_E(Lab, Lab[::-1], method='CIE 2000')
+            colour.uv_to_CCT(np.array([0.1978, 0.3122]))
+            colour.oetf(0.5, 'ITU-R BT.709')
+            colour.chromatic_adaptation(
+                np.array([0.20654008, 0.12197225, 0.05136952]),
+                np.array([0.95045593, 1.00000000, 1.08905775]),
+                np.array([0.96429568, 1.00000000, 0.82510460]))
+
+        self.assertFalse(is_instrumentation_enabled())
+
+        records = instrumentation_records()
+        for name in (
+                'colour.difference.delta_E',
+                'colour.difference.delta_e.delta_E_CIE2000',
+                'colour.temperature.cct.uv_to_CCT',
+                'colour.temperature.cct.uv_to_CCT_Ohno2013',
+                'colour.models.rgb.transfer_functions.oetf',
+                'colour.adaptation.chromatic_adaptation',
+                'colour.adaptation.vonkries.chromatic_adaptation_VonKries'):
+            self.assertIn(name, records)
+            self.assertEqual(records[name].calls, 1)
+
+        record = records['colour.difference.delta_E']
+        self.assertEqual(record.size, 96)
+        self.assertEqual(record.bytes, 128)
+        self.assertLess(record.own_time, record.time)
+
+        with instrumentation(reset=False):
+            colour.delta_E(Lab, Lab[::-1], method='CIE 2000')
+
+        self.assertEqual(
+            instrumentation_records()['colour.difference.delta_E'].calls, 2)
+
+        with instrumentation():
+            pass
+
+        self.assertDictEqual(instrumentation_records(), {})
+
+
+class TestInstrumentationReport(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.instrumentation.instrumentation_report`
+    definition unit tests methods.
+    """
+
+    def test_instrumentation_report(self):
+        """
+        Tests :func:`colour.utilities.instrumentation.instrumentation_report`
+        definition.
+        """
+
+        with instrumentation():
+            colour.delta_E(np.array([100.00000000, 21.57210357, 272.22819350]),
+                           np.array([100.00000000, 426.67945353, 72.39590835]))
+
+        report = instrumentation_report(sort='calls').splitlines()
+        self.assertEqual(len(report), 3)
+        self.assertTrue(report[0].startswith('Name'))
+        self.assertTrue(report[1].startswith('colour.difference.delta_E'))
+
+        self.assertEqual(len(instrumentation_report(limit=1).splitlines()), 2)
+
+
+class TestInstrumentationTrace(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.instrumentation.instrumentation_trace`
+    and :func:`colour.utilities.instrumentation.write_instrumentation_trace`
+    definitions unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_instrumentation_trace(self):
+        """
+        Tests :func:`colour.utilities.instrumentation.instrumentation_trace`
+        and :func:`colour.utilities.instrumentation.\
+write_instrumentation_trace` definitions.
+        """
+
+        with instrumentation():
+            colour.delta_E(np.array([100.00000000, 21.57210357, 272.22819350]),
+                           np.array([100.00000000, 426.67945353, 72.39590835]))
+
+        events = instrumentation_trace()['traceEvents']
+        self.assertEqual(len(events), 2)
+
+        inner, outer = events
+        self.assertEqual(outer['name'], 'colour.difference.delta_E')
+        self.assertEqual(outer['ph'], 'X')
+        self.assertLessEqual(outer['ts'], inner['ts'])
+        self.assertGreaterEqual(outer['dur'], inner['dur'])
+
+        path = os.path.join(self._temporary_directory, 'Trace.json')
+        self.assertTrue(write_instrumentation_trace(path))
+        with open(path) as file_:
+            self.assertListEqual(json.load(file_)['traceEvents'], events)
+
+        with instrumentation(trace=False):
+            colour.delta_E(np.array([100.00000000, 21.57210357, 272.22819350]),
+                           np.array([100.00000000, 426.67945353, 72.39590835]))
+
+        self.assertListEqual(instrumentation_trace()['traceEvents'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.utilities.tiling` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.appearance import XYZ_to_CAM16
+from colour.models import XYZ_to_Lab
+from colour.utilities import process_tiles, tiles
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestTiles', 'TestProcessTiles']
+
+
+class TestTiles(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.tiling.tiles` definition unit tests
+    methods.
+    """
+
+    def test_tiles(self):
+        """
+        Tests :func:`colour.utilities.tiling.tiles` definition.
+        """
+
+        self.assertListEqual(tiles(10, 5), [slice(0, 5), slice(5, 10)])
+
+        self.assertListEqual(
+            tiles(10, 4), [slice(0, 4), slice(4, 8),
+                           slice(8, 10)])
+
+        self.assertListEqual(tiles(3, 8), [slice(0, 3)])
+
+        self.assertListEqual(tiles(0, 8), [])
+
+
+class TestProcessTiles(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.tiling.process_tiles` definition unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._XYZ = np.random.RandomState(4).uniform(0, 1, (7, 5, 3))
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_process_tiles(self):
+        """
+        Tests :func:`colour.utilities.tiling.process_tiles` definition.
+        """
+
+        Lab = XYZ_to_Lab(self._XYZ)
+
+        for tile_size in (1, 4, 35, 64):
+            np.testing.assert_almost_equal(
+                process_tiles(
+                    XYZ_to_Lab, self._XYZ, tile_size=tile_size, processes=1),
+                Lab,
+                decimal=7)
+
+            np.testing.assert_almost_equal(
+                process_tiles(
+                    XYZ_to_Lab, self._XYZ, tile_size=tile_size, processes=4),
+                Lab,
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            process_tiles(
+                XYZ_to_Lab,
+                self._XYZ,
+                tile_size=4,
+                illuminant=np.array([0.31270, 0.32900])),
+            XYZ_to_Lab(self._XYZ, np.array([0.31270, 0.32900])),
+            decimal=7)
+
+        self.assertEqual(
+            process_tiles(XYZ_to_Lab, self._XYZ, dtype=np.float32).dtype,
+            np.float32)
+
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        specification = XYZ_to_CAM16(self._XYZ * 100, XYZ_w, 318.31, 20.0)
+        np.testing.assert_almost_equal(
+            process_tiles(
+                XYZ_to_CAM16,
+                self._XYZ * 100,
+                tile_size=4,
+                XYZ_w=XYZ_w,
+                L_A=318.31,
+                Y_b=20.0),
+            np.stack(specification[:7], axis=-1),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            process_tiles(np.sum, self._XYZ, tile_size=4, axis=-1),
+            np.sum(self._XYZ, axis=-1)[..., np.newaxis],
+            decimal=7)
+
+    def test_process_tiles_memmap(self):
+        """
+        Tests :func:`colour.utilities.tiling.process_tiles` definition with
+        memory-mapped arrays.
+        """
+
+        Lab = XYZ_to_Lab(self._XYZ)
+
+        XYZ_path = os.path.join(self._temporary_directory, 'XYZ.npy')
+        np.save(XYZ_path, self._XYZ)
+
+        for method in ('Threads', 'Processes'):
+            Lab_path = os.path.join(self._temporary_directory,
+                                    'Lab_{0}.npy'.format(method))
+            output = process_tiles(
+                XYZ_to_Lab,
+                XYZ_path,
+                Lab_path,
+                tile_size=4,
+                processes=2,
+                method=method)
+            self.assertIsInstance(output, np.memmap)
+            np.testing.assert_almost_equal(output, Lab, decimal=7)
+            np.testing.assert_almost_equal(np.load(Lab_path), Lab, decimal=7)
+
+        XYZ = np.memmap(
+            os.path.join(self._temporary_directory, 'XYZ.raw'),
+            np.float32,
+            'w+',
+            shape=self._XYZ.shape)
+        XYZ[:] = self._XYZ
+        output = np.memmap(
+            os.path.join(self._temporary_directory, 'Lab.raw'),
+            np.float32,
+            'w+',
+            shape=self._XYZ.shape)
+        self.assertIs(
+            process_tiles(
+                XYZ_to_Lab,
+                XYZ,
+                output,
+                tile_size=4,
+                processes=2,
+                method='Processes'), output)
+        np.testing.assert_almost_equal(output, Lab, decimal=4)
+
+        XYZ = np.load(XYZ_path, mmap_mode='r')[4:]
+        for method in ('Threads', 'Processes'):
+            np.testing.assert_almost_equal(
+                process_tiles(
+                    XYZ_to_Lab,
+                    XYZ,
+                    os.path.join(self._temporary_directory,
+                                 'Lab_View_{0}.npy'.format(method)),
+                    tile_size=4,
+                    processes=2,
+                    method=method),
+                Lab[4:],
+                decimal=7)
+
+    def test_raise_exception_process_tiles(self):
+        """
+        Tests :func:`colour.utilities.tiling.process_tiles` definition raised
+        exception.
+        """
+
+        self.assertRaises(
+            ValueError, process_tiles, XYZ_to_Lab, self._XYZ, method='Fibers')
+
+        self.assertRaises(ValueError, process_tiles, XYZ_to_Lab,
+                          np.zeros((0, 3)))
+
+        self.assertRaises(ValueError, process_tiles, XYZ_to_Lab, self._XYZ,
+                          np.zeros((7, 5, 2)))
+
+        self.assertRaises(ValueError, process_tiles, XYZ_to_Lab,
+                          np.zeros((7, 10, 3))[:, :5])
+
+        output = np.zeros((7, 10, 3))
+        self.assertRaises(ValueError, process_tiles, XYZ_to_Lab, self._XYZ,
+                          output[:, :5])
+
+        self.assertRaises(
+            ValueError,
+            process_tiles,
+            XYZ_to_Lab,
+            self._XYZ,
+            tile_size=4,
+            processes=2,
+            method='Processes')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.utilities.verbose` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import unittest
+import warnings
+
+from colour.utilities import (ColourWarning, set_warnings_rate_limit,
+                              warning, warnings_rate_limit,
+                              warnings_registry)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestWarning', 'TestSetWarningsRateLimit', 'TestWarningsRateLimit']
+
+
+class TestWarning(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.verbose.warning` definition unit tests
+    methods.
+    """
+
+    def test_warning(self):
+        """
+        Tests :func:`colour.utilities.verbose.warning` definition.
+        """
+
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+
+            for _ in range(3):
+                self.assertTrue(warning('This is a warning!'))
+
+        self.assertEqual(len(records), 3)
+        self.assertIs(records[0].category, ColourWarning)
+        self.assertDictEqual(warnings_registry(), {})
+
+
+class TestSetWarningsRateLimit(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.verbose.set_warnings_rate_limit`
+    definition unit tests methods.
+    """
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        set_warnings_rate_limit()
+
+    def test_set_warnings_rate_limit(self):
+        """
+        Tests :func:`colour.utilities.verbose.set_warnings_rate_limit`
+        definition.
+        """
+
+        self.assertTupleEqual(set_warnings_rate_limit(2), (None, None))
+
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+
+            for _ in range(5):
+                warning('This is a warning!')
+                warning(message='This is another warning!')
+
+        self.assertEqual(len(records), 4)
+        self.assertDictEqual(warnings_registry(), {
+            'This is a warning!': 5,
+            'This is another warning!': 5
+        })
+
+        self.assertTupleEqual(set_warnings_rate_limit(1, 0), (2, None))
+
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+
+            for _ in range(5):
+                warning('This is a warning!')
+
+        self.assertEqual(len(records), 5)
+
+        self.assertTupleEqual(set_warnings_rate_limit(), (1, 0))
+        self.assertDictEqual(warnings_registry(), {})
+
+
+class TestWarningsRateLimit(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.verbose.warnings_rate_limit` definition
+    unit tests methods.
+    """
+
+    def test_warnings_rate_limit(self):
+        """
+        Tests :func:`colour.utilities.verbose.warnings_rate_limit` definition.
+        """
+
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+
+            with warnings_rate_limit():
+                for _ in range(3):
+                    warning('This is a warning!')
+
+                self.assertDictEqual(warnings_registry(),
+                                     {'This is a warning!': 3})
+
+            for _ in range(3):
+                warning('This is a warning!')
+
+        self.assertEqual(len(records), 4)
+        self.assertDictEqual(warnings_registry(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+Tiling
+======
+
+Defines the objects to evaluate colour conversions out-of-core, i.e. over
+arrays that do not fit in memory, by processing them in tiles:
+
+-   :func:`colour.utilities.tiles`
+-   :func:`colour.utilities.process_tiles`
+"""
+
+from __future__ import division, unicode_literals
+
+import mmap
+import multiprocessing
+import multiprocessing.pool
+import numpy as np
+
+from colour.utilities import is_string, tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TILE_SIZE', 'TILING_METHODS', 'tiles', 'process_tiles']
+
+TILE_SIZE = 2 ** 18
+"""
+Default samples count of the tiles, e.g. *262144* samples, i.e. a 512x512
+image region, amounting to 6 MiB for a *float64* *RGB* tile.
+
+TILE_SIZE : integer
+"""
+
+TILING_METHODS = ('Threads', 'Processes')
+"""
+Supported tiles processing methods:
+
+-   *Threads*: Tiles are processed concurrently by a pool of threads sharing
+    the input and output arrays, most *Numpy* operations release the *GIL*.
+-   *Processes*: Tiles are processed concurrently by a pool of processes
+    mapping the input and output arrays from their files, the conversion
+    definition must be picklable.
+
+TILING_METHODS : tuple
+    **{'Threads', 'Processes'}**
+"""
+
+
+def tiles(samples, tile_size=TILE_SIZE):
+    """
+    Returns the slices partitioning given samples count in tiles.
+
+    Parameters
+    ----------
+    samples : integer
+        Samples count to partition.
+    tile_size : integer, optional
+        Samples count of the tiles.
+
+    Returns
+    -------
+    list
+        Tiles slices.
+
+    Examples
+    --------
+    >>> tiles(10, 4)
+    [slice(0, 4, None), slice(4, 8, None), slice(8, 10, None)]
+    """
+
+    tile_size = max(int(tile_size), 1)
+
+    return [
+        slice(i, min(i + tile_size, samples))
+        for i in range(0, samples, tile_size)
+    ]
+
+
+def _as_tile_output(value):
+    """
+    Converts given conversion definition output to a tile output array with
+    channels in the last axis.
+
+    Parameters
+    ----------
+    value : array_like or tuple
+        Conversion definition output, *tuple* and *namedtuple* instances,
+        e.g. colour appearance model specifications, have their defined
+        fields stacked along the last axis.
+
+    Returns
+    -------
+    ndarray
+        Tile output array.
+    """
+
+    if isinstance(value, tuple):
+        value = tstack([field for field in value if field is not None])
+
+    value = np.asarray(value)
+    if value.ndim == 1:
+        value = value[..., np.newaxis]
+
+    return value
+
+
+def _memmap_specification(a):
+    """
+    Returns given memory-mapped array specification allowing to map it again
+    from another process.
+
+    Parameters
+    ----------
+    a : memmap
+        Memory-mapped array.
+
+    Returns
+    -------
+    tuple
+        Memory-mapped array filename, dtype, offset and shape.
+
+    Raises
+    ------
+    ValueError
+        If the array is not memory-mapped from a file.
+
+    Notes
+    -----
+    -   The offset of views of memory-mapped arrays, e.g. ``a[4:]``, is the
+        offset of the mapping they share, the actual offset of their data in
+        the file is computed from their data address in the mapping.
+    """
+
+    filename = getattr(a, 'filename', None)
+    mapping = getattr(a, '_mmap', None)
+    if filename is None or mapping is None or not a.flags.c_contiguous:
+        raise ValueError('"Processes" method requires contiguous arrays '
+                         'memory-mapped from files or ".npy" files paths!')
+
+    # The mapping starts at the offset rounded down to the allocation
+    # granularity.
+    offset = (a.offset - a.offset % mmap.ALLOCATIONGRANULARITY +
+              a.ctypes.data - np.frombuffer(mapping, np.uint8).ctypes.data)
+
+    return filename, a.dtype.str, offset, a.shape
+
+
+def _process_tile(function, a, output, tile, kwargs):
+    """
+    Evaluates given conversion definition on given tile of the input array
+    and writes the result in the output array.
+
+    Parameters
+    ----------
+    function : callable
+        Conversion definition.
+    a : ndarray
+        Input array with samples in the first axis.
+    output : ndarray
+        Output array with samples in the first axis.
+    tile : slice
+        Tile slice.
+    kwargs : dict
+        Keywords arguments for the conversion definition.
+    """
+
+    output[tile] = _as_tile_output(function(a[tile], **kwargs))
+
+
+def _wrapper_process_tile(args):
+    """
+    Convenient wrapper to be able to call
+    :func:`colour.utilities.tiling._process_tile` definition from a pool of
+    processes with memory-mapped arrays specifications.
+
+    Parameters
+    ----------
+    args : tuple
+        Conversion definition, input and output memory-mapped arrays
+        specifications, tile and keywords arguments.
+    """
+
+    function, a_specification, output_specification, tile, kwargs = args
+
+    filename, dtype, offset, shape = a_specification
+    a = np.memmap(filename, dtype, 'r', offset, shape)
+    a = a.reshape(-1, shape[-1])
+
+    filename, dtype, offset, shape = output_specification
+    output = np.memmap(filename, dtype, 'r+', offset, shape)
+
+    _process_tile(function, a, output.reshape(-1, shape[-1]), tile, kwargs)
+
+    output.flush()
+
+
+def process_tiles(function,
+                  a,
+                  output=None,
+                  tile_size=TILE_SIZE,
+                  processes=None,
+                  method='Threads',
+                  dtype=None,
+                  **kwargs):
+    """
+    Evaluates given conversion definition over given array in tiles, writing
+    the results in a pre-allocated, possibly memory-mapped, output array.
+
+    The conversion definition maps an array with channels or spectral bins in
+    the last axis, e.g. of shape (..., 3) or (..., bins), to an array of
+    shape (..., k). Only tiles of ``tile_size`` samples are loaded at any
+    time, thus the peak memory is bounded by the tiles processed
+    concurrently regardless of the array size.
+
+    Parameters
+    ----------
+    function : callable
+        Conversion definition, e.g. :func:`colour.XYZ_to_Lab`.
+    a : array_like or unicode
+        Input array of shape (..., c), e.g. a :class:`numpy.memmap` class
+        instance, or path to a *.npy* file that will be memory-mapped.
+    output : array_like or unicode, optional
+        Pre-allocated output array of shape (..., k), e.g. a
+        :class:`numpy.memmap` class instance, or path to a *.npy* file that
+        will be created and memory-mapped. If undefined, an in-memory array is
+        allocated.
+    tile_size : integer, optional
+        Samples count of the tiles.
+    processes : integer, optional
+        Threads or processes count, default to
+        :func:`multiprocessing.cpu_count` definition.
+    method : unicode, optional
+        **{'Threads', 'Processes'}**,
+        Tiles processing method.
+    dtype : object, optional
+        Output array dtype when it is allocated, default to the dtype of the
+        conversion definition output.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments for the conversion definition.
+
+    Returns
+    -------
+    ndarray
+        Output array of shape (..., k).
+
+    Raises
+    ------
+    ValueError
+        If the tiles processing method is not supported, if the input or
+        output arrays are not *C* contiguous, or if the *Processes* method is
+        used with arrays that are not memory-mapped from files.
+
+    Notes
+    -----
+    -   Conversion definitions returning *tuple* or *namedtuple* instances,
+        e.g. :func:`colour.XYZ_to_CAM16`, have their defined fields stacked
+        along the last axis of the output array.
+    -   The conversion definition must operate per sample: arguments shared
+        by all the samples, e.g. a whitepoint, are passed with ``kwargs``.
+    -   The input and output arrays must be *C* contiguous so that they are
+        tiled without being copied, e.g. with
+        :func:`numpy.ascontiguousarray` definition.
+
+    Examples
+    --------
+    >>> from colour.models import XYZ_to_Lab
+    >>> XYZ = np.tile([0.20654008, 0.12197225, 0.05136952], (4, 4, 1))
+    >>> Lab = process_tiles(XYZ_to_Lab, XYZ, tile_size=5, processes=1)
+    >>> Lab.shape
+    (4, 4, 3)
+    >>> Lab[3, 3]  # doctest: +ELLIPSIS
+    array([ 41.5278752...,  51.1935417...,  19.9184309...])
+    """
+
+    if method not in TILING_METHODS:
+        raise ValueError(
+            '"{0}" tiles processing method is invalid, it must be one of '
+            '{1}!'.format(method, TILING_METHODS))
+
+    if is_string(a):
+        a = np.load(a, mmap_mode='r')
+    else:
+        a = np.asanyarray(a)
+
+    # Reshaping non-contiguous arrays would copy them entirely.
+    if not a.flags.c_contiguous:
+        raise ValueError('Input array must be "C" contiguous!')
+
+    shape = a.shape[:-1]
+    a_t = a.reshape(-1, a.shape[-1])
+    samples = a_t.shape[0]
+    slices = tiles(samples, tile_size)
+
+    if not slices:
+        raise ValueError('Input array does not contain any sample!')
+
+    value = _as_tile_output(function(a_t[slices[0]], **kwargs))
+    output_shape = shape + value.shape[-1:]
+    dtype = value.dtype if dtype is None else dtype
+
+    if output is None:
+        output = np.empty(output_shape, dtype)
+    elif is_string(output):
+        output = np.lib.format.open_memmap(output, 'w+', dtype, output_shape)
+
+    if output.shape != output_shape:
+        raise ValueError('Output array shape {0} must be {1}!'.format(
+            output.shape, output_shape))
+
+    # Reshaping non-contiguous arrays would write the tiles in a copy.
+    if not output.flags.c_contiguous:
+        raise ValueError('Output array must be "C" contiguous!')
+
+    output_t = output.reshape(-1, output_shape[-1])
+    output_t[slices[0]] = value
+
+    slices = slices[1:]
+    processes = processes if processes else multiprocessing.cpu_count()
+
+    if processes == 1 or not slices:
+        for tile in slices:
+            _process_tile(function, a_t, output_t, tile, kwargs)
+    elif method == 'Threads':
+        pool = multiprocessing.pool.ThreadPool(processes=processes)
+        try:
+            for _ in pool.imap_unordered(
+                    lambda x: _process_tile(function, a_t, output_t, x,
+                                            kwargs), slices):
+                pass
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        if isinstance(output, np.memmap):
+            output.flush()
+
+        arguments = (function, _memmap_specification(a),
+                     _memmap_specification(output))
+        pool = multiprocessing.Pool(processes=processes)
+        try:
+            for _ in pool.imap_unordered(
+                    _wrapper_process_tile,
+                    [arguments + (tile, kwargs) for tile in slices]):
+                pass
+        finally:
+            pool.close()
+            pool.join()
+
+    if isinstance(output, np.memmap):
+        output.flush()
+
+    return output
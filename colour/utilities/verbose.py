@@ -13,6 +13,7 @@ import warnings
 from contextlib import contextmanager
 from itertools import chain
 from textwrap import TextWrapper
+from timeit import default_timer
 from warnings import filterwarnings, warn
 
 __author__ = 'Colour Developers'
@@ -23,10 +24,27 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'ColourWarning', 'message_box', 'warning', 'filter_warnings',
+    'ColourWarning', 'message_box', 'warning', 'set_warnings_rate_limit',
+    'warnings_rate_limit', 'warnings_registry', 'filter_warnings',
     'suppress_warnings', 'numpy_print_options'
 ]
 
+_WARNINGS_RATE_LIMIT = {'limit': None, 'interval': None}
+"""
+Maximum count a given warning message is issued within a given interval in
+seconds, the warnings are not rate limited if the limit is *None*.
+
+_WARNINGS_RATE_LIMIT : dict
+"""
+
+_WARNINGS_REGISTRY = {}
+"""
+Rate limited warnings registry, i.e. occurrences count, issued count within
+the current interval and interval start time per warning message.
+
+_WARNINGS_REGISTRY : dict
+"""
+
 
 class ColourWarning(Warning):
     """
@@ -139,12 +157,125 @@ def warning(*args, **kwargs):
     /Users/.../colour/utilities/verbose.py:132: UserWarning: This is a warning!
     """
 
+    limit = _WARNINGS_RATE_LIMIT['limit']
+    if limit is not None:
+        message = str(args[0] if args else kwargs.get('message'))
+        interval = _WARNINGS_RATE_LIMIT['interval']
+        time = 0 if interval is None else default_timer()
+
+        entry = _WARNINGS_REGISTRY.get(message)
+        if entry is None:
+            entry = _WARNINGS_REGISTRY[message] = [0, 0, time]
+        elif interval is not None and time - entry[2] >= interval:
+            entry[1], entry[2] = 0, time
+
+        entry[0] += 1
+        if entry[1] >= limit:
+            return True
+
+        entry[1] += 1
+
     kwargs['category'] = ColourWarning
     warn(*args, **kwargs)
 
     return True
 
 
+def set_warnings_rate_limit(limit=None, interval=None):
+    """
+    Sets the maximum count a given warning message is issued by
+    :func:`colour.utilities.warning` definition and resets the warnings
+    registry.
+
+    Rate limiting the warnings avoids paying for the *Python* warnings
+    machinery when definitions issuing warnings, e.g. alignment warnings, are
+    called in tight loops.
+
+    Parameters
+    ----------
+    limit : integer, optional
+        Maximum count a given warning message is issued, the warnings are not
+        rate limited if *None*.
+    interval : numeric, optional
+        Interval in seconds after which the warning messages count is reset,
+        the count is never reset if *None*.
+
+    Returns
+    -------
+    tuple
+        Previous limit and interval.
+
+    Examples
+    --------
+    >>> set_warnings_rate_limit(1)
+    (None, None)
+    >>> set_warnings_rate_limit()
+    (1, None)
+    """
+
+    previous = (_WARNINGS_RATE_LIMIT['limit'],
+                _WARNINGS_RATE_LIMIT['interval'])
+
+    _WARNINGS_RATE_LIMIT['limit'] = limit
+    _WARNINGS_RATE_LIMIT['interval'] = interval
+    _WARNINGS_REGISTRY.clear()
+
+    return previous
+
+
+@contextmanager
+def warnings_rate_limit(limit=1, interval=None):
+    """
+    A context manager setting the maximum count a given warning message is
+    issued by :func:`colour.utilities.warning` definition.
+
+    Parameters
+    ----------
+    limit : integer, optional
+        Maximum count a given warning message is issued, the warnings are not
+        rate limited if *None*.
+    interval : numeric, optional
+        Interval in seconds after which the warning messages count is reset,
+        the count is never reset if *None*.
+
+    Examples
+    --------
+    >>> with warnings_rate_limit(1):
+    ...     for _ in range(3):
+    ...         warning('This is a warning!')  # doctest: +SKIP
+    ...     warnings_registry()
+    /Users/.../colour/utilities/verbose.py:132: UserWarning: This is a warning!
+    {'This is a warning!': 3}
+    """
+
+    limit, interval = set_warnings_rate_limit(limit, interval)
+    try:
+        yield
+    finally:
+        set_warnings_rate_limit(limit, interval)
+
+
+def warnings_registry():
+    """
+    Returns the occurrences count of the warning messages issued by
+    :func:`colour.utilities.warning` definition since the warnings rate limit
+    was set, including the rate limited occurrences.
+
+    Returns
+    -------
+    dict
+        Occurrences count per warning message.
+
+    Examples
+    --------
+    >>> warnings_registry()
+    {}
+    """
+
+    return dict((message, entry[0])
+                for message, entry in _WARNINGS_REGISTRY.items())
+
+
 def filter_warnings(state=True, colour_warnings_only=True):
     """
     Filters *Colour* and also optionally overall Python warnings.
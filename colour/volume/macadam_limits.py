@@ -15,7 +15,6 @@ blob/master/notebooks/volume/macadam_limits.ipynb>`_
 from __future__ import division, unicode_literals
 
 import numpy as np
-from scipy.spatial import Delaunay
 
 from colour.models import xyY_to_XYZ
 from colour.volume import ILLUMINANTS_OPTIMAL_COLOUR_STIMULI
@@ -100,6 +99,8 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     triangulation = _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE.get(
         illuminant)
     if triangulation is None:
+        from scipy.spatial import Delaunay
+
         _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE[illuminant] = \
             triangulation = Delaunay(optimal_colour_stimuli)
 
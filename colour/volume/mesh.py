@@ -9,7 +9,6 @@ Defines helpers objects related to volume computations.
 from __future__ import division, unicode_literals
 
 import numpy as np
-from scipy.spatial import Delaunay
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -57,6 +56,8 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
+    from scipy.spatial import Delaunay
+
     triangulation = Delaunay(mesh)
 
     simplex = triangulation.find_simplex(points, tol=tolerance)
@@ -84,7 +84,7 @@ setup(
     author=__author__,
     author_email=__email__,
     include_package_data=True,
-    packages=find_packages(),
+    packages=find_packages(exclude=('benchmarks', 'benchmarks.*')),
     scripts=[],
     url='http://github.com/colour-science/colour',
     license=__license__,
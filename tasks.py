@@ -27,8 +27,8 @@ __status__ = 'Production'
 
 __all__ = [
     'APPLICATION_NAME', 'PYTHON_PACKAGE_NAME', 'PYPI_PACKAGE_NAME', 'clean',
-    'formatting', 'tests', 'quality', 'examples', 'docs', 'todo', 'preflight',
-    'build', 'virtualise', 'tag', 'release', 'sha256'
+    'formatting', 'tests', 'benchmarks', 'quality', 'examples', 'docs', 'todo',
+    'preflight', 'build', 'virtualise', 'tag', 'release', 'sha256'
 ]
 
 APPLICATION_NAME = colour.__application_name__
@@ -130,6 +130,38 @@ def tests(ctx, nose=True):
         ctx.run('pytest -W ignore')
 
 
+@task
+def benchmarks(ctx, output='benchmarks.json', baseline=None, threshold=0.1):
+    """
+    Runs the benchmarks and optionally compares them to given baseline
+    results.
+
+    Parameters
+    ----------
+    ctx : invoke.context.Context
+        Context.
+    output : unicode, optional
+        *JSON* results file.
+    baseline : unicode, optional
+        *JSON* baseline results file to compare the results to.
+    threshold : numeric, optional
+        Relative slowdown flagged as a regression.
+
+    Returns
+    -------
+    bool
+        Task success.
+    """
+
+    message_box('Running "Benchmarks"...')
+    ctx.run('python -m benchmarks run --output {0}'.format(output))
+
+    if baseline is not None:
+        message_box('Comparing "Benchmarks"...')
+        ctx.run('python -m benchmarks compare {0} {1} --threshold {2}'.format(
+            baseline, output, threshold))
+
+
 @task
 def quality(ctx, flake8=True, rstlint=True):
     """